@@ -2,6 +2,7 @@
 
 import typer
 import asyncio
+from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -14,6 +15,9 @@ from ...core.state.manager import StateManager
 from ...core.preview.notifiers import PreviewNotificationManager, NotificationChannel
 from ...core.preview.generator import ContentPreviewGenerator, PreviewSession
 from ...platforms.core.platform_factory import platform_factory
+from ...platforms.core.executor import ConcurrentPlatformExecutor, PlatformExecutionResult
+from ...platforms.core.http_client import close_http_client
+from ...platforms.core.pool import PlatformPool
 from ...platforms.core.base_platform import Content, Profile, ContentType, MediaFile
 import requests
 import json
@@ -126,6 +130,8 @@ def apply_main(
     config_file: str = typer.Option("campaign.yaml", "--config", "-c", help="Configuration file"),
     no_scheduler: bool = typer.Option(False, "--no-scheduler", help="Disable automatic scheduler setup"),
     scheduler_interval: int = typer.Option(60, "--interval", help="Scheduler check interval in seconds"),
+    max_concurrency: int = typer.Option(5, "--max-concurrency", help="Maximum number of platforms to post to at once"),
+    platform_timeout: float = typer.Option(300.0, "--platform-timeout", help="Timeout in seconds for each platform"),
 ):
     """Execute the campaign and post to social media platforms."""
     
@@ -166,7 +172,11 @@ def apply_main(
             console.print("⚡ [yellow]自動実行モード: 設定に基づいて確認なしで実行します[/yellow]")
         
         # Run execution with notification settings
-        asyncio.run(execute_campaign_new(config, platforms, credentials, False, skip_confirm, False, notify, preview))
+        asyncio.run(execute_campaign_new(
+            config, platforms, credentials, False, skip_confirm, False, notify, preview,
+            max_concurrency=max_concurrency,
+            platform_timeout=platform_timeout
+        ))
         
         # After successful execution, offer scheduler setup
         _offer_scheduler_setup(config_file, no_scheduler, scheduler_interval, config)
@@ -290,7 +300,8 @@ def _setup_scheduler(config_file: str, scheduler_interval: int, config):
         console.print("📝 [blue]Try manual setup: [cyan]aetherpost scheduler create[/cyan][/blue]")
 
 
-async def execute_campaign_new(config, platforms, credentials, dry_run: bool, skip_confirm: bool, skip_review: bool = False, notify: bool = True, preview: bool = True):
+async def execute_campaign_new(config, platforms, credentials, dry_run: bool, skip_confirm: bool, skip_review: bool = False, notify: bool = True, preview: bool = True,
+                               max_concurrency: int = 5, platform_timeout: float = 300.0):
     """Execute campaign across platforms using new unified system."""
     
     # Initialize components
@@ -389,11 +400,19 @@ async def execute_campaign_new(config, platforms, credentials, dry_run: bool, sk
             return
         
         # Execute posting with new platform system
-        await execute_posts_new(platform_content, credentials, state_manager)
+        await execute_posts_new(
+            platform_content,
+            credentials,
+            state_manager,
+            max_concurrency=max_concurrency,
+            platform_timeout=platform_timeout
+        )
         
     except Exception as e:
         console.print(f"❌ Campaign execution failed: {e}")
         return
+    finally:
+        await close_http_client()
 
 
 def show_execution_preview_new(platform_content: dict, config):
@@ -416,10 +435,24 @@ def show_execution_preview_new(platform_content: dict, config):
             console.print(f"🏷️  {' '.join(content.hashtags)}")
 
 
-async def execute_posts_new(platform_content: dict, credentials, state_manager: StateManager):
-    """Execute posts across platforms using new unified platform system."""
+async def execute_posts_new(
+    platform_content: dict,
+    credentials,
+    state_manager: StateManager,
+    max_concurrency: int = 5,
+    platform_timeout: float = 300.0,
+    pool: Optional[PlatformPool] = None
+):
+    """Execute posts across platforms concurrently using new unified platform system.
+
+    Pass a ``PlatformPool`` to reuse authenticated sessions across calls.
+    """
     
-    results = []
+    executor = ConcurrentPlatformExecutor(
+        max_concurrency=max_concurrency,
+        platform_timeout=platform_timeout,
+        pool=pool
+    )
     
     with Progress(
         SpinnerColumn(),
@@ -427,81 +460,37 @@ async def execute_posts_new(platform_content: dict, credentials, state_manager:
         console=console
     ) as progress:
         
-        for platform_name, content in platform_content.items():
-            task = progress.add_task(f"Posting to {platform_name}...", total=None)
+        tasks = {
+            platform_name: progress.add_task(f"Posting to {platform_name}...", total=None)
+            for platform_name in platform_content
+        }
+        
+        def record_result(outcome: PlatformExecutionResult):
+            """Record each platform as soon as it finishes."""
+            task = tasks[outcome.platform]
             
-            try:
-                # Get platform credentials
-                platform_creds = getattr(credentials, platform_name, None)
-                if not platform_creds:
-                    progress.update(task, description=f"❌ No credentials for {platform_name}")
-                    results.append({"platform": platform_name, "status": "failed", "error": "No credentials"})
-                    continue
-                
-                # Create platform instance using factory
-                try:
-                    platform = platform_factory.create_platform(
-                        platform_name=platform_name,
-                        credentials=platform_creds.__dict__ if hasattr(platform_creds, '__dict__') else platform_creds
-                    )
-                except Exception as e:
-                    progress.update(task, description=f"❌ Failed to create {platform_name} platform")
-                    results.append({"platform": platform_name, "status": "failed", "error": f"Platform creation failed: {str(e)}"})
-                    continue
-                
-                # Authenticate
-                auth_success = await platform.authenticate()
-                if not auth_success:
-                    progress.update(task, description=f"❌ Authentication failed for {platform_name}")
-                    results.append({"platform": platform_name, "status": "failed", "error": "Authentication failed"})
-                    continue
-                
-                # Validate content
-                validation_result = await platform.validate_content(content)
-                if not validation_result['is_valid']:
-                    error_msg = '; '.join(validation_result['errors'])
-                    progress.update(task, description=f"❌ Content validation failed for {platform_name}")
-                    results.append({"platform": platform_name, "status": "failed", "error": f"Validation failed: {error_msg}"})
-                    continue
-                
-                # Post content
-                result = await platform.post_content(content)
-                
-                if result.success:
-                    progress.update(task, description=f"✅ Posted to {platform_name}")
-                    
-                    # Record in state
-                    state_manager.add_post(
-                        platform=platform_name,
-                        post_id=result.post_id or "unknown",
-                        url=result.post_url or "unknown",
-                        content={
-                            'text': content.text,
-                            'hashtags': content.hashtags,
-                            'content_type': content.content_type.value
-                        }
-                    )
-                    
-                    results.append({
-                        "platform": platform_name,
-                        "status": "success",
-                        "url": result.post_url,
-                        "post_id": result.post_id
-                    })
-                else:
-                    error = result.error_message or "Unknown error"
-                    progress.update(task, description=f"❌ Failed to post to {platform_name}")
-                    results.append({"platform": platform_name, "status": "failed", "error": error})
-                
-                # Cleanup platform resources
-                await platform.cleanup()
+            if not outcome.success:
+                progress.update(task, description=f"❌ Failed to post to {outcome.platform}: {outcome.error}")
+                return
             
-            except Exception as e:
-                progress.update(task, description=f"❌ Error posting to {platform_name}")
-                results.append({"platform": platform_name, "status": "failed", "error": str(e)})
+            progress.update(task, description=f"✅ Posted to {outcome.platform} ({outcome.duration:.1f}s)")
+            
+            content = platform_content[outcome.platform]
+            state_manager.add_post(
+                platform=outcome.platform,
+                post_id=outcome.post_id or "unknown",
+                url=outcome.post_url or "unknown",
+                content={
+                    'text': content.text,
+                    'hashtags': content.hashtags,
+                    'content_type': content.content_type.value
+                }
+            )
+        
+        outcomes = await executor.execute(platform_content, credentials, on_complete=record_result)
     
     # Show results
-    show_execution_results_new(results)
+    show_execution_results_new([outcome.to_dict() for outcome in outcomes])
 
 
 def show_execution_results_new(results: list):
@@ -10,6 +10,9 @@ from rich.table import Table
 from ...core.config.parser import ConfigLoader
 from ...core.state.manager import StateManager
 from ...platforms.core.platform_factory import platform_factory
+from ...platforms.core.deletion import BatchDeletionEngine
+from ...platforms.core.http_client import close_http_client
+from ...platforms.core.pool import PlatformPool
 
 console = Console()
 destroy_app = typer.Typer()
@@ -20,6 +23,7 @@ def destroy_main(
     platform: str = typer.Option(None, "--platform", help="Only delete posts from specific platform"),
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
     no_profile_restore: bool = typer.Option(False, "--no-profile-restore", help="Skip profile restoration after cleanup"),
+    concurrency: int = typer.Option(4, "--concurrency", help="Maximum concurrent deletions per platform"),
 ):
     """Delete posted content and clean up campaign resources."""
     
@@ -76,7 +80,12 @@ def destroy_main(
                 return
         
         # Execute destruction
-        asyncio.run(execute_destruction(posts_to_delete, config, state_manager, target_platform=platform, no_profile_restore=no_profile_restore))
+        asyncio.run(execute_destruction(
+            posts_to_delete, config, state_manager,
+            target_platform=platform,
+            no_profile_restore=no_profile_restore,
+            concurrency=concurrency
+        ))
         
     except FileNotFoundError:
         console.print(f"❌ [red]Configuration file not found: {config_file}[/red]")
@@ -84,7 +93,7 @@ def destroy_main(
         console.print(f"❌ [red]Error: {e}[/red]")
 
 
-async def execute_destruction(posts_to_delete, config, state_manager, target_platform=None, no_profile_restore=False):
+async def execute_destruction(posts_to_delete, config, state_manager, target_platform=None, no_profile_restore=False, concurrency=4):
     """Execute the destruction of posts."""
     
     console.print(f"\n[bold]Deleting {len(posts_to_delete)} posts...[/bold]")
@@ -93,69 +102,40 @@ async def execute_destruction(posts_to_delete, config, state_manager, target_pla
     config_loader = ConfigLoader()
     credentials = config_loader.load_credentials()
     
-    deleted_count = 0
-    failed_count = 0
+    # One login per platform, shared by deletion and profile restoration
+    pool = PlatformPool()
+    try:
+        await _execute_destruction(
+            posts_to_delete, config, state_manager, credentials, pool,
+            target_platform, no_profile_restore, concurrency
+        )
+    finally:
+        await pool.close()
+        await close_http_client()
+
+
+async def _execute_destruction(posts_to_delete, config, state_manager, credentials, pool, target_platform, no_profile_restore, concurrency):
+    """Delete posts and optionally restore profiles using pooled platforms."""
     
-    for post in posts_to_delete:
-        platform_instance = None
-        try:
-            # Load platform credentials
-            if isinstance(credentials, dict):
-                platform_credentials = credentials.get(post.platform, {})
+    engine = BatchDeletionEngine(per_platform_concurrency=concurrency, pool=pool)
+    if len(engine.checkpoint) > 0:
+        console.print(f"🔁 [blue]Resuming interrupted destroy: {len(engine.checkpoint)} posts already deleted[/blue]")
+    
+    def on_result(post, outcome):
+        if outcome.success:
+            if outcome.resumed:
+                console.print(f"⏭️  [green]Already deleted {post.platform} post {post.post_id}[/green]")
             else:
-                platform_credentials = getattr(credentials, post.platform, {})
-            
-            # Convert to dictionary if needed
-            if hasattr(platform_credentials, '__dict__'):
-                platform_credentials = platform_credentials.__dict__
-            
-            if not platform_credentials:
-                console.print(f"⚠️  [yellow]No credentials for {post.platform}, skipping post {post.post_id}[/yellow]")
-                failed_count += 1
-                continue
-            
-            # Create platform instance using new factory
-            try:
-                platform_instance = platform_factory.create_platform(
-                    platform_name=post.platform,
-                    credentials=platform_credentials
-                )
-            except Exception as e:
-                console.print(f"❌ [red]Failed to create {post.platform} platform instance: {e}[/red]")
-                failed_count += 1
-                continue
-            
-            # Authenticate platform
-            auth_success = await platform_instance.authenticate()
-            if not auth_success:
-                console.print(f"❌ [red]Authentication failed for {post.platform}[/red]")
-                failed_count += 1
-                continue
-            
-            # Delete the post using new platform system
-            result = await platform_instance.delete_post(post.post_id)
-            success = result.success
-            
-            if success:
                 console.print(f"✅ [green]Deleted {post.platform} post {post.post_id}[/green]")
-                deleted_count += 1
-                
-                # Remove from state
-                state_manager.remove_post(post.post_id)
-            else:
-                console.print(f"❌ [red]Failed to delete {post.platform} post {post.post_id}: {result.error_message or 'Unknown error'}[/red]")
-                failed_count += 1
-                
-        except Exception as e:
-            console.print(f"❌ [red]Error deleting {post.platform} post {post.post_id}: {e}[/red]")
-            failed_count += 1
-        finally:
-            # Always cleanup platform resources
-            if platform_instance:
-                try:
-                    await platform_instance.cleanup()
-                except Exception as e:
-                    console.print(f"⚠️  [yellow]Warning: cleanup failed for {post.platform}: {e}[/yellow]")
+            
+            # Remove from state
+            state_manager.remove_post(post.post_id)
+        else:
+            console.print(f"❌ [red]Failed to delete {post.platform} post {post.post_id}: {outcome.error}[/red]")
+    
+    summary = await engine.delete_posts(posts_to_delete, credentials, on_result=on_result)
+    deleted_count = summary.deleted_count
+    failed_count = summary.failed_count
     
     # Summary
     console.print(f"\n[bold]Destruction Summary:[/bold]")
@@ -177,13 +157,13 @@ async def execute_destruction(posts_to_delete, config, state_manager, target_pla
         console.print("This will clear campaign-specific content from your social media profiles.")
         
         if Confirm.ask("Restore profiles to clean state?"):
-            await _restore_original_profiles(config, target_platform)
+            await _restore_original_profiles(config, target_platform, pool)
         else:
             console.print("⏭️  [yellow]Profile restoration skipped[/yellow]")
             console.print("💡 [blue]To restore later, run: [cyan]aetherpost destroy --platform <platform>[/cyan][/blue]")
 
 
-async def _restore_original_profiles(config, target_platform=None):
+async def _restore_original_profiles(config, target_platform=None, pool=None):
     """Restore original profiles by clearing campaign-specific content."""
     
     console.print("\n[bold blue]🔄 Profile Restoration[/bold blue]")
@@ -210,14 +190,18 @@ async def _restore_original_profiles(config, target_platform=None):
                 console.print(f"⚠️  [yellow]No credentials for {platform_name}, skipping profile restoration[/yellow]")
                 continue
             
-            # Create platform instance
-            platform_instance = platform_factory.create_platform(
-                platform_name=platform_name,
-                credentials=platform_credentials
-            )
+            # Create platform instance and authenticate, reusing a pooled login if available
+            if pool is not None:
+                platform_instance = await pool.acquire(platform_name, platform_credentials)
+            else:
+                platform_instance = platform_factory.create_platform(
+                    platform_name=platform_name,
+                    credentials=platform_credentials
+                )
+                if not await platform_instance.authenticate():
+                    platform_instance = None
             
-            # Authenticate
-            if not await platform_instance.authenticate():
+            if platform_instance is None:
                 console.print(f"❌ [red]Authentication failed for {platform_name}, cannot restore profile[/red]")
                 continue
             
@@ -238,8 +222,11 @@ async def _restore_original_profiles(config, target_platform=None):
             else:
                 console.print(f"❌ [red]Failed to restore {platform_name} profile: {result.error_message or 'Unknown error'}[/red]")
             
-            # Cleanup
-            await platform_instance.cleanup()
+            # Cleanup (pooled instances are closed by the pool's owner)
+            if pool is not None:
+                await pool.release(platform_instance)
+            else:
+                await platform_instance.cleanup()
             
         except Exception as e:
             console.print(f"❌ [red]Error restoring {platform_name} profile: {e}[/red]")
@@ -56,18 +56,33 @@ async def generate_preview(config):
     config_loader = ConfigLoader()
     credentials = config_loader.load_credentials()
     
-    # Initialize content generator
+    # Initialize content generator, closing its AI clients once the preview is shown
     content_generator = ContentGenerator(credentials)
+    try:
+        await show_preview(config, credentials, content_generator)
+    finally:
+        await content_generator.close()
+
+
+async def show_preview(config, credentials, content_generator):
+    """Generate content with ``content_generator`` and display the preview."""
+    
+    # Generate content for all platforms in a single request
+    console.print(f"⠋ Generating content for {', '.join(config.platforms)}...")
+    try:
+        batch_content = await content_generator.generate_content_batch(config, config.platforms)
+    except Exception as e:
+        console.print(f"⚠️  [yellow]Batch generation failed, generating per platform: {e}[/yellow]")
+        batch_content = {}
     
-    # Generate content for each platform
     platform_previews = []
     
     for platform_name in config.platforms:
         try:
-            console.print(f"⠋ Generating content for {platform_name}...")
-            
-            # Generate raw content using existing content generator
-            content_data = await content_generator.generate_content(config, platform_name)
+            content_data = batch_content.get(platform_name)
+            if content_data is None:
+                console.print(f"⠋ Generating content for {platform_name}...")
+                content_data = await content_generator.generate_content(config, platform_name)
             
             # Create Content object for new platform system
             content = Content(
@@ -12,7 +12,6 @@ from rich.progress import track
 from pathlib import Path
 
 from ...core.scheduler.scheduler import PostingScheduler
-from ...core.scheduler.background import BackgroundScheduler, create_scheduler_daemon, stop_scheduler_daemon
 from ...core.scheduler.models import FrequencyType, ScheduleStatus
 from ...core.config.parser import ConfigLoader
 
@@ -109,10 +108,12 @@ def create(
 def start(
     campaign_config: str = typer.Option("campaign.yaml", "--config", "-c", help="Campaign configuration file"),
     check_interval: int = typer.Option(60, "--interval", "-i", help="Check interval in seconds"),
+    workers: int = typer.Option(4, "--workers", "-w", help="Maximum posts to publish concurrently"),
     daemon: bool = typer.Option(False, "--daemon", "-d", help="Run as background daemon"),
     foreground: bool = typer.Option(False, "--foreground", "-f", help="Run in foreground")
 ):
     """Start the automated posting scheduler."""
+    from ...core.scheduler.background import BackgroundScheduler, create_scheduler_daemon
     
     if daemon and foreground:
         console.print("❌ [red]Cannot use both --daemon and --foreground[/red]")
@@ -136,6 +137,7 @@ def start(
         f"[bold green]Starting Automated Posting Scheduler[/bold green]\n"
         f"📁 Campaign: {campaign_config}\n"
         f"⏰ Check interval: {check_interval} seconds\n"
+        f"👷 Workers: {workers}\n"
         f"📝 Pending posts: {pending_count}",
         title="🚀 Scheduler Startup"
     ))
@@ -144,7 +146,8 @@ def start(
         # Run as daemon
         success = create_scheduler_daemon(
             campaign_file=campaign_config,
-            check_interval=check_interval
+            check_interval=check_interval,
+            max_concurrent_posts=workers
         )
         
         if success:
@@ -160,7 +163,8 @@ def start(
         async def run_foreground():
             background_scheduler = BackgroundScheduler(
                 campaign_file=campaign_config,
-                check_interval_seconds=check_interval
+                check_interval_seconds=check_interval,
+                max_concurrent_posts=workers
             )
             
             try:
@@ -180,6 +184,7 @@ def start(
 @scheduler_app.command()
 def stop():
     """Stop the automated posting scheduler daemon."""
+    from ...core.scheduler.background import stop_scheduler_daemon
     
     console.print(Panel(
         "[bold red]Stopping Automated Posting Scheduler[/bold red]",
@@ -206,7 +206,10 @@ async def test_setup():
             from ...core.content.generator import ContentGenerator
             
             content_generator = ContentGenerator(credentials)
-            test_content = await content_generator.generate_content(config, config.platforms[0])
+            try:
+                test_content = await content_generator.generate_content(config, config.platforms[0])
+            finally:
+                await content_generator.close()
             
             if test_content and test_content.get("text"):
                 progress.update(task3, description="✅ Content generation working")
@@ -357,6 +360,7 @@ def reset():
     files_to_remove = [
         Path("campaign.yaml"),
         Path("promo.state.json"),
+        Path("promo.state.db"),
         Path(".aetherpost")
     ]
     
@@ -0,0 +1,57 @@
+"""Lazily imported CLI sub-apps, so startup only pays for the command that runs."""
+
+import importlib
+from dataclasses import dataclass
+from typing import Dict, List
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+@dataclass
+class LazySubcommand:
+    """A typer sub-app registered by import path instead of by object."""
+    module: str
+    attr: str
+    help: str
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Typer group whose ``lazy_subcommands`` are imported only when invoked.
+
+    Listing commands in ``--help`` uses a placeholder carrying the
+    registered help text, so the sub-app module (and everything it
+    imports) is loaded only when the command is actually resolved.
+    Subclass and set ``lazy_subcommands`` to register them.
+    """
+    
+    lazy_subcommands: Dict[str, LazySubcommand] = {}
+    
+    def list_commands(self, ctx) -> List[str]:
+        names = list(super().list_commands(ctx))
+        return names + [name for name in self.lazy_subcommands if name not in names]
+    
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            entry = self.lazy_subcommands[cmd_name]
+            return TyperCommand(name=cmd_name, help=entry.help, short_help=entry.help)
+        return command
+    
+    def resolve_command(self, ctx, args):
+        cmd_name, command, args = super().resolve_command(ctx, args)
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            command = self._load(cmd_name)
+        return cmd_name, command, args
+    
+    def _load(self, cmd_name: str):
+        """Import a lazy sub-app and register it as a real command."""
+        entry = self.lazy_subcommands[cmd_name]
+        sub_app = getattr(importlib.import_module(entry.module), entry.attr)
+        command = typer.main.get_group(sub_app)
+        command.name = cmd_name
+        if not command.help:
+            command.help = entry.help
+        self.add_command(command, cmd_name)
+        return command
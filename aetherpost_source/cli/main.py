@@ -3,26 +3,36 @@
 import typer
 from rich.console import Console
 
-# Import enhanced error handling and UI
-from .utils.ui import ui, handle_cli_errors
-from ..core.exceptions import AetherPostError, ErrorCode, create_user_friendly_error
-from ..core.logging.logger import logger, audit
-from ..core.config.unified import config_manager
 from .banner import show_banner, show_command_header
+from .lazy import LazySubcommand, LazyTyperGroup
+
+# Command modules and their dependencies (platform SDKs, aiohttp, the
+# config manager and logger) are imported only when a command runs, so
+# `--help` and unrelated commands start fast.
+
+
+class AetherPostGroup(LazyTyperGroup):
+    """Top-level command group with lazily imported management sub-apps."""
+    
+    lazy_subcommands = {
+        "profile": LazySubcommand(
+            f"{__package__}.commands.profile", "profile_app",
+            "Generate and manage social media profiles"
+        ),
+        "scheduler": LazySubcommand(
+            f"{__package__}.commands.scheduler", "scheduler_app",
+            "Manage automated posting schedules"
+        ),
+    }
 
-from .commands.init import init_main
-from .commands.plan import plan_main
-from .commands.apply import apply_main
-from .commands.destroy import destroy_main
-from .commands.profile import profile_app
-from .commands.scheduler import scheduler_app
 
 # Create main CLI app
 app = typer.Typer(
     name="aetherpost",
     help="🚀 AetherPost - Promotion as Code",
     add_completion=False,
-    rich_markup_mode="rich"
+    rich_markup_mode="rich",
+    cls=AetherPostGroup
 )
 
 console = Console()
@@ -40,6 +50,9 @@ def main_callback(
     banner: bool = typer.Option(True, "--banner/--no-banner", help="Show ASCII art banner")
 ):
     """🚀 AetherPost - Promotion as Code"""
+    from ..core.logging.logger import logger
+    logger.configure()
+    
     if banner:
         # Show banner for main command only, not subcommands
         import sys
@@ -54,6 +67,7 @@ def init_with_banner(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be created")
 ):
     """Initialize campaign configuration"""
+    from .commands.init import init_main
     show_command_header("init", "🎯 Initialize your social media campaign")
     return init_main(campaign_name, interactive, platforms, dry_run)
 
@@ -63,6 +77,7 @@ def plan_with_banner(
     output_format: str = typer.Option("rich", "--format", help="Output format (rich, json, markdown)")
 ):
     """Preview campaign content"""
+    from .commands.plan import plan_main
     show_command_header("plan", "👀 Preview your campaign content")
     return plan_main(config_file, platform, output_format)
 
@@ -72,6 +87,7 @@ def apply_with_banner(
     scheduler_interval: int = typer.Option(60, "--interval", help="Scheduler check interval in seconds")
 ):
     """Execute campaign"""
+    from .commands.apply import apply_main
     show_command_header("apply", "🚀 Execute your campaign")
     return apply_main(config_file, no_scheduler, scheduler_interval)
 
@@ -82,6 +98,7 @@ def destroy_with_banner(
     no_profile_restore: bool = typer.Option(False, "--no-profile-restore", help="Skip profile restoration after cleanup")
 ):
     """Delete posted content and clean up campaign resources"""
+    from .commands.destroy import destroy_main
     show_command_header("destroy", "🗑️ Clean up your campaign")
     return destroy_main(config_file, platform, yes, no_profile_restore)
 
@@ -91,9 +108,7 @@ app.command(name="plan", help="Preview campaign content")(plan_with_banner)
 app.command(name="apply", help="Execute campaign")(apply_with_banner)
 app.command(name="destroy", help="Delete posted content and clean up")(destroy_with_banner)
 
-# Advanced management commands
-app.add_typer(profile_app, name="profile", help="Generate and manage social media profiles")
-app.add_typer(scheduler_app, name="scheduler", help="Manage automated posting schedules")
+# Advanced management commands are registered lazily on AetherPostGroup
 
 
 # Removed version and status commands to maintain simplicity
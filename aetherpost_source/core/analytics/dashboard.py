@@ -1,13 +1,20 @@
 """Advanced analytics dashboard and insights generation."""
 
+import calendar
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-import statistics
 from dataclasses import dataclass, asdict
 
+import numpy as np
+
 from ..state.manager import StateManager
+from .frame import (
+    PostFrame, LENGTH_BUCKETS, CTA_TYPES, CONTENT_THEMES, SEASONS, MONTH_SEASONS,
+    group_stats, ranked_groups
+)
+from .incremental import IncrementalPostFrame, high_water_mark
 
 
 @dataclass
@@ -79,9 +86,12 @@ class CompetitorInsights:
 class AnalyticsDashboard:
     """Advanced analytics dashboard for AetherPost campaigns."""
     
-    def __init__(self):
+    def __init__(self, report_ttl: int = 300):
         self.state_manager = StateManager()
         self.analytics_cache = self._load_analytics_cache()
+        self.frame_cache = IncrementalPostFrame()
+        # Seconds a cached report is reused while the state is unchanged
+        self.report_ttl = report_ttl
     
     def _load_analytics_cache(self) -> Dict:
         """Load cached analytics data."""
@@ -102,33 +112,56 @@ class AnalyticsDashboard:
         with open(cache_file, "w") as f:
             json.dump(self.analytics_cache, f, indent=2, default=str)
     
+    def _get_cached_report(self, mark: Dict[str, str], days: int) -> Optional[Dict]:
+        """Return the cached report if it was built from this state version recently."""
+        cache = self.analytics_cache
+        if cache.get("high_water_mark") != mark or cache.get("days") != days or not cache.get("last_updated"):
+            return None
+        
+        age = (datetime.utcnow() - datetime.fromisoformat(cache["last_updated"])).total_seconds()
+        return cache.get("cached_insights") if age < self.report_ttl else None
+    
     def generate_comprehensive_report(self, days: int = 30) -> Dict:
         """Generate comprehensive analytics report."""
         
-        state = self.state_manager.load_state()
-        if not state or not state.posts:
+        backend = self.state_manager.backend
+        # First use of the backend imports legacy JSON state
+        if not backend.exists() and not self.state_manager.load_state():
+            return {"error": "No data available for analysis"}
+        
+        campaign = backend.load_campaign()
+        if campaign is None:
+            return {"error": "No data available for analysis"}
+        
+        mark = high_water_mark(campaign)
+        cached_report = self._get_cached_report(mark, days)
+        if cached_report:
+            return cached_report
+        
+        # Columnar view shared by all insight calculations, updated with
+        # only the posts and metrics that changed since the last run;
+        # unchanged posts are never loaded
+        frame = self.frame_cache.refresh_from_backend(backend)
+        if frame is None or not len(frame):
             return {"error": "No data available for analysis"}
         
         # Filter posts by date range
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        recent_posts = [
-            post for post in state.posts 
-            if post.created_at >= cutoff_date
-        ]
+        frame = frame.select(frame.created_at >= np.datetime64(cutoff_date, "s"))
         
-        if not recent_posts:
+        if not len(frame):
             return {"error": f"No posts found in the last {days} days"}
         
         # Generate insights
-        platform_insights = self._generate_platform_insights(recent_posts)
-        content_insights = self._generate_content_insights(recent_posts)
-        time_insights = self._generate_time_insights(recent_posts)
+        platform_insights = self._generate_platform_insights(frame)
+        content_insights = self._generate_content_insights(frame)
+        time_insights = self._generate_time_insights(frame)
         
         # Overall metrics
-        overall_metrics = self._calculate_overall_metrics(recent_posts)
+        overall_metrics = self._calculate_overall_metrics(frame)
         
         # Competitive insights (if available)
-        competitive_insights = self._generate_competitive_insights(recent_posts)
+        competitive_insights = self._generate_competitive_insights(frame)
         
         # Recommendations
         recommendations = self._generate_recommendations(
@@ -147,65 +180,46 @@ class AnalyticsDashboard:
             "time_insights": asdict(time_insights),
             "competitive_insights": asdict(competitive_insights) if competitive_insights else None,
             "recommendations": recommendations,
-            "data_quality": self._assess_data_quality(recent_posts)
+            "data_quality": self._assess_data_quality(frame)
         }
         
         # Cache the report
         self.analytics_cache["last_updated"] = datetime.utcnow().isoformat()
+        self.analytics_cache["high_water_mark"] = mark
+        self.analytics_cache["days"] = days
         self.analytics_cache["cached_insights"] = report
         self._save_analytics_cache()
         
         return report
     
-    def _generate_platform_insights(self, posts: List) -> Dict[str, PlatformInsights]:
+    def _generate_platform_insights(self, frame: PostFrame) -> Dict[str, PlatformInsights]:
         """Generate insights for each platform."""
         platform_insights = {}
         
-        # Group posts by platform
-        platforms = {}
-        for post in posts:
-            if post.platform not in platforms:
-                platforms[post.platform] = []
-            platforms[post.platform].append(post)
-        
-        for platform, platform_posts in platforms.items():
-            # Calculate metrics
-            total_posts = len(platform_posts)
+        for code, platform in self._active_platforms(frame):
+            platform_frame = frame.select(frame.platform_codes == code)
             
-            engagements = []
-            for post in platform_posts:
-                if hasattr(post, 'metrics') and post.metrics:
-                    engagement = self._calculate_post_engagement(post.metrics)
-                    engagements.append(engagement)
+            # Calculate metrics
+            total_posts = len(platform_frame)
+            measured = np.flatnonzero(platform_frame.has_metrics)
+            engagements = platform_frame.engagement[measured]
             
-            total_engagement = sum(engagements)
+            total_engagement = float(engagements.sum())
             avg_engagement = total_engagement / total_posts if total_posts > 0 else 0
             
             # Find best and worst performing posts
             best_post = None
             worst_post = None
             
-            if engagements:
-                max_engagement = max(engagements)
-                min_engagement = min(engagements)
+            if engagements.size:
+                max_engagement = engagements.max()
+                min_engagement = engagements.min()
                 
-                for i, post in enumerate(platform_posts):
-                    if engagements[i] == max_engagement:
-                        best_post = self._serialize_post(post)
-                    elif engagements[i] == min_engagement:
-                        worst_post = self._serialize_post(post)
-            
-            # Optimal posting times
-            optimal_times = self._find_optimal_posting_times(platform_posts)
-            
-            # Top hashtags
-            top_hashtags = self._analyze_hashtag_performance(platform_posts)
-            
-            # Engagement trend (last 30 days)
-            engagement_trend = self._calculate_engagement_trend(platform_posts)
-            
-            # Audience growth (simplified calculation)
-            audience_growth = self._estimate_audience_growth(platform_posts)
+                best = measured[np.flatnonzero(engagements == max_engagement)[-1]]
+                best_post = self._serialize_post(self._post_at(platform_frame, best))
+                if min_engagement != max_engagement:
+                    worst = measured[np.flatnonzero(engagements == min_engagement)[-1]]
+                    worst_post = self._serialize_post(self._post_at(platform_frame, worst))
             
             platform_insights[platform] = PlatformInsights(
                 platform=platform,
@@ -214,125 +228,52 @@ class AnalyticsDashboard:
                 avg_engagement_per_post=avg_engagement,
                 best_performing_post=best_post,
                 worst_performing_post=worst_post,
-                optimal_posting_times=optimal_times,
-                top_hashtags=top_hashtags,
-                engagement_trend=engagement_trend,
-                audience_growth=audience_growth
+                optimal_posting_times=self._find_optimal_posting_times(platform_frame),
+                top_hashtags=self._analyze_hashtag_performance(platform_frame),
+                engagement_trend=self._calculate_engagement_trend(platform_frame),
+                audience_growth=self._estimate_audience_growth(platform_frame)
             )
         
         return platform_insights
     
-    def _generate_content_insights(self, posts: List) -> ContentInsights:
+    def _generate_content_insights(self, frame: PostFrame) -> ContentInsights:
         """Generate content performance insights."""
+        content = frame.select(frame.has_content)
+        engagement = content.engagement
         
-        # Analyze content length effectiveness
-        length_performance = {}
-        style_performance = {}
-        cta_performance = {}
-        emoji_scores = []
-        hashtag_performance = {}
+        # Length, style and CTA effectiveness
+        length_ranking = ranked_groups(
+            LENGTH_BUCKETS, *group_stats(content.length_bucket, engagement, len(LENGTH_BUCKETS))
+        )
         
-        for post in posts:
-            if not hasattr(post, 'content') or not post.content:
-                continue
-                
-            engagement = self._calculate_post_engagement(getattr(post, 'metrics', {}))
-            content_text = post.content.get('text', '')
-            
-            # Length analysis
-            length = len(content_text)
-            length_bucket = self._categorize_length(length)
-            if length_bucket not in length_performance:
-                length_performance[length_bucket] = []
-            length_performance[length_bucket].append(engagement)
-            
-            # Style analysis (if available in post metadata)
-            style = getattr(post, 'style', None)
-            if style:
-                if style not in style_performance:
-                    style_performance[style] = []
-                style_performance[style].append(engagement)
-            
-            # CTA analysis
-            cta_type = self._extract_cta_type(content_text)
-            if cta_type not in cta_performance:
-                cta_performance[cta_type] = []
-            cta_performance[cta_type].append(engagement)
-            
-            # Emoji analysis
-            emoji_count = self._count_emojis(content_text)
-            emoji_scores.append((emoji_count, engagement))
-            
-            # Hashtag analysis
-            hashtags = self._extract_hashtags(content_text)
-            for hashtag in hashtags:
-                if hashtag not in hashtag_performance:
-                    hashtag_performance[hashtag] = []
-                hashtag_performance[hashtag].append(engagement)
-        
-        # Find optimal values
-        optimal_length = self._find_optimal_length(length_performance)
-        best_style = self._find_best_performer(style_performance)
-        best_cta = self._find_best_performer(cta_performance)
-        emoji_effectiveness = self._analyze_emoji_effectiveness(emoji_scores)
-        
-        # Process hashtag performance
-        hashtag_avg_performance = {
-            tag: statistics.mean(scores) 
-            for tag, scores in hashtag_performance.items() 
-            if len(scores) >= 2
-        }
+        has_style = content.style_codes >= 0
+        style_ranking = ranked_groups(
+            content.styles, *group_stats(content.style_codes[has_style], engagement[has_style], len(content.styles))
+        )
+        
+        cta_ranking = ranked_groups(CTA_TYPES, *group_stats(content.cta, engagement, len(CTA_TYPES)))
         
-        # Content themes (simplified)
-        content_themes = self._identify_content_themes(posts)
+        # Hashtags used at least twice
+        hashtag_performance = dict(ranked_groups(
+            content.hashtags,
+            *group_stats(content.hashtag_codes, engagement[content.hashtag_post], len(content.hashtags)),
+            min_count=2
+        ))
         
         return ContentInsights(
-            optimal_length=optimal_length,
-            best_style=best_style,
-            best_cta_type=best_cta,
-            emoji_effectiveness=emoji_effectiveness,
-            hashtag_performance=hashtag_avg_performance,
-            content_themes=content_themes
+            optimal_length=self._find_optimal_length(length_ranking),
+            best_style=style_ranking[0][0] if style_ranking else "unknown",
+            best_cta_type=cta_ranking[0][0] if cta_ranking else "unknown",
+            emoji_effectiveness=self._analyze_emoji_effectiveness(content),
+            hashtag_performance=hashtag_performance,
+            content_themes=self._identify_content_themes(content)
         )
     
-    def _generate_time_insights(self, posts: List) -> TimeInsights:
+    def _generate_time_insights(self, frame: PostFrame) -> TimeInsights:
         """Generate time-based posting insights."""
         
-        day_performance = {}
-        hour_performance = {}
-        
-        for post in posts:
-            if not hasattr(post, 'created_at'):
-                continue
-                
-            engagement = self._calculate_post_engagement(getattr(post, 'metrics', {}))
-            
-            # Day analysis
-            day_name = post.created_at.strftime('%A')
-            if day_name not in day_performance:
-                day_performance[day_name] = []
-            day_performance[day_name].append(engagement)
-            
-            # Hour analysis
-            hour = post.created_at.hour
-            if hour not in hour_performance:
-                hour_performance[hour] = []
-            hour_performance[hour].append(engagement)
-        
-        # Calculate averages and sort
-        day_averages = {
-            day: statistics.mean(scores) 
-            for day, scores in day_performance.items()
-        }
-        
-        hour_averages = {
-            hour: statistics.mean(scores) 
-            for hour, scores in hour_performance.items()
-        }
-        
-        # Sort by performance
-        sorted_days = sorted(day_averages.items(), key=lambda x: x[1], reverse=True)
-        sorted_hours = sorted(hour_averages.items(), key=lambda x: x[1], reverse=True)
+        sorted_days = ranked_groups(list(calendar.day_name), *group_stats(frame.weekday, frame.engagement, 7))
+        sorted_hours = ranked_groups(range(24), *group_stats(frame.hour, frame.engagement, 24))
         
         best_days = [day for day, _ in sorted_days[:3]]
         worst_days = [day for day, _ in sorted_days[-2:]]
@@ -340,7 +281,7 @@ class AnalyticsDashboard:
         worst_hours = [hour for hour, _ in sorted_hours[-2:]]
         
         # Seasonal trends (simplified)
-        seasonal_trends = self._analyze_seasonal_trends(posts)
+        seasonal_trends = self._analyze_seasonal_trends(frame)
         
         return TimeInsights(
             best_days=best_days,
@@ -350,14 +291,12 @@ class AnalyticsDashboard:
             seasonal_trends=seasonal_trends
         )
     
-    def _generate_competitive_insights(self, posts: List) -> Optional[CompetitorInsights]:
+    def _generate_competitive_insights(self, frame: PostFrame) -> Optional[CompetitorInsights]:
         """Generate competitive analysis insights."""
         
         # This would require external data sources
         # For now, return industry benchmarks based on platform
         
-        platforms = set(post.platform for post in posts)
-        
         # Industry benchmarks (these would come from external APIs)
         benchmarks = {
             "twitter": {"avg_engagement_rate": 0.045, "avg_reach": 1000},
@@ -368,13 +307,12 @@ class AnalyticsDashboard:
         industry_benchmarks = {}
         performance_vs_industry = {}
         
-        for platform in platforms:
+        for code, platform in self._active_platforms(frame):
             if platform in benchmarks:
                 industry_benchmarks[platform] = benchmarks[platform]
                 
                 # Calculate our performance vs industry
-                our_posts = [p for p in posts if p.platform == platform]
-                our_engagement_rate = self._calculate_avg_engagement_rate(our_posts)
+                our_engagement_rate = self._calculate_avg_engagement_rate(frame, frame.platform_codes == code)
                 
                 performance_vs_industry[platform] = {
                     "engagement_rate_ratio": our_engagement_rate / benchmarks[platform]["avg_engagement_rate"]
@@ -489,36 +427,29 @@ class AnalyticsDashboard:
         
         return recommendations
     
-    def _calculate_overall_metrics(self, posts: List) -> Dict:
+    def _calculate_overall_metrics(self, frame: PostFrame) -> Dict:
         """Calculate overall metrics for the period."""
         
-        total_posts = len(posts)
-        total_engagement = sum(
-            self._calculate_post_engagement(getattr(post, 'metrics', {}))
-            for post in posts
-        )
+        total_posts = len(frame)
+        engagements = frame.engagement
+        total_engagement = float(engagements.sum())
         
         avg_engagement_per_post = total_engagement / total_posts if total_posts > 0 else 0
         
         # Platform distribution
-        platform_distribution = {}
-        for post in posts:
-            platform = post.platform
-            platform_distribution[platform] = platform_distribution.get(platform, 0) + 1
+        counts = np.bincount(frame.platform_codes, minlength=len(frame.platforms))
+        platform_distribution = {
+            platform: int(counts[code]) for code, platform in self._active_platforms(frame)
+        }
         
         # Engagement distribution
-        engagements = [
-            self._calculate_post_engagement(getattr(post, 'metrics', {}))
-            for post in posts
-        ]
-        
         engagement_stats = {}
-        if engagements:
+        if total_posts:
             engagement_stats = {
-                "min": min(engagements),
-                "max": max(engagements),
-                "median": statistics.median(engagements),
-                "std_dev": statistics.stdev(engagements) if len(engagements) > 1 else 0
+                "min": float(engagements.min()),
+                "max": float(engagements.max()),
+                "median": float(np.median(engagements)),
+                "std_dev": float(np.std(engagements, ddof=1)) if total_posts > 1 else 0
             }
         
         return {
@@ -530,19 +461,12 @@ class AnalyticsDashboard:
             "posting_frequency": total_posts / 30  # Posts per day
         }
     
-    def _assess_data_quality(self, posts: List) -> Dict:
+    def _assess_data_quality(self, frame: PostFrame) -> Dict:
         """Assess the quality and completeness of data."""
         
-        total_posts = len(posts)
-        posts_with_metrics = sum(
-            1 for post in posts 
-            if hasattr(post, 'metrics') and post.metrics
-        )
-        
-        posts_with_content = sum(
-            1 for post in posts 
-            if hasattr(post, 'content') and post.content
-        )
+        total_posts = len(frame)
+        posts_with_metrics = int(frame.has_metrics.sum())
+        posts_with_content = int(frame.has_content.sum())
         
         data_completeness = posts_with_metrics / total_posts if total_posts > 0 else 0
         content_completeness = posts_with_content / total_posts if total_posts > 0 else 0
@@ -587,26 +511,21 @@ class AnalyticsDashboard:
         return recommendations
     
     # Helper methods
-    def _calculate_post_engagement(self, metrics: Dict) -> float:
-        """Calculate engagement score for a post."""
-        if not metrics:
-            return 0.0
-        
-        weights = {
-            "likes": 1.0,
-            "shares": 2.0,
-            "comments": 3.0,
-            "clicks": 1.5,
-            "retweets": 2.0,
-            "replies": 3.0
-        }
-        
-        total_score = 0.0
-        for metric, value in metrics.items():
-            if metric in weights and isinstance(value, (int, float)):
-                total_score += value * weights[metric]
-        
-        return total_score
+    def _active_platforms(self, frame: PostFrame) -> List[Tuple[int, str]]:
+        """Platform codes and labels that have at least one post in the frame.
+        
+        Selections keep the full label list, so platforms with no posts in the
+        window (or whose posts were removed) are skipped here.
+        """
+        counts = np.bincount(frame.platform_codes, minlength=len(frame.platforms))
+        return [(int(code), frame.platforms[code]) for code in np.flatnonzero(counts)]
+    
+    def _post_at(self, frame: PostFrame, row: int):
+        """The record behind a frame row, read from the backend if the frame has none."""
+        if frame.posts:
+            return frame.posts[row]
+        posts = self.state_manager.backend.get_posts([str(frame.ids[row])])
+        return posts[0] if posts else None
     
     def _serialize_post(self, post) -> Dict:
         """Serialize post for JSON output."""
@@ -618,262 +537,98 @@ class AnalyticsDashboard:
             "metrics": getattr(post, 'metrics', {})
         }
     
-    def _find_optimal_posting_times(self, posts: List) -> List[int]:
+    def _find_optimal_posting_times(self, frame: PostFrame) -> List[int]:
         """Find optimal posting times for a platform."""
-        hour_performance = {}
-        
-        for post in posts:
-            if hasattr(post, 'created_at'):
-                hour = post.created_at.hour
-                engagement = self._calculate_post_engagement(getattr(post, 'metrics', {}))
-                
-                if hour not in hour_performance:
-                    hour_performance[hour] = []
-                hour_performance[hour].append(engagement)
-        
-        # Calculate averages and return top 3 hours
-        hour_averages = {
-            hour: statistics.mean(scores) 
-            for hour, scores in hour_performance.items() 
-            if len(scores) >= 2
-        }
-        
-        sorted_hours = sorted(hour_averages.items(), key=lambda x: x[1], reverse=True)
-        return [hour for hour, _ in sorted_hours[:3]]
+        hours = ranked_groups(range(24), *group_stats(frame.hour, frame.engagement, 24), min_count=2)
+        return [hour for hour, _ in hours[:3]]
     
-    def _analyze_hashtag_performance(self, posts: List) -> List[Tuple[str, float]]:
+    def _analyze_hashtag_performance(self, frame: PostFrame) -> List[Tuple[str, float]]:
         """Analyze hashtag performance."""
-        hashtag_performance = {}
-        
-        for post in posts:
-            if hasattr(post, 'content') and post.content:
-                content_text = post.content.get('text', '')
-                hashtags = self._extract_hashtags(content_text)
-                engagement = self._calculate_post_engagement(getattr(post, 'metrics', {}))
-                
-                for hashtag in hashtags:
-                    if hashtag not in hashtag_performance:
-                        hashtag_performance[hashtag] = []
-                    hashtag_performance[hashtag].append(engagement)
-        
-        # Calculate averages and return top performers
-        hashtag_averages = {
-            tag: statistics.mean(scores) 
-            for tag, scores in hashtag_performance.items() 
-            if len(scores) >= 2
-        }
-        
-        sorted_hashtags = sorted(hashtag_averages.items(), key=lambda x: x[1], reverse=True)
-        return sorted_hashtags[:5]
+        return ranked_groups(
+            frame.hashtags,
+            *group_stats(frame.hashtag_codes, frame.engagement[frame.hashtag_post], len(frame.hashtags)),
+            min_count=2
+        )[:5]
     
-    def _calculate_engagement_trend(self, posts: List) -> List[float]:
+    def _calculate_engagement_trend(self, frame: PostFrame) -> List[float]:
         """Calculate engagement trend over time."""
-        # Group posts by day and calculate daily engagement
-        daily_engagement = {}
-        
-        for post in posts:
-            if hasattr(post, 'created_at'):
-                date_key = post.created_at.date()
-                engagement = self._calculate_post_engagement(getattr(post, 'metrics', {}))
-                
-                if date_key not in daily_engagement:
-                    daily_engagement[date_key] = []
-                daily_engagement[date_key].append(engagement)
-        
-        # Calculate daily averages
-        daily_averages = {
-            date: statistics.mean(scores) 
-            for date, scores in daily_engagement.items()
-        }
+        # Daily average engagement, in date order
+        days, day_codes = np.unique(frame.day, return_inverse=True)
+        sums, counts = group_stats(day_codes, frame.engagement, len(days))
         
         # Return trend as list (last 30 days)
-        sorted_days = sorted(daily_averages.items())
-        return [avg for _, avg in sorted_days[-30:]]
+        return (sums / np.maximum(counts, 1))[-30:].tolist()
     
-    def _estimate_audience_growth(self, posts: List) -> float:
+    def _estimate_audience_growth(self, frame: PostFrame) -> float:
         """Estimate audience growth based on reach metrics."""
         # Simplified calculation based on reach changes
-        reach_values = []
-        
-        for post in posts:
-            if hasattr(post, 'metrics') and post.metrics:
-                reach = post.metrics.get('reach', 0)
-                if reach > 0:
-                    reach_values.append(reach)
+        reach_values = frame.reach[frame.has_metrics & (frame.reach > 0)]
         
         if len(reach_values) < 2:
             return 0.0
         
         # Simple growth calculation
-        early_avg = statistics.mean(reach_values[:len(reach_values)//2])
-        recent_avg = statistics.mean(reach_values[len(reach_values)//2:])
+        half = len(reach_values) // 2
+        early_avg = reach_values[:half].mean()
+        recent_avg = reach_values[half:].mean()
         
         if early_avg == 0:
             return 0.0
         
         growth_rate = ((recent_avg - early_avg) / early_avg) * 100
-        return growth_rate
+        return float(growth_rate)
     
     # Content analysis helpers
-    def _categorize_length(self, length: int) -> str:
-        """Categorize content length."""
-        if length < 100:
-            return "short"
-        elif length < 200:
-            return "medium"
-        else:
-            return "long"
-    
-    def _extract_cta_type(self, text: str) -> str:
-        """Extract call-to-action type from text."""
-        text_lower = text.lower()
-        
-        cta_patterns = {
-            "try": ["try", "test", "demo"],
-            "learn": ["learn", "discover", "find out"],
-            "get": ["get", "download", "install"],
-            "join": ["join", "sign up", "register"],
-            "visit": ["visit", "check out", "see"],
-            "buy": ["buy", "purchase", "order"]
-        }
-        
-        for cta_type, patterns in cta_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
-                return cta_type
-        
-        return "other"
-    
-    def _count_emojis(self, text: str) -> int:
-        """Count emojis in text."""
-        emoji_count = 0
-        for char in text:
-            if ord(char) > 127:  # Simple emoji detection
-                emoji_count += 1
-        return emoji_count
-    
-    def _extract_hashtags(self, text: str) -> List[str]:
-        """Extract hashtags from text."""
-        import re
-        return re.findall(r'#\w+', text)
-    
-    def _find_optimal_length(self, length_performance: Dict) -> int:
+    def _find_optimal_length(self, length_ranking: List[Tuple[str, float]]) -> int:
         """Find optimal content length."""
-        if not length_performance:
+        if not length_ranking:
             return 200  # Default
         
-        avg_performance = {
-            category: statistics.mean(scores) 
-            for category, scores in length_performance.items()
-        }
-        
-        best_category = max(avg_performance, key=avg_performance.get)
+        best_category = length_ranking[0][0]
         
         # Return representative length for category
         length_map = {"short": 80, "medium": 150, "long": 250}
         return length_map.get(best_category, 200)
     
-    def _find_best_performer(self, performance_dict: Dict) -> str:
-        """Find best performing item from performance dictionary."""
-        if not performance_dict:
-            return "unknown"
-        
-        avg_performance = {
-            item: statistics.mean(scores) 
-            for item, scores in performance_dict.items()
-        }
-        
-        return max(avg_performance, key=avg_performance.get)
-    
-    def _analyze_emoji_effectiveness(self, emoji_scores: List[Tuple[int, float]]) -> float:
+    def _analyze_emoji_effectiveness(self, frame: PostFrame) -> float:
         """Analyze emoji effectiveness."""
-        if not emoji_scores:
-            return 0.0
+        with_emoji = frame.engagement[frame.emoji_count > 0]
+        without_emoji = frame.engagement[frame.emoji_count == 0]
         
-        with_emoji = [score for count, score in emoji_scores if count > 0]
-        without_emoji = [score for count, score in emoji_scores if count == 0]
-        
-        if not with_emoji or not without_emoji:
+        if not with_emoji.size or not without_emoji.size:
             return 0.0
         
-        with_avg = statistics.mean(with_emoji)
-        without_avg = statistics.mean(without_emoji)
+        with_avg = with_emoji.mean()
+        without_avg = without_emoji.mean()
         
         if without_avg == 0:
             return 0.0
         
-        return (with_avg / without_avg - 1) * 100  # Percentage improvement
+        return float((with_avg / without_avg - 1) * 100)  # Percentage improvement
     
-    def _identify_content_themes(self, posts: List) -> List[Tuple[str, float]]:
+    def _identify_content_themes(self, frame: PostFrame) -> List[Tuple[str, float]]:
         """Identify content themes and their performance."""
-        # Simplified theme identification
-        themes = {
-            "product": ["product", "feature", "update", "release"],
-            "company": ["company", "team", "culture", "news"],
-            "educational": ["how", "why", "learn", "tutorial", "guide"],
-            "promotional": ["sale", "discount", "offer", "deal", "free"]
-        }
-        
-        theme_performance = {}
-        
-        for post in posts:
-            if hasattr(post, 'content') and post.content:
-                content_text = post.content.get('text', '').lower()
-                engagement = self._calculate_post_engagement(getattr(post, 'metrics', {}))
-                
-                for theme, keywords in themes.items():
-                    if any(keyword in content_text for keyword in keywords):
-                        if theme not in theme_performance:
-                            theme_performance[theme] = []
-                        theme_performance[theme].append(engagement)
-        
-        # Calculate averages and return sorted by performance
-        theme_averages = {
-            theme: statistics.mean(scores) 
-            for theme, scores in theme_performance.items() 
-            if len(scores) >= 2
-        }
-        
-        sorted_themes = sorted(theme_averages.items(), key=lambda x: x[1], reverse=True)
-        return sorted_themes
+        # Theme membership matrix against engagement gives per-theme totals
+        sums = frame.engagement @ frame.themes
+        counts = frame.themes.sum(axis=0)
+        return ranked_groups(list(CONTENT_THEMES), sums, counts, min_count=2)
     
-    def _analyze_seasonal_trends(self, posts: List) -> Dict[str, float]:
+    def _analyze_seasonal_trends(self, frame: PostFrame) -> Dict[str, float]:
         """Analyze seasonal trends."""
-        # Simplified seasonal analysis
-        seasonal_performance = {"spring": [], "summer": [], "fall": [], "winter": []}
+        seasons = MONTH_SEASONS[frame.month - 1]
+        sums, counts = group_stats(seasons, frame.engagement, len(SEASONS))
         
-        for post in posts:
-            if hasattr(post, 'created_at'):
-                month = post.created_at.month
-                engagement = self._calculate_post_engagement(getattr(post, 'metrics', {}))
-                
-                if month in [3, 4, 5]:
-                    seasonal_performance["spring"].append(engagement)
-                elif month in [6, 7, 8]:
-                    seasonal_performance["summer"].append(engagement)
-                elif month in [9, 10, 11]:
-                    seasonal_performance["fall"].append(engagement)
-                else:
-                    seasonal_performance["winter"].append(engagement)
-        
-        # Calculate averages
-        seasonal_averages = {}
-        for season, scores in seasonal_performance.items():
-            if scores:
-                seasonal_averages[season] = statistics.mean(scores)
-        
-        return seasonal_averages
+        return {
+            season: float(sums[i] / counts[i])
+            for i, season in enumerate(SEASONS)
+            if counts[i]
+        }
     
-    def _calculate_avg_engagement_rate(self, posts: List) -> float:
-        """Calculate average engagement rate for posts."""
-        rates = []
-        
-        for post in posts:
-            if hasattr(post, 'metrics') and post.metrics:
-                engagement = self._calculate_post_engagement(post.metrics)
-                impressions = post.metrics.get('impressions', 0)
-                
-                if impressions > 0:
-                    rate = (engagement / impressions) * 100
-                    rates.append(rate)
+    def _calculate_avg_engagement_rate(self, frame: PostFrame, mask: np.ndarray) -> float:
+        """Calculate average engagement rate for the selected posts."""
+        rated = mask & frame.has_metrics & (frame.impressions > 0)
+        if not rated.any():
+            return 0.0
         
-        return statistics.mean(rates) if rates else 0.0
\ No newline at end of file
+        rates = frame.engagement[rated] / frame.impressions[rated] * 100
+        return float(rates.mean())
@@ -0,0 +1,328 @@
+"""Columnar post representation for vectorized analytics."""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+# Weighted engagement score per metric
+ENGAGEMENT_WEIGHTS = {
+    "likes": 1.0,
+    "shares": 2.0,
+    "comments": 3.0,
+    "clicks": 1.5,
+    "retweets": 2.0,
+    "replies": 3.0
+}
+
+LENGTH_BUCKETS = ("short", "medium", "long")
+
+CTA_PATTERNS = {
+    "try": ["try", "test", "demo"],
+    "learn": ["learn", "discover", "find out"],
+    "get": ["get", "download", "install"],
+    "join": ["join", "sign up", "register"],
+    "visit": ["visit", "check out", "see"],
+    "buy": ["buy", "purchase", "order"]
+}
+CTA_TYPES = tuple(CTA_PATTERNS) + ("other",)
+
+CONTENT_THEMES = {
+    "product": ["product", "feature", "update", "release"],
+    "company": ["company", "team", "culture", "news"],
+    "educational": ["how", "why", "learn", "tutorial", "guide"],
+    "promotional": ["sale", "discount", "offer", "deal", "free"]
+}
+
+SEASONS = ("spring", "summer", "fall", "winter")
+# Season index for months 1-12
+MONTH_SEASONS = np.array([3, 3, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3])
+
+HASHTAG_PATTERN = re.compile(r'#\w+')
+
+_METRIC_COLUMNS = tuple(ENGAGEMENT_WEIGHTS) + ("impressions", "reach")
+
+
+_CTA_REGEXES = [
+    (cta_type, re.compile("|".join(re.escape(pattern) for pattern in patterns)))
+    for cta_type, patterns in CTA_PATTERNS.items()
+]
+_THEME_REGEXES = [
+    re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    for keywords in CONTENT_THEMES.values()
+]
+
+
+def extract_cta_type(text: str) -> str:
+    """Extract call-to-action type from text."""
+    text_lower = text.lower()
+    
+    for cta_type, regex in _CTA_REGEXES:
+        if regex.search(text_lower):
+            return cta_type
+    
+    return "other"
+
+
+def count_emojis(text: str) -> int:
+    """Count non-ASCII characters (simple emoji detection)."""
+    return len(text) - len(text.encode("ascii", "ignore"))
+
+
+def _text_features(text: str) -> Tuple[int, int, int, Tuple[bool, ...], List[str]]:
+    """Length, emoji count, CTA code, theme flags and hashtags for one text."""
+    text_lower = text.lower()
+    return (
+        len(text),
+        count_emojis(text),
+        CTA_TYPES.index(extract_cta_type(text)),
+        tuple(regex.search(text_lower) is not None for regex in _THEME_REGEXES),
+        HASHTAG_PATTERN.findall(text)
+    )
+
+
+def _metric_columns(metric_dicts: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """One float column per metric; non-numeric values count as zero."""
+    n = len(metric_dicts)
+    return {
+        key: np.array(
+            [value if isinstance(value, (int, float)) else 0.0
+             for value in (metrics.get(key, 0) for metrics in metric_dicts)],
+            dtype=float
+        ).reshape(n)
+        for key in _METRIC_COLUMNS
+    }
+
+
+def _engagement(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    return sum(columns[key] * weight for key, weight in ENGAGEMENT_WEIGHTS.items())
+
+
+def group_stats(codes: np.ndarray, values: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-group sums and counts for integer group codes in ``[0, size)``."""
+    sums = np.bincount(codes, weights=values, minlength=size)
+    counts = np.bincount(codes, minlength=size)
+    return sums, counts
+
+
+def ranked_groups(labels: Sequence,
+                  sums: np.ndarray,
+                  counts: np.ndarray,
+                  min_count: int = 1) -> List[Tuple[Any, float]]:
+    """(label, mean) pairs for groups with at least ``min_count`` members, best first."""
+    groups = np.flatnonzero(counts >= max(min_count, 1))
+    means = sums[groups] / counts[groups]
+    order = np.argsort(-means, kind="stable")
+    return [(labels[groups[i]], float(means[i])) for i in order]
+
+
+# Columns with one entry per post, and the label lists codes index into
+_ROW_COLUMNS = (
+    "ids", "created_at", "platform_codes", "engagement", "impressions", "reach", "has_metrics",
+    "has_content", "length", "emoji_count", "length_bucket", "cta", "style_codes", "themes"
+)
+_LABEL_COLUMNS = ("platforms", "styles", "hashtags")
+
+
+@dataclass
+class PostFrame:
+    """Post records laid out as parallel NumPy columns.
+
+    Built in a single pass over the posts; every insight is then a
+    vectorized group-by over these columns instead of another loop over
+    the records.
+    """
+    posts: List                  # PostRecords; empty for frames restored from the cache
+    ids: np.ndarray              # PostRecord.id
+    created_at: np.ndarray       # datetime64[s]
+    platform_codes: np.ndarray   # index into ``platforms``
+    platforms: List[str]
+    engagement: np.ndarray       # weighted engagement score
+    impressions: np.ndarray
+    reach: np.ndarray
+    has_metrics: np.ndarray
+    has_content: np.ndarray
+    length: np.ndarray
+    emoji_count: np.ndarray
+    length_bucket: np.ndarray    # index into LENGTH_BUCKETS
+    cta: np.ndarray              # index into CTA_TYPES
+    style_codes: np.ndarray      # index into ``styles``, -1 when unknown
+    styles: List[str]
+    themes: np.ndarray           # (posts, CONTENT_THEMES) membership
+    hashtag_post: np.ndarray     # post index of each hashtag occurrence
+    hashtag_codes: np.ndarray    # index into ``hashtags``
+    hashtags: List[str]
+    
+    @classmethod
+    def from_posts(cls, posts: Sequence) -> "PostFrame":
+        """Build the columns from post records."""
+        posts = list(posts)
+        n = len(posts)
+        
+        platform_index: Dict[str, int] = {}
+        style_index: Dict[str, int] = {}
+        hashtag_index: Dict[str, int] = {}
+        # Identical texts (e.g. the same message on several platforms) are analyzed once
+        text_features: Dict[str, tuple] = {}
+        
+        platform_codes = []
+        metric_dicts = []
+        style_codes = []
+        has_content = []
+        features = []
+        hashtag_post: List[int] = []
+        hashtag_codes: List[int] = []
+        
+        for i, post in enumerate(posts):
+            platform_codes.append(platform_index.setdefault(post.platform, len(platform_index)))
+            metric_dicts.append(getattr(post, 'metrics', None) or {})
+            
+            style = getattr(post, 'style', None)
+            style_codes.append(style_index.setdefault(style, len(style_index)) if style else -1)
+            
+            content = getattr(post, 'content', None)
+            text = content.get('text', '') if content else ''
+            has_content.append(bool(content))
+            
+            post_features = text_features.get(text)
+            if post_features is None:
+                post_features = text_features[text] = _text_features(text)
+            features.append(post_features)
+            
+            for hashtag in post_features[4]:
+                hashtag_post.append(i)
+                hashtag_codes.append(hashtag_index.setdefault(hashtag, len(hashtag_index)))
+        
+        metric_columns = _metric_columns(metric_dicts)
+        length = np.array([f[0] for f in features], dtype=np.int64).reshape(n)
+        
+        return cls(
+            posts=posts,
+            ids=np.array([str(getattr(post, 'id', '')) for post in posts], dtype=str).reshape(n),
+            created_at=np.array([post.created_at for post in posts], dtype="datetime64[us]").astype("datetime64[s]"),
+            platform_codes=np.array(platform_codes, dtype=np.int64),
+            platforms=list(platform_index),
+            engagement=_engagement(metric_columns),
+            impressions=metric_columns["impressions"],
+            reach=metric_columns["reach"],
+            has_metrics=np.array([bool(metrics) for metrics in metric_dicts], dtype=bool).reshape(n),
+            has_content=np.array(has_content, dtype=bool).reshape(n),
+            length=length,
+            emoji_count=np.array([f[1] for f in features], dtype=np.int64).reshape(n),
+            # short (<100), medium (<200), long
+            length_bucket=np.digitize(length, [100, 200]),
+            cta=np.array([f[2] for f in features], dtype=np.int64).reshape(n),
+            style_codes=np.array(style_codes, dtype=np.int64),
+            styles=list(style_index),
+            themes=np.array([f[3] for f in features], dtype=bool).reshape(n, len(CONTENT_THEMES)),
+            hashtag_post=np.array(hashtag_post, dtype=np.int64),
+            hashtag_codes=np.array(hashtag_codes, dtype=np.int64),
+            hashtags=list(hashtag_index)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def select(self, mask: np.ndarray) -> "PostFrame":
+        """Return a frame with only the rows where ``mask`` is true."""
+        rows = np.flatnonzero(mask)
+        
+        # Re-point hashtag occurrences at the new row numbers
+        keep = mask[self.hashtag_post]
+        new_row = np.cumsum(mask) - 1
+        
+        return PostFrame(
+            posts=[self.posts[i] for i in rows] if self.posts else [],
+            platforms=self.platforms,
+            styles=self.styles,
+            hashtag_post=new_row[self.hashtag_post[keep]],
+            hashtag_codes=self.hashtag_codes[keep],
+            hashtags=self.hashtags,
+            **{name: getattr(self, name)[rows] for name in _ROW_COLUMNS}
+        )
+    
+    def concat(self, other: "PostFrame") -> "PostFrame":
+        """Append the rows of ``other``, merging its label lists into this frame's."""
+        platforms, platform_map = _merge_labels(self.platforms, other.platforms)
+        styles, style_map = _merge_labels(self.styles, other.styles)
+        hashtags, hashtag_map = _merge_labels(self.hashtags, other.hashtags)
+        
+        style_codes = other.style_codes.copy()
+        styled = style_codes >= 0
+        style_codes[styled] = style_map[style_codes[styled]]
+        
+        remapped = {"platform_codes": platform_map[other.platform_codes], "style_codes": style_codes}
+        columns = {
+            name: np.concatenate([getattr(self, name), remapped.get(name, getattr(other, name))])
+            for name in _ROW_COLUMNS
+        }
+        
+        # Records are only kept while they line up with every row
+        has_posts = len(self.posts) == len(self) and len(other.posts) == len(other)
+        
+        return PostFrame(
+            posts=list(self.posts) + list(other.posts) if has_posts else [],
+            platforms=platforms,
+            styles=styles,
+            hashtag_post=np.concatenate([self.hashtag_post, other.hashtag_post + len(self)]),
+            hashtag_codes=np.concatenate([self.hashtag_codes, hashtag_map[other.hashtag_codes]]),
+            hashtags=hashtags,
+            **columns
+        )
+    
+    def update_metrics(self, rows: Sequence[int], metric_dicts: Sequence[Dict[str, Any]]):
+        """Replace the metric-derived columns of ``rows`` in place."""
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = _metric_columns([metrics or {} for metrics in metric_dicts])
+        
+        self.engagement[rows] = _engagement(columns)
+        self.impressions[rows] = columns["impressions"]
+        self.reach[rows] = columns["reach"]
+        self.has_metrics[rows] = [bool(metrics) for metrics in metric_dicts]
+    
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Columns (not the post records) as arrays suitable for ``np.savez``."""
+        arrays = {name: getattr(self, name) for name in _ROW_COLUMNS}
+        arrays.update({name: np.array(getattr(self, name), dtype=str) for name in _LABEL_COLUMNS})
+        arrays["hashtag_post"] = self.hashtag_post
+        arrays["hashtag_codes"] = self.hashtag_codes
+        return arrays
+    
+    @classmethod
+    def from_arrays(cls, arrays) -> "PostFrame":
+        """Rebuild a frame from ``to_arrays`` output; ``posts`` is left empty."""
+        return cls(
+            posts=[],
+            hashtag_post=np.array(arrays["hashtag_post"]),
+            hashtag_codes=np.array(arrays["hashtag_codes"]),
+            **{name: np.array(arrays[name]).tolist() for name in _LABEL_COLUMNS},
+            **{name: np.array(arrays[name]) for name in _ROW_COLUMNS}
+        )
+    
+    @property
+    def hour(self) -> np.ndarray:
+        return (self.created_at.astype(np.int64) // 3600) % 24
+    
+    @property
+    def day(self) -> np.ndarray:
+        """Days since the epoch."""
+        return self.created_at.astype("datetime64[D]").astype(np.int64)
+    
+    @property
+    def weekday(self) -> np.ndarray:
+        """Day of week, Monday is 0."""
+        return (self.day + 3) % 7  # 1970-01-01 was a Thursday
+    
+    @property
+    def month(self) -> np.ndarray:
+        """Calendar month, 1-12."""
+        return self.created_at.astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+
+def _merge_labels(labels: List[str], other: List[str]) -> Tuple[List[str], np.ndarray]:
+    """Union of two label lists and the mapping from ``other``'s codes into it."""
+    index = {label: i for i, label in enumerate(labels)}
+    mapping = np.array([index.setdefault(label, len(index)) for label in other], dtype=np.int64)
+    return list(index), mapping.reshape(len(other))
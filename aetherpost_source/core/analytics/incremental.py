@@ -0,0 +1,173 @@
+"""Post frame kept in sync with campaign state across dashboard runs."""
+
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+import numpy as np
+
+from ..state.backends import StateBackend
+from ..state.models import CampaignState, PostRecord
+from .frame import PostFrame
+
+logger = logging.getLogger(__name__)
+
+
+def high_water_mark(state: CampaignState) -> Dict[str, str]:
+    """Identify a state version; any StateManager mutation bumps ``updated_at``."""
+    return {"campaign_id": state.campaign_id, "updated_at": state.updated_at.isoformat()}
+
+
+class IncrementalPostFrame:
+    """Maintain a ``PostFrame`` incrementally, keyed by a state high-water mark.
+
+    The frame is persisted together with the campaign id and the state's
+    ``updated_at`` at the time it was built. On refresh only posts added
+    since then are analyzed, only posts whose ``metrics_updated_at`` is past
+    the mark have their metric columns recomputed, and removed posts are
+    masked out, so repeated dashboard runs cost O(new data).
+
+    ``refresh_from_backend`` goes further and reads only the campaign row,
+    the post ids and the changed posts from the state backend, so an
+    unchanged campaign is never deserialized. Frames restored from the
+    cache carry no ``posts``; look records up by ``frame.ids`` instead.
+    """
+    
+    def __init__(self, cache_file: Union[str, Path] = ".aetherpost/analytics_frame.npz"):
+        self.cache_file = Path(cache_file)
+        self.frame: Optional[PostFrame] = None
+        self.high_water_mark: Optional[Dict[str, str]] = None
+        self.last_refresh: Dict[str, Any] = {}
+    
+    def refresh(self, state: CampaignState) -> PostFrame:
+        """Bring the frame up to date with ``state`` and return it."""
+        if self.frame is None:
+            self._load()
+        
+        mark = high_water_mark(state)
+        if self._needs_rebuild(state):
+            return self._rebuild(state, mark)
+        
+        stats = {"added": 0, "updated": 0, "removed": 0, "rebuilt": False}
+        frame = self.frame
+        if mark != self.high_water_mark:
+            since = datetime.fromisoformat(self.high_water_mark["updated_at"])
+            frame = self._apply_changes(
+                frame,
+                [post.id for post in state.posts],
+                lambda new_ids: [post for post in state.posts if post.id in new_ids],
+                [post for post in state.posts if post.metrics_updated_at and post.metrics_updated_at > since],
+                stats
+            )
+        return self._commit(frame, mark, stats)
+    
+    def refresh_from_backend(self, backend: StateBackend) -> Optional[PostFrame]:
+        """Like ``refresh``, reading only what changed from ``backend``.
+
+        Returns None if the backend holds no campaign.
+        """
+        if self.frame is None:
+            self._load()
+        
+        campaign = backend.load_campaign()
+        if campaign is None:
+            return None
+        
+        mark = high_water_mark(campaign)
+        if self._needs_rebuild(campaign):
+            return self._rebuild(backend.load(), mark)
+        
+        stats = {"added": 0, "updated": 0, "removed": 0, "rebuilt": False}
+        frame = self.frame
+        if mark != self.high_water_mark:
+            since = datetime.fromisoformat(self.high_water_mark["updated_at"])
+            frame = self._apply_changes(
+                frame,
+                backend.post_ids(),
+                lambda new_ids: backend.get_posts(list(new_ids)),
+                backend.query_posts(metrics_updated_since=since),
+                stats
+            )
+        return self._commit(frame, mark, stats)
+    
+    def _needs_rebuild(self, campaign: CampaignState) -> bool:
+        return self.frame is None or self.high_water_mark["campaign_id"] != campaign.campaign_id
+    
+    def _rebuild(self, state: CampaignState, mark: Dict[str, str]) -> PostFrame:
+        frame = PostFrame.from_posts(state.posts)
+        return self._commit(frame, mark, {"added": len(frame), "updated": 0, "removed": 0, "rebuilt": True})
+    
+    def _commit(self, frame: PostFrame, mark: Dict[str, str], stats: Dict[str, Any]) -> PostFrame:
+        if mark != self.high_water_mark:
+            self.high_water_mark = mark
+            self._save(frame)
+        
+        self.frame = frame
+        self.last_refresh = stats
+        return frame
+    
+    @staticmethod
+    def _apply_changes(frame: PostFrame,
+                       post_ids: List[str],
+                       load_new: Callable[[Set[str]], List[PostRecord]],
+                       changed_posts: List[PostRecord],
+                       stats: Dict[str, Any]) -> PostFrame:
+        """Fold posts and metrics newer than the high-water mark into ``frame``.
+
+        ``post_ids`` are all current record ids, ``load_new`` returns the
+        records for ids the frame does not hold yet, and ``changed_posts``
+        are the records whose metrics changed since the mark.
+        """
+        present = np.isin(frame.ids, np.array(post_ids, dtype=str))
+        if not present.all():
+            stats["removed"] = int((~present).sum())
+            frame = frame.select(present)
+        
+        row_of = {post_id: row for row, post_id in enumerate(frame.ids.tolist())}
+        changed = [(row_of[post.id], post.metrics) for post in changed_posts if post.id in row_of]
+        if changed:
+            rows, metrics = zip(*changed)
+            frame.update_metrics(list(rows), list(metrics))
+            stats["updated"] = len(changed)
+        
+        new_ids = {post_id for post_id in post_ids if post_id not in row_of}
+        if new_ids:
+            frame = frame.concat(PostFrame.from_posts(load_new(new_ids)))
+            stats["added"] = len(new_ids)
+        
+        return frame
+    
+    def _load(self):
+        """Load a previously saved frame, ignoring unreadable caches."""
+        if not self.cache_file.exists():
+            return
+        
+        try:
+            with np.load(self.cache_file, allow_pickle=False) as data:
+                self.frame = PostFrame.from_arrays(data)
+                self.high_water_mark = {
+                    "campaign_id": str(data["mark_campaign_id"]),
+                    "updated_at": str(data["mark_updated_at"])
+                }
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable analytics cache {self.cache_file}: {e}")
+            self.frame = None
+            self.high_water_mark = None
+    
+    def _save(self, frame: PostFrame):
+        """Persist the frame and its high-water mark atomically."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_name(f".{self.cache_file.name}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    mark_campaign_id=np.array(self.high_water_mark["campaign_id"]),
+                    mark_updated_at=np.array(self.high_water_mark["updated_at"]),
+                    **frame.to_arrays()
+                )
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save analytics cache {self.cache_file}: {e}")
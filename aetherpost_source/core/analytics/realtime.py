@@ -1,13 +1,15 @@
 """Real-time analytics and monitoring system."""
 
 import asyncio
+import threading
 import time
 import json
-from typing import Dict, Any, List, Optional, Callable
-from dataclasses import dataclass, asdict
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional, Callable, Tuple
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from enum import Enum
-import statistics
 from pathlib import Path
 
 from ..logging.logger import logger
@@ -53,11 +55,136 @@ class AnalyticsSnapshot:
     recent_activity: List[Dict[str, Any]]
 
 
+def _append_ordered(metrics: Deque[Metric], metric: Metric):
+    """Append a metric, inserting from the right if it arrived out of order."""
+    if metrics and metric.timestamp < metrics[-1].timestamp:
+        index = len(metrics)
+        while index > 0 and metrics[index - 1].timestamp > metric.timestamp:
+            index -= 1
+        metrics.insert(index, metric)
+    else:
+        metrics.append(metric)
+
+
+@dataclass
+class PlatformAggregate:
+    """Running totals for one platform inside a metric window."""
+    count: int = 0
+    engagement: float = 0.0
+    reach: float = 0.0
+    errors: int = 0
+    posts: int = 0
+    rate_total: float = 0.0
+    rate_count: int = 0
+
+
+class MetricWindow:
+    """Time-ordered sliding window with incrementally maintained aggregates.
+
+    Metrics are appended in O(1) and expire from the left of the deque, so
+    each metric is added to and subtracted from the aggregates exactly once.
+    """
+    
+    def __init__(self, span: float):
+        self.span = span
+        self.metrics: Deque[Metric] = deque()
+        self._reset()
+    
+    def _reset(self):
+        self.count = 0
+        self.error_count = 0
+        self.post_count = 0
+        self.engagement = 0.0
+        self.reach = 0.0
+        self.platforms: Dict[str, PlatformAggregate] = {}
+        self.performance: Dict[str, List[float]] = {}  # name -> [total, count]
+    
+    def __len__(self) -> int:
+        return len(self.metrics)
+    
+    def add(self, metric: Metric):
+        """Add a metric, keeping the deque ordered by timestamp."""
+        _append_ordered(self.metrics, metric)
+        self._apply(metric, 1)
+    
+    def expire(self, now: float) -> List[Metric]:
+        """Drop metrics older than the window span and return them."""
+        cutoff = now - self.span
+        expired = []
+        while self.metrics and self.metrics[0].timestamp <= cutoff:
+            metric = self.metrics.popleft()
+            self._apply(metric, -1)
+            expired.append(metric)
+        
+        if not self.metrics:
+            # Start from exact zeros so float totals don't drift
+            self._reset()
+        return expired
+    
+    def _apply(self, metric: Metric, sign: int):
+        """Add (sign=1) or subtract (sign=-1) a metric from the aggregates."""
+        is_engagement = metric.metric_type == MetricType.ENGAGEMENT
+        is_error = metric.metric_type == MetricType.ERROR
+        is_post = metric.name.startswith("post_")
+        
+        self.count += sign
+        if is_error:
+            self.error_count += sign
+        if is_post:
+            self.post_count += sign
+        if is_engagement:
+            self.engagement += sign * metric.value
+        if metric.name == "post_reach":
+            self.reach += sign * metric.value
+        
+        if metric.metric_type == MetricType.PERFORMANCE:
+            totals = self.performance.setdefault(metric.name, [0.0, 0])
+            totals[0] += sign * metric.value
+            totals[1] += sign
+            if totals[1] == 0:
+                del self.performance[metric.name]
+        
+        if metric.platform:
+            platform = self.platforms.setdefault(metric.platform, PlatformAggregate())
+            platform.count += sign
+            if is_engagement:
+                platform.engagement += sign * metric.value
+            if metric.metric_type == MetricType.REACH:
+                platform.reach += sign * metric.value
+            if is_error:
+                platform.errors += sign
+            if is_post:
+                platform.posts += sign
+            if metric.name == "engagement_rate":
+                platform.rate_total += sign * metric.value
+                platform.rate_count += sign
+            if platform.count == 0:
+                del self.platforms[metric.platform]
+
+
+@dataclass
+class _HourBucket:
+    """Values recorded for one metric name within one clock hour."""
+    values: Deque[Tuple[float, float]] = field(default_factory=deque)
+    total: float = 0.0
+
+
 class RealTimeAnalytics:
     """Real-time analytics collection and processing."""
     
-    def __init__(self):
-        self.metrics: List[Metric] = []
+    RETENTION_SECONDS = 86400
+    RECENT_SECONDS = 3600
+    
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self._lock = threading.RLock()
+        
+        # 24-hour history plus the last-hour window used for snapshots
+        self.metrics: Deque[Metric] = deque()
+        self._recent = MetricWindow(self.RECENT_SECONDS)
+        # metric name -> hour start -> bucket, for trend queries
+        self._hourly: Dict[str, Dict[int, _HourBucket]] = {}
+        
         self.subscribers: List[Callable] = []
         self.data_file = Path("logs/analytics.json")
         self.running = False
@@ -76,14 +203,13 @@ class RealTimeAnalytics:
             value=value,
             metric_type=metric_type,
             platform=platform,
+            timestamp=self.clock(),
             metadata=metadata
         )
         
-        self.metrics.append(metric)
-        
-        # Keep only recent metrics (last 24 hours)
-        cutoff_time = time.time() - 86400
-        self.metrics = [m for m in self.metrics if m.timestamp > cutoff_time]
+        with self._lock:
+            self._add(metric)
+            self._expire(metric.timestamp)
         
         # Notify subscribers
         self._notify_subscribers(metric)
@@ -96,6 +222,40 @@ class RealTimeAnalytics:
             "metadata": metadata
         })
     
+    def _add(self, metric: Metric):
+        """Add a metric to the history, the recent window and the trend buckets."""
+        _append_ordered(self.metrics, metric)
+        self._recent.add(metric)
+        
+        hour = int(metric.timestamp // 3600) * 3600
+        bucket = self._hourly.setdefault(metric.name, {}).setdefault(hour, _HourBucket())
+        bucket.values.append((metric.timestamp, metric.value))
+        bucket.total += metric.value
+    
+    def _expire(self, now: Optional[float] = None):
+        """Expire metrics past the retention period (amortized O(1) per metric)."""
+        now = self.clock() if now is None else now
+        self._recent.expire(now)
+        
+        cutoff = now - self.RETENTION_SECONDS
+        while self.metrics and self.metrics[0].timestamp <= cutoff:
+            metric = self.metrics.popleft()
+            hour = int(metric.timestamp // 3600) * 3600
+            buckets = self._hourly.get(metric.name, {})
+            bucket = buckets.get(hour)
+            if bucket is None:
+                continue
+            entry = (metric.timestamp, metric.value)
+            if bucket.values[0] == entry:
+                bucket.values.popleft()
+            else:
+                bucket.values.remove(entry)
+            bucket.total -= metric.value
+            if not bucket.values:
+                del buckets[hour]
+                if not buckets:
+                    del self._hourly[metric.name]
+    
     def record_post_engagement(self, platform: str, likes: int, shares: int, 
                               comments: int, reach: int):
         """Record engagement metrics for a post."""
@@ -144,59 +304,48 @@ class RealTimeAnalytics:
     def get_current_snapshot(self) -> AnalyticsSnapshot:
         """Get current analytics snapshot."""
         now = datetime.now()
-        hour_ago = time.time() - 3600
-        
-        # Filter recent metrics
-        recent_metrics = [m for m in self.metrics if m.timestamp > hour_ago]
-        
-        # Calculate totals
-        total_posts = len([m for m in recent_metrics if m.name.startswith("post_")])
-        total_engagement = sum(m.value for m in recent_metrics if m.metric_type == MetricType.ENGAGEMENT)
-        total_reach = sum(m.value for m in recent_metrics if m.name == "post_reach")
-        
-        # Platform analysis
-        platforms_active = list(set(m.platform for m in recent_metrics if m.platform))
-        
-        # Top performing platform
-        platform_engagement = {}
-        for platform in platforms_active:
-            platform_metrics = [m for m in recent_metrics if m.platform == platform and m.metric_type == MetricType.ENGAGEMENT]
-            platform_engagement[platform] = sum(m.value for m in platform_metrics)
-        
-        top_platform = max(platform_engagement, key=platform_engagement.get) if platform_engagement else None
-        
-        # Engagement rate
-        engagement_rate = (total_engagement / total_reach * 100) if total_reach > 0 else 0
-        
-        # Error rate
-        error_count = len([m for m in recent_metrics if m.metric_type == MetricType.ERROR])
-        total_operations = len(recent_metrics)
-        error_rate = (error_count / total_operations * 100) if total_operations > 0 else 0
-        
-        # Performance metrics
-        performance_metrics = {}
-        perf_metrics = [m for m in recent_metrics if m.metric_type == MetricType.PERFORMANCE]
-        for metric in perf_metrics:
-            if metric.name not in performance_metrics:
-                performance_metrics[metric.name] = []
-            performance_metrics[metric.name].append(metric.value)
-        
-        # Calculate averages
-        avg_performance = {
-            name: statistics.mean(values) 
-            for name, values in performance_metrics.items()
-        }
         
-        # Recent activity
-        recent_activity = []
-        for metric in sorted(recent_metrics, key=lambda x: x.timestamp, reverse=True)[:10]:
-            recent_activity.append({
-                "timestamp": datetime.fromtimestamp(metric.timestamp).isoformat(),
-                "name": metric.name,
-                "value": metric.value,
-                "platform": metric.platform,
-                "type": metric.metric_type.value
-            })
+        with self._lock:
+            self._expire()
+            window = self._recent
+            
+            # Calculate totals
+            total_posts = window.post_count
+            total_engagement = window.engagement
+            total_reach = window.reach
+            
+            # Platform analysis
+            platforms_active = list(window.platforms)
+            
+            # Top performing platform
+            platform_engagement = {
+                platform: aggregate.engagement
+                for platform, aggregate in window.platforms.items()
+            }
+            top_platform = max(platform_engagement, key=platform_engagement.get) if platform_engagement else None
+            
+            # Engagement rate
+            engagement_rate = (total_engagement / total_reach * 100) if total_reach > 0 else 0
+            
+            # Error rate
+            error_rate = (window.error_count / window.count * 100) if window.count > 0 else 0
+            
+            # Performance averages
+            avg_performance = {
+                name: total / count
+                for name, (total, count) in window.performance.items()
+            }
+            
+            # Recent activity (the window is ordered by timestamp)
+            recent_activity = []
+            for metric in islice(reversed(window.metrics), 10):
+                recent_activity.append({
+                    "timestamp": datetime.fromtimestamp(metric.timestamp).isoformat(),
+                    "name": metric.name,
+                    "value": metric.value,
+                    "platform": metric.platform,
+                    "type": metric.metric_type.value
+                })
         
         return AnalyticsSnapshot(
             timestamp=now.isoformat(),
@@ -212,55 +361,49 @@ class RealTimeAnalytics:
         )
     
     def get_trend_data(self, metric_name: str, hours: int = 24) -> List[Dict[str, Any]]:
-        """Get trend data for a specific metric."""
-        cutoff_time = time.time() - (hours * 3600)
-        relevant_metrics = [
-            m for m in self.metrics 
-            if m.name == metric_name and m.timestamp > cutoff_time
-        ]
-        
-        # Group by hour
-        hourly_data = {}
-        for metric in relevant_metrics:
-            hour = int(metric.timestamp // 3600) * 3600
-            if hour not in hourly_data:
-                hourly_data[hour] = []
-            hourly_data[hour].append(metric.value)
-        
-        # Calculate hourly averages
-        trend_data = []
-        for hour, values in sorted(hourly_data.items()):
-            trend_data.append({
-                "timestamp": datetime.fromtimestamp(hour).isoformat(),
-                "value": statistics.mean(values),
-                "count": len(values)
-            })
+        """Get hourly averages for a specific metric."""
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            cutoff_time = now - (hours * 3600)
+            
+            trend_data = []
+            for hour, bucket in sorted(self._hourly.get(metric_name, {}).items()):
+                if hour + 3600 <= cutoff_time:
+                    continue
+                
+                if hour <= cutoff_time:
+                    # Only the hour straddling the cutoff needs its values filtered
+                    values = [value for timestamp, value in bucket.values if timestamp > cutoff_time]
+                    if not values:
+                        continue
+                    total, count = sum(values), len(values)
+                else:
+                    total, count = bucket.total, len(bucket.values)
+                
+                trend_data.append({
+                    "timestamp": datetime.fromtimestamp(hour).isoformat(),
+                    "value": total / count,
+                    "count": count
+                })
         
         return trend_data
     
     def get_platform_comparison(self) -> Dict[str, Dict[str, float]]:
         """Get comparison data across platforms."""
-        hour_ago = time.time() - 3600
-        recent_metrics = [m for m in self.metrics if m.timestamp > hour_ago and m.platform]
-        
-        platform_stats = {}
-        
-        for platform in set(m.platform for m in recent_metrics):
-            platform_metrics = [m for m in recent_metrics if m.platform == platform]
+        with self._lock:
+            self._expire()
             
-            engagement_metrics = [m for m in platform_metrics if m.metric_type == MetricType.ENGAGEMENT]
-            reach_metrics = [m for m in platform_metrics if m.metric_type == MetricType.REACH]
-            error_metrics = [m for m in platform_metrics if m.metric_type == MetricType.ERROR]
-            
-            platform_stats[platform] = {
-                "total_engagement": sum(m.value for m in engagement_metrics),
-                "total_reach": sum(m.value for m in reach_metrics),
-                "error_count": len(error_metrics),
-                "post_count": len([m for m in platform_metrics if m.name.startswith("post_")]),
-                "avg_engagement_rate": statistics.mean([m.value for m in engagement_metrics if m.name == "engagement_rate"]) if any(m.name == "engagement_rate" for m in engagement_metrics) else 0
+            return {
+                platform: {
+                    "total_engagement": aggregate.engagement,
+                    "total_reach": aggregate.reach,
+                    "error_count": aggregate.errors,
+                    "post_count": aggregate.posts,
+                    "avg_engagement_rate": aggregate.rate_total / aggregate.rate_count if aggregate.rate_count else 0
+                }
+                for platform, aggregate in self._recent.platforms.items()
             }
-        
-        return platform_stats
     
     def subscribe(self, callback: Callable[[Metric], None]):
         """Subscribe to real-time metric updates."""
@@ -287,7 +430,8 @@ class RealTimeAnalytics:
                     data = json.load(f)
                 
                 # Load recent metrics (last 24 hours)
-                cutoff_time = time.time() - 86400
+                cutoff_time = self.clock() - self.RETENTION_SECONDS
+                loaded = []
                 for metric_data in data.get('metrics', []):
                     if metric_data.get('timestamp', 0) > cutoff_time:
                         metric = Metric(
@@ -298,10 +442,15 @@ class RealTimeAnalytics:
                             timestamp=metric_data['timestamp'],
                             metadata=metric_data.get('metadata')
                         )
-                        self.metrics.append(metric)
+                        loaded.append(metric)
                 
-                logger.info(f"Loaded {len(self.metrics)} historical metrics")
+                with self._lock:
+                    for metric in sorted(loaded, key=lambda m: m.timestamp):
+                        self._add(metric)
+                    self._expire()
                 
+                logger.info(f"Loaded {len(self.metrics)} historical metrics")
+            
             except Exception as e:
                 logger.warning(f"Failed to load analytics data: {e}")
     
@@ -310,9 +459,9 @@ class RealTimeAnalytics:
         try:
             self.data_file.parent.mkdir(exist_ok=True)
             
-            # Save only recent metrics (last 7 days)
-            week_ago = time.time() - (7 * 86400)
-            recent_metrics = [m for m in self.metrics if m.timestamp > week_ago]
+            with self._lock:
+                self._expire()
+                recent_metrics = list(self.metrics)
             
             data = {
                 "last_updated": datetime.now().isoformat(),
@@ -333,7 +482,7 @@ class RealTimeAnalytics:
                 json.dump(data, f, indent=2)
             
             logger.debug("Analytics data saved")
-            
+        
         except Exception as e:
             logger.warning(f"Failed to save analytics data: {e}")
     
@@ -348,22 +497,20 @@ class RealTimeAnalytics:
                     self._save_data()
                     
                     # Clean up old metrics
-                    cutoff_time = time.time() - 86400
-                    old_count = len(self.metrics)
-                    self.metrics = [m for m in self.metrics if m.timestamp > cutoff_time]
+                    with self._lock:
+                        old_count = len(self.metrics)
+                        self._expire()
                     
                     if len(self.metrics) < old_count:
                         logger.debug(f"Cleaned up {old_count - len(self.metrics)} old metrics")
                     
                     await asyncio.sleep(300)  # 5 minutes
-                    
+                
                 except Exception as e:
                     logger.error(f"Error in analytics background processor: {e}")
                     await asyncio.sleep(60)
         
         # Start background task
-        import threading
-        
         def run_background():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -437,29 +584,53 @@ class AlertSystem:
         # like Slack, Discord, email, etc.
 
 
-# Global analytics instance
-analytics = RealTimeAnalytics()
-alert_system = AlertSystem(analytics)
+_analytics: Optional[RealTimeAnalytics] = None
+_alert_system: Optional[AlertSystem] = None
+
+
+def get_analytics() -> RealTimeAnalytics:
+    """Return the process-wide analytics, creating it (with its background thread and alert system) on first use."""
+    global _analytics, _alert_system
+    if _analytics is None:
+        _analytics = RealTimeAnalytics()
+        _alert_system = AlertSystem(_analytics)
+    return _analytics
+
+
+def get_alert_system() -> AlertSystem:
+    """Return the alert system watching the process-wide analytics."""
+    get_analytics()
+    return _alert_system
+
+
+def __getattr__(name):
+    # Keep `from aetherpost.core.analytics.realtime import analytics` working
+    if name == "analytics":
+        return get_analytics()
+    if name == "alert_system":
+        return get_alert_system()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions
 def record_engagement(platform: str, likes: int, shares: int, comments: int, reach: int):
     """Record engagement metrics."""
-    analytics.record_post_engagement(platform, likes, shares, comments, reach)
+    get_analytics().record_post_engagement(platform, likes, shares, comments, reach)
 
 
 def record_performance(operation: str, duration_ms: float, platform: Optional[str] = None, success: bool = True):
     """Record performance metrics."""
-    analytics.record_performance_metric(operation, duration_ms, platform, success)
+    get_analytics().record_performance_metric(operation, duration_ms, platform, success)
 
 
 def record_usage(feature: str, user_id: Optional[str] = None):
     """Record feature usage."""
-    analytics.record_usage(feature, user_id)
+    get_analytics().record_usage(feature, user_id)
 
 
 def get_dashboard_data() -> Dict[str, Any]:
     """Get comprehensive dashboard data."""
+    analytics = get_analytics()
     snapshot = analytics.get_current_snapshot()
     platform_comparison = analytics.get_platform_comparison()
     engagement_trend = analytics.get_trend_data("engagement_rate", 24)
@@ -1,39 +1,67 @@
 """Caching and performance optimization utilities."""
 
 import asyncio
+import atexit
 import functools
 import hashlib
 import json
 import pickle
+import threading
 import time
-from typing import Any, Callable, Optional, Dict, Union
-from dataclasses import dataclass
+from typing import Any, Callable, Optional, Dict, Tuple, Union
+from dataclasses import dataclass, field
 from pathlib import Path
-import redis
-import aioredis
 
 from ..logging import get_logger
+from .memory import MemoryCache, NamespaceLimit, NamespaceStats
 
 logger = get_logger("cache")
 
+_MISSING = object()
+
 
 @dataclass
 class CacheConfig:
     """Cache configuration."""
     ttl: int = 3600  # Time to live in seconds
-    max_size: int = 1000  # Maximum cache size for in-memory cache
+    max_size: int = 1000  # Maximum entries per namespace in the memory cache
+    max_memory_bytes: int = 64 * 1024 * 1024  # Maximum bytes per namespace in the memory cache
+    eviction_policy: str = "lru"  # "lru" or "lfu"
+    namespace_limits: Dict[str, NamespaceLimit] = field(default_factory=dict)
     prefix: str = "aetherpost"
     use_redis: bool = True
     redis_url: str = "redis://localhost:6379/0"
+    max_redis_value_bytes: int = 1024 * 1024  # Larger values are only cached in memory
+    write_behind: bool = True  # Batch Redis writes instead of writing on every set
+    write_batch_size: int = 100
+    write_behind_delay: float = 0.05  # Seconds an async write may wait for others to batch with
 
 
 class CacheManager:
-    """Centralized cache management."""
+    """Centralized cache management.
+
+    An in-process ``MemoryCache`` (L1) sits in front of Redis (L2). Reads
+    are served from memory when possible and read through to Redis on a
+    miss, populating memory with the entry's remaining TTL. Writes land in
+    memory immediately and reach Redis in batches: synchronous writes once
+    ``write_batch_size`` are queued (and at exit), asynchronous ones after
+    ``write_behind_delay``. ``flush()``/``aflush()`` write them out now.
+    """
     
     def __init__(self, config: CacheConfig = None):
         self.config = config or CacheConfig()
-        self.memory_cache = {}
-        self.cache_stats = {"hits": 0, "misses": 0, "sets": 0}
+        self.memory_cache = MemoryCache(
+            NamespaceLimit(self.config.max_size, self.config.max_memory_bytes),
+            self.config.namespace_limits,
+            self.config.eviction_policy
+        )
+        self.cache_stats = {"hits": 0, "misses": 0, "sets": 0, "l2_hits": 0, "l2_writes": 0}
+        self._l2_hits: Dict[str, int] = {}
+        
+        # Redis writes not yet sent: prefixed key -> (payload, ttl)
+        self._pending: Dict[str, Tuple[bytes, int]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
         
         # Redis clients
         self.redis_client = None
@@ -45,8 +73,11 @@ class CacheManager:
     def _setup_redis(self):
         """Setup Redis clients."""
         try:
+            # Optional dependency, imported only when Redis is enabled
+            import redis
             self.redis_client = redis.from_url(self.config.redis_url)
             self.redis_client.ping()
+            atexit.register(self.flush)
             logger.info("Redis connection established")
         except Exception as e:
             logger.warning(f"Redis connection failed, falling back to memory cache: {e}")
@@ -56,6 +87,7 @@ class CacheManager:
         """Setup async Redis client."""
         if not self.async_redis_client and self.config.use_redis:
             try:
+                import aioredis
                 self.async_redis_client = await aioredis.from_url(self.config.redis_url)
                 await self.async_redis_client.ping()
                 logger.info("Async Redis connection established")
@@ -66,25 +98,46 @@ class CacheManager:
         """Create cache key with prefix."""
         return f"{self.config.prefix}:{key}"
     
+    def _memory_get(self, key: str) -> Any:
+        value = self.memory_cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self.cache_stats["hits"] += 1
+        return value
+    
+    def _read_through(self, key: str, payload: Optional[bytes], pttl: Optional[int]) -> Optional[Any]:
+        """Populate memory from a Redis entry, keeping its remaining TTL."""
+        if payload is None:
+            self.cache_stats["misses"] += 1
+            return None
+        
+        value = pickle.loads(payload)
+        ttl = pttl / 1000 if pttl and pttl > 0 else self.config.ttl
+        self.memory_cache.set(key, value, ttl, size=len(payload))
+        
+        namespace = MemoryCache.namespace_of(key)
+        self._l2_hits[namespace] = self._l2_hits.get(namespace, 0) + 1
+        self.cache_stats["hits"] += 1
+        self.cache_stats["l2_hits"] += 1
+        return value
+    
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache (sync)."""
+        value = self._memory_get(key)
+        if value is not _MISSING:
+            return value
+        
         cache_key = self._make_key(key)
         
         try:
             if self.config.use_redis and self.redis_client:
-                value = self.redis_client.get(cache_key)
-                if value:
-                    self.cache_stats["hits"] += 1
-                    return pickle.loads(value)
-            else:
-                # Memory cache fallback
-                if cache_key in self.memory_cache:
-                    entry = self.memory_cache[cache_key]
-                    if entry["expires"] > time.time():
-                        self.cache_stats["hits"] += 1
-                        return entry["value"]
-                    else:
-                        del self.memory_cache[cache_key]
+                if cache_key in self._pending:
+                    # Evicted from memory before its write reached Redis
+                    self.flush()
+                pipe = self.redis_client.pipeline()
+                pipe.get(cache_key)
+                pipe.pttl(cache_key)
+                payload, pttl = pipe.execute()
+                return self._read_through(key, payload, pttl)
             
             self.cache_stats["misses"] += 1
             return None
@@ -96,25 +149,23 @@ class CacheManager:
     
     async def aget(self, key: str) -> Optional[Any]:
         """Get value from cache (async)."""
+        value = self._memory_get(key)
+        if value is not _MISSING:
+            return value
+        
         cache_key = self._make_key(key)
         
         try:
             if self.config.use_redis:
                 await self._setup_async_redis()
                 if self.async_redis_client:
-                    value = await self.async_redis_client.get(cache_key)
-                    if value:
-                        self.cache_stats["hits"] += 1
-                        return pickle.loads(value)
-            
-            # Memory cache fallback
-            if cache_key in self.memory_cache:
-                entry = self.memory_cache[cache_key]
-                if entry["expires"] > time.time():
-                    self.cache_stats["hits"] += 1
-                    return entry["value"]
-                else:
-                    del self.memory_cache[cache_key]
+                    if cache_key in self._pending:
+                        await self.aflush()
+                    pipe = self.async_redis_client.pipeline()
+                    pipe.get(cache_key)
+                    pipe.pttl(cache_key)
+                    payload, pttl = await pipe.execute()
+                    return self._read_through(key, payload, pttl)
             
             self.cache_stats["misses"] += 1
             return None
@@ -124,24 +175,38 @@ class CacheManager:
             self.cache_stats["misses"] += 1
             return None
     
+    def _store(self, key: str, value: Any, ttl: int) -> bool:
+        """Cache in memory and queue the Redis write; True if a write is queued."""
+        payload = None
+        if self.config.use_redis:
+            try:
+                payload = pickle.dumps(value)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                logger.debug(f"Caching unpicklable value for {key} in memory only: {e}")
+        
+        self.memory_cache.set(key, value, ttl, size=len(payload) if payload is not None else None)
+        self.cache_stats["sets"] += 1
+        
+        if payload is None:
+            return False
+        if len(payload) > self.config.max_redis_value_bytes:
+            logger.debug(f"Value for {key} is {len(payload)} bytes, caching in memory only")
+            return False
+        
+        with self._pending_lock:
+            self._pending[self._make_key(key)] = (payload, ttl)
+        return True
+    
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache (sync)."""
-        cache_key = self._make_key(key)
         ttl = ttl or self.config.ttl
         
         try:
-            if self.config.use_redis and self.redis_client:
-                serialized = pickle.dumps(value)
-                self.redis_client.setex(cache_key, ttl, serialized)
-            else:
-                # Memory cache fallback
-                self._cleanup_memory_cache()
-                self.memory_cache[cache_key] = {
-                    "value": value,
-                    "expires": time.time() + ttl
-                }
-            
-            self.cache_stats["sets"] += 1
+            queued = self._store(key, value, ttl)
+            if queued and self.redis_client and (
+                not self.config.write_behind or len(self._pending) >= self.config.write_batch_size
+            ):
+                self.flush()
             return True
         
         except Exception as e:
@@ -150,65 +215,88 @@ class CacheManager:
     
     async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache (async)."""
-        cache_key = self._make_key(key)
         ttl = ttl or self.config.ttl
         
         try:
-            if self.config.use_redis:
+            if self._store(key, value, ttl):
                 await self._setup_async_redis()
-                if self.async_redis_client:
-                    serialized = pickle.dumps(value)
-                    await self.async_redis_client.setex(cache_key, ttl, serialized)
-                    self.cache_stats["sets"] += 1
-                    return True
-            
-            # Memory cache fallback
-            self._cleanup_memory_cache()
-            self.memory_cache[cache_key] = {
-                "value": value,
-                "expires": time.time() + ttl
-            }
-            
-            self.cache_stats["sets"] += 1
+                if not self.config.write_behind or len(self._pending) >= self.config.write_batch_size:
+                    await self.aflush()
+                elif self._flush_task is None or self._flush_task.done():
+                    self._flush_task = asyncio.ensure_future(self._delayed_flush())
             return True
         
         except Exception as e:
             logger.error(f"Async cache set error: {e}")
             return False
     
+    def _take_pending(self) -> Dict[str, Tuple[bytes, int]]:
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        return pending
+    
+    def flush(self):
+        """Write queued entries to Redis in one pipeline (sync)."""
+        if not self.redis_client:
+            return
+        pending = self._take_pending()
+        if not pending:
+            return
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for cache_key, (payload, ttl) in pending.items():
+                pipe.setex(cache_key, ttl, payload)
+            pipe.execute()
+            self.cache_stats["l2_writes"] += len(pending)
+        except Exception as e:
+            logger.error(f"Cache flush error, dropped {len(pending)} writes: {e}")
+    
+    async def aflush(self):
+        """Write queued entries to Redis in one pipeline (async)."""
+        if not self.async_redis_client:
+            self.flush()
+            return
+        pending = self._take_pending()
+        if not pending:
+            return
+        
+        try:
+            pipe = self.async_redis_client.pipeline(transaction=False)
+            for cache_key, (payload, ttl) in pending.items():
+                pipe.setex(cache_key, ttl, payload)
+            await pipe.execute()
+            self.cache_stats["l2_writes"] += len(pending)
+        except Exception as e:
+            logger.error(f"Async cache flush error, dropped {len(pending)} writes: {e}")
+    
+    async def _delayed_flush(self):
+        await asyncio.sleep(self.config.write_behind_delay)
+        await self.aflush()
+    
     def delete(self, key: str) -> bool:
         """Delete value from cache."""
         cache_key = self._make_key(key)
         
         try:
+            self.memory_cache.delete(key)
+            with self._pending_lock:
+                self._pending.pop(cache_key, None)
+            
             if self.config.use_redis and self.redis_client:
                 self.redis_client.delete(cache_key)
             
-            if cache_key in self.memory_cache:
-                del self.memory_cache[cache_key]
-            
             return True
         
         except Exception as e:
             logger.error(f"Cache delete error: {e}")
             return False
     
-    def _cleanup_memory_cache(self):
-        """Clean up expired entries from memory cache."""
-        if len(self.memory_cache) > self.config.max_size:
-            # Remove oldest entries
-            sorted_items = sorted(
-                self.memory_cache.items(),
-                key=lambda x: x[1]["expires"]
-            )
-            
-            # Keep only the newest max_size/2 entries
-            to_keep = dict(sorted_items[-(self.config.max_size // 2):])
-            self.memory_cache = to_keep
-    
     def clear(self):
         """Clear all cache entries."""
         try:
+            self._take_pending()
+            
             if self.config.use_redis and self.redis_client:
                 pattern = f"{self.config.prefix}:*"
                 keys = self.redis_client.keys(pattern)
@@ -221,23 +309,44 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Cache clear error: {e}")
     
-    def get_stats(self) -> Dict[str, Union[int, float]]:
-        """Get cache statistics."""
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics, overall and per namespace."""
         total_requests = self.cache_stats["hits"] + self.cache_stats["misses"]
         hit_rate = (
             self.cache_stats["hits"] / total_requests 
             if total_requests > 0 else 0
         )
         
+        namespaces = self.memory_cache.get_stats()
+        for name, stats in namespaces.items():
+            stats["l2_hits"] = self._l2_hits.get(name, 0)
+        
         return {
             **self.cache_stats,
             "hit_rate": hit_rate,
-            "memory_entries": len(self.memory_cache)
+            "memory_entries": len(self.memory_cache),
+            "memory_bytes": self.memory_cache.bytes,
+            "pending_writes": len(self._pending),
+            "namespaces": namespaces
         }
 
 
-# Global cache manager instance
-cache_manager = CacheManager()
+_cache_manager: Optional[CacheManager] = None
+
+
+def get_cache_manager() -> CacheManager:
+    """Return the process-wide cache manager, creating it (and connecting to Redis) on first use."""
+    global _cache_manager
+    if _cache_manager is None:
+        _cache_manager = CacheManager()
+    return _cache_manager
+
+
+def __getattr__(name):
+    # Keep `from aetherpost.core.cache import cache_manager` working
+    if name == "cache_manager":
+        return get_cache_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _generate_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
@@ -277,7 +386,7 @@ def cache(ttl: int = 3600, key_prefix: Optional[str] = None):
             cache_key = f"{prefix}:{_generate_cache_key(func.__name__, args, kwargs)}"
             
             # Try to get from cache
-            cached_result = cache_manager.get(cache_key)
+            cached_result = get_cache_manager().get(cache_key)
             if cached_result is not None:
                 logger.debug(f"Cache hit for {func.__name__}")
                 return cached_result
@@ -285,7 +394,7 @@ def cache(ttl: int = 3600, key_prefix: Optional[str] = None):
             # Execute function and cache result
             logger.debug(f"Cache miss for {func.__name__}, executing function")
             result = func(*args, **kwargs)
-            cache_manager.set(cache_key, result, ttl)
+            get_cache_manager().set(cache_key, result, ttl)
             
             return result
         
@@ -296,7 +405,7 @@ def cache(ttl: int = 3600, key_prefix: Optional[str] = None):
             cache_key = f"{prefix}:{_generate_cache_key(func.__name__, args, kwargs)}"
             
             # Try to get from cache
-            cached_result = await cache_manager.aget(cache_key)
+            cached_result = await get_cache_manager().aget(cache_key)
             if cached_result is not None:
                 logger.debug(f"Cache hit for {func.__name__}")
                 return cached_result
@@ -304,7 +413,7 @@ def cache(ttl: int = 3600, key_prefix: Optional[str] = None):
             # Execute function and cache result
             logger.debug(f"Cache miss for {func.__name__}, executing function")
             result = await func(*args, **kwargs)
-            await cache_manager.aset(cache_key, result, ttl)
+            await get_cache_manager().aset(cache_key, result, ttl)
             
             return result
         
@@ -0,0 +1,230 @@
+"""In-process cache tier with O(1) eviction, TTLs and per-namespace budgets."""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class NamespaceLimit:
+    """Budget for one namespace of the memory cache."""
+    max_entries: int = 1000
+    max_bytes: int = 64 * 1024 * 1024
+
+
+@dataclass
+class NamespaceStats:
+    """Counters for one namespace of the memory cache."""
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires: float
+    frequency: int = 1
+
+
+class _LRUStore:
+    """Entries ordered from least to most recently used."""
+    
+    def __init__(self):
+        self.entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+    
+    def get(self, key: str) -> Optional[_Entry]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+    
+    def put(self, key: str, entry: _Entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+    
+    def pop(self, key: str) -> Optional[_Entry]:
+        return self.entries.pop(key, None)
+    
+    def victim(self) -> str:
+        return next(iter(self.entries))
+
+
+class _LFUStore:
+    """Entries bucketed by access count, least recently used first within a bucket."""
+    
+    def __init__(self):
+        self.entries: Dict[str, _Entry] = {}
+        self.buckets: Dict[int, 'OrderedDict[str, None]'] = {}
+        self.min_frequency = 1
+    
+    def get(self, key: str) -> Optional[_Entry]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self._unlink(key, entry.frequency)
+            entry.frequency += 1
+            self.buckets.setdefault(entry.frequency, OrderedDict())[key] = None
+        return entry
+    
+    def put(self, key: str, entry: _Entry):
+        self.pop(key)
+        self.entries[key] = entry
+        self.buckets.setdefault(entry.frequency, OrderedDict())[key] = None
+        self.min_frequency = min(self.min_frequency, entry.frequency)
+    
+    def pop(self, key: str) -> Optional[_Entry]:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self._unlink(key, entry.frequency)
+        return entry
+    
+    def victim(self) -> str:
+        if self.min_frequency not in self.buckets:
+            self.min_frequency = min(self.buckets)
+        return next(iter(self.buckets[self.min_frequency]))
+    
+    def _unlink(self, key: str, frequency: int):
+        bucket = self.buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[frequency]
+            if frequency == self.min_frequency:
+                self.min_frequency += 1
+
+
+class _Namespace:
+    def __init__(self, limit: NamespaceLimit, policy: str):
+        self.limit = limit
+        self.store = _LFUStore() if policy == 'lfu' else _LRUStore()
+        self.stats = NamespaceStats()
+
+
+class MemoryCache:
+    """Bounded in-process cache, partitioned into namespaces.
+
+    A key's namespace is the part before its first ``:`` (``default`` when
+    there is none), so one busy caller cannot evict everyone else's entries.
+    Each namespace evicts by LRU or LFU in O(1) once it exceeds its entry or
+    byte budget, and expired entries are dropped when they are next read.
+    """
+    
+    def __init__(
+        self,
+        default_limit: Optional[NamespaceLimit] = None,
+        namespace_limits: Optional[Dict[str, NamespaceLimit]] = None,
+        policy: str = 'lru'
+    ):
+        if policy not in ('lru', 'lfu'):
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        
+        self.default_limit = default_limit or NamespaceLimit()
+        self.namespace_limits = namespace_limits or {}
+        self.policy = policy
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def namespace_of(key: str) -> str:
+        return key.split(':', 1)[0] if ':' in key else 'default'
+    
+    def _namespace(self, key: str) -> _Namespace:
+        name = self.namespace_of(key)
+        namespace = self._namespaces.get(name)
+        if namespace is None:
+            limit = self.namespace_limits.get(name, self.default_limit)
+            namespace = self._namespaces[name] = _Namespace(limit, self.policy)
+        return namespace
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value, or ``default`` if absent or expired."""
+        value, _ = self.get_with_ttl(key, default)
+        return value
+    
+    def get_with_ttl(self, key: str, default: Any = None) -> Tuple[Any, float]:
+        """Return the cached value and its remaining lifetime in seconds."""
+        with self._lock:
+            namespace = self._namespace(key)
+            entry = namespace.store.get(key)
+            
+            if entry is None:
+                namespace.stats.misses += 1
+                return default, 0.0
+            
+            remaining = entry.expires - time.monotonic()
+            if remaining <= 0:
+                self._remove(namespace, key)
+                namespace.stats.expirations += 1
+                namespace.stats.misses += 1
+                return default, 0.0
+            
+            namespace.stats.hits += 1
+            return entry.value, remaining
+    
+    def set(self, key: str, value: Any, ttl: float, size: Optional[int] = None) -> bool:
+        """Cache ``value`` for ``ttl`` seconds.
+
+        ``size`` is the value's footprint in bytes (e.g. its serialized
+        length); it is estimated when omitted. Returns False if the value is
+        larger than its namespace's whole byte budget and was not cached.
+        """
+        size = size if size is not None else sys.getsizeof(value)
+        
+        with self._lock:
+            namespace = self._namespace(key)
+            self._remove(namespace, key)
+            
+            if size > namespace.limit.max_bytes:
+                return False
+            
+            # Make room first, so a new entry is never its own victim
+            while namespace.stats.entries and (
+                namespace.stats.entries + 1 > namespace.limit.max_entries
+                or namespace.stats.bytes + size > namespace.limit.max_bytes
+            ):
+                self._remove(namespace, namespace.store.victim())
+                namespace.stats.evictions += 1
+            
+            namespace.store.put(key, _Entry(value=value, size=size, expires=time.monotonic() + ttl))
+            namespace.stats.sets += 1
+            namespace.stats.entries += 1
+            namespace.stats.bytes += size
+            return True
+    
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._remove(self._namespace(key), key)
+    
+    def clear(self):
+        with self._lock:
+            for namespace in self._namespaces.values():
+                namespace.store = _LFUStore() if self.policy == 'lfu' else _LRUStore()
+                namespace.stats.entries = 0
+                namespace.stats.bytes = 0
+    
+    def _remove(self, namespace: _Namespace, key: str) -> bool:
+        entry = namespace.store.pop(key)
+        if entry is None:
+            return False
+        namespace.stats.entries -= 1
+        namespace.stats.bytes -= entry.size
+        return True
+    
+    def __len__(self) -> int:
+        return sum(namespace.stats.entries for namespace in self._namespaces.values())
+    
+    @property
+    def bytes(self) -> int:
+        return sum(namespace.stats.bytes for namespace in self._namespaces.values())
+    
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-namespace counters."""
+        with self._lock:
+            return {name: asdict(namespace.stats) for name, namespace in self._namespaces.items()}
@@ -4,11 +4,12 @@ import asyncio
 import hashlib
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 from ..config.models import CampaignConfig, CredentialsConfig
-from ..context import ProjectContextReader, ProjectDiffDetector
+from ..context import ContextSession, ProjectContextReader, ProjectDiffDetector
+from .providers import AnthropicProvider, OpenAIProvider, ProviderPool
 
 
 class ContentGenerator:
@@ -23,20 +24,47 @@ class ContentGenerator:
         # Initialize project context systems
         self.context_reader = ProjectContextReader()
         self.diff_detector = ProjectDiffDetector()
+        self._context_session: Optional[ContextSession] = None
         
         self._setup_providers()
     
+    async def close(self):
+        """Close AI provider clients and their connection pools."""
+        await self.provider_pool.close()
+    
+    def context_session(self) -> ContextSession:
+        """Project context and diff for the current run, scanned on first use."""
+        if self._context_session is None:
+            self._context_session = ContextSession(self.context_reader, self.diff_detector)
+        return self._context_session.load()
+    
+    def commit_context(self) -> bool:
+        """
+        Mark the current run as done once its posts succeeded.
+        
+        Saves the project snapshot so the next run reports changes made
+        after this one, and starts a fresh session for later generation.
+        
+        Returns:
+            True if a snapshot was saved
+        """
+        session, self._context_session = self._context_session, None
+        if session is None:
+            return False
+        try:
+            return session.commit()
+        except Exception as e:
+            print(f"Failed to save project snapshot: {e}")
+            return False
+    
     def _setup_providers(self):
-        """Setup available AI providers using direct imports."""
+        """Setup available AI providers using their async clients."""
         # Setup [AI Service] if credentials available
         if self.credentials.ai_service and self.credentials.ai_service.get("api_key"):
             try:
-                import anthropic
-                client = anthropic.Anthropic(api_key=self.credentials.ai_service["api_key"])
-                self.ai_providers["anthropic"] = {
-                    "client": client,
-                    "type": "anthropic"
-                }
+                provider = AnthropicProvider(api_key=self.credentials.ai_service["api_key"])
+                provider.client  # Create the pooled client up front to surface import errors
+                self.ai_providers["anthropic"] = provider
             except ImportError:
                 print("Anthropic library not available. Install with: pip install anthropic")
             except Exception as e:
@@ -45,16 +73,15 @@ class ContentGenerator:
         # Setup OpenAI if credentials available  
         if self.credentials.openai and self.credentials.openai.get("api_key"):
             try:
-                import openai
-                client = openai.OpenAI(api_key=self.credentials.openai["api_key"])
-                self.ai_providers["openai"] = {
-                    "client": client,
-                    "type": "openai"
-                }
+                provider = OpenAIProvider(api_key=self.credentials.openai["api_key"])
+                provider.client
+                self.ai_providers["openai"] = provider
             except ImportError:
                 print("OpenAI library not available. Install with: pip install openai")
             except Exception as e:
                 print(f"Failed to setup OpenAI provider: {e}")
+        
+        self.provider_pool = ProviderPool(list(self.ai_providers.values()))
     
     async def generate_content(self, 
                              config: CampaignConfig, 
@@ -94,23 +121,73 @@ class ContentGenerator:
         
         return content
     
+    async def generate_content_batch(self,
+                                     config: CampaignConfig,
+                                     platforms: List[str],
+                                     variant_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Generate content for several platforms with one LLM request.
+        
+        Project context and diff are built once and shared. Platforms whose
+        variant is missing or over its character limit fall back to a
+        single-platform request using the same shared context.
+        """
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        cache_keys = {platform: self._get_cache_key(config, platform, variant_id) for platform in platforms}
+        
+        for platform in platforms:
+            cached_content = self._get_cached_content(cache_keys[platform])
+            if cached_content:
+                results[platform] = cached_content
+        
+        pending = [platform for platform in platforms if platform not in results]
+        if not pending:
+            return {platform: results[platform] for platform in platforms}
+        
+        # Media is prepared while the text is generated
+        media_task = asyncio.ensure_future(self._prepare_media_batch(config, pending))
+        
+        try:
+            project_context_text = self._get_project_context_text()
+            project_diff_text = self._get_project_diff_text()
+            
+            texts: Dict[str, str] = {}
+            if len(pending) > 1:
+                prompt = self._build_batch_prompt(config, pending, variant_id, project_context_text, project_diff_text)
+                texts = await self._generate_batch_text(prompt, pending)
+            
+            for platform in pending:
+                if platform not in texts:
+                    prompt = self._build_prompt(config, platform, variant_id, project_context_text, project_diff_text)
+                    texts[platform] = await self._generate_text(prompt, config, platform)
+            
+            media = await media_task
+        finally:
+            media_task.cancel()
+        
+        for platform in pending:
+            content = {
+                "text": texts[platform],
+                "media": media[platform],
+                "hashtags": self._generate_hashtags(config, platform),
+                "platform": platform,
+                "variant_id": variant_id
+            }
+            
+            self._cache_content(cache_keys[platform], content)
+            results[platform] = content
+        
+        return {platform: results[platform] for platform in platforms}
+    
     def _build_prompt(self, 
                      config: CampaignConfig, 
                      platform: str,
-                     variant_id: Optional[str] = None) -> str:
+                     variant_id: Optional[str] = None,
+                     project_context_text: Optional[str] = None,
+                     project_diff_text: Optional[str] = None) -> str:
         """Build AI prompt for content generation."""
         
-        # Get variant-specific settings if applicable
-        variant_config = None
-        if variant_id and config.experiments:
-            for variant in config.experiments.variants:
-                if variant.get("id") == variant_id:
-                    variant_config = variant
-                    break
-        
-        # Use variant settings or defaults
-        style = variant_config.get("style") if variant_config else config.content.style
-        action = variant_config.get("action") if variant_config else config.content.action
+        style, action = self._get_variant_style(config, variant_id)
         language = config.content.language
         
         # Platform-specific constraints
@@ -123,9 +200,11 @@ class ContentGenerator:
         # Language-specific instructions
         language_instructions = self._get_language_instructions(language)
         
-        # Get project context and diff information
-        project_context_text = self._get_project_context_text()
-        project_diff_text = self._get_project_diff_text()
+        # Get project context and diff information unless already built
+        if project_context_text is None:
+            project_context_text = self._get_project_context_text()
+        if project_diff_text is None:
+            project_diff_text = self._get_project_diff_text()
         
         # Build context-aware prompt
         base_prompt = f"""Create an engaging social media post for {platform} about the following:
@@ -168,6 +247,78 @@ Generate only the post text, no explanations or additional commentary."""
         
         return prompt
     
+    def _get_variant_style(self, config: CampaignConfig, variant_id: Optional[str] = None) -> Tuple[str, str]:
+        """Get style and call to action, honouring experiment variants."""
+        variant_config = None
+        if variant_id and config.experiments:
+            for variant in config.experiments.variants:
+                if variant.get("id") == variant_id:
+                    variant_config = variant
+                    break
+        
+        style = variant_config.get("style") if variant_config else config.content.style
+        action = variant_config.get("action") if variant_config else config.content.action
+        return style, action
+    
+    def _build_batch_prompt(self,
+                            config: CampaignConfig,
+                            platforms: List[str],
+                            variant_id: Optional[str],
+                            project_context_text: str,
+                            project_diff_text: str) -> str:
+        """Build a single prompt requesting one post per platform as JSON."""
+        
+        style, action = self._get_variant_style(config, variant_id)
+        language = config.content.language
+        language_name = self._get_language_name(language)
+        
+        platform_sections = []
+        for platform in platforms:
+            features = self._get_platform_features(platform)
+            hashtag_rule = 'Use appropriate hashtags' if platform != 'twitter' else 'Limit hashtags (Twitter style)'
+            section = f"### {platform}\n- Character limit: {self._get_platform_char_limit(platform)}\n- {hashtag_rule}"
+            if features:
+                section += f"\n{features}"
+            platform_sections.append(section)
+        
+        example = json.dumps({platform: "..." for platform in platforms}, ensure_ascii=False)
+        
+        return f"""Create engaging social media posts for each of these platforms: {', '.join(platforms)}
+
+App/Service: {config.name}
+Description: {config.concept}
+{f'URL: {config.url}' if config.url else ''}
+
+{project_context_text}
+
+{project_diff_text}
+
+Style Guidelines:
+- Tone: {style}
+- Call to action: {action}
+- Language: Write ENTIRELY in {language_name} ({language})
+
+{self._get_language_instructions(language)}
+
+{self._get_style_instructions(style)}
+
+Platform Requirements:
+{chr(10).join(platform_sections)}
+
+Requirements:
+- Write every post ENTIRELY in {language_name}
+- Each post MUST stay within its platform's character limit
+- Adapt each post to its platform rather than repeating the same text
+- Use the project context and recent changes to make the posts specific and relevant
+- If significant changes were detected, focus on those updates
+- Make them engaging and shareable
+- Include the call to action naturally
+- Keep them authentic and not overly promotional
+- Use culturally appropriate expressions for {language_name} speakers
+
+Respond with ONLY a JSON object mapping each platform name to its post text, for example:
+{example}"""
+    
     def _get_platform_char_limit(self, platform: str) -> int:
         """Get character limit for platform."""
         limits = {
@@ -329,58 +480,84 @@ Generate only the post text, no explanations or additional commentary."""
                            platform: str) -> str:
         """Generate text content using AI providers."""
         
-        # Try providers in order of preference
-        providers_to_try = ["anthropic", "openai"]
+        char_limit = self._get_platform_char_limit(platform)
         
-        for provider_name in providers_to_try:
-            if provider_name in self.ai_providers:
-                try:
-                    provider = self.ai_providers[provider_name]
-                    client = provider["client"]
-                    provider_type = provider["type"]
-                    
-                    # Generate text based on provider type
-                    if provider_type == "anthropic":
-                        response = client.messages.create(
-                            model="claude-3-haiku-20240307",
-                            max_tokens=min(300, self._get_platform_char_limit(platform) + 50),
-                            temperature=0.0,
-                            messages=[{"role": "user", "content": prompt}]
-                        )
-                        text = response.content[0].text
-                    
-                    elif provider_type == "openai":
-                        response = client.chat.completions.create(
-                            model="gpt-3.5-turbo",
-                            max_tokens=min(300, self._get_platform_char_limit(platform) + 50),
-                            temperature=0.0,
-                            seed=42,
-                            messages=[{"role": "user", "content": prompt}]
-                        )
-                        text = response.choices[0].message.content
-                    
-                    else:
-                        continue
-                    
-                    # Validate length
-                    char_limit = self._get_platform_char_limit(platform)
-                    if len(text) <= char_limit:
-                        return text.strip()
-                    else:
-                        # Try to trim if slightly over limit
-                        if len(text) <= char_limit + 20:
-                            sentences = text.split('. ')
-                            trimmed = '. '.join(sentences[:-1])
-                            if len(trimmed) <= char_limit:
-                                return trimmed.strip()
+        # Try providers fastest-first, based on observed latency
+        for provider in self.provider_pool.ordered():
+            try:
+                text = await provider.generate(
+                    prompt,
+                    max_tokens=min(300, char_limit + 50),
+                    temperature=0.0
+                )
                 
-                except Exception as e:
-                    print(f"Failed to generate with {provider_name}: {e}")
-                    continue
+                fitted = self._fit_to_limit(text, char_limit)
+                if fitted:
+                    return fitted
+            
+            except Exception as e:
+                print(f"Failed to generate with {provider.name}: {e}")
+                continue
         
         # Fallback to template-based generation
         return self._generate_fallback_content(config, platform)
     
+    def _fit_to_limit(self, text: str, char_limit: int) -> Optional[str]:
+        """Return text if it fits the limit, trimming a slightly long final sentence."""
+        if len(text) <= char_limit:
+            return text.strip()
+        
+        # Try to trim if slightly over limit
+        if len(text) <= char_limit + 20:
+            sentences = text.split('. ')
+            trimmed = '. '.join(sentences[:-1])
+            if trimmed and len(trimmed) <= char_limit:
+                return trimmed.strip()
+        
+        return None
+    
+    async def _generate_batch_text(self,
+                                   prompt: str,
+                                   platforms: List[str]) -> Dict[str, str]:
+        """Generate all platform texts in one call and keep those that validate."""
+        
+        max_tokens = sum(min(300, self._get_platform_char_limit(p) + 50) for p in platforms) + 50 * len(platforms)
+        
+        for provider in self.provider_pool.ordered():
+            try:
+                raw = await provider.generate(prompt, max_tokens=max_tokens, temperature=0.0)
+                variants = self._parse_batch_response(raw)
+            except Exception as e:
+                print(f"Failed to generate batch with {provider.name}: {e}")
+                continue
+            
+            texts = {}
+            for platform in platforms:
+                text = variants.get(platform)
+                if not isinstance(text, str):
+                    continue
+                fitted = self._fit_to_limit(text, self._get_platform_char_limit(platform))
+                if fitted:
+                    texts[platform] = fitted
+            
+            if texts:
+                return texts
+        
+        return {}
+    
+    def _parse_batch_response(self, raw: str) -> Dict[str, Any]:
+        """Extract the platform-to-text JSON object from a model response."""
+        start = raw.find("{")
+        end = raw.rfind("}")
+        if start == -1 or end <= start:
+            raise ValueError("No JSON object in batch response")
+        
+        data = json.loads(raw[start:end + 1])
+        if not isinstance(data, dict):
+            raise ValueError("Batch response is not a JSON object")
+        
+        return {str(key).lower(): value for key, value in data.items()}
+    
     def _generate_fallback_content(self, config: CampaignConfig, platform: str) -> str:
         """Generate fallback content using style-appropriate templates."""
         templates = {
@@ -430,6 +607,15 @@ Generate only the post text, no explanations or additional commentary."""
         
         return media_files
     
+    async def _prepare_media_batch(self, config: CampaignConfig, platforms: List[str]) -> Dict[str, List[str]]:
+        """Prepare media for several platforms at once.
+        
+        The media depends only on the campaign's image setting, so it is
+        prepared (and any image generated) once and shared by every platform.
+        """
+        media_files = await self._prepare_media(config, platforms[0])
+        return {platform: list(media_files) for platform in platforms}
+    
     async def _generate_image(self, config: CampaignConfig, platform: str) -> Optional[str]:
         """Generate image using AI providers."""
         
@@ -437,24 +623,16 @@ Generate only the post text, no explanations or additional commentary."""
         if "openai" in self.ai_providers:
             try:
                 provider = self.ai_providers["openai"]
-                client = provider["client"]
                 
                 # Build image prompt
                 image_prompt = f"Create a promotional image for {config.name}: {config.concept}. Modern, clean design, suitable for social media."
                 
                 # Generate image using DALL-E
-                response = client.images.generate(
-                    model="dall-e-3",
-                    prompt=image_prompt,
-                    size="1024x1024",
-                    quality="standard",
-                    n=1
-                )
+                image_url = await provider.generate_image(image_prompt)
                 
-                # Download the image
+                # Download the image without blocking the event loop
                 import requests
-                image_url = response.data[0].url
-                image_response = requests.get(image_url)
+                image_response = await asyncio.to_thread(requests.get, image_url, timeout=60)
                 
                 if image_response.status_code == 200:
                     # Save image
@@ -570,8 +748,8 @@ Generate only the post text, no explanations or additional commentary."""
             Formatted project context text or empty string
         """
         try:
-            # Read project context
-            context = self.context_reader.read_project_context()
+            # Project context is read once per run and shared by every platform
+            context = self.context_session().context
             
             if not context or not context.files:
                 return ""
@@ -617,8 +795,8 @@ Generate only the post text, no explanations or additional commentary."""
             Formatted project diff text or empty string
         """
         try:
-            # Detect changes since last run
-            diff = self.diff_detector.detect_changes()
+            # Changes since the last committed run; the snapshot is saved by commit_context()
+            diff = self.context_session().diff
             
             if not diff or not diff.has_significant_changes:
                 return ""
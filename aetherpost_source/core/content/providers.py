@@ -0,0 +1,301 @@
+"""Async AI provider layer used by the content generator."""
+
+import asyncio
+import functools
+import logging
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Shared worker pool for SDKs that only ship a blocking client
+_bridge_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_bridge_executor() -> ThreadPoolExecutor:
+    """Return the thread pool used to bridge synchronous SDK clients."""
+    global _bridge_executor
+    if _bridge_executor is None:
+        _bridge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ai-provider")
+    return _bridge_executor
+
+
+def _build_http_client(max_connections: int, timeout: float):
+    """Create a pooled httpx client for SDKs that accept one, if httpx is available."""
+    try:
+        import httpx
+    except ImportError:
+        return None
+    
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections
+        ),
+        timeout=timeout
+    )
+
+
+class ProviderStats:
+    """Exponentially weighted latency and failure tracking for a provider."""
+    
+    def __init__(self, alpha: float = 0.3, failure_cooldown: float = 60.0):
+        self.alpha = alpha
+        self.failure_cooldown = failure_cooldown
+        self.ewma_latency: Optional[float] = None
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_failure: Optional[float] = None
+    
+    def record_success(self, latency: float):
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = self.alpha * latency + (1 - self.alpha) * self.ewma_latency
+        self.successes += 1
+        self.consecutive_failures = 0
+    
+    def record_failure(self):
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_failure = time.monotonic()
+    
+    def in_cooldown(self) -> bool:
+        """Whether the provider failed recently enough to be tried last."""
+        if not self.consecutive_failures or self.last_failure is None:
+            return False
+        cooldown = self.failure_cooldown * min(self.consecutive_failures, 5)
+        return time.monotonic() - self.last_failure < cooldown
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'ewma_latency': self.ewma_latency,
+            'successes': self.successes,
+            'failures': self.failures,
+            'consecutive_failures': self.consecutive_failures,
+            'in_cooldown': self.in_cooldown()
+        }
+
+
+class AIProvider(ABC):
+    """Base class for async text generation providers.
+
+    Each provider owns one long-lived client (and therefore one connection
+    pool) and bounds the number of in-flight requests with a semaphore.
+    """
+    
+    def __init__(self, api_key: str, model: str, max_concurrency: int = 4, timeout: float = 60.0):
+        self.api_key = api_key
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.stats = ProviderStats()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._client = None
+        self._is_async = False
+    
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Provider identifier (e.g., 'anthropic', 'openai')."""
+        pass
+    
+    @abstractmethod
+    def _create_client(self):
+        """Create the SDK client, preferring the native async client."""
+        pass
+    
+    @abstractmethod
+    async def _complete(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """Provider-specific completion call."""
+        pass
+    
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+    
+    async def generate(self, prompt: str, max_tokens: int = 300, temperature: float = 0.0) -> str:
+        """Generate text, recording latency for failover ordering."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async with self._semaphore:
+            start = time.monotonic()
+            try:
+                text = await asyncio.wait_for(
+                    self._complete(prompt, max_tokens, temperature),
+                    timeout=self.timeout
+                )
+            except Exception:
+                self.stats.record_failure()
+                raise
+            
+            self.stats.record_success(time.monotonic() - start)
+            return text
+    
+    async def _call(self, func, *args, **kwargs):
+        """Await an SDK call, running blocking clients on the bridge pool."""
+        if self._is_async:
+            return await func(*args, **kwargs)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_bridge_executor(),
+            functools.partial(func, *args, **kwargs)
+        )
+    
+    async def close(self):
+        """Close the underlying client and its connection pool."""
+        if self._client is None:
+            return
+        try:
+            close = getattr(self._client, "close", None)
+            if close:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+        except Exception as e:
+            logger.debug(f"Error closing {self.name} client: {e}")
+        finally:
+            self._client = None
+
+
+class AnthropicProvider(AIProvider):
+    """Anthropic Messages API provider."""
+    
+    def __init__(self, api_key: str, model: str = "claude-3-haiku-20240307", **kwargs):
+        super().__init__(api_key, model, **kwargs)
+    
+    @property
+    def name(self) -> str:
+        return "anthropic"
+    
+    def _create_client(self):
+        import anthropic
+        
+        if hasattr(anthropic, "AsyncAnthropic"):
+            self._is_async = True
+            http_client = _build_http_client(self.max_concurrency, self.timeout)
+            if http_client is not None:
+                return anthropic.AsyncAnthropic(api_key=self.api_key, http_client=http_client)
+            return anthropic.AsyncAnthropic(api_key=self.api_key)
+        
+        self._is_async = False
+        return anthropic.Anthropic(api_key=self.api_key)
+    
+    async def _complete(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        response = await self._call(
+            self.client.messages.create,
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return response.content[0].text
+
+
+class OpenAIProvider(AIProvider):
+    """OpenAI Chat Completions provider."""
+    
+    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo", **kwargs):
+        super().__init__(api_key, model, **kwargs)
+    
+    @property
+    def name(self) -> str:
+        return "openai"
+    
+    def _create_client(self):
+        import openai
+        
+        if hasattr(openai, "AsyncOpenAI"):
+            self._is_async = True
+            http_client = _build_http_client(self.max_concurrency, self.timeout)
+            if http_client is not None:
+                return openai.AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+            return openai.AsyncOpenAI(api_key=self.api_key)
+        
+        self._is_async = False
+        return openai.OpenAI(api_key=self.api_key)
+    
+    async def _complete(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        response = await self._call(
+            self.client.chat.completions.create,
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            seed=42,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return response.choices[0].message.content
+    
+    async def generate_image(self, prompt: str, size: str = "1024x1024", quality: str = "standard") -> str:
+        """Generate an image with DALL-E and return its URL."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async with self._semaphore:
+            response = await self._call(
+                self.client.images.generate,
+                model="dall-e-3",
+                prompt=prompt,
+                size=size,
+                quality=quality,
+                n=1
+            )
+        return response.data[0].url
+
+
+class ProviderPool:
+    """Orders providers by observed latency for failover.
+
+    Providers without samples keep their configured preference order;
+    providers that failed recently are moved to the back until their
+    cooldown expires.
+    """
+    
+    def __init__(self, providers: Optional[List[AIProvider]] = None):
+        self._providers: Dict[str, AIProvider] = {}
+        self._preference: List[str] = []
+        for provider in providers or []:
+            self.add(provider)
+    
+    def add(self, provider: AIProvider):
+        self._providers[provider.name] = provider
+        if provider.name not in self._preference:
+            self._preference.append(provider.name)
+    
+    def get(self, name: str) -> Optional[AIProvider]:
+        return self._providers.get(name)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._providers
+    
+    def __len__(self) -> int:
+        return len(self._providers)
+    
+    def ordered(self) -> List[AIProvider]:
+        """Return providers in the order they should be tried."""
+        measured = [p.stats.ewma_latency for p in self._providers.values() if p.stats.ewma_latency is not None]
+        # Unmeasured providers are assumed to be as fast as the best known one
+        default_latency = min(measured) if measured else 0.0
+        
+        def sort_key(provider: AIProvider):
+            latency = provider.stats.ewma_latency
+            return (
+                provider.stats.in_cooldown(),
+                latency if latency is not None else default_latency,
+                self._preference.index(provider.name)
+            )
+        
+        return sorted(self._providers.values(), key=sort_key)
+    
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        return {name: provider.stats.to_dict() for name, provider in self._providers.items()}
+    
+    async def close(self):
+        await asyncio.gather(*[provider.close() for provider in self._providers.values()])
@@ -2,5 +2,6 @@
 
 from .project_reader import ProjectContextReader
 from .diff_detector import ProjectDiffDetector
+from .session import ContextSession
 
-__all__ = ["ProjectContextReader", "ProjectDiffDetector"]
\ No newline at end of file
+__all__ = ["ProjectContextReader", "ProjectDiffDetector", "ContextSession"]
\ No newline at end of file
@@ -158,6 +158,26 @@ class ProjectDiffDetector:
             # Context reading disabled
             return None
         
+        diff = self.compare(current_context)
+        
+        # Save new snapshot
+        self.save_snapshot(diff.new_snapshot)
+        
+        return diff
+    
+    def compare(self, current_context: ProjectContext) -> ProjectDiff:
+        """
+        Compare already-read project context with the last saved snapshot.
+        
+        Unlike detect_changes, this neither rescans the project nor saves
+        the new snapshot.
+        
+        Args:
+            current_context: Current project context
+            
+        Returns:
+            ProjectDiff object
+        """
         # Create current snapshot
         new_snapshot = self.create_snapshot(current_context)
         
@@ -175,9 +195,6 @@ class ProjectDiffDetector:
         # Determine if changes are significant
         has_significant = self._has_significant_changes(changes, old_snapshot, new_snapshot)
         
-        # Save new snapshot
-        self.save_snapshot(new_snapshot)
-        
         return ProjectDiff(
             old_snapshot=old_snapshot,
             new_snapshot=new_snapshot,
@@ -1,15 +1,19 @@
 """Secure project file reader with security controls."""
 
 import os
-import re
 import hashlib
+import json
+import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
-import fnmatch
 import yaml
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 from ..exceptions import AetherPostError, ErrorCode
+from .scanner import ExcludeMatcher, ProjectScanner, ScanEntry, ScanIndex
+from .secrets import DEFAULT_RULES, SecretScanner
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -42,29 +46,22 @@ class ProjectContextReader:
     Security Features:
     - Path traversal prevention
     - Sensitive information detection and filtering
-    - File size limits (10KB per file)
+    - File size limits (64KB per file)
     - Whitelist-based access control
     - Read-only operations
+    
+    Excluded directories are pruned before they are descended into, and
+    the outcome of reading each file is kept in an index under
+    ``.aetherpost`` so a rescan only opens files that changed.
     """
     
     # Security configuration
-    MAX_FILE_SIZE = 10 * 1024  # 10KB per file
+    MAX_FILE_SIZE = 64 * 1024  # 64KB per file
     MAX_TOTAL_FILES = 100      # Maximum files to read
     MAX_TOTAL_SIZE = 1024 * 1024  # 1MB total content
     
-    # Sensitive information patterns
-    SENSITIVE_PATTERNS = [
-        r'password\s*[=:]\s*["\']?[^"\'\s]+',
-        r'secret\s*[=:]\s*["\']?[^"\'\s]+',
-        r'key\s*[=:]\s*["\']?[^"\'\s]+',
-        r'token\s*[=:]\s*["\']?[^"\'\s]+',
-        r'api_key\s*[=:]\s*["\']?[^"\'\s]+',
-        r'private_key\s*[=:]\s*["\']?[^"\'\s]+',
-        r'access_token\s*[=:]\s*["\']?[^"\'\s]+',
-        r'[A-Za-z0-9+/]{40,}={0,2}',  # Base64 patterns
-        r'sk-[A-Za-z0-9]{32,}',       # OpenAI API keys
-        r'xoxb-[A-Za-z0-9-]+',        # Slack tokens
-    ]
+    # Sensitive information rules, matched while each file is streamed
+    SECRET_RULES = DEFAULT_RULES
     
     # File patterns to always exclude
     DEFAULT_EXCLUDES = [
@@ -96,15 +93,28 @@ class ProjectContextReader:
         "config.json",
         ".aws",
         ".ssh",
+        ".aetherpost",
     ]
     
-    def __init__(self):
-        """Initialize the project reader."""
+    def __init__(self, incremental: bool = True):
+        """
+        Initialize the project reader.
+        
+        Args:
+            incremental: Reuse per-file results from earlier scans for unchanged files
+        """
         self.project_root = Path.cwd()
-        self.sensitive_regex = re.compile(
-            '|'.join(self.SENSITIVE_PATTERNS), 
-            re.IGNORECASE | re.MULTILINE
-        )
+        self.incremental = incremental
+        self.secret_scanner = SecretScanner(self.SECRET_RULES)
+    
+    @property
+    def index_file(self) -> Path:
+        return self.project_root / ".aetherpost" / "context_index.json"
+    
+    def _rules_fingerprint(self) -> str:
+        """Hash of the rules deciding whether a file is read, for invalidating the scan index."""
+        rules = [[(r.name, r.pattern) for r in self.SECRET_RULES], self.MAX_FILE_SIZE]
+        return hashlib.md5(json.dumps(rules).encode('utf-8')).hexdigest()
     
     def load_context_config(self, campaign_file: str = "campaign.yaml") -> Dict:
         """
@@ -182,7 +192,8 @@ class ProjectContextReader:
             )
         
         # Combine exclude patterns
-        all_excludes = self.DEFAULT_EXCLUDES + exclude_patterns
+        matcher = ExcludeMatcher(self.DEFAULT_EXCLUDES + exclude_patterns)
+        index = ScanIndex(self.index_file, self._rules_fingerprint()) if self.incremental else None
         
         # Read files safely
         files = []
@@ -192,7 +203,7 @@ class ProjectContextReader:
         
         for watch_path in watch_paths:
             path_files, path_excluded, path_oversized = self._read_path_safely(
-                watch_path, all_excludes
+                watch_path, matcher, index
             )
             files.extend(path_files)
             excluded_count += path_excluded
@@ -217,6 +228,9 @@ class ProjectContextReader:
                 files = files[:self.MAX_TOTAL_FILES]
                 break
         
+        if index is not None:
+            index.save()
+        
         return ProjectContext(
             files=files,
             total_files=len(files),
@@ -227,13 +241,19 @@ class ProjectContextReader:
             oversized_files=oversized_count
         )
     
-    def _read_path_safely(self, watch_path: str, exclude_patterns: List[str]) -> Tuple[List[ProjectFile], int, int]:
+    def _read_path_safely(
+        self,
+        watch_path: str,
+        matcher: ExcludeMatcher,
+        index: Optional[ScanIndex] = None
+    ) -> Tuple[List[ProjectFile], int, int]:
         """
         Safely read files from a watch path.
         
         Args:
             watch_path: Path to read (relative to project root)
-            exclude_patterns: Patterns to exclude
+            matcher: Compiled exclude patterns
+            index: Results of earlier scans, reused for unchanged files
             
         Returns:
             Tuple of (files, excluded_count, oversized_count)
@@ -249,48 +269,52 @@ class ProjectContextReader:
             # Invalid path, skip
             return files, excluded_count + 1, oversized_count
         
+        relative_watch_path = os.path.relpath(abs_watch_path, self.project_root)
+        if relative_watch_path != os.curdir and matcher.matches_path(relative_watch_path):
+            return files, excluded_count + 1, oversized_count
+        
         # Handle single file
         if abs_watch_path.is_file():
-            if self._should_exclude_file(abs_watch_path, exclude_patterns):
-                excluded_count += 1
+            stat = abs_watch_path.stat()
+            entry = ScanEntry(str(abs_watch_path), relative_watch_path, stat.st_size, stat.st_mtime_ns, stat.st_ino)
+            file_obj = self._read_entry(entry, index)
+            if file_obj:
+                files.append(file_obj)
             else:
-                file_obj = self._read_file_safely(abs_watch_path)
-                if file_obj:
-                    files.append(file_obj)
-                else:
-                    oversized_count += 1
+                oversized_count += 1
             return files, excluded_count, oversized_count
         
         # Handle directory
         if not abs_watch_path.is_dir():
             return files, excluded_count + 1, oversized_count
         
-        try:
-            for file_path in abs_watch_path.rglob('*'):
-                if not file_path.is_file():
-                    continue
-                
-                # Check exclusion patterns
-                if self._should_exclude_file(file_path, exclude_patterns):
-                    excluded_count += 1
-                    continue
-                
-                # Read file safely
-                file_obj = self._read_file_safely(file_path)
-                if file_obj:
-                    files.append(file_obj)
-                else:
-                    oversized_count += 1
-                
-                # Respect limits
-                if len(files) >= self.MAX_TOTAL_FILES:
-                    break
-                    
-        except (PermissionError, OSError):
-            # Skip inaccessible directories
-            excluded_count += 1
+        scanner = ProjectScanner(self.project_root, matcher)
+        for entry in scanner.walk(abs_watch_path):
+            # Read file safely
+            file_obj = self._read_entry(entry, index)
+            if file_obj:
+                files.append(file_obj)
+            else:
+                oversized_count += 1
+            
+            # Respect limits
+            if len(files) >= self.MAX_TOTAL_FILES:
+                break
         
-        return files, excluded_count, oversized_count
+        return files, excluded_count + scanner.excluded, oversized_count
+    
+    def _read_entry(self, entry: ScanEntry, index: Optional[ScanIndex]) -> Optional[ProjectFile]:
+        """Read a scanned file, or reuse the indexed result if it has not changed."""
+        if index is not None:
+            record = index.lookup(entry)
+            if record is not None:
+                result = record['result']
+                return ProjectFile(**{**result, 'path': entry.path}) if result else None
+        
+        file_obj = self._read_file_safely(Path(entry.path))
+        if index is not None:
+            index.store(entry, asdict(file_obj) if file_obj else None)
+        return file_obj
     
     def _resolve_safe_path(self, path: str) -> Path:
         """
@@ -329,33 +353,6 @@ class ProjectContextReader:
         except Exception as e:
             raise AetherPostError(f"Invalid path: {path} - {e}", ErrorCode.FILE_NOT_FOUND)
     
-    def _should_exclude_file(self, file_path: Path, exclude_patterns: List[str]) -> bool:
-        """
-        Check if file should be excluded based on patterns.
-        
-        Args:
-            file_path: File path to check
-            exclude_patterns: Exclusion patterns
-            
-        Returns:
-            True if file should be excluded
-        """
-        relative_path = str(file_path.relative_to(self.project_root))
-        file_name = file_path.name
-        
-        for pattern in exclude_patterns:
-            # Check against full relative path
-            if fnmatch.fnmatch(relative_path, pattern):
-                return True
-            # Check against filename only
-            if fnmatch.fnmatch(file_name, pattern):
-                return True
-            # Check against directory names in path
-            if pattern in relative_path.split(os.sep):
-                return True
-        
-        return False
-    
     def _read_file_safely(self, file_path: Path) -> Optional[ProjectFile]:
         """
         Read a single file safely with all security checks.
@@ -376,22 +373,19 @@ class ProjectContextReader:
             if file_size == 0:
                 return None
             
-            # Read file content
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                # Try with different encoding
-                try:
-                    with open(file_path, 'r', encoding='latin-1', errors='ignore') as f:
-                        content = f.read()
-                except:
-                    # Skip binary or unreadable files
-                    return None
-            
-            # Check for sensitive information
-            if self._contains_sensitive_info(content):
-                return None
+            # Stream the content, stopping at the first secret
+            stream = self.secret_scanner.stream()
+            chunks = []
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                for chunk in iter(lambda: f.read(self.secret_scanner.chunk_size), ''):
+                    if stream.feed(chunk):
+                        logger.info(
+                            f"Skipping {file_path}: matched secret rule "
+                            f"'{stream.match.rule}' at line {stream.match.line}"
+                        )
+                        return None
+                    chunks.append(chunk)
+            content = ''.join(chunks)
             
             # Calculate hash
             content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
@@ -422,21 +416,7 @@ class ProjectContextReader:
         Returns:
             True if sensitive information detected
         """
-        # Check for sensitive patterns
-        if self.sensitive_regex.search(content):
-            return True
-        
-        # Check for long base64-like strings (potential keys)
-        base64_pattern = re.compile(r'[A-Za-z0-9+/]{50,}={0,2}')
-        if base64_pattern.search(content):
-            return True
-        
-        # Check for environment variable assignments with sensitive names
-        env_pattern = re.compile(r'^(PASSWORD|SECRET|KEY|TOKEN|API_KEY)=', re.MULTILINE | re.IGNORECASE)
-        if env_pattern.search(content):
-            return True
-        
-        return False
+        return self.secret_scanner.scan(content) is not None
     
     def get_file_summary(self, context: ProjectContext) -> Dict:
         """
@@ -0,0 +1,174 @@
+"""Pruning directory scanner and incremental scan index for project context."""
+
+import fnmatch
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScanEntry:
+    """A file found by the scanner, with the stat fields used to detect changes."""
+    path: str
+    relative_path: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+
+class ExcludeMatcher:
+    """All exclude patterns compiled into one matcher.
+
+    A path is excluded when any pattern matches its relative path or its
+    name, or equals its name exactly. Directories are matched the same way,
+    so an excluded directory is skipped without being descended into.
+    """
+    
+    def __init__(self, patterns: List[str]):
+        self.names: Set[str] = set(patterns)
+        self.regex = re.compile('|'.join(f"(?:{fnmatch.translate(p)})" for p in patterns)) if patterns else None
+    
+    def matches(self, relative_path: str, name: str) -> bool:
+        if name in self.names:
+            return True
+        if self.regex is None:
+            return False
+        return bool(self.regex.match(name) or self.regex.match(relative_path))
+    
+    def matches_path(self, relative_path: str) -> bool:
+        """Whether a path or any directory above it is excluded."""
+        parts = relative_path.split(os.sep)
+        return any(
+            self.matches(os.sep.join(parts[:i + 1]), part)
+            for i, part in enumerate(parts)
+        )
+
+
+class ProjectScanner:
+    """Depth-first ``os.scandir`` walk that prunes excluded directories.
+
+    Entries are visited in name order, so the files kept under the
+    reader's file limit are the same on every run. Symlinked directories
+    are not followed.
+    """
+    
+    def __init__(self, project_root: Path, matcher: ExcludeMatcher):
+        self.project_root = project_root
+        self.matcher = matcher
+        self.excluded = 0
+        self.pruned_dirs = 0
+    
+    def walk(self, directory: Path) -> Iterator[ScanEntry]:
+        stack = [(str(directory), os.path.relpath(directory, self.project_root))]
+        
+        while stack:
+            path, relative_dir = stack.pop()
+            try:
+                with os.scandir(path) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError:
+                # Skip inaccessible directories
+                self.excluded += 1
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                relative_path = entry.name if relative_dir == os.curdir else os.path.join(relative_dir, entry.name)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.matcher.matches(relative_path, entry.name):
+                            self.excluded += 1
+                            self.pruned_dirs += 1
+                        else:
+                            subdirs.append((entry.path, relative_path))
+                        continue
+                    
+                    if not entry.is_file():
+                        continue
+                    if self.matcher.matches(relative_path, entry.name):
+                        self.excluded += 1
+                        continue
+                    
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                
+                yield ScanEntry(
+                    path=entry.path,
+                    relative_path=relative_path,
+                    size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    inode=stat.st_ino
+                )
+            
+            stack.extend(reversed(subdirs))
+
+
+class ScanIndex:
+    """Results of reading each file, persisted between runs.
+
+    Records are keyed by relative path and valid while the file's size,
+    mtime and inode are unchanged, so a rescan opens only new or modified
+    files. The index is discarded when ``fingerprint`` (the reader's
+    filtering rules) changes, and records for files not seen during a
+    scan are dropped when it is saved.
+    """
+    
+    def __init__(self, index_file: Path, fingerprint: str):
+        self.index_file = index_file
+        self.fingerprint = fingerprint
+        self.stats = {'reused': 0, 'read': 0}
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._seen: Set[str] = set()
+        self._dirty = False
+        self._load()
+    
+    def _load(self):
+        if not self.index_file.exists():
+            return
+        try:
+            data = json.loads(self.index_file.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read context index {self.index_file}: {e}")
+            return
+        if data.get('fingerprint') == self.fingerprint:
+            self._records = data.get('files', {})
+    
+    def lookup(self, entry: ScanEntry) -> Optional[Dict[str, Any]]:
+        """The stored record for an unchanged file."""
+        record = self._records.get(entry.relative_path)
+        if record is None or (record['size'], record['mtime_ns'], record['inode']) != (entry.size, entry.mtime_ns, entry.inode):
+            return None
+        self._seen.add(entry.relative_path)
+        self.stats['reused'] += 1
+        return record
+    
+    def store(self, entry: ScanEntry, result: Optional[Dict[str, Any]]):
+        """Record the outcome of reading a file; ``None`` means it was skipped."""
+        self._records[entry.relative_path] = {
+            'size': entry.size,
+            'mtime_ns': entry.mtime_ns,
+            'inode': entry.inode,
+            'result': result
+        }
+        self._seen.add(entry.relative_path)
+        self.stats['read'] += 1
+        self._dirty = True
+    
+    def save(self):
+        if not self._dirty and self._seen == set(self._records):
+            return
+        files = {path: record for path, record in self._records.items() if path in self._seen}
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_suffix('.tmp')
+            tmp_file.write_text(json.dumps({'fingerprint': self.fingerprint, 'files': files}), encoding='utf-8')
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            logger.warning(f"Could not save context index {self.index_file}: {e}")
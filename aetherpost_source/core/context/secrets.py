@@ -0,0 +1,151 @@
+"""Multi-pattern secret scanner for project files."""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SecretRule:
+    """A named secret pattern.
+
+    ``anchors`` are lowercase literals, at least one of which occurs in any
+    text the pattern can match. Text without an anchor skips the rule
+    without running its regex; a rule with no anchors always runs.
+    """
+    name: str
+    pattern: str
+    anchors: Tuple[str, ...] = ()
+
+
+@dataclass
+class SecretMatch:
+    """Where a rule first matched: character offset and 1-based line."""
+    rule: str
+    offset: int
+    line: int
+
+
+DEFAULT_RULES: Tuple[SecretRule, ...] = (
+    SecretRule('password', r'password\s*[=:]\s*["\']?[^"\'\s]+', ('password',)),
+    SecretRule('secret', r'secret\s*[=:]\s*["\']?[^"\'\s]+', ('secret',)),
+    SecretRule('api_key', r'api_key\s*[=:]\s*["\']?[^"\'\s]+', ('api_key',)),
+    SecretRule('private_key', r'private_key\s*[=:]\s*["\']?[^"\'\s]+', ('private_key',)),
+    SecretRule('access_token', r'access_token\s*[=:]\s*["\']?[^"\'\s]+', ('access_token',)),
+    SecretRule('key', r'key\s*[=:]\s*["\']?[^"\'\s]+', ('key',)),
+    SecretRule('token', r'token\s*[=:]\s*["\']?[^"\'\s]+', ('token',)),
+    SecretRule('env_assignment', r'^(?:PASSWORD|SECRET|KEY|TOKEN|API_KEY)=', ('=',)),
+    SecretRule('openai_key', r'sk-[A-Za-z0-9]{32,}', ('sk-',)),
+    SecretRule('slack_token', r'xoxb-[A-Za-z0-9-]+', ('xoxb-',)),
+    SecretRule('base64_blob', r'[A-Za-z0-9+/]{40,}={0,2}'),
+)
+
+
+class SecretScanner:
+    """Finds the first secret in text using a set of rules compiled once.
+
+    Rules are prefiltered by their anchors, and the ones left are searched
+    together in a single alternation, compiled once per distinct set of
+    rules. The earliest match wins, ties going to the rule listed first.
+
+    Files are scanned as a stream of chunks (see ``stream``). Each chunk is
+    searched together with the last ``overlap`` characters of the one
+    before, so a secret no longer than the overlap is found even when it
+    straddles a chunk boundary.
+    """
+    
+    CHUNK_SIZE = 16 * 1024
+    OVERLAP = 256
+    FLAGS = re.IGNORECASE | re.MULTILINE
+    
+    def __init__(self, rules: Iterable[SecretRule] = DEFAULT_RULES,
+                 chunk_size: Optional[int] = None, overlap: Optional[int] = None):
+        self.rules: List[SecretRule] = list(rules)
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.overlap = self.OVERLAP if overlap is None else overlap
+        self._anchored = [i for i, rule in enumerate(self.rules) if rule.anchors]
+        self._always = tuple(i for i, rule in enumerate(self.rules) if not rule.anchors)
+        self._compiled: Dict[Tuple[int, ...], re.Pattern] = {}
+    
+    def _regex_for(self, active: Tuple[int, ...]) -> re.Pattern:
+        regex = self._compiled.get(active)
+        if regex is None:
+            regex = re.compile(
+                '|'.join(f"(?P<r{i}>{self.rules[i].pattern})" for i in active),
+                self.FLAGS
+            )
+            self._compiled[active] = regex
+        return regex
+    
+    def search(self, text: str, pos: int = 0) -> Optional[Tuple[SecretRule, int]]:
+        """
+        Find the first rule matching ``text`` from ``pos``.
+
+        Characters before ``pos`` are not searched but still count as
+        context for ``^``, which only matches after a newline there.
+
+        Returns:
+            The matching rule and the offset of the match, or None
+        """
+        lowered = text.lower()
+        active = tuple(sorted(
+            [i for i in self._anchored if any(a in lowered for a in self.rules[i].anchors)]
+            + list(self._always)
+        ))
+        if not active:
+            return None
+        
+        match = self._regex_for(active).search(text, pos)
+        if match is None:
+            return None
+        return self.rules[int(match.lastgroup[1:])], match.start()
+    
+    def scan(self, text: str) -> Optional[SecretMatch]:
+        """The first secret in ``text``, or None."""
+        found = self.search(text)
+        if found is None:
+            return None
+        rule, offset = found
+        return SecretMatch(rule.name, offset, text.count('\n', 0, offset) + 1)
+    
+    def stream(self) -> "SecretStream":
+        """A fresh stream for scanning one file chunk by chunk."""
+        return SecretStream(self)
+
+
+class SecretStream:
+    """Incremental scan of one file, fed with consecutive chunks of text."""
+    
+    def __init__(self, scanner: SecretScanner):
+        self.scanner = scanner
+        self.match: Optional[SecretMatch] = None
+        self._tail = ''
+        self._tail_offset = 0
+        self._tail_line = 1
+    
+    def feed(self, chunk: str) -> Optional[SecretMatch]:
+        """
+        Scan the next chunk.
+
+        Returns:
+            The first match so far; once set, later chunks are ignored
+        """
+        if self.match is not None or not chunk:
+            return self.match
+        
+        # The first carried character is context only, so ``^`` sees
+        # whether the searched text starts a line
+        window = self._tail + chunk
+        found = self.scanner.search(window, 1 if self._tail else 0)
+        if found is not None:
+            rule, offset = found
+            line = self._tail_line + window.count('\n', 0, offset)
+            self.match = SecretMatch(rule.name, self._tail_offset + offset, line)
+            return self.match
+        
+        keep = min(len(window), self.scanner.overlap + 1)
+        dropped = len(window) - keep
+        self._tail_line += window.count('\n', 0, dropped)
+        self._tail_offset += dropped
+        self._tail = window[dropped:]
+        return None
@@ -0,0 +1,50 @@
+"""Per-run project context shared by every prompt of the run."""
+
+from typing import Optional
+
+from .diff_detector import ProjectDiff, ProjectDiffDetector
+from .project_reader import ProjectContext, ProjectContextReader
+
+
+class ContextSession:
+    """
+    Project context and diff for one run, read once.
+
+    The project is scanned on first use and the diff computed against the
+    last saved snapshot; every later caller in the run gets the same
+    result. The new snapshot is only saved by ``commit()``, so a run that
+    fails leaves its changes to be reported again by the next one.
+    """
+    
+    def __init__(self, reader: ProjectContextReader, detector: ProjectDiffDetector,
+                 campaign_file: str = "campaign.yaml"):
+        self.reader = reader
+        self.detector = detector
+        self.campaign_file = campaign_file
+        self.context: Optional[ProjectContext] = None
+        self.diff: Optional[ProjectDiff] = None
+        self.committed = False
+        self._loaded = False
+    
+    def load(self) -> "ContextSession":
+        """Scan the project and compute the diff, unless already done."""
+        if not self._loaded:
+            # Mark first so a failing scan is not retried for every platform
+            self._loaded = True
+            self.context = self.reader.read_project_context(self.campaign_file)
+            if self.context:
+                self.diff = self.detector.compare(self.context)
+        return self
+    
+    def commit(self) -> bool:
+        """
+        Save this run's snapshot as the baseline for the next diff.
+
+        Returns:
+            True if a snapshot was saved
+        """
+        if self.committed or self.diff is None:
+            return False
+        self.detector.save_snapshot(self.diff.new_snapshot)
+        self.committed = True
+        return True
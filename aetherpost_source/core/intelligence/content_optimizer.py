@@ -347,7 +347,10 @@ class ContentOptimizer:
         
         # Use existing content generator
         content_generator = ContentGenerator({})  # Credentials handled elsewhere
-        return await content_generator.generate_content(config, platform)
+        try:
+            return await content_generator.generate_content(config, platform)
+        finally:
+            await content_generator.close()
     
     async def _generate_length_optimized_variant(self, config: CampaignConfig, platform: str, length_insights: Dict) -> Dict:
         """Generate content optimized for length."""
@@ -137,9 +137,15 @@ class AuditLogger:
     """Specialized logger for audit events."""
     
     def __init__(self):
-        self.logger = logging.getLogger("autopromo.audit")
+        self._logger = logging.getLogger("autopromo.audit")
         self.audit_handler = None
-        self._setup_audit_handler()
+    
+    @property
+    def logger(self) -> logging.Logger:
+        """The audit logger, with its file handler attached on first use."""
+        if self.audit_handler is None:
+            self._setup_audit_handler()
+        return self._logger
     
     def _setup_audit_handler(self):
         """Setup dedicated audit log handler."""
@@ -149,11 +155,12 @@ class AuditLogger:
         self.audit_handler = logging.handlers.RotatingFileHandler(
             log_path / "audit.log",
             maxBytes=10485760,  # 10MB
-            backupCount=10
+            backupCount=10,
+            delay=True
         )
         self.audit_handler.setFormatter(JSONFormatter())
-        self.logger.addHandler(self.audit_handler)
-        self.logger.setLevel(logging.INFO)
+        self._logger.addHandler(self.audit_handler)
+        self._logger.setLevel(logging.INFO)
     
     def log_campaign_action(self, action: str, campaign_id: str, user_id: str = None, 
                            platform: str = None, details: Dict[str, Any] = None):
@@ -171,12 +171,20 @@ class AetherPostLogger:
         self.logger = logging.getLogger(name)
         self.log_dir = Path("logs")
         self.session_id = self._generate_session_id()
+        self.audit_logger = logging.getLogger(f"{name}.audit")
+        self.audit_handler = None
         
-        # Ensure logs directory exists
-        self.log_dir.mkdir(exist_ok=True)
-        
-        # Setup logging if not already configured
+        # Handlers (and the logs directory) are set up on first use, so
+        # importing the module opens no files
+        self._configured = False
+    
+    def configure(self):
+        """Set up console and file handlers; runs once, before the first record."""
+        if self._configured:
+            return
+        self._configured = True
         if not self.logger.handlers:
+            self.log_dir.mkdir(exist_ok=True)
             self._setup_logging()
     
     def _generate_session_id(self) -> str:
@@ -208,7 +216,8 @@ class AetherPostLogger:
         file_handler = logging.handlers.RotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
+            backupCount=5,
+            delay=True
         )
         file_handler.setLevel(logging.DEBUG)
         file_formatter = AetherPostFormatter(LogFormat.DETAILED, include_color=False)
@@ -220,7 +229,8 @@ class AetherPostLogger:
         json_handler = logging.handlers.RotatingFileHandler(
             json_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=3
+            backupCount=3,
+            delay=True
         )
         json_handler.setLevel(logging.INFO)
         json_formatter = AetherPostFormatter(LogFormat.JSON)
@@ -232,7 +242,8 @@ class AetherPostLogger:
         error_handler = logging.handlers.RotatingFileHandler(
             error_file,
             maxBytes=5 * 1024 * 1024,  # 5MB
-            backupCount=3
+            backupCount=3,
+            delay=True
         )
         error_handler.setLevel(logging.ERROR)
         error_formatter = AetherPostFormatter(LogFormat.DETAILED, include_color=False)
@@ -244,13 +255,13 @@ class AetherPostLogger:
         self.audit_handler = logging.handlers.RotatingFileHandler(
             audit_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=10  # Keep more audit logs
+            backupCount=10,  # Keep more audit logs
+            delay=True
         )
         audit_formatter = AetherPostFormatter(LogFormat.JSON)
         self.audit_handler.setFormatter(audit_formatter)
         
-        # Create audit logger
-        self.audit_logger = logging.getLogger(f"{self.name}.audit")
+        # Attach to the audit logger
         self.audit_logger.addHandler(self.audit_handler)
         self.audit_logger.setLevel(logging.INFO)
     
@@ -281,6 +292,8 @@ class AetherPostLogger:
     
     def _log(self, level: int, message: str, **kwargs):
         """Internal logging method."""
+        self.configure()
+        
         # Add session ID to all logs
         kwargs['session_id'] = self.session_id
         
@@ -322,6 +335,7 @@ class AetherPostLogger:
     
     def audit(self, action: str, details: Dict[str, Any], **kwargs):
         """Log audit event."""
+        self.configure()
         audit_data = {
             'action': action,
             'timestamp': datetime.utcnow().isoformat(),
@@ -388,6 +402,7 @@ class AetherPostLogger:
     
     def set_level(self, level: LogLevel):
         """Set logging level."""
+        self.configure()
         self.logger.setLevel(level.value)
         
         # Update console handler level
@@ -399,11 +414,13 @@ class AetherPostLogger:
     def add_file_handler(self, filename: str, level: LogLevel = LogLevel.INFO, 
                         format_type: LogFormat = LogFormat.DETAILED):
         """Add additional file handler."""
+        self.configure()
         file_path = self.log_dir / filename
         handler = logging.handlers.RotatingFileHandler(
             file_path,
             maxBytes=5 * 1024 * 1024,  # 5MB
-            backupCount=3
+            backupCount=3,
+            delay=True
         )
         handler.setLevel(level.value)
         
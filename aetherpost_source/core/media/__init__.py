@@ -1,7 +1,23 @@
 """Media generation and processing utilities."""
 
-from .audio_generator import AudioGenerator
-from .video_generator import VideoGenerator
-from .image_generator import ImageGenerator
+import importlib
 
-__all__ = ["AudioGenerator", "VideoGenerator", "ImageGenerator"]
\ No newline at end of file
+__all__ = ["AudioGenerator", "VideoGenerator", "ImageGenerator", "RenderJob", "RenderResult"]
+
+# Generators are imported on first access, so importing one submodule
+# (e.g. the avatar generator used by `apply`) does not need Pillow
+_EXPORTS = {
+    "AudioGenerator": ".audio_generator",
+    "VideoGenerator": ".video_generator",
+    "ImageGenerator": ".image_generator",
+    "RenderJob": ".image_generator",
+    "RenderResult": ".image_generator",
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,20 +1,34 @@
 """Audio generation utilities for promotional content."""
 
-import asyncio
+import os
 from typing import Dict, Any, Optional, List
 import logging
-import hashlib
-import os
+
+from .ffmpeg_pipeline import FFmpegPipeline, file_digest, find_tts_engine
 
 logger = logging.getLogger(__name__)
 
+# Every stage writes 44.1 kHz stereo PCM so outputs can be mixed and
+# concatenated without re-encoding
+SAMPLE_FORMAT = ['-ar', '44100', '-ac', '2', '-c:a', 'pcm_s16le']
+
+# Chords (Hz) and pulse rate of the synthesized bed used when no music file is available
+SYNTH_MUSIC = {
+    'upbeat': ((261.63, 329.63, 392.00), 4.0),
+    'calm': ((220.00, 261.63, 329.63), 0.5),
+    'corporate': ((196.00, 246.94, 293.66), 1.0),
+    'modern': ((233.08, 293.66, 349.23), 2.0)
+}
+
 
 class AudioGenerator:
     """Audio generation for promotional content."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, pipeline: Optional[FFmpegPipeline] = None):
         self.config = config or {}
         self.cache_dir = self.config.get('cache_dir', '/tmp/autopromo_audio')
+        self.music_dir = self.config.get('music_dir', 'assets/music')
+        self.pipeline = pipeline or FFmpegPipeline(self.cache_dir, threads=self.config.get('encode_threads', 0))
         os.makedirs(self.cache_dir, exist_ok=True)
     
     async def text_to_speech(self, text: str, voice_config: Optional[Dict[str, Any]] = None) -> str:
@@ -27,16 +41,13 @@ class AudioGenerator:
                 'language': 'ja-JP'
             }
             
-            # キャッシュチェック
-            cache_key = self._get_cache_key(text, voice_config)
-            cached_path = os.path.join(self.cache_dir, f"{cache_key}.mp3")
+            engine = find_tts_engine()
+            inputs = {'text': text, 'voice': voice_config, 'engine': os.path.basename(engine) if engine else None}
             
-            if os.path.exists(cached_path):
-                logger.info(f"Using cached audio: {cache_key}")
-                return cached_path
+            async def build(output_path: str):
+                await self._generate_speech(text, voice_config, output_path, engine)
             
-            # 音声生成（実装例）
-            audio_path = await self._generate_speech(text, voice_config, cached_path)
+            audio_path = await self.pipeline.stage('tts', inputs, 'wav', build)
             
             logger.info(f"Generated audio: {audio_path}")
             return audio_path
@@ -56,15 +67,22 @@ class AudioGenerator:
                 'modern': 'electronic_modern.mp3'
             }
             
-            base_music = music_styles.get(style, music_styles['upbeat'])
-            
-            # 指定時間に調整
-            output_path = os.path.join(self.cache_dir, f"bg_music_{style}_{duration}s.mp3")
+            source_path = os.path.join(self.music_dir, music_styles.get(style, music_styles['upbeat']))
+            has_source = os.path.exists(source_path)
+            inputs = {
+                'duration': duration,
+                'style': style,
+                # Keyed by content, so replacing a track re-renders only what uses it
+                'source': file_digest(source_path) if has_source else None
+            }
             
-            if not os.path.exists(output_path):
-                await self._trim_audio(base_music, duration, output_path)
+            async def build(output_path: str):
+                if has_source:
+                    await self._trim_audio(source_path, duration, output_path)
+                else:
+                    await self._synthesize_music(style, duration, output_path)
             
-            return output_path
+            return await self.pipeline.stage('music', inputs, 'wav', build)
             
         except Exception as e:
             logger.error(f"Background music creation failed: {e}")
@@ -73,13 +91,12 @@ class AudioGenerator:
     async def mix_audio(self, voice_path: str, music_path: str, voice_volume: float = 0.8, music_volume: float = 0.3) -> str:
         """Mix voice and background music."""
         try:
-            output_path = os.path.join(self.cache_dir, f"mixed_{hashlib.md5(f'{voice_path}{music_path}'.encode()).hexdigest()}.mp3")
+            inputs = {'voice': voice_path, 'music': music_path, 'voice_volume': voice_volume, 'music_volume': music_volume}
             
-            if os.path.exists(output_path):
-                return output_path
+            async def build(output_path: str):
+                await self._mix_audio_tracks(voice_path, music_path, output_path, voice_volume, music_volume)
             
-            # 音声ミキシング実装
-            await self._mix_audio_tracks(voice_path, music_path, output_path, voice_volume, music_volume)
+            output_path = await self.pipeline.stage('mix', inputs, 'wav', build)
             
             logger.info(f"Mixed audio: {output_path}")
             return output_path
@@ -88,47 +105,60 @@ class AudioGenerator:
             logger.error(f"Audio mixing failed: {e}")
             raise
     
-    def _get_cache_key(self, text: str, config: Dict[str, Any]) -> str:
-        """Generate cache key for audio."""
-        voice = config.get('voice', 'default')
-        speed = config.get('speed', 1.0)
-        pitch = config.get('pitch', 0)
-        language = config.get('language', 'en-US')
-        content = f"{text}_{voice}_{speed}_{pitch}_{language}"
-        return hashlib.md5(content.encode()).hexdigest()
-    
-    async def _generate_speech(self, text: str, config: Dict[str, Any], output_path: str) -> str:
-        """Generate speech audio (implementation placeholder)."""
-        # 実際の実装では以下のサービスを使用:
-        # - Google Text-to-Speech API
-        # - Amazon Polly
-        # - Microsoft Speech Service
-        # - OpenAI TTS
-        
-        # モック実装
-        await asyncio.sleep(1)  # 生成時間シミュレーション
+    async def _generate_speech(self, text: str, config: Dict[str, Any], output_path: str, engine: Optional[str]):
+        """Synthesize speech with a local espeak-ng, or silence of the same length without one."""
+        if engine is None:
+            logger.warning("No speech synthesizer found (install espeak-ng); using silent narration")
+            # Roughly 15 characters per second of speech
+            duration = max(1.0, len(text) / 15 / config.get('speed', 1.0))
+            await self.pipeline.run('-f', 'lavfi', '-i', 'anullsrc=r=44100:cl=stereo', '-t', f"{duration:.2f}", *SAMPLE_FORMAT, output_path)
+            return
         
-        # ダミーファイル作成
-        with open(output_path, 'w') as f:
-            f.write(f"# Audio file for: {text[:50]}...")
-        
-        return output_path
+        raw_path = f"{output_path}.raw.wav"
+        language = config.get('language', 'en-US').split('-')[0].lower()
+        try:
+            await self.pipeline.execute([
+                engine,
+                '-v', language,
+                '-s', str(int(175 * config.get('speed', 1.0))),
+                '-p', str(max(0, min(99, 50 + int(config.get('pitch', 0))))),
+                '-w', raw_path,
+                '--', text
+            ])
+            await self.pipeline.run('-i', raw_path, *SAMPLE_FORMAT, output_path)
+        finally:
+            if os.path.exists(raw_path):
+                os.remove(raw_path)
     
     async def _trim_audio(self, source_path: str, duration: float, output_path: str):
-        """Trim audio to specified duration."""
-        # FFmpeg等を使用した実装
-        await asyncio.sleep(0.5)
-        
-        with open(output_path, 'w') as f:
-            f.write(f"# Trimmed audio: {duration}s from {source_path}")
+        """Loop or cut audio to ``duration`` seconds, fading out at the end."""
+        fade = min(2.0, duration / 4)
+        await self.pipeline.run(
+            '-stream_loop', '-1', '-i', source_path,
+            '-t', str(duration),
+            '-af', f"afade=t=out:st={duration - fade}:d={fade}",
+            *SAMPLE_FORMAT, output_path
+        )
+    
+    async def _synthesize_music(self, style: str, duration: float, output_path: str):
+        """Render a soft pulsing chord bed for ``style``."""
+        chord, pulse = SYNTH_MUSIC.get(style, SYNTH_MUSIC['upbeat'])
+        tones = '+'.join(f"0.2*sin(2*PI*{frequency}*t)" for frequency in chord)
+        expression = f"({tones})*(0.7+0.3*sin(2*PI*{pulse}*t))"
+        fade = min(2.0, duration / 4)
+        await self.pipeline.run(
+            '-f', 'lavfi', '-i', f"aevalsrc={expression}:s=44100:d={duration}",
+            '-af', f"afade=t=in:d={fade},afade=t=out:st={duration - fade}:d={fade}",
+            *SAMPLE_FORMAT, output_path
+        )
     
     async def _mix_audio_tracks(self, voice_path: str, music_path: str, output_path: str, voice_vol: float, music_vol: float):
         """Mix audio tracks with specified volumes."""
-        # FFmpeg等を使用した実装
-        await asyncio.sleep(1)
-        
-        with open(output_path, 'w') as f:
-            f.write(f"# Mixed audio: voice({voice_vol}) + music({music_vol})")
+        await self.pipeline.run(
+            '-i', voice_path, '-i', music_path,
+            '-filter_complex', f"[0:a]volume={voice_vol}[v];[1:a]volume={music_vol}[m];[v][m]amix=inputs=2:duration=longest",
+            *SAMPLE_FORMAT, output_path
+        )
 
 
 class PodcastGenerator(AudioGenerator):
@@ -183,20 +213,8 @@ class PodcastGenerator(AudioGenerator):
     
     async def _concatenate_audio(self, audio_files: List[str]) -> str:
         """Concatenate multiple audio files."""
-        output_path = os.path.join(self.cache_dir, f"concatenated_{hashlib.md5(str(audio_files).encode()).hexdigest()}.mp3")
-        
-        if os.path.exists(output_path):
-            return output_path
-        
-        # FFmpeg等を使用した実装
-        await asyncio.sleep(1)
-        
-        with open(output_path, 'w') as f:
-            f.write(f"# Concatenated audio from {len(audio_files)} segments")
-        
-        return output_path
+        return await self.pipeline.concat('concat_audio', audio_files, 'wav')
     
     async def _get_audio_duration(self, audio_path: str) -> float:
         """Get audio duration in seconds."""
-        # FFprobe等を使用した実装
-        return 120.0  # モック: 2分
\ No newline at end of file
+        return round(await self.pipeline.probe_duration(audio_path), 2)
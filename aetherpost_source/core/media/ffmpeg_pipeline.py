@@ -0,0 +1,165 @@
+"""Local ffmpeg render pipeline with content-addressed stage caching."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..exceptions import ContentError, ErrorCode
+
+logger = logging.getLogger(__name__)
+
+# Bump when a stage's command line changes so stale outputs are not reused
+PIPELINE_VERSION = 1
+
+
+_digests: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a source file, memoized by path, size and mtime."""
+    stat = os.stat(path)
+    signature = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if signature not in _digests:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        _digests[signature] = digest.hexdigest()
+    return _digests[signature]
+
+
+class FFmpegPipeline:
+    """Run media stages as ffmpeg subprocesses, caching each stage's output.
+
+    A stage's output lives at ``<cache_dir>/<stage>/<key>.<ext>`` where the
+    key hashes the stage name and its inputs. Inputs produced by earlier
+    stages are passed as their (already content-addressed) paths, so a
+    change anywhere invalidates exactly the stages downstream of it while
+    everything else is reused. Identical stages requested concurrently run
+    once.
+    """
+
+    def __init__(self, cache_dir: str, threads: int = 0, ffmpeg: str = 'ffmpeg', ffprobe: str = 'ffprobe'):
+        self.cache_dir = cache_dir
+        self.threads = threads
+        self.ffmpeg = ffmpeg
+        self.ffprobe = ffprobe
+        self.stats = {'hits': 0, 'runs': 0}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def stage_key(stage: str, inputs: Any) -> str:
+        payload = json.dumps(
+            {'stage': stage, 'version': PIPELINE_VERSION, 'inputs': inputs},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+    async def stage(
+        self,
+        name: str,
+        inputs: Any,
+        ext: str,
+        build: Callable[[str], Awaitable[None]]
+    ) -> str:
+        """Return the cached output of a stage, running ``build(tmp_path)`` on a miss."""
+        key = self.stage_key(name, inputs)
+        output_path = os.path.join(self.cache_dir, name, f"{key}.{ext}")
+
+        if os.path.exists(output_path):
+            self.stats['hits'] += 1
+            return output_path
+
+        if output_path in self._in_flight:
+            return await asyncio.shield(self._in_flight[output_path])
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[output_path] = future
+        try:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            # Keep the extension last so ffmpeg infers the output format
+            tmp_path = os.path.join(os.path.dirname(output_path), f"{key}.{os.getpid()}.tmp.{ext}")
+            await build(tmp_path)
+            os.replace(tmp_path, output_path)
+            self.stats['runs'] += 1
+            logger.debug(f"Built {name} stage: {output_path}")
+            future.set_result(output_path)
+            return output_path
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[output_path]
+
+    async def run(self, *args: str, threads: bool = False):
+        """Run ffmpeg with ``args``; ``threads`` applies the configured encoder thread count."""
+        command = [self.ffmpeg, '-hide_banner', '-loglevel', 'error', '-y', *args]
+        if threads:
+            # Output options go before the output file, which is the last argument
+            command[-1:-1] = ['-threads', str(self.threads)]
+        await self.execute(command)
+
+    async def probe_duration(self, path: str) -> float:
+        """Duration of a media file in seconds."""
+        output = await self.execute([
+            self.ffprobe, '-v', 'error', '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1', path
+        ])
+        return float(output.strip() or 0)
+
+    async def concat(self, name: str, paths: Sequence[str], ext: str) -> str:
+        """Join same-format media files without re-encoding."""
+        async def build(tmp_path: str):
+            list_path = f"{tmp_path}.txt"
+            with open(list_path, 'w') as f:
+                for path in paths:
+                    f.write(f"file '{os.path.abspath(path)}'\n")
+            try:
+                await self.run('-f', 'concat', '-safe', '0', '-i', list_path, '-c', 'copy', tmp_path)
+            finally:
+                os.remove(list_path)
+
+        return await self.stage(name, list(paths), ext, build)
+
+    async def execute(self, command: List[str]) -> str:
+        """Run a command, returning its stdout; raises ContentError if it fails."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise ContentError(
+                f"{command[0]} is not installed",
+                ErrorCode.MEDIA_GENERATION_FAILED,
+                suggestions=["Install ffmpeg (e.g. `brew install ffmpeg` or `apt install ffmpeg`)"]
+            )
+
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise ContentError(
+                f"{os.path.basename(command[0])} failed: {stderr.decode(errors='replace').strip()[-500:]}",
+                ErrorCode.MEDIA_GENERATION_FAILED,
+                details={'command': ' '.join(command)}
+            )
+        return stdout.decode(errors='replace')
+
+
+def find_tts_engine() -> Optional[str]:
+    """Locally installed speech synthesizer, if any."""
+    for engine in ('espeak-ng', 'espeak'):
+        path = shutil.which(engine)
+        if path:
+            return path
+    return None
@@ -1,22 +1,61 @@
 """Image generation utilities for promotional content."""
 
 import asyncio
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Iterable
 import logging
-import hashlib
 import os
 from datetime import datetime
 
+from .renderer import RenderCache, render_cache_key, render_to_file
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RenderJob:
+    """One image to render: ``kind`` selects the create_* method, ``data`` is its input."""
+    kind: str
+    data: Dict[str, Any]
+    
+    @property
+    def key(self) -> str:
+        return render_cache_key(self.kind, self.data)
+
+
+@dataclass
+class RenderResult:
+    """Outcome of a render job; ``index`` is the job's position in the batch."""
+    index: int
+    job: RenderJob
+    path: Optional[str] = None
+    error: Optional[str] = None
+
+
 class ImageGenerator:
-    """Image generation for promotional content."""
+    """Image generation for promotional content.
+    
+    Images are rendered offline with Pillow in a pool of worker processes
+    (``render_workers``, default one per core; 0 renders in a thread) and
+    kept in a size-bounded on-disk cache (``cache_max_mb``).
+    """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.cache_dir = self.config.get('cache_dir', '/tmp/autopromo_images')
-        os.makedirs(self.cache_dir, exist_ok=True)
+        self.render_cache = RenderCache(
+            self.cache_dir,
+            max_bytes=int(self.config.get('cache_max_mb', 512) * 1024 * 1024)
+        )
+        self.render_workers = self.config.get('render_workers', os.cpu_count() or 1)
+        self._pool: Optional[ProcessPoolExecutor] = None
+    
+    async def close(self):
+        """Shut down the render worker processes."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown)
     
     async def create_social_media_image(self, content: Dict[str, Any]) -> str:
         """Create optimized image for social media platforms."""
@@ -30,9 +69,9 @@ class ImageGenerator:
             
             # キャッシュチェック
             cache_key = self._get_cache_key(content)
-            image_path = os.path.join(self.cache_dir, f"{cache_key}.png")
+            image_path = self.render_cache.path_for(cache_key)
             
-            if os.path.exists(image_path):
+            if self.render_cache.get(image_path):
                 logger.info(f"Using cached image: {cache_key}")
                 return image_path
             
@@ -43,14 +82,17 @@ class ImageGenerator:
                 'dimensions': dimensions,
                 'platform': platform,
                 'branding': content.get('branding', True),
-                'effects': content.get('effects', ['drop_shadow', 'gradient'])
+                'effects': content.get('effects', ['drop_shadow', 'gradient']),
+                'slide_number': content.get('slide_number'),
+                'total_slides': content.get('total_slides')
             }
             
             await self._generate_image(image_config, image_path)
+            self.render_cache.put(image_path)
             
             logger.info(f"Generated image: {image_path}")
             return image_path
-            
+        
         except Exception as e:
             logger.error(f"Social media image generation failed: {e}")
             raise
@@ -73,14 +115,15 @@ class ImageGenerator:
             }
             
             cache_key = self._get_cache_key(thumbnail_config)
-            thumbnail_path = os.path.join(self.cache_dir, f"thumb_{cache_key}.png")
+            thumbnail_path = self.render_cache.path_for(f"thumb_{cache_key}")
             
-            if not os.path.exists(thumbnail_path):
+            if not self.render_cache.get(thumbnail_path):
                 await self._generate_thumbnail(thumbnail_config, thumbnail_path)
+                self.render_cache.put(thumbnail_path)
             
             logger.info(f"Generated thumbnail: {thumbnail_path}")
             return thumbnail_path
-            
+        
         except Exception as e:
             logger.error(f"Thumbnail generation failed: {e}")
             raise
@@ -102,14 +145,15 @@ class ImageGenerator:
             }
             
             cache_key = self._get_cache_key(infographic_config)
-            infographic_path = os.path.join(self.cache_dir, f"info_{cache_key}.png")
+            infographic_path = self.render_cache.path_for(f"info_{cache_key}")
             
-            if not os.path.exists(infographic_path):
+            if not self.render_cache.get(infographic_path):
                 await self._generate_infographic(infographic_config, infographic_path)
+                self.render_cache.put(infographic_path)
             
             logger.info(f"Generated infographic: {infographic_path}")
             return infographic_path
-            
+        
         except Exception as e:
             logger.error(f"Infographic generation failed: {e}")
             raise
@@ -131,14 +175,15 @@ class ImageGenerator:
             }
             
             cache_key = self._get_cache_key(quote_config)
-            quote_path = os.path.join(self.cache_dir, f"quote_{cache_key}.png")
+            quote_path = self.render_cache.path_for(f"quote_{cache_key}")
             
-            if not os.path.exists(quote_path):
+            if not self.render_cache.get(quote_path):
                 await self._generate_quote_image(quote_config, quote_path)
+                self.render_cache.put(quote_path)
             
             logger.info(f"Generated quote image: {quote_path}")
             return quote_path
-            
+        
         except Exception as e:
             logger.error(f"Quote image generation failed: {e}")
             raise
@@ -150,10 +195,8 @@ class ImageGenerator:
             platform = carousel_data.get('platform', 'instagram')
             style = carousel_data.get('style', 'cohesive')
             
-            image_paths = []
-            
-            for i, slide in enumerate(slides):
-                slide_config = {
+            slide_configs = [
+                {
                     'text': slide['text'],
                     'style': style,
                     'platform': platform,
@@ -161,17 +204,80 @@ class ImageGenerator:
                     'total_slides': len(slides),
                     'carousel_theme': carousel_data.get('theme', 'professional')
                 }
-                
-                slide_path = await self.create_social_media_image(slide_config)
-                image_paths.append(slide_path)
+                for i, slide in enumerate(slides)
+            ]
+            
+            image_paths = await self.render_all(RenderJob('social', slide_config) for slide_config in slide_configs)
             
             logger.info(f"Generated carousel with {len(image_paths)} images")
             return image_paths
-            
+        
         except Exception as e:
             logger.error(f"Carousel creation failed: {e}")
             raise
     
+    async def render_batch(
+        self,
+        jobs: Iterable[RenderJob],
+        max_concurrency: Optional[int] = None
+    ) -> AsyncIterator[RenderResult]:
+        """Render many jobs, yielding each result as soon as it is ready.
+        
+        Identical jobs are rendered once and every duplicate receives the
+        same path. At most ``max_concurrency`` renders (default: one per
+        render worker) are in flight. A failed job is yielded with ``error``
+        set instead of stopping the batch.
+        """
+        jobs = list(jobs)
+        renderers = {
+            'social': self.create_social_media_image,
+            'thumbnail': self.create_thumbnail,
+            'infographic': self.create_infographic,
+            'quote': self.create_quote_image
+        }
+        for job in jobs:
+            if job.kind not in renderers:
+                raise ValueError(f"Unknown render job kind: {job.kind}")
+        
+        # Group duplicate jobs behind one render
+        groups: Dict[str, List[int]] = {}
+        for index, job in enumerate(jobs):
+            groups.setdefault(job.key, []).append(index)
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.render_workers or 1))
+        
+        async def render(key: str) -> Tuple[str, Optional[str], Optional[str]]:
+            job = jobs[groups[key][0]]
+            async with semaphore:
+                try:
+                    return key, await renderers[job.kind](job.data), None
+                except Exception as e:
+                    return key, None, str(e)
+        
+        tasks = [asyncio.ensure_future(render(key)) for key in groups]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                key, path, error = await finished
+                for index in groups[key]:
+                    yield RenderResult(index=index, job=jobs[index], path=path, error=error)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        logger.info(f"Rendered {len(jobs)} images ({len(groups)} unique)")
+    
+    async def render_all(self, jobs: Iterable[RenderJob], max_concurrency: Optional[int] = None) -> List[str]:
+        """Render a batch and return paths in job order; raises if any job fails."""
+        jobs = list(jobs)
+        paths: List[Optional[str]] = [None] * len(jobs)
+        
+        async for result in self.render_batch(jobs, max_concurrency):
+            if result.error:
+                raise RuntimeError(f"Rendering {result.job.kind} image failed: {result.error}")
+            paths[result.index] = result.path
+        
+        return paths
+    
     def _get_platform_dimensions(self, platform: str) -> Tuple[int, int]:
         """Get optimal dimensions for each platform."""
         dimensions = {
@@ -199,148 +305,33 @@ class ImageGenerator:
     
     def _get_cache_key(self, content: Dict[str, Any]) -> str:
         """Generate cache key for image."""
-        content_str = str(sorted(content.items()))
-        return hashlib.md5(content_str.encode()).hexdigest()
+        return render_cache_key('image', content)
     
-    async def _generate_image(self, config: Dict[str, Any], output_path: str):
-        """Generate image file (implementation placeholder)."""
-        # 実際の実装では以下のツールを使用:
-        # - DALL-E API for AI image generation
-        # - Midjourney API for artistic images
-        # - Canva API for template-based design
-        # - Figma API for design automation
-        # - PIL/Pillow for programmatic image creation
-        # - Playwright for web-to-image conversion
-        
-        style_templates = {
-            'modern': {
-                'background': 'linear_gradient',
-                'colors': ['#667eea', '#764ba2'],
-                'font_family': 'Inter',
-                'text_color': '#ffffff'
-            },
-            'professional': {
-                'background': 'solid_color',
-                'colors': ['#2c3e50'],
-                'font_family': 'Roboto',
-                'text_color': '#ffffff'
-            },
-            'vibrant': {
-                'background': 'geometric_shapes',
-                'colors': ['#ff6b6b', '#4ecdc4', '#45b7d1'],
-                'font_family': 'Poppins',
-                'text_color': '#ffffff'
-            },
-            'minimal': {
-                'background': 'clean_white',
-                'colors': ['#ffffff'],
-                'font_family': 'Helvetica',
-                'text_color': '#333333'
-            }
-        }
-        
-        template = style_templates.get(config['style'], style_templates['modern'])
+    async def _render(self, kind: str, config: Dict[str, Any], output_path: str):
+        """Render an image on the worker pool."""
+        if not self.render_workers:
+            await asyncio.to_thread(render_to_file, kind, config, output_path)
+            return
         
-        # モック実装
-        await asyncio.sleep(1)  # 生成時間シミュレーション
-        
-        # ダミーファイル作成
-        with open(output_path, 'w') as f:
-            f.write(f"# Image file\n")
-            f.write(f"# Text: {config['text'][:50]}...\n")
-            f.write(f"# Dimensions: {config['dimensions']}\n")
-            f.write(f"# Platform: {config['platform']}\n")
-            f.write(f"# Style: {config['style']}\n")
-            f.write(f"# Template: {template}\n")
-            f.write(f"# Generated: {datetime.now()}\n")
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.render_workers)
+        await asyncio.get_running_loop().run_in_executor(self._pool, render_to_file, kind, config, output_path)
+    
+    async def _generate_image(self, config: Dict[str, Any], output_path: str):
+        """Generate image file from the style templates."""
+        await self._render('social', config, output_path)
     
     async def _generate_thumbnail(self, config: Dict[str, Any], output_path: str):
         """Generate thumbnail image."""
-        # サムネイル特化のスタイル
-        thumbnail_styles = {
-            'clickbait': {
-                'text_style': 'bold_large',
-                'colors': ['#ff0000', '#ffff00'],  # 目立つ色
-                'effects': ['drop_shadow', 'outline', 'glow'],
-                'emotion_indicators': True
-            },
-            'professional': {
-                'text_style': 'clean_bold',
-                'colors': ['#2c3e50', '#3498db'],
-                'effects': ['subtle_shadow'],
-                'emotion_indicators': False
-            },
-            'tech': {
-                'text_style': 'futuristic',
-                'colors': ['#00d4ff', '#0066cc'],
-                'effects': ['neon_glow', 'tech_grid'],
-                'emotion_indicators': False
-            }
-        }
-        
-        style = thumbnail_styles.get(config['style'], thumbnail_styles['clickbait'])
-        
-        await asyncio.sleep(1)
-        
-        with open(output_path, 'w') as f:
-            f.write(f"# Thumbnail image\n")
-            f.write(f"# Title: {config['text']}\n")
-            f.write(f"# Style: {config['style']}\n")
-            f.write(f"# Platform: {config['platform']}\n")
-            f.write(f"# Style config: {style}\n")
-            f.write(f"# Generated: {datetime.now()}\n")
+        await self._render('thumbnail', config, output_path)
     
     async def _generate_infographic(self, config: Dict[str, Any], output_path: str):
         """Generate infographic."""
-        layout_templates = {
-            'vertical': 'timeline_style',
-            'horizontal': 'dashboard_style',
-            'circular': 'hub_and_spoke',
-            'comparison': 'side_by_side'
-        }
-        
-        layout = layout_templates.get(config['layout'], 'timeline_style')
-        
-        await asyncio.sleep(2)  # 複雑な生成のため時間がかかる
-        
-        with open(output_path, 'w') as f:
-            f.write(f"# Infographic\n")
-            f.write(f"# Title: {config['title']}\n")
-            f.write(f"# Sections: {len(config['sections'])}\n")
-            f.write(f"# Layout: {layout}\n")
-            f.write(f"# Color scheme: {config['color_scheme']}\n")
-            f.write(f"# Generated: {datetime.now()}\n")
+        await self._render('infographic', config, output_path)
     
     async def _generate_quote_image(self, config: Dict[str, Any], output_path: str):
         """Generate quote image."""
-        typography_styles = {
-            'elegant': {
-                'font_family': 'Playfair Display',
-                'text_alignment': 'center',
-                'decorative_elements': True
-            },
-            'modern': {
-                'font_family': 'Inter',
-                'text_alignment': 'left',
-                'decorative_elements': False
-            },
-            'handwritten': {
-                'font_family': 'Dancing Script',
-                'text_alignment': 'center',
-                'decorative_elements': True
-            }
-        }
-        
-        typography = typography_styles.get(config['typography'], typography_styles['elegant'])
-        
-        await asyncio.sleep(1)
-        
-        with open(output_path, 'w') as f:
-            f.write(f"# Quote image\n")
-            f.write(f"# Quote: {config['quote'][:50]}...\n")
-            f.write(f"# Author: {config['author']}\n")
-            f.write(f"# Typography: {typography}\n")
-            f.write(f"# Generated: {datetime.now()}\n")
+        await self._render('quote', config, output_path)
 
 
 class AIImageGenerator(ImageGenerator):
@@ -358,14 +349,15 @@ class AIImageGenerator(ImageGenerator):
             }
             
             cache_key = self._get_cache_key(ai_config)
-            image_path = os.path.join(self.cache_dir, f"ai_{cache_key}.png")
+            image_path = self.render_cache.path_for(f"ai_{cache_key}")
             
-            if not os.path.exists(image_path):
+            if not self.render_cache.get(image_path):
                 await self._call_ai_image_api(ai_config, image_path)
+                self.render_cache.put(image_path)
             
             logger.info(f"Generated AI image: {image_path}")
             return image_path
-            
+        
         except Exception as e:
             logger.error(f"AI image generation failed: {e}")
             raise
@@ -0,0 +1,513 @@
+"""Offline Pillow renderer and render cache for generated images."""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont
+except ImportError:
+    # Pillow is optional; it is only needed once something is rendered
+    Image = ImageChops = ImageDraw = ImageFilter = ImageFont = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when rendering output changes so stale cached images are not reused
+RENDERER_VERSION = 1
+
+Color = Tuple[int, int, int]
+
+IMAGE_STYLES = {
+    'modern': {
+        'background': 'linear_gradient',
+        'colors': ['#667eea', '#764ba2'],
+        'font_family': 'Inter',
+        'text_color': '#ffffff'
+    },
+    'professional': {
+        'background': 'solid_color',
+        'colors': ['#2c3e50'],
+        'font_family': 'Roboto',
+        'text_color': '#ffffff'
+    },
+    'vibrant': {
+        'background': 'geometric_shapes',
+        'colors': ['#ff6b6b', '#4ecdc4', '#45b7d1'],
+        'font_family': 'Poppins',
+        'text_color': '#ffffff'
+    },
+    'minimal': {
+        'background': 'clean_white',
+        'colors': ['#ffffff'],
+        'font_family': 'Helvetica',
+        'text_color': '#333333'
+    }
+}
+
+THUMBNAIL_STYLES = {
+    'clickbait': {
+        'text_style': 'bold_large',
+        'colors': ['#ff0000', '#ffff00'],  # 目立つ色
+        'effects': ['drop_shadow', 'outline', 'glow'],
+        'emotion_indicators': True
+    },
+    'professional': {
+        'text_style': 'clean_bold',
+        'colors': ['#2c3e50', '#3498db'],
+        'effects': ['subtle_shadow'],
+        'emotion_indicators': False
+    },
+    'tech': {
+        'text_style': 'futuristic',
+        'colors': ['#00d4ff', '#0066cc'],
+        'effects': ['neon_glow', 'tech_grid'],
+        'emotion_indicators': False
+    }
+}
+
+INFOGRAPHIC_LAYOUTS = {
+    'vertical': 'timeline_style',
+    'horizontal': 'dashboard_style',
+    'circular': 'hub_and_spoke',
+    'comparison': 'side_by_side'
+}
+
+INFOGRAPHIC_COLOR_SCHEMES = {
+    'blue_gradient': ['#1e3c72', '#2a5298'],
+    'green_gradient': ['#134e5e', '#71b280'],
+    'sunset': ['#ff7e5f', '#feb47b'],
+    'dark': ['#232526', '#414345']
+}
+
+QUOTE_TYPOGRAPHY = {
+    'elegant': {
+        'font_family': 'Playfair Display',
+        'text_alignment': 'center',
+        'decorative_elements': True
+    },
+    'modern': {
+        'font_family': 'Inter',
+        'text_alignment': 'left',
+        'decorative_elements': False
+    },
+    'handwritten': {
+        'font_family': 'Dancing Script',
+        'text_alignment': 'center',
+        'decorative_elements': True
+    }
+}
+
+QUOTE_BACKGROUNDS = {
+    'gradient': ('linear_gradient', ['#0f2027', '#2c5364']),
+    'solid': ('solid_color', ['#222831']),
+    'light': ('clean_white', ['#ffffff'])
+}
+
+# Installed fonts tried after the requested family; CJK fonts first so
+# Japanese text renders instead of empty boxes
+FALLBACK_FONTS = {
+    'regular': ['NotoSansCJK-Regular.ttc', 'NotoSansJP-Regular.otf', 'DejaVuSans.ttf', 'Arial.ttf'],
+    'bold': ['NotoSansCJK-Bold.ttc', 'NotoSansJP-Bold.otf', 'DejaVuSans-Bold.ttf', 'Arial Bold.ttf']
+}
+
+
+def render_cache_key(kind: str, config: Dict[str, Any]) -> str:
+    """Stable key for a render: identical configs hash identically in any process."""
+    payload = json.dumps(
+        {'kind': kind, 'version': RENDERER_VERSION, 'config': config},
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+def hex_to_rgb(color: str) -> Color:
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+# Fonts and glyph measurements are cached per process, so a worker that
+# renders many slides loads each face and measures each word only once
+@lru_cache(maxsize=64)
+def load_font(family: str, size: int, bold: bool = False) -> "ImageFont.ImageFont":
+    """Load a font by family name, falling back to installed fonts."""
+    suffix = '-Bold' if bold else '-Regular'
+    candidates = [f"{family}{suffix}.ttf", f"{family.replace(' ', '')}{suffix}.ttf", f"{family}.ttf"]
+    candidates += FALLBACK_FONTS['bold' if bold else 'regular']
+    
+    for candidate in candidates:
+        try:
+            return ImageFont.truetype(candidate, size)
+        except OSError:
+            continue
+    
+    logger.warning(f"No TrueType font found for {family}, using Pillow's default font")
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1 has no scalable default font
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=4096)
+def _text_width(family: str, size: int, bold: bool, text: str) -> float:
+    return load_font(family, size, bold).getlength(text)
+
+
+def wrap_text(text: str, family: str, size: int, bold: bool, max_width: int) -> List[str]:
+    """Greedy word wrap; text without spaces (e.g. Japanese) wraps per character."""
+    lines: List[str] = []
+    
+    for paragraph in text.split('\n'):
+        spaced = ' ' in paragraph.strip()
+        separator = ' ' if spaced else ''
+        current = ''
+        for unit in (paragraph.split(' ') if spaced else paragraph):
+            candidate = f"{current}{separator}{unit}" if current else unit
+            if current and _text_width(family, size, bold, candidate) > max_width:
+                lines.append(current)
+                current = unit
+            else:
+                current = candidate
+        lines.append(current)
+    
+    return lines
+
+
+def fit_text(
+    text: str,
+    family: str,
+    bold: bool,
+    box: Tuple[int, int],
+    max_size: int,
+    min_size: int = 18,
+    line_spacing: float = 1.25
+) -> Tuple[int, List[str]]:
+    """Largest font size (and its wrapped lines) that fits ``text`` in ``box``."""
+    size = max_size
+    while True:
+        lines = wrap_text(text, family, size, bold, box[0])
+        if size <= min_size or len(lines) * size * line_spacing <= box[1]:
+            return size, lines
+        size = max(min_size, int(size * 0.9))
+
+
+# Backgrounds depend only on style, colors and size, so one layer serves
+# every slide of a carousel; callers copy it before drawing
+@lru_cache(maxsize=32)
+def background_layer(kind: str, colors: Tuple[str, ...], size: Tuple[int, int]) -> "Image.Image":
+    """Render a background layer."""
+    rgb = [hex_to_rgb(c) for c in colors] or [(255, 255, 255)]
+    
+    if kind == 'linear_gradient' and len(rgb) > 1:
+        # Diagonal gradient between the first two colors
+        vertical = Image.linear_gradient('L')
+        mask = ImageChops.add(vertical, vertical.transpose(Image.Transpose.ROTATE_90), scale=2.0).resize(size)
+        return Image.composite(Image.new('RGB', size, rgb[1]), Image.new('RGB', size, rgb[0]), mask)
+    
+    if kind == 'geometric_shapes':
+        layer = Image.new('RGB', size, rgb[0])
+        draw = ImageDraw.Draw(layer)
+        width, height = size
+        for i, color in enumerate(rgb[1:] * 2):
+            radius = int(min(size) * (0.35 + 0.1 * i))
+            cx = width if i % 2 == 0 else 0
+            cy = int(height * (0.15 + 0.25 * i)) % height
+            draw.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill=color)
+        return layer.filter(ImageFilter.GaussianBlur(radius=min(size) // 40))
+    
+    return Image.new('RGB', size, rgb[0])
+
+
+def draw_text_block(
+    image: "Image.Image",
+    lines: List[str],
+    family: str,
+    size: int,
+    bold: bool,
+    fill: Color,
+    box: Tuple[int, int, int, int],
+    align: str = 'center',
+    shadow: bool = False,
+    outline: int = 0,
+    line_spacing: float = 1.25
+):
+    """Draw wrapped lines vertically centered in ``box`` (left, top, right, bottom)."""
+    font = load_font(family, size, bold)
+    line_height = int(size * line_spacing)
+    left, top, right, bottom = box
+    y = top + (bottom - top - line_height * len(lines)) // 2
+    
+    positions = []
+    for line in lines:
+        x = left if align == 'left' else left + (right - left - _text_width(family, size, bold, line)) / 2
+        positions.append((x, y, line))
+        y += line_height
+    
+    if shadow:
+        # Blurred, offset copy of the text underneath it
+        offset = max(2, size // 20)
+        mask = Image.new('L', image.size, 0)
+        mask_draw = ImageDraw.Draw(mask)
+        for x, y, line in positions:
+            mask_draw.text((x + offset, y + offset), line, font=font, fill=160)
+        mask = mask.filter(ImageFilter.GaussianBlur(radius=max(2, size // 15)))
+        image.paste((0, 0, 0), mask=mask)
+    
+    draw = ImageDraw.Draw(image)
+    for x, y, line in positions:
+        draw.text((x, y), line, font=font, fill=fill, stroke_width=outline, stroke_fill=(0, 0, 0))
+
+
+def render_social_image(config: Dict[str, Any]) -> "Image.Image":
+    template = IMAGE_STYLES.get(config.get('style'), IMAGE_STYLES['modern'])
+    size = tuple(config['dimensions'])
+    image = background_layer(template['background'], tuple(template['colors']), size).copy()
+    width, height = size
+    margin = int(min(size) * 0.08)
+    family = template['font_family']
+    
+    font_size, lines = fit_text(config['text'], family, True, (width - 2 * margin, height - 2 * margin), max_size=int(height * 0.12))
+    draw_text_block(
+        image, lines, family, font_size, True, hex_to_rgb(template['text_color']),
+        (margin, margin, width - margin, height - margin),
+        shadow='drop_shadow' in config.get('effects', [])
+    )
+    
+    if config.get('slide_number') and config.get('total_slides'):
+        indicator = f"{config['slide_number']}/{config['total_slides']}"
+        indicator_size = max(16, height // 30)
+        ImageDraw.Draw(image).text(
+            (width - margin, height - margin // 2), indicator,
+            font=load_font(family, indicator_size), fill=hex_to_rgb(template['text_color']), anchor='rs'
+        )
+    return image
+
+
+def render_thumbnail(config: Dict[str, Any]) -> "Image.Image":
+    style = THUMBNAIL_STYLES.get(config.get('style'), THUMBNAIL_STYLES['clickbait'])
+    size = tuple(config['dimensions'])
+    image = background_layer('linear_gradient', tuple(style['colors']), size).copy()
+    width, height = size
+    margin = int(min(size) * 0.06)
+    effects = set(style['effects']) | set(config.get('effects', []))
+    
+    font_size, lines = fit_text(config['text'], 'Impact', True, (width - 2 * margin, height - 2 * margin), max_size=int(height * 0.18))
+    draw_text_block(
+        image, lines, 'Impact', font_size, True, (255, 255, 255),
+        (margin, margin, width - margin, height - margin),
+        shadow=bool(effects & {'drop_shadow', 'subtle_shadow', 'glow', 'neon_glow'}),
+        outline=max(2, font_size // 16) if effects & {'outline', 'text_outline'} else 0
+    )
+    return image
+
+
+def render_infographic(config: Dict[str, Any]) -> "Image.Image":
+    colors = INFOGRAPHIC_COLOR_SCHEMES.get(config.get('color_scheme'), INFOGRAPHIC_COLOR_SCHEMES['blue_gradient'])
+    size = tuple(config['dimensions'])
+    image = background_layer('linear_gradient', tuple(colors), size).copy()
+    draw = ImageDraw.Draw(image)
+    width, height = size
+    margin = int(width * 0.08)
+    family = 'Inter'
+    
+    # Title band
+    title_height = int(height * 0.16)
+    title_size, title_lines = fit_text(config['title'], family, True, (width - 2 * margin, title_height), max_size=int(width * 0.08))
+    draw_text_block(image, title_lines, family, title_size, True, (255, 255, 255), (margin, margin, width - margin, margin + title_height))
+    
+    sections = config.get('sections') or []
+    if not sections:
+        return image
+    
+    # One card per section, stacked down the page
+    top = margin + title_height + margin // 2
+    gap = margin // 3
+    card_height = (height - top - margin - gap * (len(sections) - 1)) // len(sections)
+    heading_size = max(18, min(int(width * 0.045), card_height // 3))
+    
+    for i, section in enumerate(sections):
+        if isinstance(section, dict):
+            heading = str(section.get('title') or section.get('label') or '')
+            body = str(section.get('content') or section.get('text') or section.get('value') or '')
+        else:
+            heading, body = '', str(section)
+        
+        card_top = top + i * (card_height + gap)
+        card = (margin, card_top, width - margin, card_top + card_height)
+        draw.rounded_rectangle(card, radius=margin // 3, fill=(255, 255, 255))
+        draw.ellipse((margin + gap, card_top + gap, margin + gap + heading_size, card_top + gap + heading_size), fill=hex_to_rgb(colors[0]))
+        
+        inner_left = margin + 2 * gap + heading_size
+        text_box = (inner_left, card_top + gap, width - margin - gap, card_top + card_height - gap)
+        if heading:
+            draw.text((inner_left, card_top + gap), heading, font=load_font(family, heading_size, True), fill=hex_to_rgb(colors[0]))
+            text_box = (inner_left, card_top + gap + int(heading_size * 1.4), text_box[2], text_box[3])
+        if body:
+            body_size, body_lines = fit_text(body, family, False, (text_box[2] - text_box[0], text_box[3] - text_box[1]), max_size=int(heading_size * 0.8), min_size=12)
+            draw_text_block(image, body_lines, family, body_size, False, (51, 51, 51), text_box, align='left')
+    
+    return image
+
+
+def render_quote_image(config: Dict[str, Any]) -> "Image.Image":
+    typography = QUOTE_TYPOGRAPHY.get(config.get('typography'), QUOTE_TYPOGRAPHY['elegant'])
+    background, colors = QUOTE_BACKGROUNDS.get(config.get('background'), QUOTE_BACKGROUNDS['gradient'])
+    size = tuple(config['dimensions'])
+    image = background_layer(background, tuple(colors), size).copy()
+    width, height = size
+    margin = int(min(size) * 0.12)
+    family = typography['font_family']
+    align = typography['text_alignment']
+    text_color = (51, 51, 51) if background == 'clean_white' else (255, 255, 255)
+    
+    if typography['decorative_elements']:
+        mark_size = int(height * 0.2)
+        ImageDraw.Draw(image).text(
+            (width // 2, margin), '“', font=load_font('DejaVuSerif', mark_size, True),
+            fill=tuple(int(c * 0.6) for c in text_color), anchor='mt'
+        )
+    
+    author_height = int(height * 0.12) if config.get('author') else 0
+    font_size, lines = fit_text(config['quote'], family, False, (width - 2 * margin, height - 2 * margin - author_height), max_size=int(height * 0.08))
+    draw_text_block(image, lines, family, font_size, False, text_color, (margin, margin, width - margin, height - margin - author_height), align=align)
+    
+    if config.get('author'):
+        author_font = load_font(family, max(16, font_size * 2 // 3), True)
+        anchor = 'ls' if align == 'left' else 'ms'
+        x = margin if align == 'left' else width // 2
+        ImageDraw.Draw(image).text((x, height - margin), f"— {config['author']}", font=author_font, fill=text_color, anchor=anchor)
+    return image
+
+
+def render_video_frame(config: Dict[str, Any]) -> "Image.Image":
+    """Still frame for a video segment: centered text, with an optional code panel below it."""
+    size = tuple(config['dimensions'])
+    image = background_layer(config['background'], tuple(config['colors']), size).copy()
+    width, height = size
+    margin = int(min(size) * 0.08)
+    family = config.get('font_family', 'Inter')
+    code = config.get('code')
+    text_bottom = int(height * 0.4) if code else height - margin
+    
+    font_size, lines = fit_text(config['text'], family, True, (width - 2 * margin, text_bottom - margin), max_size=int(min(size) * 0.09))
+    draw_text_block(image, lines, family, font_size, True, hex_to_rgb(config.get('text_color', '#ffffff')), (margin, margin, width - margin, text_bottom), shadow=config.get('shadow', False))
+    
+    if code:
+        panel = (margin, text_bottom + margin // 2, width - margin, height - margin)
+        ImageDraw.Draw(image).rounded_rectangle(panel, radius=margin // 3, fill=(30, 33, 39))
+        padding = margin // 2
+        code_lines = code.rstrip('\n').split('\n')
+        code_size = max(12, min(int(min(size) * 0.04), int((panel[3] - panel[1] - 2 * padding) / (len(code_lines) * 1.25))))
+        # Top-aligned, like an editor
+        code_top = panel[1] + padding
+        draw_text_block(image, code_lines, 'DejaVuSansMono', code_size, False, (171, 178, 191), (panel[0] + padding, code_top, panel[2] - padding, code_top + int(len(code_lines) * code_size * 1.25)), align='left')
+    return image
+
+
+RENDERERS = {
+    'social': render_social_image,
+    'thumbnail': render_thumbnail,
+    'infographic': render_infographic,
+    'quote': render_quote_image,
+    'frame': render_video_frame
+}
+
+
+def render_to_file(kind: str, config: Dict[str, Any], output_path: str) -> str:
+    """Render an image and write it as PNG; runs inside render worker processes."""
+    if Image is None:
+        raise ImportError("Pillow is required to render images. Install with: pip install pillow")
+    image = RENDERERS[kind](config)
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    image.save(tmp_path, 'PNG', optimize=False)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+class RenderCache:
+    """Rendered images on disk, bounded by total size and evicted least recently used.
+
+    An in-memory index of recently used files sits in front of the directory,
+    so repeat lookups skip the filesystem. Hits refresh the file's mtime,
+    which orders eviction across processes sharing the directory.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 512 * 1024 * 1024, max_memory_entries: int = 256):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_memory_entries = max_memory_entries
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+        self._memory: 'OrderedDict[str, int]' = OrderedDict()
+        self._disk_bytes: Optional[int] = None
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def path_for(self, name: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}.png")
+    
+    def get(self, path: str) -> bool:
+        """Whether a rendered image exists at ``path``; marks it recently used."""
+        if path in self._memory and os.path.exists(path):
+            self._memory.move_to_end(path)
+            self.stats['memory_hits'] += 1
+        elif os.path.exists(path):
+            self._remember(path, os.path.getsize(path))
+            self.stats['disk_hits'] += 1
+        else:
+            self._memory.pop(path, None)
+            self.stats['misses'] += 1
+            return False
+        
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+    
+    def put(self, path: str):
+        """Record a newly rendered image and evict old ones over budget."""
+        size = os.path.getsize(path)
+        self._remember(path, size)
+        if self._disk_bytes is None:
+            # The first scan already counts the new file
+            self._disk_bytes = sum(entry.stat().st_size for entry in self._entries())
+        else:
+            self._disk_bytes += size
+        if self._disk_bytes > self.max_bytes:
+            self._evict(keep=path)
+    
+    def _remember(self, path: str, size: int):
+        self._memory[path] = size
+        self._memory.move_to_end(path)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+    
+    def _entries(self):
+        with os.scandir(self.cache_dir) as entries:
+            return [entry for entry in entries if entry.is_file() and entry.name.endswith('.png')]
+    
+    def _evict(self, keep: str):
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in entries)
+        
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.path == keep:
+                continue
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except OSError:
+                continue
+            total -= size
+            self._memory.pop(entry.path, None)
+            self.stats['evictions'] += 1
+        
+        self._disk_bytes = total
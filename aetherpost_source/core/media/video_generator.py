@@ -1,24 +1,86 @@
 """Video generation utilities for promotional content."""
 
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import logging
 import hashlib
 import os
 from datetime import datetime
 
 from .audio_generator import AudioGenerator
+from .ffmpeg_pipeline import FFmpegPipeline
+from .renderer import render_to_file
 
 logger = logging.getLogger(__name__)
 
+# Look of each video style; 'frame_background' is the renderer's background layer
+STYLE_TEMPLATES = {
+    'modern': {
+        'background': 'gradient_animation',
+        'frame_background': 'linear_gradient',
+        'font': 'modern_sans',
+        'colors': ['#667eea', '#764ba2'],
+        'text_color': '#ffffff',
+        'animations': ['fade_in', 'slide_up']
+    },
+    'viral_shorts': {
+        'background': 'dynamic_shapes',
+        'frame_background': 'geometric_shapes',
+        'font': 'bold_impact',
+        'colors': ['#ff6b6b', '#4ecdc4'],
+        'text_color': '#ffffff',
+        'animations': ['zoom_in', 'quick_cuts', 'text_pop']
+    },
+    'presentation': {
+        'background': 'clean_white',
+        'frame_background': 'clean_white',
+        'font': 'professional',
+        'colors': ['#ffffff'],
+        'text_color': '#2c3e50',
+        'animations': ['fade_in', 'smooth_transition']
+    },
+    'tutorial_intro': {
+        'background': 'tech_grid',
+        'frame_background': 'linear_gradient',
+        'font': 'title_font',
+        'colors': ['#1e3c72', '#2a5298'],
+        'text_color': '#ffffff'
+    },
+    'tutorial_step': {
+        'background': 'code_editor',
+        'frame_background': 'solid_color',
+        'font': 'monospace',
+        'colors': ['#282c34'],
+        'text_color': '#61dafb'
+    },
+    'tutorial_outro': {
+        'background': 'celebration',
+        'frame_background': 'geometric_shapes',
+        'font': 'friendly',
+        'colors': ['#fd79a8', '#fdcb6e'],
+        'text_color': '#ffffff'
+    }
+}
+
+# Length of fade in/out effects, in seconds
+FADE_DURATION = 0.5
+
 
 class VideoGenerator:
-    """Video generation for promotional content."""
+    """Video generation for promotional content.
+
+    Videos are assembled locally with ffmpeg from a rendered still frame
+    and a narration track. Each stage (speech, music, mix, frame, encode,
+    concat) is cached by its inputs, so regenerating a video after a
+    change re-runs only the stages downstream of it.
+    """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.cache_dir = self.config.get('cache_dir', '/tmp/autopromo_video')
-        self.audio_generator = AudioGenerator(config)
+        self.fps = self.config.get('fps', 30)
+        self.pipeline = FFmpegPipeline(self.cache_dir, threads=self.config.get('encode_threads', 0))
+        self.audio_generator = AudioGenerator(config, pipeline=self.pipeline)
         os.makedirs(self.cache_dir, exist_ok=True)
     
     async def create_text_video(self, content: Dict[str, Any]) -> str:
@@ -28,26 +90,27 @@ class VideoGenerator:
             style = content.get('style', 'modern')
             duration = content.get('duration', 30)
             
-            # キャッシュチェック
-            cache_key = self._get_cache_key(content)
-            video_path = os.path.join(self.cache_dir, f"{cache_key}.mp4")
-            
-            if os.path.exists(video_path):
-                logger.info(f"Using cached video: {cache_key}")
-                return video_path
-            
             # 音声生成
             voice_config = content.get('voice_config', {
                 'voice': 'professional',
                 'speed': 1.0,
                 'language': 'ja-JP'
             })
-            audio_path = await self.audio_generator.text_to_speech(text, voice_config)
             
-            # 背景音楽
-            if content.get('background_music', True):
-                music_path = await self.audio_generator.create_background_music(duration, 'modern')
-                audio_path = await self.audio_generator.mix_audio(audio_path, music_path)
+            async def prepare_audio() -> str:
+                audio_path = await self.audio_generator.text_to_speech(text, voice_config)
+                
+                # 背景音楽
+                if content.get('background_music', True):
+                    music_path = await self.audio_generator.create_background_music(duration, 'modern')
+                    audio_path = await self.audio_generator.mix_audio(audio_path, music_path)
+                return audio_path
+            
+            # Audio and the frame do not depend on each other
+            audio_path, frame_path = await asyncio.gather(
+                prepare_audio(),
+                self._render_frame({'text': text, 'style': style}, self._dimensions(content))
+            )
             
             # 動画生成
             video_config = {
@@ -55,10 +118,11 @@ class VideoGenerator:
                 'duration': duration,
                 'text': text,
                 'audio_path': audio_path,
+                'frame_path': frame_path,
                 'effects': content.get('effects', ['fade_in', 'text_animation'])
             }
             
-            await self._generate_video(video_config, video_path)
+            video_path = await self._generate_video(video_config)
             
             logger.info(f"Generated video: {video_path}")
             return video_path
@@ -99,22 +163,26 @@ class VideoGenerator:
     async def create_slideshow_video(self, slides: List[Dict[str, Any]]) -> str:
         """Create slideshow video from multiple slides."""
         try:
-            slide_videos = []
+            slide_configs = []
             
-            for i, slide in enumerate(slides):
+            for slide in slides:
                 slide_config = {
                     'text': slide['text'],
                     'style': slide.get('style', 'presentation'),
                     'duration': slide.get('duration', 5),
                     'background': slide.get('background', 'gradient'),
-                    'transition': slide.get('transition', 'fade')
+                    'transition': slide.get('transition', 'fade'),
+                    'code': slide.get('code')
                 }
-                
-                slide_video = await self._create_slide(slide_config, i)
-                slide_videos.append(slide_video)
+                slide_configs.append(slide_config)
+            
+            # Slides are independent; encode them concurrently
+            slide_videos = await asyncio.gather(*(
+                self._create_slide(slide_config, i) for i, slide_config in enumerate(slide_configs)
+            ))
             
             # スライド結合
-            final_video = await self._concatenate_videos(slide_videos)
+            final_video = await self._concatenate_videos(list(slide_videos))
             
             logger.info(f"Created slideshow video: {final_video}")
             return final_video
@@ -161,96 +229,77 @@ class VideoGenerator:
             logger.error(f"Tutorial video creation failed: {e}")
             raise
     
-    def _get_cache_key(self, content: Dict[str, Any]) -> str:
-        """Generate cache key for video."""
-        # コンテンツのハッシュを生成
-        content_str = str(sorted(content.items()))
-        return hashlib.md5(content_str.encode()).hexdigest()
+    def _dimensions(self, config: Dict[str, Any]) -> Tuple[int, int]:
+        return (1080, 1920) if config.get('aspect_ratio') == '9:16' else (1920, 1080)
     
-    async def _generate_video(self, config: Dict[str, Any], output_path: str):
-        """Generate video file (implementation placeholder)."""
-        # 実際の実装では以下のツールを使用:
-        # - FFmpeg for video processing
-        # - Remotion for programmatic video creation
-        # - Runway ML API for AI video generation
-        # - Synthesia API for AI avatar videos
-        # - Loom API for screen recording
-        
-        style_templates = {
-            'modern': {
-                'background': 'gradient_animation',
-                'font': 'modern_sans',
-                'colors': ['#667eea', '#764ba2'],
-                'animations': ['fade_in', 'slide_up']
-            },
-            'viral_shorts': {
-                'background': 'dynamic_shapes',
-                'font': 'bold_impact',
-                'colors': ['#ff6b6b', '#4ecdc4'],
-                'animations': ['zoom_in', 'quick_cuts', 'text_pop']
-            },
-            'presentation': {
-                'background': 'clean_white',
-                'font': 'professional',
-                'colors': ['#2c3e50', '#3498db'],
-                'animations': ['fade_in', 'smooth_transition']
-            },
-            'tutorial_intro': {
-                'background': 'tech_grid',
-                'font': 'title_font',
-                'colors': ['#1e3c72', '#2a5298']
-            },
-            'tutorial_step': {
-                'background': 'code_editor',
-                'font': 'monospace',
-                'colors': ['#282c34', '#61dafb']
-            },
-            'tutorial_outro': {
-                'background': 'celebration',
-                'font': 'friendly',
-                'colors': ['#fd79a8', '#fdcb6e']
-            }
+    async def _render_frame(self, config: Dict[str, Any], dimensions: Tuple[int, int]) -> str:
+        """Render the still frame shown for a video or slide."""
+        template = STYLE_TEMPLATES.get(config['style'], STYLE_TEMPLATES['modern'])
+        frame_config = {
+            'text': config['text'],
+            'code': config.get('code'),
+            'dimensions': list(dimensions),
+            'background': template['frame_background'],
+            'colors': template['colors'],
+            'text_color': template['text_color'],
+            'shadow': template['frame_background'] != 'clean_white'
         }
         
-        template = style_templates.get(config['style'], style_templates['modern'])
+        async def build(output_path: str):
+            await asyncio.to_thread(render_to_file, 'frame', frame_config, output_path)
         
-        # モック実装
-        await asyncio.sleep(2)  # 生成時間シミュレーション
+        return await self.pipeline.stage('frames', frame_config, 'png', build)
+    
+    async def _generate_video(self, config: Dict[str, Any]) -> str:
+        """Encode a still frame and an optional audio track into an H.264 video."""
+        frame_path = config['frame_path']
+        audio_path = config.get('audio_path')
+        duration = config['duration']
+        effects = config.get('effects', [])
         
-        # ダミーファイル作成
-        with open(output_path, 'w') as f:
-            f.write(f"# Video file\n")
-            f.write(f"# Text: {config['text'][:50]}...\n")
-            f.write(f"# Style: {config['style']}\n")
-            f.write(f"# Duration: {config['duration']}s\n")
-            f.write(f"# Template: {template}\n")
-            f.write(f"# Generated: {datetime.now()}\n")
+        filters = []
+        if 'fade_in' in effects or config.get('transition') == 'fade':
+            filters.append(f"fade=t=in:st=0:d={FADE_DURATION}")
+        if config.get('transition') == 'fade':
+            filters.append(f"fade=t=out:st={max(0, duration - FADE_DURATION)}:d={FADE_DURATION}")
+        
+        inputs = {
+            'frame': frame_path,
+            'audio': audio_path,
+            'duration': duration,
+            'fps': self.fps,
+            'filters': filters
+        }
+        
+        async def build(output_path: str):
+            # Slides get a silent track so every segment has the same streams
+            # and can be concatenated without re-encoding
+            audio_input = ['-i', audio_path] if audio_path else ['-f', 'lavfi', '-i', 'anullsrc=r=44100:cl=stereo']
+            await self.pipeline.run(
+                '-loop', '1', '-framerate', str(self.fps), '-i', frame_path,
+                *audio_input,
+                '-map', '0:v', '-map', '1:a',
+                '-t', str(duration),
+                *(['-vf', ','.join(filters)] if filters else []),
+                '-c:v', 'libx264', '-preset', 'veryfast', '-tune', 'stillimage', '-pix_fmt', 'yuv420p',
+                '-r', str(self.fps),
+                '-c:a', 'aac', '-b:a', '192k', '-ar', '44100', '-ac', '2',
+                '-movflags', '+faststart',
+                output_path,
+                threads=True
+            )
+        
+        return await self.pipeline.stage('encode', inputs, 'mp4', build)
     
     async def _create_slide(self, slide_config: Dict[str, Any], slide_number: int) -> str:
         """Create individual slide video."""
-        output_path = os.path.join(self.cache_dir, f"slide_{slide_number}_{hashlib.md5(str(slide_config).encode()).hexdigest()}.mp4")
-        
-        if os.path.exists(output_path):
-            return output_path
-        
-        await self._generate_video(slide_config, output_path)
-        return output_path
+        frame_path = await self._render_frame(slide_config, self._dimensions(slide_config))
+        logger.debug(f"Encoding slide {slide_number + 1}")
+        return await self._generate_video({**slide_config, 'frame_path': frame_path})
     
     async def _concatenate_videos(self, video_files: List[str]) -> str:
         """Concatenate multiple video files."""
-        output_path = os.path.join(self.cache_dir, f"concatenated_{hashlib.md5(str(video_files).encode()).hexdigest()}.mp4")
-        
-        if os.path.exists(output_path):
-            return output_path
-        
-        # FFmpeg等を使用した実装
-        await asyncio.sleep(1)
-        
-        with open(output_path, 'w') as f:
-            f.write(f"# Concatenated video from {len(video_files)} segments\n")
-            f.write(f"# Generated: {datetime.now()}\n")
-        
-        return output_path
+        return await self.pipeline.concat('concat_video', video_files, 'mp4')
 
 
 class LiveStreamGenerator(VideoGenerator):
@@ -285,4 +334,4 @@ class LiveStreamGenerator(VideoGenerator):
             f.write(f"# Title: {config['title']}\n")
             f.write(f"# Generated: {datetime.now()}\n")
         
-        return output_path
\ No newline at end of file
+        return output_path
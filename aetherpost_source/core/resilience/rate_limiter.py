@@ -59,6 +59,13 @@ class UsageStats:
         self.request_times = [t for t in self.request_times if t > hour_ago]
         self.request_times.append(current_time)
     
+    def remove_request(self):
+        """Undo the most recent request, e.g. a reservation that was not used."""
+        if self.request_times:
+            self.request_times.pop()
+            self.requests_made = max(self.requests_made - 1, 0)
+            self.daily_requests = max(self.daily_requests - 1, 0)
+    
     def add_error(self):
         """Record an error."""
         self.errors_count += 1
@@ -194,6 +201,20 @@ class PlatformRateLimiter:
             
             return True
     
+    async def release(self):
+        """Give back the budget taken by the last ``acquire``."""
+        async with self._lock:
+            self.usage_stats.remove_request()
+    
+    def seconds_until_available(self) -> int:
+        """Seconds to wait before a request would be admitted (0 if now)."""
+        current_time = time.time()
+        if current_time - self.usage_stats.daily_reset_time > 86400:
+            return 0
+        if self._can_make_request(current_time):
+            return 0
+        return max(self._calculate_delay(current_time), 1)
+    
     def _can_make_request(self, current_time: float) -> bool:
         """Check if we can make a request now."""
         
@@ -321,6 +342,15 @@ class GlobalRateLimitManager:
         limiter = self.get_limiter(platform)
         return await limiter.acquire(endpoint)
     
+    async def release(self, platform: str):
+        """Return budget acquired for a request that was not made."""
+        if platform in self.limiters:
+            await self.limiters[platform].release()
+    
+    def seconds_until_available(self, platforms: List[str]) -> int:
+        """Seconds until every one of ``platforms`` would admit a request."""
+        return max((self.get_limiter(platform).seconds_until_available() for platform in platforms), default=0)
+    
     def record_success(self, platform: str):
         """Record successful API call."""
         if platform in self.limiters:
@@ -398,8 +428,22 @@ class GlobalRateLimitManager:
         thread.start()
 
 
-# Global rate limit manager
-rate_limit_manager = GlobalRateLimitManager()
+_rate_limit_manager: Optional[GlobalRateLimitManager] = None
+
+
+def get_rate_limit_manager() -> GlobalRateLimitManager:
+    """Return the process-wide rate limit manager, creating it (and its stats-saving thread) on first use."""
+    global _rate_limit_manager
+    if _rate_limit_manager is None:
+        _rate_limit_manager = GlobalRateLimitManager()
+    return _rate_limit_manager
+
+
+def __getattr__(name):
+    # Keep `from aetherpost.core.resilience.rate_limiter import rate_limit_manager` working
+    if name == "rate_limit_manager":
+        return get_rate_limit_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Decorator for automatic rate limiting
@@ -410,13 +454,13 @@ def rate_limited(platform: str, endpoint: str = "default"):
         async def async_wrapper(*args, **kwargs):
             try:
                 # Acquire rate limit permission
-                await rate_limit_manager.acquire(platform, endpoint)
+                await get_rate_limit_manager().acquire(platform, endpoint)
                 
                 # Execute function
                 result = await func(*args, **kwargs)
                 
                 # Record success
-                rate_limit_manager.record_success(platform)
+                get_rate_limit_manager().record_success(platform)
                 
                 return result
                 
@@ -426,7 +470,7 @@ def rate_limited(platform: str, endpoint: str = "default"):
             except Exception as e:
                 # Record other errors
                 error_type = type(e).__name__
-                rate_limit_manager.record_error(platform, error_type)
+                get_rate_limit_manager().record_error(platform, error_type)
                 raise
         
         def sync_wrapper(*args, **kwargs):
@@ -1,7 +1,24 @@
 """Scheduling system for automated posting."""
 
-from .scheduler import PostingScheduler
-from .background import BackgroundScheduler
-from .models import ScheduleConfig, ScheduledPost
+import importlib
 
-__all__ = ['PostingScheduler', 'BackgroundScheduler', 'ScheduleConfig', 'ScheduledPost']
\ No newline at end of file
+__all__ = ['PostingScheduler', 'BackgroundScheduler', 'ScheduledPostExecutor', 'ScheduleConfig', 'ScheduledPost']
+
+# Exports are imported on first access, so importing one submodule (e.g.
+# the models for `scheduler status`) does not load the background daemon
+# and its HTTP client.
+_EXPORTS = {
+    'PostingScheduler': '.scheduler',
+    'BackgroundScheduler': '.background',
+    'ScheduledPostExecutor': '.executor',
+    'ScheduleConfig': '.models',
+    'ScheduledPost': '.models',
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
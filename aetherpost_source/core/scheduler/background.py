@@ -9,8 +9,10 @@ from typing import Optional, Dict, Any
 from pathlib import Path
 
 from .scheduler import PostingScheduler
+from .executor import ScheduledPostExecutor
 from .models import ScheduledPost, ScheduleStatus
 from ..exceptions import AetherPostError, ErrorCode
+from ...platforms.core.http_client import close_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +23,25 @@ class BackgroundScheduler:
     def __init__(self, 
                  campaign_file: str = "campaign.yaml",
                  check_interval_seconds: int = 60,
-                 aetherpost_dir: str = ".aetherpost"):
+                 aetherpost_dir: str = ".aetherpost",
+                 max_concurrent_posts: int = 4):
         """Initialize background scheduler."""
         self.campaign_file = campaign_file
         self.check_interval = check_interval_seconds
         self.scheduler = PostingScheduler(aetherpost_dir)
+        self.executor = ScheduledPostExecutor(
+            self._execute_post,
+            defer=self.scheduler.defer_post,
+            max_workers=max_concurrent_posts
+        )
         self.running = False
         self.task: Optional[asyncio.Task] = None
         
+        # Set when the schedule changes so the loop recomputes its wake-up time
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.scheduler.add_change_listener(self._on_schedule_changed)
+        
         # Track statistics
         self.stats = {
             "started_at": None,
@@ -57,7 +70,10 @@ class BackgroundScheduler:
         self.stats["started_at"] = datetime.utcnow()
         
         logger.info(f"Starting background scheduler for {self.campaign_file}")
-        logger.info(f"Check interval: {self.check_interval} seconds")
+        logger.info(f"Schedule file check interval: {self.check_interval} seconds")
+        
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         
         # Start the main loop
         self.task = asyncio.create_task(self._run_loop())
@@ -73,6 +89,10 @@ class BackgroundScheduler:
                 "error": str(e)
             })
             raise
+        finally:
+            # Log out of platforms only once the daemon is done posting
+            await self.scheduler.platform_pool.close()
+            await close_http_client()
     
     def stop(self):
         """Stop the background scheduler."""
@@ -85,17 +105,43 @@ class BackgroundScheduler:
         
         logger.info("Background scheduler stopped")
     
+    def _on_schedule_changed(self):
+        """Wake the loop; may be called from any thread."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+    
+    def _seconds_until_next_due(self) -> float:
+        """Time to sleep before the next post is due.
+        
+        check_interval only caps the sleep so that edits made to
+        schedule.json by other processes are noticed.
+        """
+        timeout = float(self.check_interval)
+        next_due = self.scheduler.next_due_time()
+        if next_due is not None:
+            timeout = min(timeout, max((next_due - datetime.utcnow()).total_seconds(), 0.0))
+        return timeout
+    
+    async def _wait_for_next_due(self):
+        """Sleep until the next post is due or the schedule changes."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self._seconds_until_next_due())
+        except asyncio.TimeoutError:
+            pass
+    
     async def _run_loop(self):
         """Main scheduler loop."""
         logger.info("Background scheduler loop started")
         
         while self.running:
             try:
+                # Clear before checking so changes made meanwhile still wake us
+                self._wakeup.clear()
                 await self._check_and_execute_posts()
                 self.stats["last_check"] = datetime.utcnow()
                 
-                # Sleep for the check interval
-                await asyncio.sleep(self.check_interval)
+                await self._wait_for_next_due()
                 
             except asyncio.CancelledError:
                 logger.info("Scheduler loop cancelled")
@@ -121,36 +167,24 @@ class BackgroundScheduler:
             
             logger.info(f"Found {len(pending_posts)} pending posts")
             
-            # Execute each pending post
-            for post in pending_posts:
-                try:
-                    logger.info(f"Executing post {post.id} scheduled for {post.scheduled_time}")
-                    
-                    success = await self.scheduler.execute_scheduled_post(post)
-                    
-                    if success:
-                        self.stats["posts_executed"] += 1
-                        logger.info(f"Successfully executed post {post.id}")
-                    else:
-                        self.stats["posts_failed"] += 1
-                        logger.error(f"Failed to execute post {post.id}")
-                    
-                    # Small delay between posts to avoid rate limits
-                    await asyncio.sleep(5)
-                    
-                except Exception as e:
-                    logger.error(f"Error executing post {post.id}: {e}")
-                    self.stats["posts_failed"] += 1
-                    self.stats["errors"].append({
-                        "time": datetime.utcnow().isoformat(),
-                        "post_id": post.id,
-                        "error": str(e)
-                    })
+            # Run them on the worker pool; posts over their platform rate
+            # limits are deferred back into the schedule
+            summary = await self.executor.run(pending_posts)
+            
+            self.stats["posts_executed"] += len(summary.executed)
+            self.stats["posts_failed"] += len(summary.failed)
+            self.stats["errors"].extend(summary.errors)
+            
+            if summary.deferred:
+                logger.info(f"Deferred {len(summary.deferred)} posts until platform rate limits allow")
             
         except Exception as e:
             logger.error(f"Error checking for pending posts: {e}")
             raise
     
+    async def _execute_post(self, post: ScheduledPost) -> bool:
+        return await self.scheduler.execute_scheduled_post(post)
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current scheduler status."""
         schedule_stats = self.scheduler.get_schedule_stats()
@@ -159,6 +193,7 @@ class BackgroundScheduler:
             "running": self.running,
             "campaign_file": self.campaign_file,
             "check_interval_seconds": self.check_interval,
+            "max_concurrent_posts": self.executor.max_workers,
             "stats": self.stats.copy(),
             "schedule": schedule_stats
         }
@@ -192,13 +227,15 @@ class BackgroundScheduler:
 async def run_background_scheduler(
     campaign_file: str = "campaign.yaml",
     check_interval: int = 60,
-    daemon: bool = False
+    daemon: bool = False,
+    max_concurrent_posts: int = 4
 ):
     """Run the background scheduler."""
     
     scheduler = BackgroundScheduler(
         campaign_file=campaign_file,
-        check_interval_seconds=check_interval
+        check_interval_seconds=check_interval,
+        max_concurrent_posts=max_concurrent_posts
     )
     
     if daemon:
@@ -233,7 +270,8 @@ async def run_background_scheduler(
 def create_scheduler_daemon(
     campaign_file: str = "campaign.yaml",
     check_interval: int = 60,
-    pid_file: Optional[str] = None
+    pid_file: Optional[str] = None,
+    max_concurrent_posts: int = 4
 ):
     """Create a scheduler daemon process."""
     
@@ -324,7 +362,8 @@ def create_scheduler_daemon(
         # Run the scheduler
         asyncio.run(run_background_scheduler(
             campaign_file=campaign_file,
-            check_interval=check_interval
+            check_interval=check_interval,
+            max_concurrent_posts=max_concurrent_posts
         ))
         
     except Exception as e:
@@ -0,0 +1,130 @@
+"""Concurrent execution of due scheduled posts."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .models import ScheduledPost
+from ..exceptions import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExecutionSummary:
+    """Outcome of one executor run."""
+    executed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    deferred: Dict[str, datetime] = field(default_factory=dict)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class ScheduledPostExecutor:
+    """Run due posts concurrently on a bounded pool of workers.
+
+    Posts are admitted in the order given, which is due-time order (earliest
+    first); ScheduledPost has no separate priority. Before a post is started
+    it reserves budget on every one of its platforms in the rate limit
+    manager, all or nothing; a post that cannot is handed to ``defer`` with
+    the time its platforms free up, so it never holds a worker or blocks
+    posts for other platforms queued behind it.
+    """
+    
+    def __init__(
+        self,
+        execute: Callable[[ScheduledPost], Awaitable[bool]],
+        defer: Optional[Callable[[ScheduledPost, datetime], None]] = None,
+        max_workers: int = 4,
+        rate_limits=None
+    ):
+        self.execute = execute
+        self.defer = defer
+        self.max_workers = max(1, max_workers)
+        self._rate_limits = rate_limits
+    
+    @property
+    def rate_limits(self):
+        """Rate limit manager used for admission (the global one by default)."""
+        if self._rate_limits is None:
+            from ..resilience.rate_limiter import get_rate_limit_manager
+            self._rate_limits = get_rate_limit_manager()
+        return self._rate_limits
+    
+    async def run(self, posts: List[ScheduledPost]) -> ExecutionSummary:
+        """Execute ``posts`` and wait for every admitted post to finish."""
+        summary = ExecutionSummary()
+        workers = asyncio.Semaphore(self.max_workers)
+        tasks = []
+        
+        for post in posts:
+            await workers.acquire()
+            
+            retry_after = await self._admit(post)
+            if retry_after:
+                workers.release()
+                self._defer(post, retry_after, summary)
+                continue
+            
+            tasks.append(asyncio.create_task(self._run_post(post, workers, summary)))
+        
+        if tasks:
+            await asyncio.gather(*tasks)
+        
+        return summary
+    
+    async def _admit(self, post: ScheduledPost) -> int:
+        """Reserve rate limit budget for the post; return seconds to wait if refused.
+
+        Budget is taken on every platform or on none: if a later platform
+        refuses, the reservations already made are released.
+        """
+        retry_after = self.rate_limits.seconds_until_available(post.platforms)
+        if retry_after:
+            return retry_after
+        
+        reserved = []
+        for platform in post.platforms:
+            try:
+                await self.rate_limits.acquire(platform, "scheduled_post")
+            except RateLimitError as e:
+                for acquired in reserved:
+                    await self.rate_limits.release(acquired)
+                return max(e.details.get("retry_after") or 1, 1)
+            reserved.append(platform)
+        
+        return 0
+    
+    def _defer(self, post: ScheduledPost, retry_after: int, summary: ExecutionSummary):
+        until = datetime.utcnow() + timedelta(seconds=retry_after)
+        summary.deferred[post.id] = until
+        logger.info(f"Deferring post {post.id} for {retry_after}s until its platforms are within rate limits")
+        
+        if self.defer:
+            self.defer(post, until)
+    
+    async def _run_post(self, post: ScheduledPost, workers: asyncio.Semaphore, summary: ExecutionSummary):
+        try:
+            logger.info(f"Executing post {post.id} scheduled for {post.scheduled_time}")
+            success = await self.execute(post)
+        except Exception as e:
+            logger.error(f"Error executing post {post.id}: {e}")
+            success = False
+            summary.errors.append({
+                "time": datetime.utcnow().isoformat(),
+                "post_id": post.id,
+                "error": str(e)
+            })
+        finally:
+            workers.release()
+        
+        if success:
+            summary.executed.append(post.id)
+            logger.info(f"Successfully executed post {post.id}")
+        else:
+            summary.failed.append(post.id)
+            logger.error(f"Failed to execute post {post.id}")
+        
+        for platform in post.post_ids or {}:
+            self.rate_limits.record_success(platform)
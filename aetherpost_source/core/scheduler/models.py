@@ -62,6 +62,7 @@ class ScheduledPost:
     last_error: Optional[str] = None
     posted_at: Optional[datetime] = None
     post_ids: Dict[str, str] = None  # platform -> post_id mapping
+    last_attempt_at: Optional[datetime] = None
     
     def __post_init__(self):
         """Set defaults after initialization."""
@@ -80,6 +81,7 @@ class ScheduledPost:
     def mark_attempt(self, error: Optional[str] = None):
         """Mark an attempt."""
         self.attempts += 1
+        self.last_attempt_at = datetime.utcnow()
         if error:
             self.last_error = error
             self.status = ScheduleStatus.FAILED
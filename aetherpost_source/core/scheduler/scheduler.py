@@ -1,19 +1,19 @@
 """Core posting scheduler implementation."""
 
 import asyncio
+import heapq
 import json
+import os
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import logging
 
 from .models import ScheduleConfig, ScheduledPost, FrequencyType, ScheduleStatus
 from ..config.parser import ConfigLoader
-from ..content.generator import ContentGenerator
 from ..state.manager import StateManager
 from ..exceptions import AetherPostError, ErrorCode
-from ...platforms.core.platform_factory import platform_factory
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +21,40 @@ logger = logging.getLogger(__name__)
 class PostingScheduler:
     """Manages automated posting schedules."""
     
-    def __init__(self, aetherpost_dir: str = ".aetherpost"):
+    def __init__(self, aetherpost_dir: str = ".aetherpost", retry_delay_seconds: int = 60):
         """Initialize scheduler."""
         self.aetherpost_dir = Path(aetherpost_dir)
         self.schedule_file = self.aetherpost_dir / "schedule.json"
         self.config_loader = ConfigLoader()
         self.state_manager = StateManager()
+        self.retry_delay = timedelta(seconds=retry_delay_seconds)
+        
+        # Authenticated platforms shared by every post this scheduler executes,
+        # created on first use so reading the schedule skips the platform imports
+        self._platform_pool = None
+        
+        # In-memory schedule, re-read only when schedule.json changes on disk
+        self._posts: Dict[str, ScheduledPost] = {}
+        self._file_signature: Optional[Tuple[int, int]] = None
+        self._loaded = False
+        
+        # Min-heap of (due time, post id). Entries are invalidated lazily:
+        # an entry is live only while it matches _due_at for its post.
+        self._queue: List[Tuple[datetime, str]] = []
+        self._due_at: Dict[str, datetime] = {}
+        
+        self._change_listeners: List[Callable[[], None]] = []
         
         # Ensure directory exists
         self.aetherpost_dir.mkdir(exist_ok=True)
     
+    @property
+    def platform_pool(self):
+        if self._platform_pool is None:
+            from ...platforms.core.pool import PlatformPool
+            self._platform_pool = PlatformPool()
+        return self._platform_pool
+    
     def create_schedule(
         self, 
         campaign_file: str = "campaign.yaml",
@@ -174,6 +198,14 @@ class PostingScheduler:
     
     def save_schedule(self, scheduled_posts: List[ScheduledPost]):
         """Save scheduled posts to disk."""
+        self._write_schedule_file(scheduled_posts)
+        self._index(scheduled_posts)
+        self._file_signature = self._get_file_signature()
+        self._notify_change()
+        
+        logger.info(f"Saved {len(scheduled_posts)} scheduled posts to {self.schedule_file}")
+    
+    def _write_schedule_file(self, scheduled_posts: List[ScheduledPost]):
         schedule_data = {
             "version": "1.0",
             "created_at": datetime.utcnow().isoformat(),
@@ -192,17 +224,24 @@ class PostingScheduler:
                 "max_attempts": post.max_attempts,
                 "last_error": post.last_error,
                 "posted_at": post.posted_at.isoformat() if post.posted_at else None,
-                "post_ids": post.post_ids
+                "post_ids": post.post_ids,
+                "last_attempt_at": post.last_attempt_at.isoformat() if post.last_attempt_at else None
             }
             schedule_data["posts"].append(post_data)
         
-        with open(self.schedule_file, 'w', encoding='utf-8') as f:
+        # Write to a temporary file and rename so readers never see a partial schedule
+        tmp_file = self.schedule_file.with_name(f".{self.schedule_file.name}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
             json.dump(schedule_data, f, indent=2)
-        
-        logger.info(f"Saved {len(scheduled_posts)} scheduled posts to {self.schedule_file}")
+        os.replace(tmp_file, self.schedule_file)
     
     def load_schedule(self) -> List[ScheduledPost]:
-        """Load scheduled posts from disk."""
+        """Get all scheduled posts, re-reading schedule.json only if it changed."""
+        self._refresh_if_changed()
+        return list(self._posts.values())
+    
+    def _read_schedule_file(self) -> List[ScheduledPost]:
+        """Parse scheduled posts from disk."""
         if not self.schedule_file.exists():
             return []
         
@@ -223,7 +262,8 @@ class PostingScheduler:
                     max_attempts=post_data.get("max_attempts", 3),
                     last_error=post_data.get("last_error"),
                     posted_at=datetime.fromisoformat(post_data["posted_at"]) if post_data.get("posted_at") else None,
-                    post_ids=post_data.get("post_ids", {})
+                    post_ids=post_data.get("post_ids", {}),
+                    last_attempt_at=datetime.fromisoformat(post_data["last_attempt_at"]) if post_data.get("last_attempt_at") else None
                 )
                 scheduled_posts.append(post)
             
@@ -234,29 +274,124 @@ class PostingScheduler:
             logger.error(f"Error loading schedule: {e}")
             return []
     
+    def _get_file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.schedule_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _refresh_if_changed(self):
+        """Reload the schedule if another process rewrote schedule.json."""
+        signature = self._get_file_signature()
+        if self._loaded and signature == self._file_signature:
+            return
+        
+        self._index(self._read_schedule_file())
+        self._file_signature = signature
+    
+    def _index(self, scheduled_posts: List[ScheduledPost]):
+        """Rebuild the in-memory schedule and due-time heap."""
+        self._posts = {post.id: post for post in scheduled_posts}
+        self._due_at = {}
+        self._queue = []
+        self._loaded = True
+        
+        for post in scheduled_posts:
+            if self._is_runnable(post):
+                due = self._due_time(post)
+                self._due_at[post.id] = due
+                self._queue.append((due, post.id))
+        heapq.heapify(self._queue)
+    
+    @staticmethod
+    def _is_runnable(post: ScheduledPost) -> bool:
+        return post.status == ScheduleStatus.PENDING or post.can_retry()
+    
+    def _requeue(self, post: ScheduledPost):
+        """Update a single post's position in the due-time heap."""
+        if not self._is_runnable(post):
+            self._due_at.pop(post.id, None)
+            return
+        
+        due = self._due_time(post)
+        if self._due_at.get(post.id) != due:
+            self._due_at[post.id] = due
+            heapq.heappush(self._queue, (due, post.id))
+    
+    def _due_time(self, post: ScheduledPost) -> datetime:
+        """When a runnable post is due; failed posts back off before retrying."""
+        if post.status != ScheduleStatus.FAILED:
+            return post.scheduled_time
+        # Posts saved before attempt times were recorded back off from now
+        failed_at = post.last_attempt_at or datetime.utcnow()
+        return max(post.scheduled_time, failed_at + self.retry_delay)
+    
+    def _peek(self) -> Optional[Tuple[datetime, str]]:
+        """Return the earliest live heap entry, discarding stale ones."""
+        while self._queue:
+            due, post_id = self._queue[0]
+            if self._due_at.get(post_id) == due:
+                return self._queue[0]
+            heapq.heappop(self._queue)
+        return None
+    
+    def defer_post(self, post: ScheduledPost, until: datetime):
+        """Hold a due post back until ``until`` without rescheduling it on disk."""
+        if post.id in self._posts and self._is_runnable(post) and self._due_at.get(post.id) != until:
+            self._due_at[post.id] = until
+            heapq.heappush(self._queue, (until, post.id))
+    
+    def next_due_time(self) -> Optional[datetime]:
+        """Time at which the next post becomes due, if any."""
+        self._refresh_if_changed()
+        entry = self._peek()
+        return entry[0] if entry else None
+    
+    def add_change_listener(self, callback: Callable[[], None]):
+        """Call ``callback`` whenever the schedule is modified through this scheduler."""
+        self._change_listeners.append(callback)
+    
+    def remove_change_listener(self, callback: Callable[[], None]):
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+    
+    def _notify_change(self):
+        for callback in self._change_listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Schedule change listener failed: {e}")
+    
     def get_pending_posts(self, until_time: Optional[datetime] = None) -> List[ScheduledPost]:
-        """Get posts that are ready to be posted."""
-        scheduled_posts = self.load_schedule()
+        """Get posts that are ready to be posted, earliest first."""
+        self._refresh_if_changed()
         
         if until_time is None:
             until_time = datetime.utcnow()
         
-        pending_posts = []
-        for post in scheduled_posts:
-            if (post.status == ScheduleStatus.PENDING and 
-                post.scheduled_time <= until_time):
-                pending_posts.append(post)
-            elif (post.status == ScheduleStatus.FAILED and 
-                  post.can_retry() and 
-                  post.scheduled_time <= until_time):
-                pending_posts.append(post)
-        
-        return pending_posts
+        # Pop due entries off the heap, then push them back; they leave the
+        # queue once executing changes their status.
+        due_entries = []
+        while True:
+            entry = self._peek()
+            if entry is None or entry[0] > until_time:
+                break
+            due_entries.append(heapq.heappop(self._queue))
+        
+        for entry in due_entries:
+            heapq.heappush(self._queue, entry)
+        
+        return [self._posts[post_id] for _, post_id in due_entries]
     
     async def execute_scheduled_post(self, scheduled_post: ScheduledPost) -> bool:
         """Execute a scheduled post."""
+        from ..content.generator import ContentGenerator
+        from ...platforms.core.base_platform import Content, ContentType
+        
         logger.info(f"Executing scheduled post {scheduled_post.id}")
         
+        content_generator = None
         try:
             # Mark as running
             scheduled_post.status = ScheduleStatus.RUNNING
@@ -266,26 +401,33 @@ class PostingScheduler:
             config = self.config_loader.load_campaign_config(scheduled_post.campaign_file)
             credentials = self.config_loader.load_credentials()
             
-            # Generate content
-            content_generator = ContentGenerator(config)
-            content_items = await content_generator.generate_content(
-                platforms=scheduled_post.platforms
+            # Generate content for all platforms in one request
+            content_generator = ContentGenerator(credentials)
+            content_items = await content_generator.generate_content_batch(
+                config,
+                scheduled_post.platforms
             )
             
             # Post to each platform
             posted_ids = {}
             for platform_name in scheduled_post.platforms:
+                platform_credentials = None
+                platform_instance = None
                 try:
                     # Get platform content
-                    platform_content = next(
-                        (item for item in content_items if item.platform == platform_name), 
-                        None
-                    )
+                    content_data = content_items.get(platform_name)
                     
-                    if not platform_content:
+                    if not content_data:
                         logger.warning(f"No content generated for {platform_name}")
                         continue
                     
+                    platform_content = Content(
+                        text=content_data.get("text", ""),
+                        hashtags=content_data.get("hashtags", []),
+                        content_type=ContentType.TEXT,
+                        platform_data=content_data
+                    )
+                    
                     # Get platform credentials
                     if isinstance(credentials, dict):
                         platform_credentials = credentials.get(platform_name, {})
@@ -299,40 +441,46 @@ class PostingScheduler:
                         logger.warning(f"No credentials for {platform_name}")
                         continue
                     
-                    # Create platform instance
-                    platform_instance = platform_factory.create_platform(
-                        platform_name=platform_name,
-                        credentials=platform_credentials
-                    )
+                    # Reuse the pooled login for this account, authenticating only when needed
+                    platform_instance = await self.platform_pool.acquire(platform_name, platform_credentials)
                     
-                    # Authenticate and post
-                    if await platform_instance.authenticate():
-                        post_result = await platform_instance.post_content(platform_content.content)
+                    if platform_instance:
+                        post_result = await platform_instance.post_content(platform_content)
                         
                         if post_result.success and post_result.post_id:
                             posted_ids[platform_name] = post_result.post_id
                             logger.info(f"Posted to {platform_name}: {post_result.post_id}")
                             
                             # Save to state
-                            from ..state.models import CampaignPost
-                            campaign_post = CampaignPost(
-                                post_id=post_result.post_id,
+                            if not self.state_manager.state and not self.state_manager.load_state():
+                                self.state_manager.initialize_campaign(config.name)
+                            self.state_manager.add_post(
                                 platform=platform_name,
-                                content=platform_content.content.dict(),
-                                created_at=datetime.utcnow()
+                                post_id=post_result.post_id,
+                                url=post_result.post_url or "unknown",
+                                content={
+                                    'text': platform_content.text,
+                                    'hashtags': platform_content.hashtags,
+                                    'content_type': platform_content.content_type.value
+                                }
                             )
-                            self.state_manager.add_post(campaign_post)
                         else:
                             logger.error(f"Failed to post to {platform_name}: {post_result.error_message}")
-                    
-                    # Cleanup
-                    await platform_instance.cleanup()
+                    else:
+                        logger.error(f"Authentication failed for {platform_name}")
                     
                 except Exception as e:
                     logger.error(f"Error posting to {platform_name}: {e}")
+                    if platform_credentials:
+                        await self.platform_pool.invalidate(platform_name, platform_credentials)
+                finally:
+                    if platform_instance is not None:
+                        await self.platform_pool.release(platform_instance)
             
             # Mark as completed or failed
             if posted_ids:
+                # The project changes have been announced; diff against this run next time
+                content_generator.commit_context()
                 scheduled_post.mark_completed(posted_ids)
                 logger.info(f"Scheduled post {scheduled_post.id} completed successfully")
             else:
@@ -348,17 +496,24 @@ class PostingScheduler:
             scheduled_post.mark_attempt(str(e))
             self._update_post_in_schedule(scheduled_post)
             return False
+        finally:
+            # Release the AI provider clients opened for this post
+            if content_generator is not None:
+                await content_generator.close()
     
     def _update_post_in_schedule(self, updated_post: ScheduledPost):
         """Update a specific post in the saved schedule."""
-        scheduled_posts = self.load_schedule()
+        self._refresh_if_changed()
         
-        for i, post in enumerate(scheduled_posts):
-            if post.id == updated_post.id:
-                scheduled_posts[i] = updated_post
-                break
+        if updated_post.id not in self._posts:
+            return
         
-        self.save_schedule(scheduled_posts)
+        self._posts[updated_post.id] = updated_post
+        self._requeue(updated_post)
+        
+        self._write_schedule_file(list(self._posts.values()))
+        self._file_signature = self._get_file_signature()
+        self._notify_change()
     
     def cleanup_old_posts(self, days_old: int = 30):
         """Remove old completed/failed posts from schedule."""
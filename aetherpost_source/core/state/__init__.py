@@ -1 +1,17 @@
-"""State management for AetherPost campaigns."""
\ No newline at end of file
+"""State management for AetherPost campaigns."""
+
+from .models import PostRecord, MediaRecord, AnalyticsRecord, CampaignState
+from .backends import StateBackend, JSONStateBackend, SQLiteStateBackend, create_state_backend
+from .manager import StateManager
+
+__all__ = [
+    'PostRecord',
+    'MediaRecord',
+    'AnalyticsRecord',
+    'CampaignState',
+    'StateBackend',
+    'JSONStateBackend',
+    'SQLiteStateBackend',
+    'create_state_backend',
+    'StateManager'
+]
@@ -0,0 +1,433 @@
+"""Storage backends for campaign state."""
+
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Union
+
+from .models import CampaignState, PostRecord, MediaRecord, AnalyticsRecord
+
+
+class StateBackend(ABC):
+    """Persistence interface used by ``StateManager``.
+
+    Backends receive fine-grained mutations (one post added, one post's
+    metrics changed) so that stores which support it can write only what
+    changed instead of the whole campaign.
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+    
+    @abstractmethod
+    def exists(self) -> bool:
+        """Whether persisted state is present."""
+        pass
+    
+    @abstractmethod
+    def load(self) -> Optional[CampaignState]:
+        """Load the complete campaign state."""
+        pass
+    
+    @abstractmethod
+    def save(self, state: CampaignState):
+        """Persist the complete campaign state, replacing what is stored."""
+        pass
+    
+    def save_campaign(self, state: CampaignState):
+        """Persist campaign-level fields (timestamps, analytics)."""
+        self.save(state)
+    
+    def add_post(self, state: CampaignState, record: PostRecord):
+        self.save(state)
+    
+    def update_posts(self, state: CampaignState, records: List[PostRecord]):
+        self.save(state)
+    
+    def remove_post(self, state: CampaignState, record: PostRecord):
+        self.save(state)
+    
+    def add_media(self, state: CampaignState, record: MediaRecord):
+        self.save(state)
+    
+    def load_campaign(self) -> Optional[CampaignState]:
+        """Load campaign-level fields only; ``posts`` and ``media`` are left empty."""
+        state = self.load()
+        if state is None:
+            return None
+        return state.copy(update={"posts": [], "media": []})
+    
+    def post_ids(self) -> List[str]:
+        """Record ids of all stored posts, in insertion order."""
+        state = self.load()
+        return [post.id for post in state.posts] if state else []
+    
+    def get_posts(self, ids: List[str]) -> List[PostRecord]:
+        """Stored posts with the given record ids, in insertion order."""
+        wanted = set(ids)
+        state = self.load()
+        return [post for post in state.posts if post.id in wanted] if state else []
+    
+    def query_posts(self,
+                    platform: Optional[str] = None,
+                    variant_id: Optional[str] = None,
+                    since: Optional[datetime] = None,
+                    metrics_updated_since: Optional[datetime] = None) -> List[PostRecord]:
+        """Query stored posts without going through the in-memory state."""
+        state = self.load()
+        if not state:
+            return []
+        return [
+            post for post in state.posts
+            if (platform is None or post.platform == platform)
+            and (variant_id is None or post.variant_id == variant_id)
+            and (since is None or post.created_at >= since)
+            and (metrics_updated_since is None
+                 or (post.metrics_updated_at is not None and post.metrics_updated_at > metrics_updated_since))
+        ]
+    
+    @abstractmethod
+    def clear(self):
+        """Delete all persisted state."""
+        pass
+
+
+class JSONStateBackend(StateBackend):
+    """Single JSON document (``promo.state.json``), rewritten on every change.
+
+    Used to import and export state; opt in with ``backend="json"``.
+    """
+    
+    def exists(self) -> bool:
+        return self.path.exists()
+    
+    def load(self) -> Optional[CampaignState]:
+        if not self.path.exists():
+            return None
+        
+        with open(self.path, 'r') as f:
+            data = json.load(f)
+        return CampaignState(**data)
+    
+    def save(self, state: CampaignState):
+        # Write to a temporary file and rename so a crash never truncates state
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(
+                state.dict(),
+                f,
+                indent=2,
+                default=str  # Handle datetime serialization
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+    
+    def clear(self):
+        if self.path.exists():
+            self.path.unlink()
+
+
+class SQLiteStateBackend(StateBackend):
+    """Embedded SQLite store with indexed posts.
+
+    Each mutation touches only the affected rows, so adding a post or
+    updating metrics costs the same regardless of campaign size.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS campaign (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            campaign_id TEXT NOT NULL,
+            version TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            analytics TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS posts (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            id TEXT NOT NULL UNIQUE,
+            platform TEXT NOT NULL,
+            post_id TEXT NOT NULL,
+            url TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            content TEXT NOT NULL,
+            metrics TEXT NOT NULL,
+            status TEXT NOT NULL,
+            variant_id TEXT,
+            metrics_updated_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_posts_platform ON posts(platform);
+        CREATE INDEX IF NOT EXISTS idx_posts_post_id ON posts(post_id);
+        CREATE INDEX IF NOT EXISTS idx_posts_variant_id ON posts(variant_id);
+        CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts(created_at);
+        CREATE TABLE IF NOT EXISTS media (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            id TEXT NOT NULL UNIQUE,
+            type TEXT NOT NULL,
+            path TEXT NOT NULL,
+            provider TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        super().__init__(path)
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+            self._migrate(self._conn)
+        return self._conn
+    
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        """Add columns introduced after a database was created."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(posts)")}
+        if "metrics_updated_at" not in columns:
+            with conn:
+                conn.execute("ALTER TABLE posts ADD COLUMN metrics_updated_at TEXT")
+    
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def exists(self) -> bool:
+        if not self.path.exists():
+            return False
+        row = self.conn.execute("SELECT 1 FROM campaign WHERE id = 1").fetchone()
+        return row is not None
+    
+    @staticmethod
+    def _post_row(record: PostRecord) -> tuple:
+        return (
+            record.id,
+            record.platform,
+            record.post_id,
+            record.url,
+            record.created_at.isoformat(),
+            json.dumps(record.content, default=str),
+            json.dumps(record.metrics),
+            record.status,
+            record.variant_id,
+            record.metrics_updated_at.isoformat() if record.metrics_updated_at else None
+        )
+    
+    @staticmethod
+    def _media_row(record: MediaRecord) -> tuple:
+        return (record.id, record.type, record.path, record.provider, record.created_at.isoformat())
+    
+    @staticmethod
+    def _row_to_post(row) -> PostRecord:
+        return PostRecord(
+            id=row[0],
+            platform=row[1],
+            post_id=row[2],
+            url=row[3],
+            created_at=datetime.fromisoformat(row[4]),
+            content=json.loads(row[5]),
+            metrics=json.loads(row[6]),
+            status=row[7],
+            variant_id=row[8],
+            metrics_updated_at=datetime.fromisoformat(row[9]) if row[9] else None
+        )
+    
+    def _write_campaign(self, state: CampaignState):
+        self.conn.execute(
+            """INSERT OR REPLACE INTO campaign (id, campaign_id, version, created_at, updated_at, analytics)
+               VALUES (1, ?, ?, ?, ?, ?)""",
+            (
+                state.campaign_id,
+                state.version,
+                state.created_at.isoformat(),
+                state.updated_at.isoformat(),
+                json.dumps(state.analytics.dict(), default=str)
+            )
+        )
+    
+    POST_COLUMNS = """id, platform, post_id, url, created_at, content, metrics, status, variant_id,
+                      metrics_updated_at"""
+    
+    def load_campaign(self) -> Optional[CampaignState]:
+        if not self.path.exists():
+            return None
+        
+        row = self.conn.execute(
+            "SELECT campaign_id, version, created_at, updated_at, analytics FROM campaign WHERE id = 1"
+        ).fetchone()
+        if row is None:
+            return None
+        
+        return CampaignState(
+            campaign_id=row[0],
+            version=row[1],
+            created_at=datetime.fromisoformat(row[2]),
+            updated_at=datetime.fromisoformat(row[3]),
+            analytics=AnalyticsRecord(**json.loads(row[4]))
+        )
+    
+    def load(self) -> Optional[CampaignState]:
+        state = self.load_campaign()
+        if state is None:
+            return None
+        
+        state.posts = [
+            self._row_to_post(r)
+            for r in self.conn.execute(f"SELECT {self.POST_COLUMNS} FROM posts ORDER BY seq")
+        ]
+        state.media = [
+            MediaRecord(id=r[0], type=r[1], path=r[2], provider=r[3], created_at=datetime.fromisoformat(r[4]))
+            for r in self.conn.execute("SELECT id, type, path, provider, created_at FROM media ORDER BY seq")
+        ]
+        return state
+    
+    def post_ids(self) -> List[str]:
+        if not self.path.exists():
+            return []
+        return [row[0] for row in self.conn.execute("SELECT id FROM posts ORDER BY seq")]
+    
+    def get_posts(self, ids: List[str]) -> List[PostRecord]:
+        if not self.path.exists() or not ids:
+            return []
+        
+        ids = list(ids)
+        rows = []
+        # Stay under SQLite's limit on bound parameters
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows.extend(self.conn.execute(
+                f"SELECT seq, {self.POST_COLUMNS} FROM posts WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ))
+        rows.sort(key=lambda row: row[0])
+        return [self._row_to_post(row[1:]) for row in rows]
+    
+    def save(self, state: CampaignState):
+        with self.conn:
+            self.conn.execute("DELETE FROM posts")
+            self.conn.execute("DELETE FROM media")
+            self._write_campaign(state)
+            self.conn.executemany(
+                """INSERT INTO posts (id, platform, post_id, url, created_at, content, metrics, status, variant_id,
+                                      metrics_updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [self._post_row(post) for post in state.posts]
+            )
+            self.conn.executemany(
+                "INSERT INTO media (id, type, path, provider, created_at) VALUES (?, ?, ?, ?, ?)",
+                [self._media_row(record) for record in state.media]
+            )
+    
+    def save_campaign(self, state: CampaignState):
+        with self.conn:
+            self._write_campaign(state)
+    
+    def add_post(self, state: CampaignState, record: PostRecord):
+        with self.conn:
+            self._write_campaign(state)
+            self.conn.execute(
+                """INSERT INTO posts (id, platform, post_id, url, created_at, content, metrics, status, variant_id,
+                                      metrics_updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                self._post_row(record)
+            )
+    
+    def update_posts(self, state: CampaignState, records: List[PostRecord]):
+        with self.conn:
+            self._write_campaign(state)
+            self.conn.executemany(
+                """UPDATE posts SET url = ?, content = ?, metrics = ?, status = ?, variant_id = ?, metrics_updated_at = ?
+                   WHERE id = ?""",
+                [
+                    (
+                        record.url,
+                        json.dumps(record.content, default=str),
+                        json.dumps(record.metrics),
+                        record.status,
+                        record.variant_id,
+                        record.metrics_updated_at.isoformat() if record.metrics_updated_at else None,
+                        record.id
+                    )
+                    for record in records
+                ]
+            )
+    
+    def remove_post(self, state: CampaignState, record: PostRecord):
+        with self.conn:
+            self._write_campaign(state)
+            self.conn.execute("DELETE FROM posts WHERE id = ?", (record.id,))
+    
+    def add_media(self, state: CampaignState, record: MediaRecord):
+        with self.conn:
+            self._write_campaign(state)
+            self.conn.execute(
+                "INSERT INTO media (id, type, path, provider, created_at) VALUES (?, ?, ?, ?, ?)",
+                self._media_row(record)
+            )
+    
+    def query_posts(self,
+                    platform: Optional[str] = None,
+                    variant_id: Optional[str] = None,
+                    since: Optional[datetime] = None,
+                    metrics_updated_since: Optional[datetime] = None) -> List[PostRecord]:
+        if not self.path.exists():
+            return []
+        
+        clauses, params = [], []
+        if platform is not None:
+            clauses.append("platform = ?")
+            params.append(platform)
+        if variant_id is not None:
+            clauses.append("variant_id = ?")
+            params.append(variant_id)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since.isoformat())
+        if metrics_updated_since is not None:
+            clauses.append("metrics_updated_at > ?")
+            params.append(metrics_updated_since.isoformat())
+        
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(f"SELECT {self.POST_COLUMNS} FROM posts {where} ORDER BY seq", params)
+        return [self._row_to_post(row) for row in rows]
+    
+    def clear(self):
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            path = Path(f"{self.path}{suffix}")
+            if path.exists():
+                path.unlink()
+
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+def create_state_backend(state_file: Union[str, Path], backend: Optional[str] = None) -> StateBackend:
+    """Create a backend by name, defaulting to SQLite.
+
+    ``backend`` may be ``"json"`` or ``"sqlite"``; when omitted the
+    ``AETHERPOST_STATE_BACKEND`` environment variable is consulted. The
+    JSON backend rewrites the whole file on every change, so it is meant
+    for import and export; SQLite state lives next to ``state_file`` with
+    a ``.db`` suffix.
+    """
+    backend = (backend or os.getenv("AETHERPOST_STATE_BACKEND") or "sqlite").lower()
+    path = Path(state_file)
+    
+    if backend == "sqlite":
+        if path.suffix not in SQLITE_SUFFIXES:
+            path = path.with_suffix(".db")
+        return SQLiteStateBackend(path)
+    if backend == "json":
+        return JSONStateBackend(path)
+    
+    raise ValueError(f"Unknown state backend: {backend}")
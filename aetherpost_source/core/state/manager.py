@@ -1,60 +1,47 @@
 """State management for tracking campaign progress and results."""
 
 import json
+import time
 import uuid
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 
-
-class PostRecord(BaseModel):
-    """Record of a social media post."""
-    id: str
-    platform: str
-    post_id: str
-    url: str
-    created_at: datetime
-    content: Dict[str, Any]
-    metrics: Dict[str, int] = {}
-    status: str = "published"  # published, failed, deleted
-    variant_id: Optional[str] = None
-
-
-class MediaRecord(BaseModel):
-    """Record of generated media."""
-    id: str
-    type: str  # image, video
-    path: str
-    provider: str
-    created_at: datetime
-
-
-class AnalyticsRecord(BaseModel):
-    """Analytics summary."""
-    total_reach: int = 0
-    total_engagement: int = 0
-    best_performing_variant: Optional[str] = None
-    platform_performance: Dict[str, Dict[str, Any]] = {}
-
-
-class CampaignState(BaseModel):
-    """Complete campaign state."""
-    version: str = "1.0"
-    campaign_id: str
-    created_at: datetime
-    updated_at: datetime
-    posts: List[PostRecord] = []
-    media: List[MediaRecord] = []
-    analytics: AnalyticsRecord = AnalyticsRecord()
+from .models import PostRecord, MediaRecord, AnalyticsRecord, CampaignState
+from .backends import StateBackend, JSONStateBackend, create_state_backend
 
 
 class StateManager:
     """Manage campaign state persistence."""
     
-    def __init__(self, state_file: str = "promo.state.json"):
-        self.state_file = Path(state_file)
+    def __init__(self,
+                 state_file: str = "promo.state.json",
+                 backend: Optional[Union[str, StateBackend]] = None,
+                 flush_threshold: int = 1000,
+                 flush_interval: float = 5.0):
+        if isinstance(backend, StateBackend):
+            self.backend = backend
+        else:
+            self.backend = create_state_backend(state_file, backend)
+        
+        # Legacy JSON location, used to import existing state into other backends
+        self.json_file = Path(state_file)
+        self.state_file = self.backend.path
         self.state: Optional[CampaignState] = None
+        
+        # In-memory indexes over self.state.posts
+        self._posts_by_id: Dict[str, List[PostRecord]] = defaultdict(list)
+        self._posts_by_platform: Dict[str, List[PostRecord]] = defaultdict(list)
+        
+        # Deferred metric writes, keyed by record id; flushed as one backend write
+        self.flush_threshold = flush_threshold
+        self.flush_interval = flush_interval
+        self._dirty_posts: Dict[str, PostRecord] = {}
+        self._batch_depth = 0
+        # When the oldest pending change was made; only meaningful while dirty
+        self._dirty_since = 0.0
     
     def initialize_campaign(self, campaign_name: str) -> CampaignState:
         """Initialize a new campaign state."""
@@ -66,39 +53,57 @@ class StateManager:
             created_at=now,
             updated_at=now
         )
+        self._rebuild_indexes()
         
         self.save_state()
         return self.state
     
     def load_state(self) -> Optional[CampaignState]:
-        """Load campaign state from file."""
-        if not self.state_file.exists():
-            return None
-        
+        """Load campaign state from the configured backend."""
         try:
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
-            self.state = CampaignState(**data)
-            return self.state
+            state = self.backend.load()
+            
+            # First use of a non-JSON backend: import the existing JSON state
+            if state is None and not isinstance(self.backend, JSONStateBackend) and self.json_file.exists():
+                state = JSONStateBackend(self.json_file).load()
+                if state:
+                    self.backend.save(state)
         except Exception as e:
             raise ValueError(f"Failed to load state: {e}")
+        
+        if state is None:
+            return None
+        
+        self.state = state
+        self._rebuild_indexes()
+        return self.state
     
     def save_state(self):
-        """Save current state to file."""
+        """Save current state to the backend."""
         if not self.state:
             return
         
         self.state.updated_at = datetime.utcnow()
+        self.backend.save(self.state)
+        self._dirty_posts.clear()
+    
+    def _touch(self):
+        """Bump the campaign's updated_at timestamp."""
+        self.state.updated_at = datetime.utcnow()
+    
+    def _rebuild_indexes(self):
+        """Rebuild post lookup indexes from the loaded state."""
+        self._dirty_posts = {}
+        self._posts_by_id = defaultdict(list)
+        self._posts_by_platform = defaultdict(list)
+        if not self.state:
+            return
         
-        with open(self.state_file, 'w') as f:
-            json.dump(
-                self.state.dict(),
-                f,
-                indent=2,
-                default=str  # Handle datetime serialization
-            )
+        for post in self.state.posts:
+            self._posts_by_id[post.post_id].append(post)
+            self._posts_by_platform[post.platform].append(post)
     
-    def add_post(self, 
+    def add_post(self,
                  platform: str,
                  post_id: str,
                  url: str,
@@ -119,22 +124,100 @@ class StateManager:
         )
         
         self.state.posts.append(record)
-        self.save_state()
+        self._posts_by_id[post_id].append(record)
+        self._posts_by_platform[platform].append(record)
+        
+        self._touch()
+        self.backend.add_post(self.state, record)
         return record
     
+    def get_post(self, post_id: str) -> Optional[PostRecord]:
+        """Get the first post record with the given platform post ID."""
+        posts = self._posts_by_id.get(post_id)
+        return posts[0] if posts else None
+    
     def update_post_metrics(self, post_id: str, metrics: Dict[str, int]):
-        """Update metrics for a specific post."""
+        """Update metrics for a specific post.
+
+        Inside ``batch_updates()`` the write is deferred until the batch
+        flushes; otherwise it is persisted immediately.
+        """
         if not self.state:
             return
         
-        for post in self.state.posts:
-            if post.post_id == post_id:
+        post = self.get_post(post_id)
+        if post:
+            post.metrics.update(metrics)
+            post.metrics_updated_at = datetime.utcnow()
+            self._touch()
+            if self._batch_depth:
+                self._mark_dirty(post)
+            else:
+                self.backend.update_posts(self.state, [post])
+        elif not self._batch_depth:
+            self._touch()
+            self.backend.save_campaign(self.state)
+    
+    def update_metrics_bulk(self, updates: Iterable[Tuple[str, Dict[str, int]]]) -> int:
+        """Update metrics for many posts with a single write.
+
+        Returns the number of posts found and updated. Large batches are
+        flushed in chunks of ``flush_threshold`` posts.
+        """
+        if not self.state:
+            return 0
+        
+        updated = 0
+        now = datetime.utcnow()
+        with self.batch_updates():
+            for post_id, metrics in updates:
+                post = self.get_post(post_id)
+                if not post:
+                    continue
                 post.metrics.update(metrics)
-                break
+                post.metrics_updated_at = now
+                self._mark_dirty(post)
+                updated += 1
+            
+            if updated:
+                self._touch()
+        return updated
+    
+    @contextmanager
+    def batch_updates(self) -> Iterator["StateManager"]:
+        """Defer metric writes until the outermost batch exits.
+
+        Pending changes are also flushed early once ``flush_threshold``
+        posts are dirty or the oldest pending change is ``flush_interval``
+        seconds old.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+    
+    def _mark_dirty(self, post: PostRecord):
+        if not self._dirty_posts:
+            self._dirty_since = time.monotonic()
+        self._dirty_posts[post.id] = post
+        if (len(self._dirty_posts) >= self.flush_threshold
+                or time.monotonic() - self._dirty_since >= self.flush_interval):
+            self.flush()
+    
+    def flush(self) -> int:
+        """Persist pending metric updates. Returns the number of posts written."""
+        if not self._dirty_posts or not self.state:
+            return 0
         
-        self.save_state()
+        posts = list(self._dirty_posts.values())
+        self.backend.update_posts(self.state, posts)
+        self._dirty_posts.clear()
+        return len(posts)
     
-    def add_media(self, 
+    def add_media(self,
                   media_type: str,
                   path: str,
                   provider: str) -> MediaRecord:
@@ -151,7 +234,8 @@ class StateManager:
         )
         
         self.state.media.append(record)
-        self.save_state()
+        self._touch()
+        self.backend.add_media(self.state, record)
         return record
     
     def get_posts_by_platform(self, platform: str) -> List[PostRecord]:
@@ -159,7 +243,26 @@ class StateManager:
         if not self.state:
             return []
         
-        return [post for post in self.state.posts if post.platform == platform]
+        return list(self._posts_by_platform.get(platform, []))
+    
+    def get_posts_by_variant(self, variant_id: str) -> List[PostRecord]:
+        """Get all posts for an experiment variant."""
+        return self.query_posts(variant_id=variant_id)
+    
+    def query_posts(self,
+                    platform: Optional[str] = None,
+                    variant_id: Optional[str] = None,
+                    since: Optional[datetime] = None) -> List[PostRecord]:
+        """Filter posts by platform, variant and creation time."""
+        if not self.state:
+            return []
+        
+        posts = self._posts_by_platform.get(platform, []) if platform is not None else self.state.posts
+        return [
+            post for post in posts
+            if (variant_id is None or post.variant_id == variant_id)
+            and (since is None or post.created_at >= since)
+        ]
     
     def get_successful_posts(self) -> List[PostRecord]:
         """Get all successfully published posts."""
@@ -182,8 +285,8 @@ class StateManager:
             metrics = post.metrics
             reach = metrics.get('impressions', 0) or metrics.get('views', 0)
             engagement = (
-                metrics.get('likes', 0) + 
-                metrics.get('retweets', 0) + 
+                metrics.get('likes', 0) +
+                metrics.get('retweets', 0) +
                 metrics.get('replies', 0) +
                 metrics.get('clicks', 0)
             )
@@ -210,7 +313,8 @@ class StateManager:
         )
         
         self.state.analytics = analytics
-        self.save_state()
+        self._touch()
+        self.backend.save_campaign(self.state)
         
         return analytics
     
@@ -224,7 +328,7 @@ class StateManager:
             "created_at": self.state.created_at,
             "total_posts": len(self.state.posts),
             "successful_posts": len(self.get_successful_posts()),
-            "platforms": list(set(post.platform for post in self.state.posts)),
+            "platforms": [platform for platform, posts in self._posts_by_platform.items() if posts],
             "total_media": len(self.state.media),
             "analytics": self.state.analytics.dict()
         }
@@ -234,17 +338,55 @@ class StateManager:
         if not self.state:
             return False
         
-        # Find and remove the post
-        for i, post in enumerate(self.state.posts):
-            if post.post_id == post_id:
-                del self.state.posts[i]
-                self.save_state()
-                return True
+        post = self.get_post(post_id)
+        if not post:
+            return False
+        
+        self._remove_record(self._posts_by_id[post_id], post)
+        if not self._posts_by_id[post_id]:
+            del self._posts_by_id[post_id]
+        self._remove_record(self._posts_by_platform[post.platform], post)
+        self._remove_record(self.state.posts, post)
         
-        return False
+        self._touch()
+        self.backend.remove_post(self.state, post)
+        return True
+    
+    @staticmethod
+    def _remove_record(records: List[PostRecord], record: PostRecord):
+        """Remove a specific record object (not an equal copy) from a list."""
+        for i, candidate in enumerate(records):
+            if candidate is record:
+                del records[i]
+                return
+    
+    def export_json(self, path: Union[str, Path]) -> Path:
+        """Export the current state in the promo.state.json format."""
+        if not self.state:
+            raise ValueError("No active campaign state")
+        
+        path = Path(path)
+        JSONStateBackend(path).save(self.state)
+        return path
+    
+    def import_json(self, path: Union[str, Path]) -> CampaignState:
+        """Replace the current state with one read from a promo.state.json file."""
+        state = JSONStateBackend(path).load()
+        if state is None:
+            raise ValueError(f"State file not found: {path}")
+        
+        self.state = state
+        self._rebuild_indexes()
+        self.backend.save(self.state)
+        return self.state
     
     def clear_state(self) -> None:
         """Clear all campaign state."""
-        if self.state_file.exists():
-            self.state_file.unlink()
-        self.state = None
\ No newline at end of file
+        self.backend.clear()
+        
+        # Don't let a stale legacy file be re-imported on the next load
+        if not isinstance(self.backend, JSONStateBackend) and self.json_file.exists():
+            self.json_file.unlink()
+        
+        self.state = None
+        self._rebuild_indexes()
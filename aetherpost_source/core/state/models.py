@@ -0,0 +1,47 @@
+"""Campaign state models."""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+from pydantic import BaseModel
+
+
+class PostRecord(BaseModel):
+    """Record of a social media post."""
+    id: str
+    platform: str
+    post_id: str
+    url: str
+    created_at: datetime
+    content: Dict[str, Any]
+    metrics: Dict[str, int] = {}
+    metrics_updated_at: Optional[datetime] = None
+    status: str = "published"  # published, failed, deleted
+    variant_id: Optional[str] = None
+
+
+class MediaRecord(BaseModel):
+    """Record of generated media."""
+    id: str
+    type: str  # image, video
+    path: str
+    provider: str
+    created_at: datetime
+
+
+class AnalyticsRecord(BaseModel):
+    """Analytics summary."""
+    total_reach: int = 0
+    total_engagement: int = 0
+    best_performing_variant: Optional[str] = None
+    platform_performance: Dict[str, Dict[str, Any]] = {}
+
+
+class CampaignState(BaseModel):
+    """Complete campaign state."""
+    version: str = "1.0"
+    campaign_id: str
+    created_at: datetime
+    updated_at: datetime
+    posts: List[PostRecord] = []
+    media: List[MediaRecord] = []
+    analytics: AnalyticsRecord = AnalyticsRecord()
@@ -3,6 +3,7 @@
 import logging
 from typing import Dict, Any, Optional, List
 
+from ..http_client import get_http_client
 from .base_authenticator import BaseAuthenticator, AuthenticationResult, AuthSession
 
 logger = logging.getLogger(__name__)
@@ -126,13 +127,11 @@ class ApiKeyAuthenticator(BaseAuthenticator):
     async def _verify_api_key(self, session: AuthSession, verify_endpoint: str) -> bool:
         """Verify API key by making a test request."""
         
-        import aiohttp
-        
         try:
             headers = self.get_auth_headers(session)
             params = self.get_auth_params(session)
             
-            async with aiohttp.ClientSession() as http_session:
+            async with get_http_client().session() as http_session:
                 async with http_session.get(
                     verify_endpoint,
                     headers=headers,
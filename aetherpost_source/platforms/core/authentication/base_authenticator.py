@@ -184,6 +184,25 @@ class BaseAuthenticator(ABC):
         finally:
             self._authenticating = False
     
+    async def refresh(self, session: Optional[AuthSession] = None) -> AuthenticationResult:
+        """Renew a session before it expires.
+        
+        Uses the refresh token when there is one and falls back to a full
+        authentication otherwise.
+        """
+        session = session or self._current_session
+        
+        if session and session.refresh_token:
+            refresh_result = await self._refresh_session(session)
+            if refresh_result.success and refresh_result.session:
+                self._current_session = refresh_result.session
+                await self._save_session(self._current_session)
+                return refresh_result
+        
+        # Drop the cached session so authenticate() performs a new login
+        self._current_session = None
+        return await self.authenticate()
+    
     @abstractmethod
     async def _perform_authentication(self) -> AuthenticationResult:
         """Perform platform-specific authentication."""
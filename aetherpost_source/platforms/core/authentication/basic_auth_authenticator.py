@@ -1,10 +1,10 @@
 """HTTP Basic Authentication implementation."""
 
-import aiohttp
 import logging
 import base64
 from typing import Dict, Any, Optional, List
 
+from ..http_client import get_http_client
 from .base_authenticator import BaseAuthenticator, AuthenticationResult, AuthSession
 
 logger = logging.getLogger(__name__)
@@ -79,7 +79,7 @@ class BasicAuthAuthenticator(BaseAuthenticator):
         try:
             headers = self.get_auth_headers(session)
             
-            async with aiohttp.ClientSession() as http_session:
+            async with get_http_client().session() as http_session:
                 async with http_session.get(
                     f"{self.base_url}{self.verify_endpoint}",
                     headers=headers
@@ -1,13 +1,13 @@
 """JWT (JSON Web Token) authentication implementation."""
 
 import asyncio
-import aiohttp
 import logging
 import json
 import base64
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
+from ..http_client import get_http_client
 from .base_authenticator import BaseAuthenticator, AuthenticationResult, AuthSession
 
 logger = logging.getLogger(__name__)
@@ -61,7 +61,7 @@ class JWTAuthenticator(BaseAuthenticator):
             if self.client_secret:
                 login_data['client_secret'] = self.client_secret
             
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client().session() as session:
                 async with session.post(
                     f"{self.base_url}{self.login_endpoint}",
                     json=login_data,
@@ -177,7 +177,7 @@ class JWTAuthenticator(BaseAuthenticator):
             if self.client_secret:
                 refresh_data['client_secret'] = self.client_secret
             
-            async with aiohttp.ClientSession() as http_session:
+            async with get_http_client().session() as http_session:
                 async with http_session.post(
                     f"{self.base_url}{self.refresh_endpoint}",
                     json=refresh_data,
@@ -212,7 +212,7 @@ class JWTAuthenticator(BaseAuthenticator):
         try:
             headers = self.get_auth_headers(session)
             
-            async with aiohttp.ClientSession() as http_session:
+            async with get_http_client().session() as http_session:
                 async with http_session.get(
                     f"{self.base_url}{self.verify_endpoint}",
                     headers=headers
@@ -313,7 +313,7 @@ class BasicAuthAuthenticator(BaseAuthenticator):
         try:
             headers = self.get_auth_headers(session)
             
-            async with aiohttp.ClientSession() as http_session:
+            async with get_http_client().session() as http_session:
                 async with http_session.get(
                     f"{self.base_url}{self.verify_endpoint}",
                     headers=headers
@@ -1,12 +1,12 @@
 """OAuth2 authentication implementation."""
 
 import asyncio
-import aiohttp
 import logging
 import urllib.parse
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
+from ..http_client import get_http_client
 from .base_authenticator import BaseAuthenticator, AuthenticationResult, AuthSession
 from ..error_handling.exceptions import AuthenticationError
 
@@ -112,7 +112,7 @@ class OAuth2Authenticator(BaseAuthenticator):
                 'redirect_uri': self.redirect_uri
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with get_http_client().session() as session:
                 async with session.post(
                     self.token_endpoint,
                     data=token_data,
@@ -158,7 +158,7 @@ class OAuth2Authenticator(BaseAuthenticator):
                 'refresh_token': session.refresh_token
             }
             
-            async with aiohttp.ClientSession() as http_session:
+            async with get_http_client().session() as http_session:
                 async with http_session.post(
                     self.refresh_endpoint,
                     data=refresh_data,
@@ -262,7 +262,7 @@ class OAuth2Authenticator(BaseAuthenticator):
                 'client_secret': self.client_secret
             }
             
-            async with aiohttp.ClientSession() as http_session:
+            async with get_http_client().session() as http_session:
                 async with http_session.post(
                     introspect_endpoint,
                     data=introspect_data
@@ -284,7 +284,7 @@ class OAuth2Authenticator(BaseAuthenticator):
         try:
             headers = self.get_auth_headers(session)
             
-            async with aiohttp.ClientSession() as http_session:
+            async with get_http_client().session() as http_session:
                 async with http_session.get(
                     verify_endpoint,
                     headers=headers
@@ -309,7 +309,7 @@ class OAuth2Authenticator(BaseAuthenticator):
                 'client_secret': self.client_secret
             }
             
-            async with aiohttp.ClientSession() as http_session:
+            async with get_http_client().session() as http_session:
                 async with http_session.post(
                     self.revoke_endpoint,
                     data=revoke_data
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
@@ -13,9 +14,14 @@ from .error_handling.exceptions import *
 from .error_handling.error_processor import error_processor
 from .error_handling.retry_strategy import RetryStrategy, RetryStrategies
 from .rate_limiting.rate_limiter import RateLimiter, RateLimitConfig
+from .media_registry import MediaRegistry, get_media_registry
+from .upload import ProgressCallback, upload_all
 
 logger = logging.getLogger(__name__)
 
+# Files whose upload the current post reused from the media registry
+_reused_media: ContextVar[Optional[List[str]]] = ContextVar('reused_media', default=None)
+
 
 class ContentType(Enum):
     """Supported content types across platforms."""
@@ -192,6 +198,9 @@ class PlatformResult:
 class BasePlatform(ABC):
     """Unified base class for all social media platform implementations."""
     
+    # Error text that points at a media reference the platform rejected
+    MEDIA_ERROR_MARKERS = ('media', 'blob', 'asset')
+    
     def __init__(
         self,
         credentials: Dict[str, str],
@@ -211,6 +220,15 @@ class BasePlatform(ABC):
         self._authenticated = False
         self._current_session: Optional[AuthSession] = None
         
+        # Called with an UploadProgress as media uploads stream to the platform
+        self.upload_progress: Optional[ProgressCallback] = None
+        
+        # Media items of one post uploaded at the same time
+        self.max_concurrent_uploads = self.config.get('max_concurrent_uploads', 4)
+        
+        # Remembers uploaded media so identical files are not sent twice
+        self.media_registry: MediaRegistry = get_media_registry()
+        
         # Statistics tracking
         self.stats = {
             'posts_created': 0,
@@ -311,6 +329,37 @@ class BasePlatform(ABC):
             await self._handle_error(e, "authenticate")
             return False
     
+    async def refresh_authentication(self) -> bool:
+        """Renew the platform session ahead of token expiry.
+        
+        Uses the authenticator's refresh flow when a session is held and
+        falls back to a full login otherwise.
+        """
+        if self.authenticator and self._current_session:
+            try:
+                auth_result = await self.authenticator.refresh(self._current_session)
+            except Exception as e:
+                await self._handle_error(e, "refresh_authentication")
+                auth_result = None
+            
+            if auth_result and auth_result.success:
+                self._authenticated = True
+                self._current_session = auth_result.session
+                return True
+        
+        self._authenticated = False
+        self._current_session = None
+        return await self.authenticate()
+    
+    @property
+    def is_authenticated(self) -> bool:
+        return self._authenticated
+    
+    @property
+    def auth_session(self) -> Optional[AuthSession]:
+        """Current authentication session, if the platform tracks one."""
+        return self._current_session
+    
     async def post_content(self, content: Content) -> PlatformResult:
         """Post content to the platform with unified error handling and retry logic."""
         
@@ -340,11 +389,7 @@ class BasePlatform(ABC):
                 await self.rate_limiter.acquire("post_content", operation)
             
             # Execute with retry logic
-            result = await self.retry_strategy.execute_with_retry(
-                operation,
-                self._post_content_impl,
-                content
-            )
+            result = await self._post_with_fresh_media(operation, content)
             
             if result.success:
                 self.stats['posts_created'] += 1
@@ -505,6 +550,78 @@ class BasePlatform(ABC):
         
         return True
     
+    async def _upload_all_media(self, media_files: List[MediaFile], upload) -> List[Any]:
+        """Upload a post's media concurrently; raises MediaUploadError if any upload fails."""
+        return await upload_all(
+            media_files,
+            upload,
+            max_concurrency=self.max_concurrent_uploads,
+            platform=self.platform_name
+        )
+    
+    async def _cached_upload(self, file_path: str, upload) -> Any:
+        """Reuse this account's earlier upload of the same file content, or run ``upload``."""
+        from .pool import credential_fingerprint
+        
+        uploaded = False
+        
+        async def tracked_upload():
+            nonlocal uploaded
+            uploaded = True
+            return await upload()
+        
+        reference = await self.media_registry.get_or_upload(
+            self.platform_name,
+            credential_fingerprint(self.credentials),
+            file_path,
+            tracked_upload
+        )
+        
+        reused = _reused_media.get()
+        if not uploaded and reused is not None:
+            reused.append(file_path)
+        return reference
+    
+    async def _post_with_fresh_media(self, operation: str, content: Content) -> PlatformResult:
+        """Post ``content``, re-uploading once if a reused media reference is rejected.
+        
+        A registry reference can stop working before its validity window
+        ends (e.g. the platform dropped the blob). When a post that reused
+        one fails with a media error, those references are invalidated and
+        the post is retried with fresh uploads.
+        """
+        reused: List[str] = []
+        token = _reused_media.set(reused)
+        try:
+            try:
+                result = await self.retry_strategy.execute_with_retry(operation, self._post_content_impl, content)
+                error = None if result.success else result.error_message
+            except Exception as e:
+                result, error = None, e
+            
+            if error is not None and reused and self._is_media_error(error):
+                from .pool import credential_fingerprint
+                
+                logger.warning(f"{self.platform_display_name} rejected reused media, uploading again: {error}")
+                account = credential_fingerprint(self.credentials)
+                for file_path in set(reused):
+                    await self.media_registry.invalidate(self.platform_name, account, file_path)
+                reused.clear()
+                return await self.retry_strategy.execute_with_retry(operation, self._post_content_impl, content)
+            
+            if result is None:
+                raise error
+            return result
+        finally:
+            _reused_media.reset(token)
+    
+    def _is_media_error(self, error: Union[Exception, str]) -> bool:
+        """Whether a failed post was caused by its media rather than its text."""
+        if isinstance(error, MediaUploadError):
+            return True
+        message = str(error).lower()
+        return any(marker in message for marker in self.MEDIA_ERROR_MARKERS)
+    
     def _setup_rate_limiter(self, rate_limit_config: Optional[RateLimitConfig]):
         """Setup rate limiter for this platform."""
         
@@ -581,6 +698,9 @@ class BasePlatform(ABC):
         """Cleanup platform resources."""
         
         try:
+            # Persist media references recorded since the last registry write
+            self.media_registry.flush()
+            
             if self.authenticator and self._current_session:
                 await self.authenticator.revoke_session()
             
@@ -0,0 +1,271 @@
+"""Batched, resumable post deletion across platforms."""
+
+import asyncio
+import inspect
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Callable, Iterable, Set
+
+from .base_platform import BasePlatform
+from .executor import resolve_platform_credentials
+from .platform_factory import PlatformFactory, platform_factory
+from .pool import PlatformPool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DeletionOutcome:
+    """Result of deleting a single post."""
+    platform: str
+    post_id: str
+    success: bool
+    resumed: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class DeletionSummary:
+    """Aggregate result of a deletion run."""
+    outcomes: List[DeletionOutcome] = field(default_factory=list)
+    
+    @property
+    def deleted(self) -> List[DeletionOutcome]:
+        return [o for o in self.outcomes if o.success]
+    
+    @property
+    def failed(self) -> List[DeletionOutcome]:
+        return [o for o in self.outcomes if not o.success]
+    
+    @property
+    def deleted_count(self) -> int:
+        return len(self.deleted)
+    
+    @property
+    def failed_count(self) -> int:
+        return len(self.failed)
+
+
+class DeletionCheckpoint:
+    """Append-only record of posts already deleted on the platform side.
+
+    Each successful deletion is appended as one JSON line, so an interrupted
+    run loses at most the line being written and can resume from the rest.
+    """
+    
+    def __init__(self, checkpoint_file: str = ".aetherpost/destroy.checkpoint"):
+        self.checkpoint_file = Path(checkpoint_file)
+        self._completed: Set[str] = set()
+        self._load()
+    
+    @staticmethod
+    def _key(platform: str, post_id: str) -> str:
+        return f"{platform}:{post_id}"
+    
+    def _load(self):
+        """Load completed deletions, ignoring a torn trailing line."""
+        if not self.checkpoint_file.exists():
+            return
+        
+        try:
+            with open(self.checkpoint_file, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._completed.add(self._key(entry['platform'], entry['post_id']))
+        except OSError as e:
+            logger.warning(f"Could not read deletion checkpoint {self.checkpoint_file}: {e}")
+    
+    def __len__(self) -> int:
+        return len(self._completed)
+    
+    def is_completed(self, platform: str, post_id: str) -> bool:
+        return self._key(platform, post_id) in self._completed
+    
+    def mark_completed(self, platform: str, post_id: str):
+        """Persist a successful deletion."""
+        self._completed.add(self._key(platform, post_id))
+        self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.checkpoint_file, 'a') as f:
+            f.write(json.dumps({'platform': platform, 'post_id': post_id}) + "\n")
+            f.flush()
+    
+    def clear(self):
+        """Remove the checkpoint once a run has fully completed."""
+        self._completed.clear()
+        if self.checkpoint_file.exists():
+            self.checkpoint_file.unlink()
+
+
+class BatchDeletionEngine:
+    """Delete many posts, reusing one authenticated platform per platform.
+
+    Platforms are processed concurrently. Within a platform, up to
+    ``per_platform_concurrency`` deletions are in flight; pacing is left to
+    the platform's own ``RateLimiter``, which ``BasePlatform.delete_post``
+    consults before every request.
+    """
+    
+    def __init__(
+        self,
+        per_platform_concurrency: int = 4,
+        checkpoint: Optional[DeletionCheckpoint] = None,
+        factory: Optional[PlatformFactory] = None,
+        pool: Optional[PlatformPool] = None
+    ):
+        if per_platform_concurrency < 1:
+            raise ValueError("per_platform_concurrency must be at least 1")
+        
+        self.per_platform_concurrency = per_platform_concurrency
+        self.checkpoint = checkpoint if checkpoint is not None else DeletionCheckpoint()
+        self.factory = factory or platform_factory
+        self.pool = pool
+    
+    @staticmethod
+    def group_by_platform(posts: Iterable[Any]) -> Dict[str, List[Any]]:
+        """Group post records by platform, preserving order."""
+        groups: Dict[str, List[Any]] = OrderedDict()
+        for post in posts:
+            groups.setdefault(post.platform, []).append(post)
+        return groups
+    
+    async def delete_posts(
+        self,
+        posts: Iterable[Any],
+        credentials: Any,
+        on_result: Optional[Callable[[Any, DeletionOutcome], Any]] = None
+    ) -> DeletionSummary:
+        """Delete all posts and return a summary.
+
+        ``on_result`` receives ``(post, outcome)`` as each deletion finishes,
+        including posts skipped because the checkpoint shows them deleted.
+        The checkpoint is cleared when every post was deleted successfully.
+        """
+        groups = self.group_by_platform(posts)
+        summary = DeletionSummary()
+        
+        results = await asyncio.gather(*[
+            self._delete_platform_posts(platform_name, platform_posts, credentials, on_result)
+            for platform_name, platform_posts in groups.items()
+        ])
+        
+        for outcomes in results:
+            summary.outcomes.extend(outcomes)
+        
+        if summary.outcomes and summary.failed_count == 0:
+            self.checkpoint.clear()
+        
+        return summary
+    
+    async def _delete_platform_posts(
+        self,
+        platform_name: str,
+        posts: List[Any],
+        credentials: Any,
+        on_result: Optional[Callable[[Any, DeletionOutcome], Any]]
+    ) -> List[DeletionOutcome]:
+        """Delete all posts belonging to one platform."""
+        
+        outcomes: List[DeletionOutcome] = []
+        
+        async def report(post, outcome: DeletionOutcome):
+            outcomes.append(outcome)
+            await self._notify(on_result, post, outcome)
+        
+        pending = []
+        for post in posts:
+            if self.checkpoint.is_completed(platform_name, post.post_id):
+                await report(post, DeletionOutcome(platform_name, post.post_id, success=True, resumed=True))
+            else:
+                pending.append(post)
+        
+        if not pending:
+            return outcomes
+        
+        platform_creds = resolve_platform_credentials(credentials, platform_name)
+        if not platform_creds:
+            for post in pending:
+                await report(post, DeletionOutcome(platform_name, post.post_id, False, error="No credentials"))
+            return outcomes
+        
+        try:
+            if self.pool is not None:
+                platform = await self.pool.acquire(platform_name, platform_creds)
+            else:
+                platform = self.factory.create_platform(
+                    platform_name=platform_name,
+                    credentials=platform_creds
+                )
+        except Exception as e:
+            for post in pending:
+                await report(post, DeletionOutcome(
+                    platform_name, post.post_id, False, error=f"Platform creation failed: {e}"
+                ))
+            return outcomes
+        
+        if platform is None:
+            for post in pending:
+                await report(post, DeletionOutcome(platform_name, post.post_id, False, error="Authentication failed"))
+            return outcomes
+        
+        try:
+            if self.pool is None and not await platform.authenticate():
+                for post in pending:
+                    await report(post, DeletionOutcome(platform_name, post.post_id, False, error="Authentication failed"))
+                return outcomes
+            
+            semaphore = asyncio.Semaphore(self.per_platform_concurrency)
+            
+            async def delete_one(post):
+                async with semaphore:
+                    outcome = await self._delete_one(platform, post.post_id)
+                if outcome.success:
+                    self.checkpoint.mark_completed(platform_name, post.post_id)
+                await report(post, outcome)
+            
+            await asyncio.gather(*[delete_one(post) for post in pending])
+        finally:
+            # Pooled platforms stay open for the pool's owner to reuse
+            if self.pool is not None:
+                await self.pool.release(platform)
+            else:
+                try:
+                    await platform.cleanup()
+                except Exception as e:
+                    logger.warning(f"Cleanup failed for {platform_name}: {e}")
+        
+        return outcomes
+    
+    async def _delete_one(self, platform: BasePlatform, post_id: str) -> DeletionOutcome:
+        """Delete a single post, converting errors into a failed outcome."""
+        try:
+            result = await platform.delete_post(post_id)
+        except Exception as e:
+            return DeletionOutcome(platform.platform_name, post_id, False, error=str(e))
+        
+        if result.success:
+            return DeletionOutcome(platform.platform_name, post_id, True)
+        
+        return DeletionOutcome(
+            platform.platform_name,
+            post_id,
+            False,
+            error=result.error_message or "Unknown error"
+        )
+    
+    @staticmethod
+    async def _notify(callback, post, outcome: DeletionOutcome):
+        """Invoke the result callback without letting it break the run."""
+        if not callback:
+            return
+        try:
+            value = callback(post, outcome)
+            if inspect.isawaitable(value):
+                await value
+        except Exception as e:
+            logger.error(f"Deletion callback failed for {outcome.platform} post {outcome.post_id}: {e}")
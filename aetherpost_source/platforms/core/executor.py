@@ -0,0 +1,276 @@
+"""Concurrent multi-platform posting executor."""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Callable
+
+from .base_platform import BasePlatform, Content, PlatformResult
+from .platform_factory import PlatformFactory, platform_factory
+from .pool import PlatformPool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PlatformExecutionResult:
+    """Outcome of publishing content to a single platform."""
+    platform: str
+    success: bool
+    post_id: Optional[str] = None
+    post_url: Optional[str] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+    result: Optional[PlatformResult] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the result dictionary used by the CLI commands."""
+        if self.success:
+            return {
+                "platform": self.platform,
+                "status": "success",
+                "url": self.post_url,
+                "post_id": self.post_id
+            }
+        return {
+            "platform": self.platform,
+            "status": "failed",
+            "error": self.error or "Unknown error"
+        }
+
+
+def resolve_platform_credentials(credentials: Any, platform_name: str) -> Dict[str, Any]:
+    """Extract credentials for a platform from a credentials object or dictionary."""
+    if credentials is None:
+        return {}
+    
+    if isinstance(credentials, dict):
+        platform_creds = credentials.get(platform_name)
+    else:
+        platform_creds = getattr(credentials, platform_name, None)
+    
+    if not platform_creds:
+        return {}
+    if isinstance(platform_creds, dict):
+        return platform_creds
+    if hasattr(platform_creds, '__dict__'):
+        return platform_creds.__dict__
+    
+    try:
+        return vars(platform_creds)
+    except TypeError:
+        return {}
+
+
+class ConcurrentPlatformExecutor:
+    """Publish content to several platforms concurrently.
+
+    Each platform runs in its own task bounded by ``max_concurrency`` and
+    ``platform_timeout``; a failure or timeout on one platform is recorded as
+    a failed result and never cancels the others.
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        platform_timeout: Optional[float] = 300.0,
+        cleanup_timeout: float = 10.0,
+        factory: Optional[PlatformFactory] = None,
+        pool: Optional[PlatformPool] = None
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        self.max_concurrency = max_concurrency
+        self.platform_timeout = platform_timeout
+        self.cleanup_timeout = cleanup_timeout
+        self.factory = factory or platform_factory
+        self.pool = pool
+    
+    async def execute(
+        self,
+        platform_content: Dict[str, Content],
+        credentials: Any,
+        on_complete: Optional[Callable[[PlatformExecutionResult], Any]] = None
+    ) -> List[PlatformExecutionResult]:
+        """Post to all platforms and return results in input order.
+
+        ``on_complete`` is invoked (sync or async) as soon as each platform
+        finishes, so callers can persist results without waiting for the
+        slowest platform.
+        """
+        if not platform_content:
+            return []
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(platform_name: str, content: Content) -> PlatformExecutionResult:
+            async with semaphore:
+                result = await self._run_platform(platform_name, content, credentials)
+            await self._notify(on_complete, result)
+            return result
+        
+        tasks = [
+            asyncio.create_task(run(name, content), name=f"post:{name}")
+            for name, content in platform_content.items()
+        ]
+        
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        results = []
+        for platform_name, outcome in zip(platform_content.keys(), outcomes):
+            if isinstance(outcome, BaseException):
+                # Only reachable if the completion callback itself blew up
+                logger.error(f"Unexpected error while posting to {platform_name}: {outcome}")
+                outcome = PlatformExecutionResult(
+                    platform=platform_name,
+                    success=False,
+                    error=str(outcome)
+                )
+            results.append(outcome)
+        
+        return results
+    
+    async def _run_platform(
+        self,
+        platform_name: str,
+        content: Content,
+        credentials: Any
+    ) -> PlatformExecutionResult:
+        """Create, authenticate, validate and post for a single platform."""
+        
+        start = time.monotonic()
+        
+        def failed(error: str) -> PlatformExecutionResult:
+            return PlatformExecutionResult(
+                platform=platform_name,
+                success=False,
+                error=error,
+                duration=time.monotonic() - start
+            )
+        
+        platform_creds = resolve_platform_credentials(credentials, platform_name)
+        if not platform_creds:
+            return failed("No credentials")
+        
+        if self.pool is not None:
+            return await self._run_pooled(platform_name, content, platform_creds, failed, start)
+        
+        try:
+            platform = self.factory.create_platform(
+                platform_name=platform_name,
+                credentials=platform_creds
+            )
+        except Exception as e:
+            return failed(f"Platform creation failed: {str(e)}")
+        
+        try:
+            result = await asyncio.wait_for(
+                self._publish(platform_name, platform, content),
+                timeout=self.platform_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Posting to {platform_name} timed out after {self.platform_timeout}s")
+            return failed(f"Timed out after {self.platform_timeout:.0f}s")
+        except Exception as e:
+            logger.error(f"Error posting to {platform_name}: {e}")
+            return failed(str(e))
+        finally:
+            await self._cleanup(platform)
+        
+        result.duration = time.monotonic() - start
+        return result
+    
+    async def _run_pooled(
+        self,
+        platform_name: str,
+        content: Content,
+        platform_creds: Dict[str, Any],
+        failed: Callable[[str], PlatformExecutionResult],
+        start: float
+    ) -> PlatformExecutionResult:
+        """Post through an already-authenticated instance from the pool."""
+        
+        async def publish() -> PlatformExecutionResult:
+            async with self.pool.lease(platform_name, platform_creds) as platform:
+                if platform is None:
+                    return failed("Authentication failed")
+                return await self._publish(platform_name, platform, content, authenticate=False)
+        
+        try:
+            result = await asyncio.wait_for(publish(), timeout=self.platform_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Posting to {platform_name} timed out after {self.platform_timeout}s")
+            return failed(f"Timed out after {self.platform_timeout:.0f}s")
+        except Exception as e:
+            logger.error(f"Error posting to {platform_name}: {e}")
+            # The pooled session may be broken; log in afresh next time
+            await self.pool.invalidate(platform_name, platform_creds)
+            return failed(str(e))
+        
+        result.duration = time.monotonic() - start
+        return result
+    
+    async def _publish(
+        self,
+        platform_name: str,
+        platform: BasePlatform,
+        content: Content,
+        authenticate: bool = True
+    ) -> PlatformExecutionResult:
+        """Run the authenticate/validate/post sequence on a platform instance.
+        
+        Results are labelled with the requested ``platform_name`` so callers can
+        match them against their own keys, whatever the instance calls itself.
+        """
+        
+        if authenticate and not await platform.authenticate():
+            return PlatformExecutionResult(platform=platform_name, success=False, error="Authentication failed")
+        
+        validation_result = await platform.validate_content(content)
+        if not validation_result['is_valid']:
+            error_msg = '; '.join(validation_result['errors'])
+            return PlatformExecutionResult(
+                platform=platform_name,
+                success=False,
+                error=f"Validation failed: {error_msg}"
+            )
+        
+        result = await platform.post_content(content)
+        
+        if result.success:
+            return PlatformExecutionResult(
+                platform=platform_name,
+                success=True,
+                post_id=result.post_id,
+                post_url=result.post_url,
+                result=result
+            )
+        
+        return PlatformExecutionResult(
+            platform=platform_name,
+            success=False,
+            error=result.error_message or "Unknown error",
+            result=result
+        )
+    
+    async def _cleanup(self, platform: BasePlatform):
+        """Release platform resources without letting cleanup errors escape."""
+        try:
+            await asyncio.wait_for(platform.cleanup(), timeout=self.cleanup_timeout)
+        except Exception as e:
+            logger.warning(f"Cleanup failed for {platform.platform_name}: {e}")
+    
+    @staticmethod
+    async def _notify(callback: Optional[Callable[[PlatformExecutionResult], Any]], result: PlatformExecutionResult):
+        """Invoke the completion callback, isolating its errors from other platforms."""
+        if not callback:
+            return
+        try:
+            outcome = callback(result)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as e:
+            logger.error(f"Result callback failed for {result.platform}: {e}")
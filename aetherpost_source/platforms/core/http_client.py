@@ -0,0 +1,179 @@
+"""Process-wide HTTP client shared by platforms and authenticators."""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HTTPClientConfig:
+    """Connection pool settings for the shared connector."""
+    limit: int = 100
+    limit_per_host: int = 10
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    total_timeout: float = 30.0
+
+
+@dataclass
+class RequestTiming:
+    """Timing of a single HTTP request, passed to timing hooks."""
+    method: str
+    url: str
+    host: str
+    elapsed: float
+    status: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class HostStats:
+    """Running request totals for one host."""
+    requests: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    
+    @property
+    def avg_ms(self) -> float:
+        return self.total_time / self.requests * 1000 if self.requests else 0.0
+
+
+class HTTPClient:
+    """Owner of the shared connector that every HTTP session draws from.
+
+    Sessions handed out by ``session()`` are cheap views over one
+    ``TCPConnector``, so closing a session leaves its kept-alive connections
+    (and cached DNS lookups) available to the next one. The connector is
+    bound to the event loop it was created on and is rebuilt transparently
+    when used from a new loop.
+
+    aiohttp only speaks HTTP/1.1; connection reuse is what keeps repeat
+    requests to the same API off the TCP and TLS handshake path.
+    """
+    
+    def __init__(self, config: Optional[HTTPClientConfig] = None):
+        self.config = config or HTTPClientConfig()
+        self.stats: Dict[str, HostStats] = {}
+        self._timing_hooks: List[Callable[[RequestTiming], Any]] = []
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._trace_config = self._create_trace_config()
+    
+    def add_timing_hook(self, callback: Callable[[RequestTiming], Any]):
+        """Call ``callback`` with a ``RequestTiming`` after every request."""
+        self._timing_hooks.append(callback)
+    
+    def remove_timing_hook(self, callback: Callable[[RequestTiming], Any]):
+        if callback in self._timing_hooks:
+            self._timing_hooks.remove(callback)
+    
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        """The shared connector for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._connector is None or self._connector.closed or self._loop is not loop:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.config.limit_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+                enable_cleanup_closed=True
+            )
+            self._loop = loop
+        return self._connector
+    
+    def session(self, timeout: Optional[float] = None, **kwargs) -> aiohttp.ClientSession:
+        """Create a session on the shared connector.
+
+        The session does not own the connector; closing it only releases its
+        connections back to the pool.
+        """
+        kwargs.setdefault('json_serialize', _json_dumps)
+        return aiohttp.ClientSession(
+            connector=self.connector,
+            connector_owner=False,
+            timeout=aiohttp.ClientTimeout(total=timeout or self.config.total_timeout),
+            trace_configs=[self._trace_config],
+            **kwargs
+        )
+    
+    async def close(self):
+        """Close the shared connector and every pooled connection."""
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
+        self._loop = None
+    
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        
+        async def on_request_start(session, context, params):
+            context.start = asyncio.get_running_loop().time()
+        
+        async def on_request_end(session, context, params):
+            self._record(context, params.method, params.url, status=params.response.status)
+        
+        async def on_request_exception(session, context, params):
+            self._record(context, params.method, params.url, error=str(params.exception))
+        
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+    
+    def _record(self, context, method: str, url, status: Optional[int] = None, error: Optional[str] = None):
+        timing = RequestTiming(
+            method=method,
+            url=str(url),
+            host=url.host or "",
+            elapsed=asyncio.get_running_loop().time() - context.start,
+            status=status,
+            error=error
+        )
+        
+        host_stats = self.stats.setdefault(timing.host, HostStats())
+        host_stats.requests += 1
+        host_stats.total_time += timing.elapsed
+        if error or (status is not None and status >= 400):
+            host_stats.errors += 1
+        
+        for hook in self._timing_hooks:
+            try:
+                hook(timing)
+            except Exception as e:
+                logger.warning(f"HTTP timing hook failed: {e}")
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host request counts, error counts and average latency."""
+        return {
+            host: {"requests": s.requests, "errors": s.errors, "avg_ms": round(s.avg_ms, 1)}
+            for host, s in self.stats.items()
+        }
+
+
+def _json_dumps(obj: Any) -> str:
+    # Keep non-ASCII text (e.g. Japanese posts) as-is in request bodies
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+_http_client: Optional[HTTPClient] = None
+
+
+def get_http_client() -> HTTPClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = HTTPClient()
+    return _http_client
+
+
+async def close_http_client():
+    """Close the process-wide client's connections, if it was ever used."""
+    if _http_client is not None:
+        await _http_client.close()
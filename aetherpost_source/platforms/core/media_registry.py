@@ -0,0 +1,206 @@
+"""Content-addressed registry of media already uploaded to platforms."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long a platform keeps an uploaded media reference usable, in seconds.
+# Twitter media IDs expire 24 hours after upload; Bluesky blobs and LinkedIn
+# assets outlive that, but can disappear with the post referencing them, so
+# they are only reused for a day as well.
+DEFAULT_VALIDITY: Dict[str, Optional[int]] = {
+    'twitter': 23 * 3600,
+    'bluesky': 24 * 3600,
+    'linkedin': 24 * 3600,
+}
+
+
+@dataclass
+class MediaReference:
+    """Platform-side handle for an uploaded file (blob ref, media ID, asset URN)."""
+    reference: Any
+    uploaded_at: float
+    expires_at: Optional[float] = None
+    
+    @property
+    def is_valid(self) -> bool:
+        return self.expires_at is None or time.time() < self.expires_at
+
+
+class MediaRegistry:
+    """Remember platform references to uploaded media, keyed by file content.
+
+    Files are identified by the SHA-256 of their bytes, so the same image
+    regenerated under another name, posted again, or retried after a failed
+    post maps to the upload already made. References are scoped to the
+    platform and account they were uploaded with and are dropped once the
+    platform's validity window has passed.
+
+    Changes are written to ``registry_file`` at most once per
+    ``flush_delay`` seconds; call ``flush()`` to persist them right away.
+    """
+    
+    def __init__(
+        self,
+        registry_file: str = ".aetherpost/media_registry.json",
+        validity: Optional[Dict[str, Optional[int]]] = None,
+        flush_delay: float = 1.0
+    ):
+        self.registry_file = Path(registry_file)
+        self.validity = {**DEFAULT_VALIDITY, **(validity or {})}
+        self.flush_delay = flush_delay
+        self.stats = {'hits': 0, 'uploads': 0}
+        self._entries: Optional[Dict[str, MediaReference]] = None
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+    
+    async def file_digest(self, file_path: str) -> str:
+        """SHA-256 of a file's contents, recomputed only when the file changes."""
+        stat = os.stat(file_path)
+        signature = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        
+        digest = self._digests.get(signature)
+        if digest is None:
+            digest = await asyncio.to_thread(_hash_file, file_path)
+            self._digests[signature] = digest
+        return digest
+    
+    @staticmethod
+    def _key(platform: str, account: str, digest: str) -> str:
+        return f"{platform}:{account}:{digest}"
+    
+    def _load(self) -> Dict[str, MediaReference]:
+        if self._entries is None:
+            self._entries = {}
+            if self.registry_file.exists():
+                try:
+                    data = json.loads(self.registry_file.read_text())
+                    self._entries = {key: MediaReference(**entry) for key, entry in data.items()}
+                except (OSError, TypeError, json.JSONDecodeError) as e:
+                    logger.warning(f"Could not read media registry {self.registry_file}: {e}")
+        return self._entries
+    
+    def _write(self):
+        entries = self._load()
+        for key in [key for key, entry in entries.items() if not entry.is_valid]:
+            del entries[key]
+        
+        try:
+            self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.registry_file.with_suffix('.tmp')
+            tmp_file.write_text(json.dumps({key: asdict(entry) for key, entry in entries.items()}, indent=2))
+            os.replace(tmp_file, self.registry_file)
+        except OSError as e:
+            logger.warning(f"Could not save media registry {self.registry_file}: {e}")
+    
+    def _mark_dirty(self):
+        """Schedule a write, coalescing the changes made until it runs."""
+        self._dirty = True
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.flush_delay, self.flush)
+    
+    def flush(self):
+        """Write pending changes to the registry file."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._dirty:
+            self._dirty = False
+            self._write()
+    
+    async def lookup(self, platform: str, account: str, file_path: str) -> Optional[Any]:
+        """Return a still-valid reference to this file's content, if uploaded."""
+        key = self._key(platform, account, await self.file_digest(file_path))
+        entry = self._load().get(key)
+        return entry.reference if entry and entry.is_valid else None
+    
+    async def record(self, platform: str, account: str, file_path: str, reference: Any):
+        """Remember the reference a platform returned for this file's content."""
+        key = self._key(platform, account, await self.file_digest(file_path))
+        validity = self.validity.get(platform)
+        now = time.time()
+        self._load()[key] = MediaReference(
+            reference=reference,
+            uploaded_at=now,
+            expires_at=now + validity if validity is not None else None
+        )
+        self._mark_dirty()
+    
+    async def invalidate(self, platform: str, account: str, file_path: str):
+        """Forget a reference the platform no longer accepts."""
+        key = self._key(platform, account, await self.file_digest(file_path))
+        if self._load().pop(key, None) is not None:
+            self._mark_dirty()
+    
+    async def get_or_upload(
+        self,
+        platform: str,
+        account: str,
+        file_path: str,
+        upload: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        """Return the cached reference for ``file_path`` or upload it once.
+
+        Concurrent requests for the same content share a single upload.
+        A failed upload (``None``) is not remembered.
+        """
+        key = self._key(platform, account, await self.file_digest(file_path))
+        
+        entry = self._load().get(key)
+        if entry and entry.is_valid:
+            self.stats['hits'] += 1
+            logger.info(f"Reusing {platform} upload of {file_path}")
+            return entry.reference
+        
+        if key in self._in_flight:
+            self.stats['hits'] += 1
+            return await asyncio.shield(self._in_flight[key])
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            reference = await upload()
+            self.stats['uploads'] += 1
+            if reference is not None:
+                await self.record(platform, account, file_path, reference)
+            future.set_result(reference)
+            return reference
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve the exception so an unawaited future does not log it
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+
+def _hash_file(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+_media_registry: Optional[MediaRegistry] = None
+
+
+def get_media_registry() -> MediaRegistry:
+    """Return the process-wide media registry, creating it on first use."""
+    global _media_registry
+    if _media_registry is None:
+        _media_registry = MediaRegistry()
+    return _media_registry
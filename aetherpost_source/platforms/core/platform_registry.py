@@ -3,7 +3,7 @@
 import logging
 import importlib
 import inspect
-from typing import Dict, Type, List, Optional, Any
+from typing import Dict, Type, List, Optional, Any, Set
 from pathlib import Path
 
 from .base_platform import BasePlatform
@@ -17,6 +17,10 @@ class PlatformRegistry:
     def __init__(self):
         self._platforms: Dict[str, Type[BasePlatform]] = {}
         self._platform_configs: Dict[str, Dict[str, Any]] = {}
+        # Platform modules found by filename, imported when first requested
+        self._platform_files: Optional[Dict[str, Path]] = None
+        # Discovered platforms not to import (failed, or unregistered)
+        self._skipped: Set[str] = set()
         self._auto_discovered = False
     
     def register_platform(
@@ -31,6 +35,7 @@ class PlatformRegistry:
             raise ValueError(f"Platform class must inherit from BasePlatform")
         
         self._platforms[platform_name] = platform_class
+        self._skipped.discard(platform_name)
         if config:
             self._platform_configs[platform_name] = config
         
@@ -45,25 +50,31 @@ class PlatformRegistry:
         if platform_name in self._platform_configs:
             del self._platform_configs[platform_name]
         
+        self._skipped.add(platform_name)
+        
         logger.debug(f"Unregistered platform: {platform_name}")
     
     def get_platform_class(self, platform_name: str) -> Optional[Type[BasePlatform]]:
         """Get platform class by name."""
         
-        # Auto-discover if not done yet
-        if not self._auto_discovered:
-            self.auto_discover_platforms()
+        # Import only this platform's module (and SDK) if not done yet
+        if platform_name not in self._platforms and platform_name not in self._skipped:
+            platform_file = self._discover_platform_files().get(platform_name)
+            if platform_file:
+                self._discover_platform_from_file(platform_file)
         
         return self._platforms.get(platform_name)
     
     def get_available_platforms(self) -> List[str]:
         """Get list of available platform names."""
         
-        # Auto-discover if not done yet
-        if not self._auto_discovered:
-            self.auto_discover_platforms()
+        # Discovered platforms are listed by filename, without importing them
+        platforms = list(self._platforms.keys())
+        for platform_name in self._discover_platform_files():
+            if platform_name not in self._platforms and platform_name not in self._skipped:
+                platforms.append(platform_name)
         
-        return list(self._platforms.keys())
+        return platforms
     
     def get_platform_info(self, platform_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a platform."""
@@ -102,19 +113,30 @@ class PlatformRegistry:
                 'error': str(e)
             }
     
-    def auto_discover_platforms(self):
-        """Automatically discover and register platforms from implementations directory."""
+    def _discover_platform_files(self) -> Dict[str, Path]:
+        """Platform modules in the implementations directory, by platform name."""
         
-        try:
-            # Get the implementations directory
+        if self._platform_files is None:
+            self._platform_files = {}
             implementations_dir = Path(__file__).parent.parent / "implementations"
             
             if not implementations_dir.exists():
                 logger.warning("Implementations directory not found")
-                return
+                return self._platform_files
             
-            # Discover platform modules
-            for platform_file in implementations_dir.glob("*_platform.py"):
+            # e.g. twitter_platform.py -> twitter
+            for platform_file in sorted(implementations_dir.glob("*_platform.py")):
+                self._platform_files[platform_file.stem.replace('_platform', '')] = platform_file
+        
+        return self._platform_files
+    
+    def auto_discover_platforms(self):
+        """Import and register every platform from the implementations directory."""
+        
+        try:
+            for platform_name, platform_file in self._discover_platform_files().items():
+                if platform_name in self._platforms or platform_name in self._skipped:
+                    continue
                 try:
                     self._discover_platform_from_file(platform_file)
                 except Exception as e:
@@ -132,18 +154,18 @@ class PlatformRegistry:
         # Extract platform name from filename (e.g., twitter_platform.py -> twitter)
         platform_name = platform_file.stem.replace('_platform', '')
         
-        # Build module path 
-        module_path = f"platforms.implementations.{platform_file.stem}"
+        # Build module path relative to this package
+        module_path = f"..implementations.{platform_file.stem}"
         
         try:
             # Import the module using relative import
-            module = importlib.import_module(module_path, package="aetherpost_source")
+            module = importlib.import_module(module_path, package=__package__)
             
             # Find platform classes in the module
             for name, obj in inspect.getmembers(module, inspect.isclass):
                 if (issubclass(obj, BasePlatform) and 
                     obj != BasePlatform and 
-                    obj.__module__ == module_path):
+                    obj.__module__ == module.__name__):
                     
                     # Register the platform
                     self.register_platform(platform_name, obj)
@@ -151,11 +173,14 @@ class PlatformRegistry:
                     break
             else:
                 logger.warning(f"No platform class found in {platform_file}")
+                self._skipped.add(platform_name)
                 
         except ImportError as e:
             logger.warning(f"Failed to import platform module {module_path}: {e}")
+            self._skipped.add(platform_name)
         except Exception as e:
             logger.error(f"Error discovering platform from {platform_file}: {e}")
+            self._skipped.add(platform_name)
     
     def validate_platform(self, platform_name: str) -> Dict[str, Any]:
         """Validate a platform implementation."""
@@ -300,6 +325,8 @@ class PlatformRegistry:
         
         self._platforms.clear()
         self._platform_configs.clear()
+        self._platform_files = None
+        self._skipped.clear()
         self._auto_discovered = False
         
         logger.info("Cleared platform registry")
@@ -0,0 +1,165 @@
+"""Pool of authenticated platform instances reused across operations."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from .base_platform import BasePlatform
+from .platform_factory import PlatformFactory, platform_factory
+
+logger = logging.getLogger(__name__)
+
+
+def credential_fingerprint(credentials: Dict[str, Any]) -> str:
+    """Stable digest identifying a set of credentials without storing them."""
+    payload = json.dumps(credentials, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass
+class PooledPlatform:
+    """An authenticated platform instance held by the pool."""
+    platform: BasePlatform
+    fingerprint: str
+    refreshes: int = 0
+    leases: int = 0
+    retired: bool = False
+
+
+class PlatformPool:
+    """Long-lived cache of authenticated platform instances.
+
+    Instances are keyed by platform name and a fingerprint of their
+    credentials, so every post made with the same account reuses one login
+    and the instance's HTTP session, while rotated credentials get a fresh
+    instance. When a session reports an expiry, it is refreshed once fewer
+    than ``refresh_margin`` seconds remain, before any request can fail on
+    an expired token.
+
+    Each ``acquire`` takes a lease that is given back with ``release`` (or
+    use ``lease``). An instance invalidated while other workers still hold
+    leases leaves the pool at once but is only cleaned up when the last
+    lease is released.
+    """
+    
+    def __init__(self, factory: Optional[PlatformFactory] = None, refresh_margin: int = 300):
+        self.factory = factory or platform_factory
+        self.refresh_margin = refresh_margin
+        self._entries: Dict[Tuple[str, str], PooledPlatform] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # Every live instance by id(), including retired ones still leased
+        self._instances: Dict[int, PooledPlatform] = {}
+    
+    async def acquire(self, platform_name: str, credentials: Dict[str, Any]) -> Optional[BasePlatform]:
+        """Return an authenticated platform, logging in only when needed.
+
+        Returns ``None`` if authentication fails. Pooled instances must not be
+        cleaned up by the caller; hand them back with ``release``.
+        """
+        key = (platform_name, credential_fingerprint(credentials))
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        
+        async with lock:
+            entry = self._entries.get(key)
+            
+            if entry and self._needs_refresh(entry.platform):
+                logger.info(f"Refreshing {platform_name} session before it expires")
+                if await entry.platform.refresh_authentication():
+                    entry.refreshes += 1
+                else:
+                    await self._discard(key)
+                    entry = None
+            
+            if entry is None:
+                platform = self.factory.create_platform(platform_name=platform_name, credentials=credentials)
+                if not await platform.authenticate():
+                    await self._cleanup(platform)
+                    return None
+                
+                entry = PooledPlatform(platform=platform, fingerprint=key[1])
+                self._entries[key] = entry
+                self._instances[id(platform)] = entry
+            
+            entry.leases += 1
+            return entry.platform
+    
+    async def release(self, platform: BasePlatform):
+        """Give back a lease taken by ``acquire``."""
+        entry = self._instances.get(id(platform))
+        if entry is None or entry.platform is not platform:
+            return
+        
+        entry.leases = max(entry.leases - 1, 0)
+        if entry.retired and not entry.leases:
+            del self._instances[id(platform)]
+            await self._cleanup(platform)
+    
+    @asynccontextmanager
+    async def lease(self, platform_name: str, credentials: Dict[str, Any]) -> AsyncIterator[Optional[BasePlatform]]:
+        """``acquire`` a platform for the duration of a ``with`` block."""
+        platform = await self.acquire(platform_name, credentials)
+        try:
+            yield platform
+        finally:
+            if platform is not None:
+                await self.release(platform)
+    
+    def _needs_refresh(self, platform: BasePlatform) -> bool:
+        session = platform.auth_session
+        if session is None:
+            return False
+        expires_in = session.expires_in_seconds
+        return expires_in is not None and expires_in <= self.refresh_margin
+    
+    async def invalidate(self, platform_name: str, credentials: Dict[str, Any]):
+        """Drop a pooled instance, e.g. after its credentials were rejected.
+
+        The next ``acquire`` logs in afresh; the old instance is cleaned up
+        once nobody holds a lease on it.
+        """
+        await self._discard((platform_name, credential_fingerprint(credentials)))
+    
+    async def _discard(self, key: Tuple[str, str]):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        
+        entry.retired = True
+        if entry.leases:
+            logger.debug(f"Deferring cleanup of {key[0]} until {entry.leases} lease(s) are released")
+            return
+        
+        self._instances.pop(id(entry.platform), None)
+        await self._cleanup(entry.platform)
+    
+    @staticmethod
+    async def _cleanup(platform: BasePlatform):
+        try:
+            await platform.cleanup()
+        except Exception as e:
+            logger.warning(f"Cleanup failed for {platform.platform_name}: {e}")
+    
+    async def close(self):
+        """Release every pooled platform and its HTTP session, leased or not."""
+        entries = list(self._instances.values())
+        self._entries.clear()
+        self._instances.clear()
+        await asyncio.gather(*(self._cleanup(entry.platform) for entry in entries))
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Summarize pooled sessions per platform."""
+        return {
+            f"{name}:{fingerprint}": {
+                "authenticated": entry.platform.is_authenticated,
+                "expires_in_seconds": entry.platform.auth_session.expires_in_seconds if entry.platform.auth_session else None,
+                "refreshes": entry.refreshes
+            }
+            for (name, fingerprint), entry in self._entries.items()
+        }
@@ -0,0 +1,286 @@
+"""Streaming and resumable media uploads."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+
+import aiohttp
+
+from .error_handling.exceptions import MediaUploadError
+
+logger = logging.getLogger(__name__)
+
+# Size of each read from disk while streaming a request body
+STREAM_CHUNK_SIZE = 256 * 1024
+
+# Size of each request in a resumable upload; the protocol requires a
+# multiple of 256 KiB for every chunk but the last
+RESUMABLE_CHUNK_SIZE = 32 * STREAM_CHUNK_SIZE
+
+# Per-request timeout for a file streamed in a single request. A large file
+# may take longer than any session-wide total, so there is none; a stalled
+# connection still fails on the connect and read limits.
+STREAM_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=120)
+
+
+@dataclass
+class UploadProgress:
+    """Bytes of a file handed to the network so far."""
+    file_path: str
+    bytes_sent: int
+    total_bytes: int
+    
+    @property
+    def fraction(self) -> float:
+        return self.bytes_sent / self.total_bytes if self.total_bytes else 1.0
+
+
+ProgressCallback = Callable[[UploadProgress], Any]
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def _report(progress: Optional[ProgressCallback], file_path: str, bytes_sent: int, total_bytes: int):
+    if progress is None:
+        return
+    try:
+        progress(UploadProgress(file_path=file_path, bytes_sent=bytes_sent, total_bytes=total_bytes))
+    except Exception as e:
+        logger.warning(f"Upload progress callback failed: {e}")
+
+
+async def stream_file(
+    file_path: str,
+    start: int = 0,
+    length: Optional[int] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None
+) -> AsyncIterator[bytes]:
+    """Yield ``length`` bytes of a file from ``start``, one chunk at a time.
+
+    Reads run in a worker thread so the event loop keeps serving other
+    requests, and at most one chunk is held in memory. Passing the generator
+    as ``data=`` streams it as the request body; set ``Content-Length``
+    explicitly to avoid chunked transfer encoding.
+    """
+    total_bytes = os.path.getsize(file_path)
+    end = total_bytes if length is None else min(start + length, total_bytes)
+    
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            chunk = await asyncio.to_thread(f.read, min(chunk_size, end - position))
+            if not chunk:
+                break
+            position += len(chunk)
+            yield chunk
+            _report(progress, file_path, position, total_bytes)
+
+
+async def upload_all(
+    items: Sequence[T],
+    upload: Callable[[T], Awaitable[Optional[R]]],
+    max_concurrency: int = 4,
+    platform: Optional[str] = None
+) -> List[R]:
+    """Upload every item concurrently, all or nothing.
+
+    At most ``max_concurrency`` uploads run at once and results keep the
+    order of ``items``. An upload that raises or returns ``None`` cancels
+    the ones still in flight and raises ``MediaUploadError``, so a post is
+    never published with only some of its media.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def run(item: T) -> R:
+        file_path = getattr(item, 'file_path', None)
+        try:
+            async with semaphore:
+                result = await upload(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise MediaUploadError(f"Failed to upload {file_path or item}: {e}", platform=platform, file_path=file_path, original_error=e)
+        
+        if result is None:
+            raise MediaUploadError(f"Failed to upload {file_path or item}", platform=platform, file_path=file_path)
+        return result
+    
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class UploadStateStore:
+    """Persisted sessions of in-progress resumable uploads.
+
+    Each entry maps an upload key to the session URL and the offset the
+    server last confirmed, so an upload interrupted by a crash or a network
+    failure continues from that offset on the next run.
+    """
+    
+    def __init__(self, state_file: str = ".aetherpost/uploads.json"):
+        self.state_file = Path(state_file)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    @staticmethod
+    def key_for(platform: str, file_path: str, *extra: Any) -> str:
+        """Key identifying one upload of one version of a file.
+
+        The file's size and modification time are part of the key, so an
+        edited file never resumes a session holding its old bytes.
+        """
+        stat = os.stat(file_path)
+        identity = json.dumps([os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, *extra], default=str)
+        return f"{platform}:{hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]}"
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            if self.state_file.exists():
+                try:
+                    self._entries = json.loads(self.state_file.read_text())
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(f"Could not read upload state {self.state_file}: {e}")
+        return self._entries
+    
+    def _write(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_suffix('.tmp')
+        tmp_file.write_text(json.dumps(self._entries, indent=2))
+        os.replace(tmp_file, self.state_file)
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._load().get(key)
+    
+    def save(self, key: str, upload_url: str, offset: int):
+        self._load()[key] = {'upload_url': upload_url, 'offset': offset}
+        self._write()
+    
+    def clear(self, key: str):
+        if self._load().pop(key, None) is not None:
+            self._write()
+
+
+class ResumableUpload:
+    """Chunked upload over the resumable protocol used by Google APIs.
+
+    The file is sent as a series of ``Content-Range`` PUT requests to the
+    session URL. The server answers 308 (not a redirect here) with the range
+    it has stored after every chunk but the last; that offset is persisted
+    so the upload can be resumed. On resume, the server is asked for its
+    offset before sending anything, and a session it no longer knows is
+    replaced by a new one.
+    """
+    
+    def __init__(
+        self,
+        store: Optional[UploadStateStore] = None,
+        chunk_size: int = RESUMABLE_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None
+    ):
+        if chunk_size % STREAM_CHUNK_SIZE:
+            raise ValueError(f"chunk_size must be a multiple of {STREAM_CHUNK_SIZE}")
+        
+        self.store = store if store is not None else UploadStateStore()
+        self.chunk_size = chunk_size
+        self.progress = progress
+    
+    async def upload(
+        self,
+        session: aiohttp.ClientSession,
+        key: str,
+        file_path: str,
+        start_session: Callable[[int], Awaitable[Optional[str]]],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Upload ``file_path`` and return the JSON body of the final response.
+
+        ``start_session`` is called with the file size to open a new upload
+        session and returns its URL. Returns ``None`` if the upload fails;
+        the confirmed offset stays persisted for the next attempt.
+        """
+        headers = headers or {}
+        total_bytes = os.path.getsize(file_path)
+        upload_url, offset = None, 0
+        
+        state = self.store.get(key)
+        if state:
+            upload_url = state['upload_url']
+            status, offset, result = await self._query_offset(session, upload_url, total_bytes, headers)
+            if status == 'complete':
+                self.store.clear(key)
+                return result
+            if status == 'expired':
+                upload_url, offset = None, 0
+            else:
+                logger.info(f"Resuming upload of {file_path} at byte {offset} of {total_bytes}")
+        
+        if upload_url is None:
+            upload_url = await start_session(total_bytes)
+            if not upload_url:
+                return None
+            self.store.save(key, upload_url, 0)
+        
+        _report(self.progress, file_path, offset, total_bytes)
+        
+        while True:
+            end = min(offset + self.chunk_size, total_bytes)
+            chunk_headers = {
+                **headers,
+                'Content-Length': str(end - offset),
+                'Content-Range': f"bytes {offset}-{end - 1}/{total_bytes}" if end > offset else f"bytes */{total_bytes}"
+            }
+            
+            async with session.put(
+                upload_url,
+                headers=chunk_headers,
+                data=stream_file(file_path, offset, end - offset, progress=self.progress),
+                allow_redirects=False
+            ) as response:
+                if response.status in (200, 201):
+                    self.store.clear(key)
+                    return await response.json()
+                
+                if response.status != 308:
+                    error = await response.text()
+                    logger.error(f"Resumable upload failed at byte {offset}: {response.status} - {error}")
+                    return None
+                
+                offset = self._confirmed_offset(response)
+                self.store.save(key, upload_url, offset)
+    
+    async def _query_offset(self, session, upload_url: str, total_bytes: int, headers: Dict[str, str]):
+        """Ask the server how much of an interrupted upload it has stored."""
+        query_headers = {**headers, 'Content-Length': '0', 'Content-Range': f"bytes */{total_bytes}"}
+        
+        try:
+            async with session.put(upload_url, headers=query_headers, allow_redirects=False) as response:
+                if response.status in (200, 201):
+                    return 'complete', total_bytes, await response.json()
+                if response.status == 308:
+                    return 'active', self._confirmed_offset(response), None
+                logger.info(f"Upload session is no longer available ({response.status}), starting over")
+        except aiohttp.ClientError as e:
+            logger.warning(f"Could not query upload session, starting over: {e}")
+        
+        return 'expired', 0, None
+    
+    @staticmethod
+    def _confirmed_offset(response: aiohttp.ClientResponse) -> int:
+        """Offset after the last byte the server has stored (``Range: bytes=0-N``)."""
+        match = re.match(r'bytes=0-(\d+)', response.headers.get('Range', ''))
+        return int(match.group(1)) + 1 if match else 0
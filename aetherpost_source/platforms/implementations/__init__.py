@@ -1,9 +1,23 @@
 """Platform implementations."""
 
-from .bluesky_platform import BlueskyPlatform
-from .twitter_platform import TwitterPlatform
+import importlib
 
 __all__ = [
     'BlueskyPlatform',
     'TwitterPlatform'
-]
\ No newline at end of file
+]
+
+# Each platform module imports its SDK, so it is loaded only when its
+# class is first accessed
+_EXPORTS = {
+    'BlueskyPlatform': '.bluesky_platform',
+    'TwitterPlatform': '.twitter_platform',
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -2,6 +2,7 @@
 
 import asyncio
 import aiohttp
+import base64
 import json
 import os
 import re
@@ -11,6 +12,9 @@ from datetime import datetime
 from urllib.parse import urlparse
 
 from ..core.base_platform import BasePlatform, PlatformResult, Content, Profile, ContentType, PlatformCapability, MediaFile
+from ..core.http_client import get_http_client
+from ..core.upload import STREAM_TIMEOUT, stream_file
+from ..core.authentication.base_authenticator import AuthSession
 from ..core.authentication.basic_auth_authenticator import BasicAuthAuthenticator
 from ..core.error_handling.exceptions import (
     AuthenticationError,
@@ -25,6 +29,17 @@ from ..core.error_handling.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+def _jwt_expiry(token: Optional[str]) -> Optional[datetime]:
+    """Read the ``exp`` claim of an access JWT without verifying it."""
+    try:
+        payload_b64 = token.split('.')[1]
+        payload_b64 += '=' * (-len(payload_b64) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(payload_b64))
+        return datetime.utcfromtimestamp(payload['exp'])
+    except Exception:
+        return None
+
+
 class BlueskyPlatform(BasePlatform):
     """Bluesky social media platform connector using AT Protocol."""
     
@@ -125,8 +140,7 @@ class BlueskyPlatform(BasePlatform):
             ) as response:
                     if response.status == 200:
                         data = await response.json()
-                        self.session_token = data.get("accessJwt")
-                        self.did = data.get("did")
+                        self._store_session(data)
                         
                         # Get profile info for verification
                         profile = await self._get_profile()
@@ -149,6 +163,43 @@ class BlueskyPlatform(BasePlatform):
             logger.error(f"Bluesky authentication error: {e}")
             return False
     
+    async def refresh_authentication(self) -> bool:
+        """Renew the access token with the refresh JWT, logging in again if that fails."""
+        refresh_token = self._current_session.refresh_token if self._current_session else None
+        
+        if refresh_token:
+            try:
+                session = await self._get_session()
+                async with session.post(
+                    f"{self.base_url}/xrpc/com.atproto.server.refreshSession",
+                    headers={"Authorization": f"Bearer {refresh_token}"}
+                ) as response:
+                    if response.status == 200:
+                        self._store_session(await response.json())
+                        self._authenticated = True
+                        logger.info("Refreshed Bluesky session")
+                        return True
+                    logger.warning(f"Bluesky session refresh failed: {response.status}")
+            except Exception as e:
+                logger.warning(f"Bluesky session refresh error: {e}")
+        
+        self._authenticated = False
+        self._current_session = None
+        return await self.authenticate()
+    
+    def _store_session(self, data: Dict[str, Any]):
+        """Keep the tokens from a createSession/refreshSession response."""
+        self.session_token = data.get("accessJwt")
+        self.did = data.get("did")
+        self._current_session = AuthSession(
+            platform=self.platform_name,
+            auth_type="jwt",
+            access_token=self.session_token,
+            refresh_token=data.get("refreshJwt"),
+            expires_at=_jwt_expiry(self.session_token),
+            user_info={"did": self.did, "handle": data.get("handle")}
+        )
+    
     async def _post_content_impl(self, content: Content) -> PlatformResult:
         """Post content to Bluesky with enhanced features."""
         try:
@@ -517,30 +568,21 @@ class BlueskyPlatform(BasePlatform):
         return None
     
     async def _upload_media(self, media_files: List[MediaFile]) -> List[Dict[str, Any]]:
-        """Upload media files to Bluesky."""
-        uploaded_images = []
-        
-        for media_file in media_files[:4]:  # Bluesky supports up to 4 images
-            try:
-                blob = await self._upload_blob(media_file.file_path)
-                if blob:
-                    uploaded_images.append({
-                        "alt": media_file.alt_text or "",
-                        "image": blob
-                    })
-            except Exception as e:
-                logger.error(f"Failed to upload {media_file.file_path}: {e}")
-                continue
+        """Upload media files to Bluesky concurrently, failing the post if any upload fails."""
+        async def upload_image(media_file: MediaFile) -> Optional[Dict[str, Any]]:
+            blob = await self._upload_blob(media_file.file_path)
+            return {"alt": media_file.alt_text or "", "image": blob} if blob else None
         
-        return uploaded_images
+        # Bluesky supports up to 4 images
+        return await self._upload_all_media(media_files[:4], upload_image)
     
     async def _upload_blob(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Upload a blob to Bluesky."""
+        """Upload a blob to Bluesky, reusing the blob of an earlier identical upload."""
+        return await self._cached_upload(file_path, lambda: self._send_blob(file_path))
+    
+    async def _send_blob(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Send a file to Bluesky's blob store."""
         try:
-            # Read file content
-            with open(file_path, 'rb') as f:
-                media_data = f.read()
-            
             # Determine content type
             if file_path.lower().endswith('.png'):
                 content_type = 'image/png'
@@ -555,14 +597,15 @@ class BlueskyPlatform(BasePlatform):
             upload_headers = {
                 'Authorization': f'Bearer {self.session_token}',
                 'Content-Type': content_type,
-                'Content-Length': str(len(media_data))
+                'Content-Length': str(os.path.getsize(file_path))
             }
             
             session = await self._get_session()
             async with session.post(
                 f"{self.base_url}/xrpc/com.atproto.repo.uploadBlob",
-                data=media_data,
-                headers=upload_headers
+                data=stream_file(file_path, progress=self.upload_progress),
+                headers=upload_headers,
+                timeout=STREAM_TIMEOUT
             ) as response:
                 if response.status == 200:
                     upload_data = await response.json()
@@ -671,18 +714,9 @@ class BlueskyPlatform(BasePlatform):
         return headers
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+        """Get or create HTTP session on the shared connector."""
         if self._session is None or self._session.closed:
-            # Set up connector with proper encoding
-            connector = aiohttp.TCPConnector(
-                enable_cleanup_closed=True
-            )
-            
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                connector=connector,
-                json_serialize=lambda obj: json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
-            )
+            self._session = get_http_client().session(timeout=30)
         return self._session
     
     async def cleanup(self):
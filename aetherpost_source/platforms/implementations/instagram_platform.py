@@ -5,11 +5,13 @@ import os
 import logging
 import aiohttp
 import json
-from typing import Dict, List, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
 from ..core.base_platform import BasePlatform, PlatformResult, Content, Profile, ContentType, PlatformCapability, MediaFile
+from ..core.http_client import get_http_client
 from ..core.authentication.oauth2_authenticator import OAuth2Authenticator
 from ..core.error_handling.exceptions import (
     AuthenticationError,
@@ -232,23 +234,22 @@ class InstagramPlatform(BasePlatform):
     async def _post_carousel(self, content: Content) -> PlatformResult:
         """Post carousel (multiple images/videos) to Instagram."""
         try:
-            # Create containers for each media item
-            container_ids = []
-            for media_file in content.media[:10]:  # Instagram allows max 10 items
+            # Create containers for all media items concurrently, keeping their order
+            async def create_item_container(media_file: MediaFile) -> Optional[str]:
                 if media_file.media_type.startswith('image/'):
-                    container_id = await self._create_carousel_image_container(media_file)
-                else:
-                    container_id = await self._create_carousel_video_container(media_file)
-                
-                if container_id:
-                    container_ids.append(container_id)
+                    return await self._create_carousel_image_container(media_file)
+                return await self._create_carousel_video_container(media_file)
             
-            if not container_ids:
+            try:
+                # Instagram allows max 10 items
+                container_ids = await self._upload_all_media(content.media[:10], create_item_container)
+            except MediaUploadError as e:
+                # Unpublished item containers expire on Instagram's side
                 return PlatformResult(
                     success=False,
                     platform=self.platform_name,
                     action="post_carousel",
-                    error_message="Failed to create carousel containers"
+                    error_message=f"Failed to create carousel containers: {e.message}"
                 )
             
             # Format caption with hashtags and create carousel container
@@ -624,13 +625,15 @@ class InstagramPlatform(BasePlatform):
             return f"{caption}\n\n{hashtag_text}"
         return caption
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the platform's HTTP session on the shared connector.
+        
+        The session stays open across calls and is closed by cleanup().
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30)
-            )
-        return self._session
+            self._session = get_http_client().session(timeout=30)
+        yield self._session
     
     async def cleanup(self):
         """Cleanup platform resources."""
@@ -4,13 +4,15 @@ import asyncio
 import os
 import logging
 import aiohttp
-import json
 import base64
-from typing import Dict, List, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
 from ..core.base_platform import BasePlatform, PlatformResult, Content, Profile, ContentType, PlatformCapability, MediaFile
+from ..core.http_client import get_http_client
+from ..core.upload import STREAM_TIMEOUT, stream_file
 from ..core.authentication.oauth2_authenticator import OAuth2Authenticator
 from ..core.error_handling.exceptions import (
     AuthenticationError,
@@ -331,20 +333,12 @@ class LinkedInPlatform(BasePlatform):
         
         for media_file in media_files[:1]:  # LinkedIn typically supports 1 media item per post
             try:
-                # Register upload
-                upload_request = await self._register_upload(media_file)
-                if not upload_request:
-                    continue
-                
-                asset = upload_request.get('value', {}).get('asset')
-                upload_url = upload_request.get('value', {}).get('uploadMechanism', {}).get('com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest', {}).get('uploadUrl')
-                
-                if not asset or not upload_url:
-                    continue
-                
-                # Upload the file
-                success = await self._upload_file(media_file.file_path, upload_url)
-                if success:
+                # Reuse the asset of an earlier upload of the same file content
+                asset = await self._cached_upload(
+                    media_file.file_path,
+                    lambda: self._upload_asset(media_file)
+                )
+                if asset:
                     media_asset = {
                         "status": "READY",
                         "media": asset
@@ -370,6 +364,24 @@ class LinkedInPlatform(BasePlatform):
         
         return media_assets
     
+    async def _upload_asset(self, media_file: MediaFile) -> Optional[str]:
+        """Register and upload a media file, returning its asset URN."""
+        # Register upload
+        upload_request = await self._register_upload(media_file)
+        if not upload_request:
+            return None
+        
+        asset = upload_request.get('value', {}).get('asset')
+        upload_url = upload_request.get('value', {}).get('uploadMechanism', {}).get('com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest', {}).get('uploadUrl')
+        
+        if not asset or not upload_url:
+            return None
+        
+        # Upload the file
+        if not await self._upload_file(media_file.file_path, upload_url):
+            return None
+        return asset
+    
     async def _register_upload(self, media_file: MediaFile) -> Optional[Dict[str, Any]]:
         """Register media upload with LinkedIn."""
         try:
@@ -429,21 +441,20 @@ class LinkedInPlatform(BasePlatform):
             return None
     
     async def _upload_file(self, file_path: str, upload_url: str) -> bool:
-        """Upload file to LinkedIn's upload URL."""
+        """Stream a file to LinkedIn's upload URL."""
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
             async with self._get_session() as session:
                 headers = {
                     "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/octet-stream"
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(os.path.getsize(file_path))
                 }
                 
                 async with session.put(
                     upload_url,
-                    data=file_data,
-                    headers=headers
+                    data=stream_file(file_path, progress=self.upload_progress),
+                    headers=headers,
+                    timeout=STREAM_TIMEOUT
                 ) as response:
                     return response.status == 201
         
@@ -525,20 +536,15 @@ class LinkedInPlatform(BasePlatform):
             "User-Agent": "AetherPost/1.0 (LinkedIn)"
         }
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the platform's HTTP session on the shared connector.
+        
+        The session stays open across calls and is closed by cleanup().
+        """
         if self._session is None or self._session.closed:
-            # Set up connector with proper encoding
-            connector = aiohttp.TCPConnector(
-                enable_cleanup_closed=True
-            )
-            
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                connector=connector,
-                json_serialize=lambda obj: json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
-            )
-        return self._session
+            self._session = get_http_client().session(timeout=30)
+        yield self._session
     
     async def cleanup(self):
         """Cleanup platform resources."""
@@ -13,6 +13,7 @@ except ImportError:
 
 from ..core.base_platform import BasePlatform, PlatformResult, Content, Profile, ContentType, PlatformCapability, MediaFile
 from ..core.authentication.api_key_authenticator import TwitterApiKeyAuthenticator
+from ..core.authentication.base_authenticator import AuthSession
 from ..core.error_handling.exceptions import (
     AuthenticationError,
     PostingError,
@@ -146,6 +147,12 @@ class TwitterPlatform(BasePlatform):
             if me.data:
                 logger.info(f"Successfully authenticated Twitter account: @{me.data.username}")
                 self._authenticated = True
+                # OAuth 1.0a user tokens do not expire
+                self._current_session = AuthSession(
+                    platform=self.platform_name,
+                    auth_type="oauth1",
+                    user_info={"id": me.data.id, "username": me.data.username}
+                )
                 return True
             else:
                 return False
@@ -309,11 +316,11 @@ class TwitterPlatform(BasePlatform):
         for media_file in media_files:
             try:
                 if isinstance(media_file.file_path, str) and os.path.exists(media_file.file_path):
-                    # Use run_in_executor for synchronous API call
-                    media = await asyncio.get_event_loop().run_in_executor(
-                        None, lambda: self.api.media_upload(media_file.file_path)
+                    media_id = await self._cached_upload(
+                        media_file.file_path,
+                        lambda: self._send_media(media_file.file_path)
                     )
-                    media_ids.append(media.media_id)
+                    media_ids.append(media_id)
                 else:
                     logger.warning(f"Media path does not exist: {media_file.file_path}")
             except Exception as e:
@@ -322,6 +329,14 @@ class TwitterPlatform(BasePlatform):
         
         return media_ids
     
+    async def _send_media(self, file_path: str) -> str:
+        """Upload one file through the v1.1 media endpoint."""
+        # Use run_in_executor for synchronous API call
+        media = await asyncio.get_event_loop().run_in_executor(
+            None, lambda: self.api.media_upload(file_path)
+        )
+        return media.media_id
+    
     async def _post_thread(self, thread_posts: List[str], media_files: Optional[List[MediaFile]] = None) -> PlatformResult:
         """Post a thread to Twitter."""
         try:
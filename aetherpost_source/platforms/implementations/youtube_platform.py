@@ -4,13 +4,15 @@ import asyncio
 import os
 import logging
 import aiohttp
-import json
 import mimetypes
-from typing import Dict, List, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
 from ..core.base_platform import BasePlatform, PlatformResult, Content, Profile, ContentType, PlatformCapability, MediaFile
+from ..core.http_client import get_http_client
+from ..core.upload import ResumableUpload, UploadStateStore
 from ..core.authentication.oauth2_authenticator import OAuth2Authenticator
 from ..core.error_handling.exceptions import (
     AuthenticationError,
@@ -49,6 +51,9 @@ class YouTubePlatform(BasePlatform):
         # Session
         self._session: Optional[aiohttp.ClientSession] = None
         
+        # Offsets of interrupted video uploads, resumed on the next attempt
+        self.upload_state = UploadStateStore(self.config.get("upload_state_file", ".aetherpost/uploads.json"))
+        
         # Only require access_token if credentials were provided  
         if not self.access_token and credentials:
             raise ValueError("YouTube requires access_token")
@@ -510,55 +515,52 @@ class YouTubePlatform(BasePlatform):
     
     # Helper methods
     async def _upload_video_file(self, video_file: MediaFile, metadata: Dict[str, Any]) -> Optional[str]:
-        """Upload video file to YouTube."""
+        """Upload video file to YouTube in resumable chunks."""
         try:
-            # Step 1: Create video resource
+            content_type = video_file.media_type or "video/mp4"
+            
             async with self._get_session() as session:
-                headers = self._get_authenticated_headers()
-                params = {
-                    "part": "snippet,status",
-                    "uploadType": "resumable"
-                }
-                
-                # Initiate resumable upload
-                async with session.post(
-                    f"{self.upload_url}/videos",
-                    headers=headers,
-                    params=params,
-                    json=metadata
-                ) as response:
-                    if response.status != 200:
-                        error = await response.text()
-                        logger.error(f"Failed to initiate upload: {error}")
-                        return None
+                async def start_session(total_bytes: int) -> Optional[str]:
+                    # Step 1: Create video resource and open a resumable upload session
+                    headers = {
+                        **self._get_authenticated_headers(),
+                        "X-Upload-Content-Type": content_type,
+                        "X-Upload-Content-Length": str(total_bytes)
+                    }
+                    params = {
+                        "part": "snippet,status",
+                        "uploadType": "resumable"
+                    }
                     
-                    upload_url = response.headers.get('Location')
-                    if not upload_url:
-                        logger.error("No upload URL received")
-                        return None
-                
-                # Step 2: Upload video file
-                with open(video_file.file_path, 'rb') as f:
-                    video_data = f.read()
-                
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": video_file.media_type or "video/mp4",
-                    "Content-Length": str(len(video_data))
-                }
+                    async with session.post(
+                        f"{self.upload_url}/videos",
+                        headers=headers,
+                        params=params,
+                        json=metadata
+                    ) as response:
+                        if response.status != 200:
+                            error = await response.text()
+                            logger.error(f"Failed to initiate upload: {error}")
+                            return None
+                        
+                        upload_url = response.headers.get('Location')
+                        if not upload_url:
+                            logger.error("No upload URL received")
+                        return upload_url
                 
-                async with session.put(
-                    upload_url,
-                    headers=headers,
-                    data=video_data
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get('id')
-                    else:
-                        error = await response.text()
-                        logger.error(f"Failed to upload video: {error}")
-                        return None
+                # Step 2: Stream the video file, resuming an interrupted upload of the same file
+                uploader = ResumableUpload(self.upload_state, progress=self.upload_progress)
+                result = await uploader.upload(
+                    session,
+                    key=UploadStateStore.key_for(self.platform_name, video_file.file_path, metadata),
+                    file_path=video_file.file_path,
+                    start_session=start_session,
+                    headers={
+                        "Authorization": f"Bearer {self.access_token}",
+                        "Content-Type": content_type
+                    }
+                )
+                return result.get('id') if result else None
         
         except Exception as e:
             logger.error(f"Error uploading video file: {e}")
@@ -646,20 +648,15 @@ class YouTubePlatform(BasePlatform):
             "Accept-Charset": "utf-8"
         }
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the platform's HTTP session on the shared connector.
+        
+        The session stays open across calls and is closed by cleanup().
+        """
         if self._session is None or self._session.closed:
-            # Set up connector with proper encoding
-            connector = aiohttp.TCPConnector(
-                enable_cleanup_closed=True
-            )
-            
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=300),  # 5 minutes for video uploads
-                connector=connector,
-                json_serialize=lambda obj: json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
-            )
-        return self._session
+            self._session = get_http_client().session(timeout=300)  # 5 minutes for video uploads
+        yield self._session
     
     async def cleanup(self):
         """Cleanup platform resources."""
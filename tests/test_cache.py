@@ -0,0 +1,102 @@
+"""Test the in-memory cache tier and CacheManager."""
+
+import time
+import pytest
+
+from aetherpost.core.cache import CacheConfig, CacheManager
+from aetherpost.core.cache.memory import MemoryCache, NamespaceLimit
+
+
+@pytest.fixture
+def manager():
+    return CacheManager(CacheConfig(use_redis=False, max_size=3))
+
+
+class TestMemoryCache:
+    """Test eviction, expiry and accounting."""
+    
+    def test_lru_evicts_least_recently_used(self):
+        cache = MemoryCache(NamespaceLimit(max_entries=2))
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get_stats()["default"]["evictions"] == 1
+    
+    def test_lfu_evicts_least_frequently_used(self):
+        cache = MemoryCache(NamespaceLimit(max_entries=2), policy='lfu')
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        for _ in range(3):
+            cache.get("b")
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+        
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+    
+    def test_byte_budget(self):
+        cache = MemoryCache(NamespaceLimit(max_entries=100, max_bytes=100))
+        cache.set("a", "x", ttl=60, size=60)
+        cache.set("b", "y", ttl=60, size=60)
+        
+        assert cache.get("a") is None
+        assert cache.bytes == 60
+        assert cache.set("huge", "z", ttl=60, size=101) is False
+    
+    def test_expired_entries_are_misses(self):
+        cache = MemoryCache()
+        cache.set("a", 1, ttl=0.01)
+        time.sleep(0.02)
+        
+        assert cache.get("a") is None
+        stats = cache.get_stats()["default"]
+        assert stats["expirations"] == 1
+        assert stats["entries"] == 0
+    
+    def test_namespaces_have_separate_limits(self):
+        cache = MemoryCache(NamespaceLimit(max_entries=1), {'feeds': NamespaceLimit(max_entries=2)})
+        cache.set("feeds:1", 1, ttl=60)
+        cache.set("feeds:2", 2, ttl=60)
+        cache.set("users:1", 1, ttl=60)
+        cache.set("users:2", 2, ttl=60)
+        
+        stats = cache.get_stats()
+        assert stats["feeds"]["entries"] == 2
+        assert stats["users"]["entries"] == 1
+        assert stats["users"]["evictions"] == 1
+
+
+class TestCacheManager:
+    """Test CacheManager without Redis."""
+    
+    def test_get_set_delete(self, manager):
+        manager.set("posts:1", {"text": "hello"})
+        assert manager.get("posts:1") == {"text": "hello"}
+        
+        manager.delete("posts:1")
+        assert manager.get("posts:1") is None
+    
+    def test_stats_per_namespace(self, manager):
+        manager.set("posts:1", "a")
+        manager.get("posts:1")
+        manager.get("posts:2")
+        manager.get("users:1")
+        
+        stats = manager.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["namespaces"]["posts"]["hits"] == 1
+        assert stats["namespaces"]["posts"]["misses"] == 1
+        assert stats["namespaces"]["users"]["misses"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_async_get_set(self, manager):
+        await manager.aset("posts:1", [1, 2, 3])
+        
+        assert await manager.aget("posts:1") == [1, 2, 3]
+        assert await manager.aget("posts:2") is None
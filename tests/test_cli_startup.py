@@ -0,0 +1,82 @@
+"""Guard CLI cold start against eager imports."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from aetherpost.cli.main import app
+
+# Cumulative import time of aetherpost.cli.main, in microseconds, measured
+# with `python -X importtime` (typer and rich included)
+IMPORT_BUDGET_US = 300_000
+
+# Modules only commands should load, never `aetherpost --help`
+DEFERRED_MODULES = [
+    "aiohttp",
+    "tweepy",
+    "aetherpost.platforms",
+    "aetherpost.core.config.unified",
+    "aetherpost.core.logging.logger",
+    "aetherpost.cli.commands.init",
+    "aetherpost.cli.commands.apply",
+    "aetherpost.cli.commands.scheduler",
+]
+
+HELP_SCRIPT = """
+import sys
+from aetherpost.cli.main import app
+try:
+    app(["--help"])
+except SystemExit:
+    pass
+prefixes = sys.argv[1:]
+print("LOADED", *sorted({p for p in prefixes for m in sys.modules if m == p or m.startswith(p + ".")}))
+"""
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, timeout=60)
+
+
+def cumulative_import_us(stderr, module):
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+class TestCLIStartup:
+    """Test that command modules load only when their command runs."""
+    
+    def test_help_does_not_import_commands(self):
+        result = run_python("-c", HELP_SCRIPT, *DEFERRED_MODULES)
+        
+        assert result.returncode == 0, result.stderr
+        assert "init" in result.stdout and "scheduler" in result.stdout
+        loaded = result.stdout.strip().splitlines()[-1].split()[1:]
+        assert loaded == []
+    
+    def test_import_time_budget(self):
+        # Best of three, to keep a busy machine from failing the check
+        timings = []
+        for _ in range(3):
+            result = run_python("-X", "importtime", "-c", "import aetherpost.cli.main")
+            assert result.returncode == 0, result.stderr
+            timings.append(cumulative_import_us(result.stderr, "aetherpost.cli.main"))
+        
+        assert min(timings) < IMPORT_BUDGET_US
+    
+    @pytest.mark.parametrize("command, expected", [
+        ("scheduler", "status"),
+        ("profile", "generate"),
+    ])
+    def test_lazy_subcommands_load_when_invoked(self, command, expected):
+        result = CliRunner().invoke(app, [command, "--help"])
+        
+        assert result.exit_code == 0, result.output
+        assert expected in result.output
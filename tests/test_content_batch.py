@@ -0,0 +1,96 @@
+"""Test batched multi-platform content generation."""
+
+import json
+import pytest
+
+from aetherpost.core.config.models import CredentialsConfig
+from aetherpost.core.content.generator import ContentGenerator
+from aetherpost.core.content.providers import ProviderPool
+
+
+class ScriptedProvider:
+    """Provider returning queued responses and recording prompts."""
+    
+    name = "scripted"
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.prompts = []
+    
+    async def generate(self, prompt, max_tokens=300, temperature=0.0):
+        self.prompts.append(prompt)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def generator(temp_dir, monkeypatch):
+    monkeypatch.chdir(temp_dir)
+    generator = ContentGenerator(CredentialsConfig())
+    monkeypatch.setattr(generator, "_get_project_context_text", lambda: "")
+    monkeypatch.setattr(generator, "_get_project_diff_text", lambda: "")
+    return generator
+
+
+def use_provider(generator, provider):
+    pool = ProviderPool()
+    pool.ordered = lambda: [provider]
+    generator.provider_pool = pool
+
+
+class TestGenerateContentBatch:
+    """Test single-call generation and per-platform validation."""
+    
+    @pytest.mark.asyncio
+    async def test_single_request_for_all_platforms(self, generator, sample_config):
+        provider = ScriptedProvider([json.dumps({"twitter": "Tweet text", "bluesky": "Skeet text"})])
+        use_provider(generator, provider)
+        
+        results = await generator.generate_content_batch(sample_config, ["twitter", "bluesky"])
+        
+        assert len(provider.prompts) == 1
+        assert results["twitter"]["text"] == "Tweet text"
+        assert results["bluesky"]["text"] == "Skeet text"
+        assert results["bluesky"]["platform"] == "bluesky"
+    
+    @pytest.mark.asyncio
+    async def test_over_limit_variant_regenerated(self, generator, sample_config):
+        provider = ScriptedProvider([
+            json.dumps({"twitter": "x" * 400, "bluesky": "Skeet text"}),
+            "Short tweet"
+        ])
+        use_provider(generator, provider)
+        
+        results = await generator.generate_content_batch(sample_config, ["twitter", "bluesky"])
+        
+        assert len(provider.prompts) == 2
+        assert results["twitter"]["text"] == "Short tweet"
+        assert "twitter" in provider.prompts[1]
+    
+    @pytest.mark.asyncio
+    async def test_results_are_cached_per_platform(self, generator, sample_config):
+        provider = ScriptedProvider([json.dumps({"twitter": "Tweet text", "bluesky": "Skeet text"})])
+        use_provider(generator, provider)
+        
+        await generator.generate_content_batch(sample_config, ["twitter", "bluesky"])
+        single = await generator.generate_content(sample_config, "bluesky")
+        
+        assert single["text"] == "Skeet text"
+        assert len(provider.prompts) == 1
+    
+    @pytest.mark.asyncio
+    async def test_generated_image_shared_across_platforms(self, generator, sample_config, monkeypatch):
+        provider = ScriptedProvider([json.dumps({"twitter": "Tweet text", "bluesky": "Skeet text"})])
+        use_provider(generator, provider)
+        sample_config.image = "generate"
+        generated = []
+        
+        async def generate_image(config, platform):
+            generated.append(platform)
+            return "media/generated.png"
+        
+        monkeypatch.setattr(generator, "_generate_image", generate_image)
+        
+        results = await generator.generate_content_batch(sample_config, ["twitter", "bluesky"])
+        
+        assert generated == ["twitter"]
+        assert results["twitter"]["media"] == results["bluesky"]["media"] == ["media/generated.png"]
@@ -0,0 +1,70 @@
+"""Test the per-run project context session."""
+
+import pytest
+
+from aetherpost.core.config.models import CredentialsConfig
+from aetherpost.core.content.generator import ContentGenerator
+from aetherpost.core.context import ProjectContextReader
+
+
+@pytest.fixture
+def project(temp_dir, monkeypatch):
+    (temp_dir / "campaign.yaml").write_text("context:\n  enabled: true\n  watch: ['src']\n")
+    (temp_dir / "src").mkdir()
+    (temp_dir / "src" / "app.py").write_text("print('hello')\n")
+    monkeypatch.chdir(temp_dir)
+    return temp_dir
+
+
+@pytest.fixture
+def scans(project, monkeypatch):
+    calls = []
+    real_read = ProjectContextReader.read_project_context
+    
+    def counting_read(self, *args, **kwargs):
+        calls.append(args)
+        return real_read(self, *args, **kwargs)
+    
+    monkeypatch.setattr(ProjectContextReader, 'read_project_context', counting_read)
+    return calls
+
+
+class TestContextSession:
+    """Test that a run scans once and commits its snapshot only on success."""
+    
+    def test_prompts_share_one_scan(self, scans, sample_config):
+        generator = ContentGenerator(CredentialsConfig())
+        
+        twitter = generator._build_prompt(sample_config, "twitter")
+        bluesky = generator._build_prompt(sample_config, "bluesky")
+        
+        assert len(scans) == 1
+        for prompt in (twitter, bluesky):
+            assert "src/app.py" in prompt
+            assert "first scan" in prompt
+    
+    def test_snapshot_saved_only_on_commit(self, project, scans, sample_config):
+        generator = ContentGenerator(CredentialsConfig())
+        generator._build_prompt(sample_config, "twitter")
+        assert not (project / ".aetherpost" / "project_snapshot.json").exists()
+        
+        # A failed run is retried with the same changes
+        retry = ContentGenerator(CredentialsConfig())
+        assert "first scan" in retry._build_prompt(sample_config, "twitter")
+        
+        assert retry.commit_context() is True
+        assert (project / ".aetherpost" / "project_snapshot.json").exists()
+        
+        # After a successful run, unchanged files are no longer reported
+        assert "Recent Changes" not in ContentGenerator(CredentialsConfig())._build_prompt(sample_config, "twitter")
+    
+    def test_commit_starts_a_new_session(self, project, scans, sample_config):
+        generator = ContentGenerator(CredentialsConfig())
+        generator._build_prompt(sample_config, "twitter")
+        generator.commit_context()
+        
+        (project / "src" / "feature.py").write_text("def feature():\n    return 42\n")
+        prompt = generator._build_prompt(sample_config, "twitter")
+        
+        assert len(scans) == 2
+        assert "feature.py (added)" in prompt
@@ -0,0 +1,186 @@
+"""Test analytics dashboard reports."""
+
+import pytest
+from datetime import datetime, timedelta
+
+from aetherpost.core.analytics.dashboard import AnalyticsDashboard
+from aetherpost.core.analytics.frame import PostFrame
+from aetherpost.core.analytics.incremental import IncrementalPostFrame
+from aetherpost.core.state.manager import StateManager
+
+
+POSTS = [
+    # platform, hours ago, text, metrics
+    ("twitter", 2, "Try our new feature #launch #ai", {"likes": 10, "retweets": 2, "impressions": 100, "reach": 50}),
+    ("twitter", 26, "Learn how to ship faster #ai 🚀", {"likes": 4, "replies": 1, "impressions": 80, "reach": 100}),
+    ("twitter", 50, "Company news from the team #launch", {}),
+    ("bluesky", 3, "Join the product release #ai", {"likes": 1, "impressions": 10}),
+]
+
+
+@pytest.fixture
+def dashboard(temp_dir, monkeypatch):
+    monkeypatch.chdir(temp_dir)
+    manager = StateManager()
+    manager.initialize_campaign("test-campaign")
+    now = datetime.utcnow()
+    for i, (platform, hours_ago, text, metrics) in enumerate(POSTS):
+        record = manager.add_post(platform, str(i), f"url{i}", {"text": text})
+        record.created_at = now - timedelta(hours=hours_ago)
+        record.metrics = dict(metrics)
+    manager.save_state()
+    return AnalyticsDashboard()
+
+
+class TestPostFrame:
+    """Test the columnar post representation."""
+    
+    def test_columns(self, dashboard):
+        frame = PostFrame.from_posts(dashboard.state_manager.load_state().posts)
+        
+        assert frame.platforms == ["twitter", "bluesky"]
+        assert frame.engagement.tolist() == [14.0, 7.0, 0.0, 1.0]
+        assert frame.has_metrics.tolist() == [True, True, False, True]
+        assert frame.emoji_count.tolist() == [0, 1, 0, 0]
+        assert frame.hashtags == ["#launch", "#ai"]
+    
+    def test_select_remaps_hashtags(self, dashboard):
+        frame = PostFrame.from_posts(dashboard.state_manager.load_state().posts)
+        
+        bluesky = frame.select(frame.platform_codes == 1)
+        
+        assert len(bluesky) == 1
+        assert bluesky.hashtag_post.tolist() == [0]
+        assert [bluesky.hashtags[code] for code in bluesky.hashtag_codes] == ["#ai"]
+
+
+class TestAnalyticsDashboard:
+    """Test report generation over the columnar frame."""
+    
+    def test_report(self, dashboard):
+        report = dashboard.generate_comprehensive_report(days=30)
+        
+        overall = report["overall_metrics"]
+        assert overall["total_posts"] == 4
+        assert overall["total_engagement"] == 22.0
+        assert overall["platform_distribution"] == {"twitter": 3, "bluesky": 1}
+        assert overall["engagement_statistics"]["median"] == 4.0
+        
+        twitter = report["platform_insights"]["twitter"]
+        assert twitter["total_engagement"] == 21.0
+        assert twitter["best_performing_post"]["content"]["text"].startswith("Try")
+        assert twitter["worst_performing_post"]["content"]["text"].startswith("Learn")
+        assert twitter["top_hashtags"] == [("#ai", 10.5), ("#launch", 7.0)]
+        assert twitter["audience_growth"] == 100.0
+        
+        content = report["content_insights"]
+        assert content["hashtag_performance"] == {"#launch": 7.0, "#ai": 22 / 3}
+        assert content["best_cta_type"] == "try"
+        assert content["optimal_length"] == 80
+        
+        assert report["data_quality"]["posts_with_metrics"] == 3
+        ratio = report["competitive_insights"]["performance_vs_industry"]["bluesky"]["engagement_rate_ratio"]
+        assert ratio == pytest.approx(10.0 / 0.035)
+    
+    def test_date_filter(self, dashboard):
+        report = dashboard.generate_comprehensive_report(days=1)
+        
+        assert report["overall_metrics"]["total_posts"] == 2
+    
+    def test_out_of_window_platform_omitted(self, dashboard):
+        manager = dashboard.state_manager
+        manager.load_state()
+        record = manager.add_post("linkedin", "old", "url-old", {"text": "Old news"})
+        record.created_at = datetime.utcnow() - timedelta(days=100)
+        record.metrics = {"likes": 3}
+        manager.save_state()
+        
+        report = dashboard.generate_comprehensive_report(days=30)
+        
+        assert report["overall_metrics"]["platform_distribution"] == {"twitter": 3, "bluesky": 1}
+        assert "linkedin" not in report["platform_insights"]
+        assert "linkedin" not in report["competitive_insights"]["performance_vs_industry"]
+
+
+class TestIncrementalPostFrame:
+    """Test incremental frame maintenance across refreshes."""
+    
+    @pytest.fixture
+    def manager(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        manager = StateManager()
+        manager.initialize_campaign("test-campaign")
+        for i, (platform, _, text, metrics) in enumerate(POSTS):
+            manager.add_post(platform, str(i), f"url{i}", {"text": text})
+            if metrics:
+                manager.update_post_metrics(str(i), metrics)
+        return manager
+    
+    def test_refresh_folds_in_changes(self, manager, temp_dir):
+        cache = IncrementalPostFrame(temp_dir / "frame.npz")
+        
+        frame = cache.refresh(manager.state)
+        assert cache.last_refresh["rebuilt"]
+        assert frame.engagement.tolist() == [14.0, 7.0, 0.0, 1.0]
+        
+        cache.refresh(manager.state)
+        assert cache.last_refresh == {"added": 0, "updated": 0, "removed": 0, "rebuilt": False}
+        
+        manager.add_post("twitter", "4", "url4", {"text": "Another #ai post"})
+        manager.update_post_metrics("2", {"likes": 5})
+        manager.remove_post("3")
+        
+        frame = cache.refresh(manager.state)
+        assert cache.last_refresh == {"added": 1, "updated": 1, "removed": 1, "rebuilt": False}
+        assert frame.engagement.tolist() == [14.0, 7.0, 5.0, 0.0]
+        assert [frame.hashtags[code] for code in frame.hashtag_codes] == ["#launch", "#ai", "#ai", "#launch", "#ai"]
+        assert [post.post_id for post in frame.posts] == ["0", "1", "2", "4"]
+    
+    def test_frame_persists_between_runs(self, manager, temp_dir):
+        IncrementalPostFrame(temp_dir / "frame.npz").refresh(manager.state)
+        manager.update_post_metrics("0", {"likes": 20})
+        
+        cache = IncrementalPostFrame(temp_dir / "frame.npz")
+        frame = cache.refresh(manager.state)
+        
+        assert not cache.last_refresh["rebuilt"]
+        assert cache.last_refresh["updated"] == 1
+        assert frame.engagement[0] == 24.0
+        assert frame.platforms == ["twitter", "bluesky"]
+    
+    def test_backend_refresh_reads_only_changes(self, manager, temp_dir, monkeypatch):
+        backend = manager.backend
+        IncrementalPostFrame(temp_dir / "frame.npz").refresh_from_backend(backend)
+        
+        manager.add_post("twitter", "4", "url4", {"text": "Another #ai post"})
+        manager.update_post_metrics("2", {"likes": 5})
+        manager.remove_post("3")
+        
+        def fail():
+            raise AssertionError("full state load")
+        
+        monkeypatch.setattr(backend, "load", fail)
+        cache = IncrementalPostFrame(temp_dir / "frame.npz")
+        frame = cache.refresh_from_backend(backend)
+        
+        assert cache.last_refresh == {"added": 1, "updated": 1, "removed": 1, "rebuilt": False}
+        assert frame.engagement.tolist() == [14.0, 7.0, 5.0, 0.0]
+        assert frame.posts == []
+        assert frame.ids.tolist() == [post.id for post in manager.state.posts]
+        
+        assert cache.refresh_from_backend(backend) is frame
+        assert cache.last_refresh["added"] == 0
+    
+    def test_dashboard_reuses_report_for_unchanged_state(self, manager, monkeypatch):
+        dashboard = AnalyticsDashboard()
+        refreshes = []
+        refresh = dashboard.frame_cache.refresh_from_backend
+        monkeypatch.setattr(dashboard.frame_cache, "refresh_from_backend", lambda backend: refreshes.append(1) or refresh(backend))
+        
+        first = dashboard.generate_comprehensive_report()
+        assert dashboard.generate_comprehensive_report() is first
+        assert len(refreshes) == 1
+        
+        manager.update_post_metrics("1", {"likes": 50})
+        assert dashboard.generate_comprehensive_report()["overall_metrics"]["total_engagement"] == 68.0
+        assert len(refreshes) == 2
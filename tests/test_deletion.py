@@ -0,0 +1,84 @@
+"""Test batched deletion engine."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from aetherpost.platforms.core.base_platform import PlatformResult
+from aetherpost.platforms.core.deletion import BatchDeletionEngine, DeletionCheckpoint
+
+
+def make_platform(name, failing_ids=()):
+    """Create a mock platform whose deletions fail for ``failing_ids``."""
+    platform = Mock()
+    platform.platform_name = name
+    platform.authenticate = AsyncMock(return_value=True)
+    platform.cleanup = AsyncMock()
+    
+    async def delete_post(post_id):
+        return PlatformResult(
+            success=post_id not in failing_ids,
+            platform=name,
+            action="delete_post",
+            error_message="gone" if post_id in failing_ids else None
+        )
+    
+    platform.delete_post = AsyncMock(side_effect=delete_post)
+    return platform
+
+
+def make_posts(platform, count):
+    return [SimpleNamespace(platform=platform, post_id=f"{platform}-{i}") for i in range(count)]
+
+
+class TestBatchDeletionEngine:
+    """Test deletion grouping, reuse and checkpointing."""
+    
+    @pytest.mark.asyncio
+    async def test_one_platform_instance_per_platform(self, temp_dir):
+        """Each platform is created and authenticated once."""
+        platforms = {"twitter": make_platform("twitter"), "bluesky": make_platform("bluesky")}
+        factory = Mock()
+        factory.create_platform = Mock(side_effect=lambda platform_name, credentials: platforms[platform_name])
+        engine = BatchDeletionEngine(
+            checkpoint=DeletionCheckpoint(str(temp_dir / "checkpoint")),
+            factory=factory
+        )
+        posts = make_posts("twitter", 5) + make_posts("bluesky", 3)
+        
+        summary = await engine.delete_posts(posts, {"twitter": {"k": 1}, "bluesky": {"k": 1}})
+        
+        assert summary.deleted_count == 8
+        assert factory.create_platform.call_count == 2
+        platforms["twitter"].authenticate.assert_awaited_once()
+        assert platforms["twitter"].delete_post.await_count == 5
+        assert not (temp_dir / "checkpoint").exists()
+    
+    @pytest.mark.asyncio
+    async def test_interrupted_run_resumes(self, temp_dir):
+        """Posts recorded in the checkpoint are not deleted again."""
+        checkpoint_file = str(temp_dir / "checkpoint")
+        platform = make_platform("twitter", failing_ids={"twitter-3"})
+        factory = Mock()
+        factory.create_platform = Mock(return_value=platform)
+        posts = make_posts("twitter", 4)
+        
+        first = await BatchDeletionEngine(
+            checkpoint=DeletionCheckpoint(checkpoint_file), factory=factory
+        ).delete_posts(posts, {"twitter": {"k": 1}})
+        assert first.failed_count == 1
+        
+        platform.delete_post.reset_mock()
+        platform.delete_post.side_effect = None
+        platform.delete_post.return_value = PlatformResult(success=True, platform="twitter", action="delete_post")
+        
+        resumed = DeletionCheckpoint(checkpoint_file)
+        assert len(resumed) == 3
+        
+        second = await BatchDeletionEngine(checkpoint=resumed, factory=factory).delete_posts(
+            posts, {"twitter": {"k": 1}}
+        )
+        
+        assert second.deleted_count == 4
+        assert sum(1 for o in second.outcomes if o.resumed) == 3
+        platform.delete_post.assert_awaited_once_with("twitter-3")
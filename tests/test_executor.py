@@ -0,0 +1,144 @@
+"""Test concurrent platform executor."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from aetherpost.platforms.core.base_platform import Content, PlatformResult
+from aetherpost.platforms.core.executor import ConcurrentPlatformExecutor
+
+
+def make_platform(name, delay=0.0, success=True, raises=None):
+    """Create a mock platform that posts after ``delay`` seconds."""
+    platform = Mock()
+    platform.platform_name = name
+    platform.authenticate = AsyncMock(return_value=True)
+    platform.validate_content = AsyncMock(return_value={'is_valid': True, 'errors': []})
+    platform.cleanup = AsyncMock()
+    
+    async def post_content(content):
+        await asyncio.sleep(delay)
+        if raises:
+            raise raises
+        return PlatformResult(
+            success=success,
+            platform=name,
+            action="post_text",
+            post_id=f"{name}-1" if success else None,
+            post_url=f"https://{name}.example/1" if success else None,
+            error_message=None if success else "rejected"
+        )
+    
+    platform.post_content = post_content
+    return platform
+
+
+def make_factory(platforms):
+    """Create a mock factory returning the given platform mocks by name."""
+    factory = Mock()
+    factory.create_platform = Mock(side_effect=lambda platform_name, credentials: platforms[platform_name])
+    return factory
+
+
+CREDENTIALS = {
+    "twitter": {"api_key": "k"},
+    "bluesky": {"identifier": "i"},
+    "youtube": {"client_id": "c"},
+}
+
+
+class TestConcurrentPlatformExecutor:
+    """Test concurrent fan-out behaviour."""
+    
+    @pytest.mark.asyncio
+    async def test_posts_run_concurrently(self):
+        """Wall-clock time approaches the slowest platform, not the sum."""
+        platforms = {name: make_platform(name, delay=0.2) for name in CREDENTIALS}
+        executor = ConcurrentPlatformExecutor(max_concurrency=3, factory=make_factory(platforms))
+        content = {name: Content(text="hello") for name in CREDENTIALS}
+        
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        results = await executor.execute(content, CREDENTIALS)
+        elapsed = loop.time() - start
+        
+        assert [r.platform for r in results] == list(CREDENTIALS)
+        assert all(r.success for r in results)
+        assert elapsed < 0.5
+    
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated(self):
+        """One platform raising does not affect the others."""
+        platforms = {
+            "twitter": make_platform("twitter"),
+            "bluesky": make_platform("bluesky", raises=RuntimeError("boom")),
+            "youtube": make_platform("youtube", success=False),
+        }
+        executor = ConcurrentPlatformExecutor(factory=make_factory(platforms))
+        content = {name: Content(text="hello") for name in platforms}
+        
+        results = {r.platform: r for r in await executor.execute(content, CREDENTIALS)}
+        
+        assert results["twitter"].success
+        assert not results["bluesky"].success
+        assert "boom" in results["bluesky"].error
+        assert results["youtube"].error == "rejected"
+        for platform in platforms.values():
+            platform.cleanup.assert_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_timeout_per_platform(self):
+        """Slow platforms time out without delaying fast ones."""
+        platforms = {
+            "twitter": make_platform("twitter"),
+            "youtube": make_platform("youtube", delay=5),
+        }
+        executor = ConcurrentPlatformExecutor(platform_timeout=0.1, factory=make_factory(platforms))
+        content = {name: Content(text="hello") for name in platforms}
+        
+        results = {r.platform: r for r in await executor.execute(content, CREDENTIALS)}
+        
+        assert results["twitter"].success
+        assert not results["youtube"].success
+        assert "Timed out" in results["youtube"].error
+    
+    @pytest.mark.asyncio
+    async def test_on_complete_called_in_completion_order(self):
+        """Results are reported as each platform finishes."""
+        platforms = {
+            "twitter": make_platform("twitter", delay=0.2),
+            "bluesky": make_platform("bluesky", delay=0.0),
+        }
+        executor = ConcurrentPlatformExecutor(factory=make_factory(platforms))
+        content = {name: Content(text="hello") for name in platforms}
+        completed = []
+        
+        await executor.execute(content, CREDENTIALS, on_complete=lambda r: completed.append(r.platform))
+        
+        assert completed == ["bluesky", "twitter"]
+    
+    @pytest.mark.asyncio
+    async def test_missing_credentials(self):
+        """Platforms without credentials fail without being created."""
+        factory = make_factory({})
+        executor = ConcurrentPlatformExecutor(factory=factory)
+        
+        results = await executor.execute({"linkedin": Content(text="hi")}, CREDENTIALS)
+        
+        assert results[0].to_dict() == {"platform": "linkedin", "status": "failed", "error": "No credentials"}
+        factory.create_platform.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_results_use_requested_platform_key(self):
+        """Results carry the caller's key even when the instance names itself differently."""
+        platforms = {"twitter": make_platform("x")}
+        executor = ConcurrentPlatformExecutor(factory=make_factory(platforms))
+        completed = []
+        
+        results = await executor.execute(
+            {"twitter": Content(text="hello")}, CREDENTIALS, on_complete=lambda r: completed.append(r.platform)
+        )
+        
+        assert results[0].platform == "twitter"
+        assert results[0].success
+        assert completed == ["twitter"]
@@ -0,0 +1,67 @@
+"""Test the shared HTTP client layer."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aetherpost.platforms.core.http_client import HTTPClient
+
+
+def make_server():
+    async def ok(request):
+        return web.json_response({"text": "こんにちは"})
+    
+    async def missing(request):
+        return web.Response(status=404)
+    
+    app = web.Application()
+    app.router.add_get("/ok", ok)
+    app.router.add_get("/missing", missing)
+    return TestServer(app)
+
+
+class TestHTTPClient:
+    """Test connection sharing and request timing."""
+    
+    @pytest.mark.asyncio
+    async def test_sessions_share_connections(self):
+        server = make_server()
+        await server.start_server()
+        client = HTTPClient()
+        
+        for _ in range(3):
+            async with client.session() as session:
+                async with session.get(server.make_url("/ok")) as response:
+                    assert (await response.json())["text"] == "こんにちは"
+        
+        # Closing sessions leaves the connector and its kept-alive connection open
+        assert not client.connector.closed
+        assert sum(len(conns) for conns in client.connector._conns.values()) == 1
+        
+        await client.close()
+        assert client._connector is None
+        await server.close()
+    
+    @pytest.mark.asyncio
+    async def test_timing_hooks_and_stats(self):
+        server = make_server()
+        await server.start_server()
+        client = HTTPClient()
+        timings = []
+        client.add_timing_hook(timings.append)
+        
+        async with client.session() as session:
+            async with session.get(server.make_url("/ok")):
+                pass
+            async with session.get(server.make_url("/missing")):
+                pass
+        
+        assert [(t.method, t.status) for t in timings] == [("GET", 200), ("GET", 404)]
+        assert all(t.elapsed >= 0 for t in timings)
+        
+        stats = client.get_stats()[server.host]
+        assert stats["requests"] == 2
+        assert stats["errors"] == 1
+        
+        await client.close()
+        await server.close()
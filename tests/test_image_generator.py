@@ -0,0 +1,152 @@
+"""Test image rendering and the render cache."""
+
+import os
+import subprocess
+import sys
+import pytest
+from PIL import Image
+
+from aetherpost.core.media.image_generator import ImageGenerator, RenderJob
+from aetherpost.core.media.renderer import RenderCache, render_cache_key
+
+
+@pytest.fixture
+def generator(temp_dir):
+    return ImageGenerator({'cache_dir': str(temp_dir / "images"), 'render_workers': 0})
+
+
+class TestImageGenerator:
+    """Test that templates render real images."""
+    
+    @pytest.mark.asyncio
+    async def test_renders_platform_sized_png(self, generator):
+        path = await generator.create_social_media_image({'text': "新機能をリリースしました", 'platform': 'instagram'})
+        
+        with Image.open(path) as image:
+            assert image.format == "PNG"
+            assert image.size == (1080, 1080)
+    
+    @pytest.mark.asyncio
+    async def test_all_templates_render(self, generator):
+        paths = [
+            await generator.create_thumbnail({'title': "Ship faster", 'thumbnail_style': 'tech'}),
+            await generator.create_infographic({'title': "Q3", 'sections': [{'title': "Users", 'content': "+40%"}, "Revenue doubled"]}),
+            await generator.create_quote_image({'quote': "Simplicity is prerequisite for reliability.", 'author': "Dijkstra"}),
+        ]
+        
+        sizes = []
+        for path in paths:
+            with Image.open(path) as image:
+                sizes.append(image.size)
+        assert sizes == [(1280, 720), (1080, 1920), (1080, 1080)]
+    
+    @pytest.mark.asyncio
+    async def test_cached_render_reused(self, generator, monkeypatch):
+        content = {'text': "Hello", 'platform': 'twitter', 'effects': ['drop_shadow']}
+        first = await generator.create_social_media_image(content)
+        
+        async def fail(*args):
+            raise AssertionError("re-rendered a cached image")
+        
+        monkeypatch.setattr(generator, "_render", fail)
+        assert await generator.create_social_media_image(dict(reversed(list(content.items())))) == first
+    
+    @pytest.mark.asyncio
+    async def test_carousel_on_process_pool(self, temp_dir):
+        generator = ImageGenerator({'cache_dir': str(temp_dir / "images"), 'render_workers': 2})
+        try:
+            paths = await generator.create_carousel_images({'slides': [{'text': f"Slide {i}"} for i in range(3)]})
+        finally:
+            await generator.close()
+        
+        assert len(set(paths)) == 3
+        assert all(os.path.getsize(path) > 0 for path in paths)
+    
+    
+    @pytest.mark.asyncio
+    async def test_batch_dedupes_and_streams(self, generator, monkeypatch):
+        rendered = []
+        render = generator._render
+        
+        async def counting_render(kind, config, output_path):
+            rendered.append(config['text'])
+            await render(kind, config, output_path)
+        
+        monkeypatch.setattr(generator, "_render", counting_render)
+        jobs = [
+            RenderJob('social', {'text': f"Slide {i}", 'platform': platform})
+            for platform in ("twitter", "instagram")
+            for i in range(3)
+        ]
+        jobs.append(RenderJob('social', {'text': "Slide 0", 'platform': "twitter"}))
+        
+        results = [result async for result in generator.render_batch(jobs, max_concurrency=2)]
+        
+        assert sorted(result.index for result in results) == list(range(7))
+        assert len(rendered) == 6
+        paths = {result.index: result.path for result in results}
+        assert paths[0] == paths[6]
+        assert all(result.error is None for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_batch_reports_failed_jobs(self, generator):
+        jobs = [RenderJob('quote', {'author': "no quote"}), RenderJob('quote', {'quote': "ok"})]
+        
+        results = {result.index: result async for result in generator.render_batch(jobs)}
+        
+        assert results[0].error and results[0].path is None
+        assert results[1].path
+        with pytest.raises(RuntimeError):
+            await generator.render_all(jobs)
+
+
+class TestRenderCache:
+    """Test cache keys and size-bounded eviction."""
+    
+    def test_key_stable_for_nested_values(self):
+        a = {'title': "x", 'sections': [{'b': 1, 'a': 2}], 'dimensions': (1080, 1920)}
+        b = {'dimensions': [1080, 1920], 'sections': [{'a': 2, 'b': 1}], 'title': "x"}
+        
+        assert render_cache_key('image', a) == render_cache_key('image', b)
+        assert render_cache_key('image', a) != render_cache_key('thumbnail', a)
+    
+    def test_evicts_least_recently_used(self, temp_dir):
+        cache = RenderCache(str(temp_dir), max_bytes=2500)
+        paths = [cache.path_for(name) for name in ("a", "b", "c")]
+        
+        for i, path in enumerate(paths[:2]):
+            with open(path, "wb") as f:
+                f.write(b"x" * 1000)
+            os.utime(path, (1000 + i, 1000 + i))
+            cache.put(path)
+        
+        # Touching "a" makes "b" the least recently used
+        assert cache.get(paths[0])
+        with open(paths[2], "wb") as f:
+            f.write(b"x" * 1000)
+        cache.put(paths[2])
+        
+        assert [os.path.exists(path) for path in paths] == [True, False, True]
+        assert not cache.get(paths[1])
+        assert cache.stats['evictions'] == 1
+
+
+class TestOptionalPillow:
+    """Test that Pillow is only needed to render."""
+    
+    def test_media_imports_without_pillow(self):
+        script = (
+            "import sys; sys.modules['PIL'] = None\n"
+            "import aetherpost.core.media.avatar_generator\n"
+            "from aetherpost.core.media.image_generator import ImageGenerator\n"
+            "from aetherpost.core.media.renderer import render_to_file\n"
+            "try:\n"
+            "    render_to_file('social', {}, 'unused.png')\n"
+            "except ImportError as e:\n"
+            "    print(e)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, timeout=60)
+        
+        assert result.returncode == 0, result.stderr
+        assert "pip install pillow" in result.stdout
@@ -0,0 +1,56 @@
+"""Test that importing core modules starts no threads and opens no files."""
+
+import json
+import os
+import subprocess
+import sys
+
+from aetherpost.platforms.core.platform_registry import PlatformRegistry
+
+IMPORT_SCRIPT = """
+import json, sys, threading
+import aetherpost.core.cache
+import aetherpost.core.logging
+import aetherpost.core.logging.logger
+import aetherpost.core.resilience.rate_limiter
+import aetherpost.core.analytics.realtime
+import aetherpost.platforms.core.platform_factory
+print(json.dumps({
+    "threads": threading.active_count(),
+    "modules": sorted(m for m in ("redis", "aioredis", "tweepy") if m in sys.modules),
+    "platforms": sorted(m for m in sys.modules if ".implementations." in m),
+}))
+"""
+
+
+class TestImportSideEffects:
+    """Test lazily initialized singletons."""
+    
+    def test_import_is_side_effect_free(self, temp_dir):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            capture_output=True, text=True, env=env, cwd=temp_dir, timeout=60
+        )
+        
+        assert result.returncode == 0, result.stderr
+        state = json.loads(result.stdout.strip().splitlines()[-1])
+        assert state == {"threads": 1, "modules": [], "platforms": []}
+        assert list(temp_dir.iterdir()) == []
+    
+    def test_registry_imports_only_requested_platform(self, monkeypatch):
+        registry = PlatformRegistry()
+        imported = []
+        real_discover = PlatformRegistry._discover_platform_from_file
+        
+        def recording_discover(self, platform_file):
+            imported.append(platform_file.stem)
+            return real_discover(self, platform_file)
+        
+        monkeypatch.setattr(PlatformRegistry, "_discover_platform_from_file", recording_discover)
+        
+        assert {"bluesky", "twitter"} <= set(registry.get_available_platforms())
+        assert imported == []
+        
+        assert registry.get_platform_class("bluesky").__name__ == "BlueskyPlatform"
+        assert imported == ["bluesky_platform"]
@@ -0,0 +1,148 @@
+"""Test the content-addressed media registry."""
+
+import asyncio
+import pytest
+
+from aetherpost.platforms.core.base_platform import Content, PlatformResult
+from aetherpost.platforms.core.media_registry import MediaRegistry
+from aetherpost.platforms.core.pool import credential_fingerprint
+from aetherpost.platforms.implementations.bluesky_platform import BlueskyPlatform
+
+
+@pytest.fixture
+def registry(temp_dir):
+    return MediaRegistry(str(temp_dir / "media_registry.json"))
+
+
+def make_uploader(reference="ref-1"):
+    calls = []
+    
+    async def upload():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return reference
+    
+    upload.calls = calls
+    return upload
+
+
+class TestMediaRegistry:
+    """Test upload reuse by file content."""
+    
+    @pytest.mark.asyncio
+    async def test_same_content_uploaded_once(self, registry, temp_dir):
+        original = temp_dir / "banner.png"
+        copy = temp_dir / "banner-copy.png"
+        original.write_bytes(b"image bytes")
+        copy.write_bytes(b"image bytes")
+        upload = make_uploader()
+        
+        assert await registry.get_or_upload("twitter", "acct", str(original), upload) == "ref-1"
+        assert await registry.get_or_upload("twitter", "acct", str(copy), upload) == "ref-1"
+        
+        # Other accounts and platforms need their own upload
+        await registry.get_or_upload("twitter", "other", str(copy), upload)
+        await registry.get_or_upload("bluesky", "acct", str(copy), upload)
+        
+        assert len(upload.calls) == 3
+        assert registry.stats == {"hits": 1, "uploads": 3}
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_upload(self, registry, temp_dir):
+        path = temp_dir / "image.png"
+        path.write_bytes(b"image bytes")
+        upload = make_uploader()
+        
+        results = await asyncio.gather(*(
+            registry.get_or_upload("bluesky", "acct", str(path), upload) for _ in range(3)
+        ))
+        
+        assert results == ["ref-1"] * 3
+        assert len(upload.calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_references_expire_and_persist(self, registry, temp_dir):
+        path = temp_dir / "image.png"
+        path.write_bytes(b"image bytes")
+        await registry.get_or_upload("twitter", "acct", str(path), make_uploader())
+        assert not registry.registry_file.exists()
+        registry.flush()
+        
+        reloaded = MediaRegistry(str(registry.registry_file))
+        assert await reloaded.lookup("twitter", "acct", str(path)) == "ref-1"
+        
+        expired = MediaRegistry(str(registry.registry_file))
+        expired._load()[next(iter(expired._load()))].expires_at = 0
+        assert await expired.lookup("twitter", "acct", str(path)) is None
+        
+        # Edited files are a different asset
+        path.write_bytes(b"new image bytes")
+        assert await reloaded.lookup("twitter", "acct", str(path)) is None
+    
+    @pytest.mark.asyncio
+    async def test_failed_upload_not_remembered(self, registry, temp_dir):
+        path = temp_dir / "image.png"
+        path.write_bytes(b"image bytes")
+        
+        assert await registry.get_or_upload("bluesky", "acct", str(path), make_uploader(None)) is None
+        assert await registry.lookup("bluesky", "acct", str(path)) is None
+    
+    @pytest.mark.asyncio
+    async def test_bluesky_reuses_blob(self, registry, temp_dir, monkeypatch):
+        path = temp_dir / "image.png"
+        path.write_bytes(b"image bytes")
+        platform = BlueskyPlatform({"identifier": "user.bsky.social", "password": "secret"})
+        platform.media_registry = registry
+        sent = []
+        
+        async def send_blob(file_path):
+            sent.append(file_path)
+            return {"ref": {"$link": "bafy"}}
+        
+        monkeypatch.setattr(platform, "_send_blob", send_blob)
+        
+        for _ in range(2):
+            assert await platform._upload_blob(str(path)) == {"ref": {"$link": "bafy"}}
+        assert sent == [str(path)]
+    
+    @pytest.mark.asyncio
+    async def test_records_written_in_one_batch(self, temp_dir, monkeypatch):
+        registry = MediaRegistry(str(temp_dir / "media_registry.json"), flush_delay=0.05)
+        writes = []
+        write = registry._write
+        monkeypatch.setattr(registry, "_write", lambda: writes.append(1) or write())
+        
+        for i in range(5):
+            path = temp_dir / f"image{i}.png"
+            path.write_bytes(f"image {i}".encode())
+            await registry.record("bluesky", "acct", str(path), f"ref-{i}")
+        assert writes == []
+        
+        await asyncio.sleep(0.1)
+        assert writes == [1]
+        assert len(MediaRegistry(str(registry.registry_file))._load()) == 5
+    
+    @pytest.mark.asyncio
+    async def test_rejected_reference_uploaded_again(self, registry, temp_dir):
+        path = temp_dir / "image.png"
+        path.write_bytes(b"image bytes")
+        platform = BlueskyPlatform({"identifier": "user.bsky.social", "password": "secret"})
+        platform.media_registry = registry
+        await platform._cached_upload(str(path), make_uploader("stale"))
+        upload = make_uploader("fresh")
+        posted = []
+        
+        async def post_content_impl(content):
+            reference = await platform._cached_upload(str(path), upload)
+            posted.append(reference)
+            if reference == "stale":
+                return PlatformResult(success=False, platform="bluesky", action="post", error_message="BlobNotFound")
+            return PlatformResult(success=True, platform="bluesky", action="post", post_id="1")
+        
+        platform._post_content_impl = post_content_impl
+        result = await platform._post_with_fresh_media("post_text", Content(text="hello"))
+        
+        assert result.success
+        assert posted == ["stale", "fresh"]
+        assert len(upload.calls) == 1
+        assert await registry.lookup("bluesky", credential_fingerprint(platform.credentials), str(path)) == "fresh"
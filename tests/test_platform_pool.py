@@ -0,0 +1,143 @@
+"""Test the authenticated platform pool."""
+
+import base64
+import json
+import pytest
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+from aetherpost.platforms.core.authentication.base_authenticator import AuthSession
+from aetherpost.platforms.core.base_platform import Content, PlatformResult
+from aetherpost.platforms.core.executor import ConcurrentPlatformExecutor
+from aetherpost.platforms.core.pool import PlatformPool
+from aetherpost.platforms.implementations.bluesky_platform import BlueskyPlatform
+
+
+def make_platform(name, expires_in=None, authenticates=True):
+    """Create a mock platform whose session expires after ``expires_in`` seconds."""
+    platform = Mock()
+    platform.platform_name = name
+    platform.auth_session = AuthSession(
+        platform=name,
+        auth_type="jwt",
+        expires_at=datetime.utcnow() + timedelta(seconds=expires_in) if expires_in else None
+    )
+    platform.authenticate = AsyncMock(return_value=authenticates)
+    platform.refresh_authentication = AsyncMock(return_value=True)
+    platform.validate_content = AsyncMock(return_value={'is_valid': True, 'errors': []})
+    platform.post_content = AsyncMock(return_value=PlatformResult(success=True, platform=name, action="post_text", post_id="1"))
+    platform.cleanup = AsyncMock()
+    return platform
+
+
+def make_factory(**kwargs):
+    """Factory creating a fresh mock platform on every call."""
+    factory = Mock()
+    factory.created = []
+    
+    def create_platform(platform_name, credentials):
+        platform = make_platform(platform_name, **kwargs)
+        factory.created.append(platform)
+        return platform
+    
+    factory.create_platform = Mock(side_effect=create_platform)
+    return factory
+
+
+class TestPlatformPool:
+    """Test login reuse, refresh and release."""
+    
+    @pytest.mark.asyncio
+    async def test_reuses_login_per_credentials(self):
+        factory = make_factory()
+        pool = PlatformPool(factory=factory)
+        
+        first = await pool.acquire("bluesky", {"identifier": "a"})
+        second = await pool.acquire("bluesky", {"identifier": "a"})
+        other = await pool.acquire("bluesky", {"identifier": "b"})
+        
+        assert first is second
+        assert other is not first
+        assert len(pool) == 2
+        assert first.authenticate.await_count == 1
+        
+        await pool.close()
+        for platform in factory.created:
+            platform.cleanup.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_refreshes_before_expiry(self):
+        factory = make_factory(expires_in=120)
+        pool = PlatformPool(factory=factory, refresh_margin=300)
+        
+        platform = await pool.acquire("bluesky", {"identifier": "a"})
+        assert await pool.acquire("bluesky", {"identifier": "a"}) is platform
+        
+        platform.refresh_authentication.assert_awaited_once()
+        assert platform.authenticate.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_login_is_not_pooled(self):
+        factory = make_factory(authenticates=False)
+        pool = PlatformPool(factory=factory)
+        
+        assert await pool.acquire("twitter", {"api_key": "k"}) is None
+        assert len(pool) == 0
+        factory.created[0].cleanup.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_waits_for_leases(self):
+        factory = make_factory()
+        pool = PlatformPool(factory=factory)
+        credentials = {"identifier": "a"}
+        
+        first = await pool.acquire("bluesky", credentials)
+        second = await pool.acquire("bluesky", credentials)
+        assert first is second
+        
+        # One worker's error must not close the instance the other is using
+        await pool.invalidate("bluesky", credentials)
+        assert len(pool) == 0
+        await pool.release(first)
+        first.cleanup.assert_not_awaited()
+        
+        async with pool.lease("bluesky", credentials) as fresh:
+            assert fresh is not first
+        
+        await pool.release(second)
+        first.cleanup.assert_awaited_once()
+        fresh.cleanup.assert_not_awaited()
+        
+        await pool.close()
+        fresh.cleanup.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_executor_posts_through_pool(self):
+        factory = make_factory()
+        pool = PlatformPool(factory=factory)
+        executor = ConcurrentPlatformExecutor(pool=pool)
+        credentials = {"twitter": {"api_key": "k"}}
+        
+        for _ in range(3):
+            results = await executor.execute({"twitter": Content(text="hello")}, credentials)
+            assert results[0].success
+        
+        platform, = factory.created
+        assert platform.authenticate.await_count == 1
+        assert platform.post_content.await_count == 3
+        platform.cleanup.assert_not_awaited()
+
+
+class TestBlueskySession:
+    """Test that Bluesky exposes its token lifetime to the pool."""
+    
+    def test_session_expiry_from_access_jwt(self):
+        exp = int(time.time()) + 7200
+        payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+        platform = BlueskyPlatform({"identifier": "user.bsky.social", "password": "secret"})
+        
+        platform._store_session({"accessJwt": f"h.{payload}.s", "refreshJwt": "r", "did": "did:plc:1"})
+        
+        assert platform.auth_session.refresh_token == "r"
+        assert 7100 < platform.auth_session.expires_in_seconds <= 7200
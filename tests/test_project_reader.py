@@ -0,0 +1,131 @@
+"""Test project context scanning."""
+
+import os
+import pytest
+
+from aetherpost.core.context import scanner
+from aetherpost.core.context.project_reader import ProjectContextReader
+from aetherpost.core.context.secrets import SecretScanner
+
+
+@pytest.fixture
+def project(temp_dir):
+    (temp_dir / "campaign.yaml").write_text("context:\n  enabled: true\n  watch: ['.']\n")
+    (temp_dir / "src").mkdir()
+    (temp_dir / "src" / "app.py").write_text("print('hello')\n")
+    (temp_dir / "README.md").write_text("# Demo\n")
+    (temp_dir / "node_modules" / "pkg").mkdir(parents=True)
+    (temp_dir / "node_modules" / "pkg" / "index.js").write_text("module.exports = 1\n")
+    (temp_dir / "debug.log").write_text("noise\n")
+    return temp_dir
+
+
+@pytest.fixture
+def reader(project):
+    reader = ProjectContextReader()
+    reader.project_root = project
+    return reader
+
+
+def read_paths(reader):
+    context = reader.read_project_context(str(reader.project_root / "campaign.yaml"))
+    return sorted(f.relative_path for f in context.files)
+
+
+class TestProjectScanner:
+    """Test pruning and incremental rescans."""
+    
+    def test_excluded_directories_are_not_descended(self, reader, monkeypatch):
+        visited = []
+        real_scandir = os.scandir
+        
+        def recording_scandir(path):
+            visited.append(os.path.basename(path))
+            return real_scandir(path)
+        
+        monkeypatch.setattr(scanner.os, 'scandir', recording_scandir)
+        
+        assert read_paths(reader) == ["README.md", "campaign.yaml", os.path.join("src", "app.py")]
+        assert "node_modules" not in visited
+        assert "pkg" not in visited
+    
+    def test_rescan_reads_only_changed_files(self, reader, project, monkeypatch):
+        first = read_paths(reader)
+        
+        opened = []
+        real_read = ProjectContextReader._read_file_safely
+        
+        def recording_read(self, file_path):
+            opened.append(file_path.name)
+            return real_read(self, file_path)
+        
+        monkeypatch.setattr(ProjectContextReader, '_read_file_safely', recording_read)
+        
+        assert read_paths(reader) == first
+        assert opened == []
+        
+        (project / "README.md").write_text("# Demo\n\nNow with more features.\n")
+        context = reader.read_project_context(str(project / "campaign.yaml"))
+        
+        assert opened == ["README.md"]
+        readme = next(f for f in context.files if f.relative_path == "README.md")
+        assert "more features" in readme.content
+    
+    def test_skipped_files_stay_skipped_without_rereading(self, reader, project, monkeypatch):
+        (project / "settings.py").write_text("password = 'hunter2'\n")
+        assert "settings.py" not in read_paths(reader)
+        
+        monkeypatch.setattr(ProjectContextReader, '_read_file_safely', lambda self, path: pytest.fail(f"re-read {path}"))
+        
+        assert "settings.py" not in read_paths(reader)
+    
+    def test_rule_changes_invalidate_index(self, reader, project, monkeypatch):
+        read_paths(reader)
+        monkeypatch.setattr(ProjectContextReader, 'MAX_FILE_SIZE', 4)
+        
+        assert read_paths(reader) == []
+
+
+class TestSecretScanner:
+    """Test rule reporting and chunked scanning."""
+    
+    def test_reports_matching_rule(self):
+        scanner = SecretScanner()
+        
+        assert scanner.scan("print('hello')\n") is None
+        match = scanner.scan("name = 'demo'\nSLACK = 'xoxb-1234-abcd'\n")
+        assert (match.rule, match.line) == ("slack_token", 2)
+        assert scanner.scan("config.api_key: abc123").rule == "api_key"
+    
+    def test_secret_across_chunk_boundary(self):
+        scanner = SecretScanner(chunk_size=16, overlap=64)
+        text = "x = 1\n" * 10 + "token: 'abcdef123456'\n"
+        stream = scanner.stream()
+        
+        for start in range(0, len(text), scanner.chunk_size):
+            if stream.feed(text[start:start + scanner.chunk_size]):
+                break
+        
+        assert stream.match.rule == "token"
+        assert stream.match.offset == text.index("token")
+        assert stream.match.line == 11
+    
+    def test_line_anchor_respects_chunk_context(self):
+        scanner = SecretScanner(overlap=8)
+        
+        mid_line = scanner.stream()
+        mid_line.feed("MY_API")
+        assert mid_line.feed("_KEY=\n") is None
+        
+        line_start = scanner.stream()
+        line_start.feed("x = 1\n")
+        assert line_start.feed("KEY=\n").rule == "env_assignment"
+    
+    def test_large_files_streamed(self, reader, project):
+        padding = "# filler line\n" * 2000
+        (project / "src" / "big.py").write_text(padding + "password = 'hunter2'\n")
+        (project / "src" / "notes.py").write_text(padding)
+        
+        paths = read_paths(reader)
+        assert os.path.join("src", "big.py") not in paths
+        assert os.path.join("src", "notes.py") in paths
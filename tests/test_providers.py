@@ -0,0 +1,74 @@
+"""Test async AI provider layer."""
+
+import asyncio
+import pytest
+
+from aetherpost.core.content.providers import AIProvider, ProviderPool
+
+
+class FakeProvider(AIProvider):
+    """Provider with a fixed simulated latency."""
+    
+    def __init__(self, provider_name, latency=0.0, fail=False, **kwargs):
+        super().__init__(api_key="test", model="test", **kwargs)
+        self._name = provider_name
+        self.latency = latency
+        self.fail = fail
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    @property
+    def name(self):
+        return self._name
+    
+    def _create_client(self):
+        return object()
+    
+    async def _complete(self, prompt, max_tokens, temperature):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.fail:
+                raise RuntimeError("provider down")
+            return f"{self._name}: {prompt}"
+        finally:
+            self.in_flight -= 1
+
+
+class TestProviderPool:
+    """Test latency-aware ordering and bounded concurrency."""
+    
+    def test_preference_order_without_samples(self):
+        pool = ProviderPool([FakeProvider("anthropic"), FakeProvider("openai")])
+        assert [p.name for p in pool.ordered()] == ["anthropic", "openai"]
+    
+    @pytest.mark.asyncio
+    async def test_faster_provider_moves_first(self):
+        slow = FakeProvider("anthropic", latency=0.05)
+        fast = FakeProvider("openai", latency=0.0)
+        pool = ProviderPool([slow, fast])
+        
+        await slow.generate("hi")
+        await fast.generate("hi")
+        
+        assert [p.name for p in pool.ordered()] == ["openai", "anthropic"]
+    
+    @pytest.mark.asyncio
+    async def test_failed_provider_tried_last(self):
+        broken = FakeProvider("anthropic", fail=True)
+        pool = ProviderPool([broken, FakeProvider("openai")])
+        
+        with pytest.raises(RuntimeError):
+            await broken.generate("hi")
+        
+        assert [p.name for p in pool.ordered()] == ["openai", "anthropic"]
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        provider = FakeProvider("openai", latency=0.02, max_concurrency=2)
+        
+        results = await asyncio.gather(*[provider.generate(str(i)) for i in range(6)])
+        
+        assert len(results) == 6
+        assert provider.max_in_flight == 2
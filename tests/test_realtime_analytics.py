@@ -0,0 +1,89 @@
+"""Test real-time analytics windows."""
+
+import pytest
+
+from aetherpost.core.analytics.realtime import RealTimeAnalytics, MetricType
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def analytics(temp_dir, monkeypatch, clock):
+    monkeypatch.chdir(temp_dir)
+    monkeypatch.setattr(RealTimeAnalytics, "_start_background_tasks", lambda self: None)
+    return RealTimeAnalytics(clock=clock)
+
+
+class TestRealTimeAnalytics:
+    """Test incremental aggregates and expiry."""
+    
+    def test_snapshot_aggregates(self, analytics):
+        analytics.record_post_engagement("twitter", likes=10, shares=5, comments=5, reach=100)
+        analytics.record_post_engagement("bluesky", likes=1, shares=0, comments=1, reach=50)
+        analytics.record_performance_metric("post", 200)
+        analytics.record_performance_metric("post", 400)
+        analytics.record_error("timeout", "bluesky")
+        
+        snapshot = analytics.get_current_snapshot()
+        
+        assert snapshot.total_posts == 8
+        assert snapshot.total_reach == 150
+        assert snapshot.top_performing_platform == "twitter"
+        assert sorted(snapshot.platforms_active) == ["bluesky", "twitter"]
+        assert snapshot.performance_metrics == {"performance_post": 300}
+        assert snapshot.error_rate == round(1 / 13 * 100, 2)
+        assert snapshot.recent_activity[0]["name"] == "error_count"
+        assert len(snapshot.recent_activity) == 10
+    
+    def test_metrics_expire_from_windows(self, analytics, clock):
+        analytics.record_post_engagement("twitter", likes=10, shares=0, comments=0, reach=100)
+        clock.now += 3601
+        analytics.record_post_engagement("bluesky", likes=1, shares=0, comments=0, reach=10)
+        
+        snapshot = analytics.get_current_snapshot()
+        assert snapshot.platforms_active == ["bluesky"]
+        assert snapshot.total_reach == 10
+        assert list(analytics.get_platform_comparison()) == ["bluesky"]
+        assert len(analytics.metrics) == 10
+        
+        clock.now += 86400
+        assert analytics.get_current_snapshot().total_posts == 0
+        assert len(analytics.metrics) == 0
+        assert analytics.get_trend_data("post_likes") == []
+    
+    def test_trend_data_hourly_averages(self, analytics, clock):
+        clock.now = 1_700_005_200.0  # 40 minutes into an hour
+        analytics.record_metric("engagement_rate", 2.0, MetricType.ENGAGEMENT, "twitter")
+        analytics.record_metric("engagement_rate", 4.0, MetricType.ENGAGEMENT, "twitter")
+        clock.now += 3600
+        analytics.record_metric("engagement_rate", 10.0, MetricType.ENGAGEMENT, "twitter")
+        
+        trend = analytics.get_trend_data("engagement_rate")
+        assert [(point["value"], point["count"]) for point in trend] == [(3.0, 2), (10.0, 1)]
+        
+        # Cutoff falls inside the first hour, after its values were recorded
+        clock.now += 600
+        assert [point["value"] for point in analytics.get_trend_data("engagement_rate", hours=1)] == [10.0]
+    
+    def test_platform_comparison(self, analytics):
+        analytics.record_post_engagement("twitter", likes=10, shares=0, comments=0, reach=100)
+        analytics.record_post_engagement("twitter", likes=30, shares=0, comments=0, reach=100)
+        
+        comparison = analytics.get_platform_comparison()["twitter"]
+        
+        assert comparison["total_reach"] == 200
+        assert comparison["post_count"] == 8
+        assert comparison["avg_engagement_rate"] == 20.0
@@ -0,0 +1,268 @@
+"""Test the event-driven posting scheduler."""
+
+import asyncio
+import json
+import pytest
+import signal
+from collections import Counter
+from datetime import datetime, timedelta
+
+from aetherpost.core.exceptions import RateLimitError
+from aetherpost.core.scheduler.background import BackgroundScheduler
+from aetherpost.core.scheduler.executor import ScheduledPostExecutor
+from aetherpost.core.scheduler.models import ScheduledPost, ScheduleStatus
+from aetherpost.core.scheduler.scheduler import PostingScheduler
+
+
+def make_post(post_id, minutes, status=ScheduleStatus.PENDING, platforms=("twitter",)):
+    return ScheduledPost(
+        id=post_id,
+        campaign_file="campaign.yaml",
+        scheduled_time=datetime.utcnow() + timedelta(minutes=minutes),
+        platforms=list(platforms),
+        status=status
+    )
+
+
+class BurstLimits:
+    """Rate limit manager admitting ``burst`` requests per platform."""
+    
+    def __init__(self, burst=100):
+        self.burst = burst
+        self.admitted = Counter()
+    
+    def seconds_until_available(self, platforms):
+        return 30 if any(self.admitted[p] >= self.burst for p in platforms) else 0
+    
+    async def acquire(self, platform, endpoint="default"):
+        self.admitted[platform] += 1
+        return True
+    
+    async def release(self, platform):
+        self.admitted[platform] -= 1
+    
+    def record_success(self, platform):
+        pass
+
+
+@pytest.fixture
+def scheduler(temp_dir, monkeypatch):
+    monkeypatch.chdir(temp_dir)
+    return PostingScheduler(str(temp_dir / ".aetherpost"))
+
+
+@pytest.fixture
+def background(temp_dir, monkeypatch):
+    monkeypatch.chdir(temp_dir)
+    # Keep the test runner's own signal handlers
+    monkeypatch.setattr(signal, "signal", lambda signum, handler: None)
+    background = BackgroundScheduler(check_interval_seconds=3600, aetherpost_dir=str(temp_dir / ".aetherpost"))
+    background.executor._rate_limits = BurstLimits()
+    return background
+
+
+class TestPostingScheduler:
+    """Test the in-memory due-time queue."""
+    
+    def test_pending_posts_in_due_order(self, scheduler):
+        scheduler.save_schedule([
+            make_post("later", -1),
+            make_post("future", 30),
+            make_post("earlier", -10),
+            make_post("done", -20, ScheduleStatus.COMPLETED),
+        ])
+        
+        assert [post.id for post in scheduler.get_pending_posts()] == ["earlier", "later"]
+        assert [post.id for post in scheduler.get_pending_posts()] == ["earlier", "later"]
+        assert scheduler.next_due_time() == scheduler._posts["earlier"].scheduled_time
+    
+    def test_schedule_file_parsed_only_when_changed(self, scheduler, monkeypatch):
+        scheduler.save_schedule([make_post("a", -1)])
+        reads = []
+        read = scheduler._read_schedule_file
+        monkeypatch.setattr(scheduler, "_read_schedule_file", lambda: reads.append(1) or read())
+        
+        for _ in range(3):
+            scheduler.get_pending_posts()
+        assert reads == []
+        
+        # Another process rewrites the schedule
+        other = PostingScheduler(str(scheduler.aetherpost_dir))
+        other.save_schedule([make_post("a", -1), make_post("b", -2)])
+        
+        assert [post.id for post in scheduler.get_pending_posts()] == ["b", "a"]
+        assert reads == [1]
+    
+    def test_status_updates_requeue_post(self, scheduler):
+        post = make_post("a", -1)
+        scheduler.save_schedule([post])
+        
+        post.status = ScheduleStatus.RUNNING
+        scheduler._update_post_in_schedule(post)
+        assert scheduler.get_pending_posts() == []
+        assert scheduler.next_due_time() is None
+        
+        post.mark_attempt("boom")
+        scheduler._update_post_in_schedule(post)
+        assert scheduler.get_pending_posts() == []
+        assert scheduler.next_due_time() > datetime.utcnow()
+        
+        saved = json.loads(scheduler.schedule_file.read_text())
+        assert saved["posts"][0]["status"] == "failed"
+    
+    def test_reload_keeps_retry_backoff(self, scheduler):
+        post = make_post("a", -10)
+        post.mark_attempt("boom")
+        scheduler.save_schedule([post])
+        
+        reloaded = PostingScheduler(str(scheduler.aetherpost_dir))
+        
+        assert reloaded.get_pending_posts() == []
+        assert reloaded.next_due_time() == post.last_attempt_at + reloaded.retry_delay
+    
+    def test_deferred_post_leaves_due_queue(self, scheduler):
+        post = make_post("a", -1)
+        scheduler.save_schedule([post])
+        until = datetime.utcnow() + timedelta(seconds=30)
+        
+        scheduler.defer_post(post, until)
+        
+        assert scheduler.get_pending_posts() == []
+        assert scheduler.next_due_time() == until
+    
+    @pytest.mark.asyncio
+    async def test_execution_closes_content_generator(self, scheduler, monkeypatch):
+        from aetherpost.core.content import generator as generator_module
+        
+        class FailingGenerator:
+            instances = []
+            
+            def __init__(self, credentials):
+                self.closed = False
+                FailingGenerator.instances.append(self)
+            
+            async def generate_content_batch(self, config, platforms):
+                raise RuntimeError("provider down")
+            
+            async def close(self):
+                self.closed = True
+        
+        class StubLoader:
+            def load_campaign_config(self, campaign_file):
+                return object()
+            
+            def load_credentials(self):
+                return {}
+        
+        monkeypatch.setattr(generator_module, "ContentGenerator", FailingGenerator)
+        scheduler.config_loader = StubLoader()
+        post = make_post("a", -1)
+        scheduler.save_schedule([post])
+        
+        assert await scheduler.execute_scheduled_post(post) is False
+        assert [generator.closed for generator in FailingGenerator.instances] == [True]
+        assert post.status == ScheduleStatus.FAILED
+
+
+class TestScheduledPostExecutor:
+    """Test the worker pool and rate limit admission."""
+    
+    @pytest.mark.asyncio
+    async def test_runs_posts_concurrently_in_order(self):
+        started = []
+        in_flight = Counter()
+        
+        async def execute(post):
+            started.append(post.id)
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return post.id != "3"
+        
+        executor = ScheduledPostExecutor(execute, max_workers=3, rate_limits=BurstLimits())
+        posts = [make_post(str(i), -10 + i) for i in range(8)]
+        
+        summary = await executor.run(posts)
+        
+        assert started == [post.id for post in posts]
+        assert in_flight["max"] == 3
+        assert summary.failed == ["3"]
+        assert len(summary.executed) == 7
+    
+    @pytest.mark.asyncio
+    async def test_rate_limited_platform_does_not_block_others(self):
+        deferred = {}
+        
+        async def execute(post):
+            return True
+        
+        executor = ScheduledPostExecutor(
+            execute,
+            defer=lambda post, until: deferred.setdefault(post.id, until),
+            rate_limits=BurstLimits(burst=1)
+        )
+        posts = [
+            make_post("t1", -4),
+            make_post("t2", -3),
+            make_post("b1", -2, platforms=["bluesky"]),
+            make_post("t3", -1),
+        ]
+        
+        summary = await executor.run(posts)
+        
+        assert sorted(summary.executed) == ["b1", "t1"]
+        assert sorted(deferred) == ["t2", "t3"]
+        assert all(until > datetime.utcnow() for until in deferred.values())
+    
+    @pytest.mark.asyncio
+    async def test_refused_admission_releases_reserved_platforms(self):
+        class RacingLimits(BurstLimits):
+            """Bluesky passes the check but is exhausted by the time it is acquired."""
+            
+            async def acquire(self, platform, endpoint="default"):
+                if platform == "bluesky":
+                    raise RateLimitError(platform, retry_after=20)
+                return await super().acquire(platform, endpoint)
+        
+        async def execute(post):
+            return True
+        
+        limits = RacingLimits()
+        executor = ScheduledPostExecutor(execute, rate_limits=limits)
+        
+        summary = await executor.run([make_post("a", -1, platforms=["twitter", "bluesky"])])
+        
+        assert list(summary.deferred) == ["a"]
+        assert limits.admitted["twitter"] == 0
+
+
+class TestBackgroundScheduler:
+    """Test that the loop sleeps until work is due."""
+    
+    @pytest.mark.asyncio
+    async def test_wakes_on_schedule_change(self, background, monkeypatch):
+        executed = asyncio.Event()
+        
+        async def execute(post):
+            post.mark_completed({"twitter": "1"})
+            background.scheduler._update_post_in_schedule(post)
+            executed.set()
+            return True
+        
+        monkeypatch.setattr(background.scheduler, "execute_scheduled_post", execute)
+        task = asyncio.create_task(background.start())
+        await asyncio.sleep(0.05)
+        
+        background.scheduler.save_schedule([make_post("a", -1)])
+        await asyncio.wait_for(executed.wait(), timeout=1)
+        
+        background.stop()
+        await task
+        assert background.stats["posts_executed"] == 1
+    
+    def test_sleep_bounded_by_next_due(self, background):
+        assert background._seconds_until_next_due() == 3600
+        
+        background.scheduler.save_schedule([make_post("a", 2)])
+        assert 100 < background._seconds_until_next_due() <= 120
@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime
 
 from aetherpost.core.state.manager import StateManager, PostRecord, CampaignState
+from aetherpost.core.state.backends import JSONStateBackend, SQLiteStateBackend
 
 
 class TestStateManager:
@@ -229,4 +230,151 @@ class TestPostRecord:
         )
         
         assert post.metrics["likes"] == 42
-        assert post.metrics["retweets"] == 12
\ No newline at end of file
+        assert post.metrics["retweets"] == 12
+
+
+class TestSQLiteStateBackend:
+    """Test the indexed SQLite state backend."""
+    
+    @pytest.fixture
+    def sqlite_manager(self, temp_dir):
+        return StateManager(str(temp_dir / "promo.state.json"), backend="sqlite")
+    
+    def test_backend_selection(self, temp_dir, sqlite_manager, monkeypatch):
+        """SQLite is the default and stores state next to the JSON file with a .db suffix."""
+        monkeypatch.delenv("AETHERPOST_STATE_BACKEND", raising=False)
+        assert isinstance(sqlite_manager.backend, SQLiteStateBackend)
+        assert sqlite_manager.state_file == temp_dir / "promo.state.db"
+        assert isinstance(StateManager(str(temp_dir / "state.db")).backend, SQLiteStateBackend)
+        assert StateManager(str(temp_dir / "state.json")).state_file == temp_dir / "state.db"
+        assert isinstance(StateManager(str(temp_dir / "state.json"), backend="json").backend, JSONStateBackend)
+        
+        monkeypatch.setenv("AETHERPOST_STATE_BACKEND", "json")
+        assert isinstance(StateManager(str(temp_dir / "state.json")).backend, JSONStateBackend)
+    
+    def test_persist_and_reload(self, temp_dir, sqlite_manager):
+        """Posts, metrics, removals and media survive a reload."""
+        sqlite_manager.initialize_campaign("test-campaign")
+        sqlite_manager.add_post("twitter", "123", "url1", {"text": "Tweet"}, variant_id="a")
+        sqlite_manager.add_post("bluesky", "456", "url2", {"text": "Skeet"})
+        sqlite_manager.add_post("twitter", "789", "url3", {"text": "Tweet 2"})
+        sqlite_manager.update_post_metrics("123", {"likes": 7})
+        sqlite_manager.remove_post("789")
+        sqlite_manager.add_media("image", "test.png", "dalle-3")
+        
+        reloaded = StateManager(str(temp_dir / "promo.state.json"), backend="sqlite")
+        state = reloaded.load_state()
+        
+        assert state.campaign_id == sqlite_manager.state.campaign_id
+        assert [post.post_id for post in state.posts] == ["123", "456"]
+        assert reloaded.get_post("123").metrics == {"likes": 7}
+        assert len(state.media) == 1
+    
+    def test_indexed_queries(self, sqlite_manager):
+        """Backend queries filter on platform, variant and creation time."""
+        sqlite_manager.initialize_campaign("test-campaign")
+        sqlite_manager.add_post("twitter", "123", "url1", {"text": "A"}, variant_id="a")
+        sqlite_manager.add_post("twitter", "456", "url2", {"text": "B"}, variant_id="b")
+        sqlite_manager.add_post("bluesky", "789", "url3", {"text": "C"}, variant_id="a")
+        
+        backend = sqlite_manager.backend
+        assert [p.post_id for p in backend.query_posts(platform="twitter")] == ["123", "456"]
+        assert [p.post_id for p in backend.query_posts(variant_id="a")] == ["123", "789"]
+        assert backend.query_posts(since=datetime.utcnow().replace(year=2100)) == []
+        assert [p.post_id for p in sqlite_manager.get_posts_by_variant("b")] == ["456"]
+    
+    def test_imports_existing_json_state(self, temp_dir):
+        """The JSON state file is imported on first load and can be exported again."""
+        json_manager = StateManager(str(temp_dir / "promo.state.json"), backend="json")
+        json_manager.initialize_campaign("test-campaign")
+        json_manager.add_post("twitter", "123", "url1", {"text": "Tweet"})
+        
+        sqlite_manager = StateManager(str(temp_dir / "promo.state.json"), backend="sqlite")
+        state = sqlite_manager.load_state()
+        assert state.campaign_id == json_manager.state.campaign_id
+        assert sqlite_manager.get_post("123") is not None
+        
+        exported = sqlite_manager.export_json(temp_dir / "export.json")
+        assert StateManager(str(exported), backend="json").load_state().posts[0].post_id == "123"
+
+
+class TestBulkMetrics:
+    """Test batched metric updates."""
+    
+    @pytest.fixture(params=["json", "sqlite"])
+    def manager(self, request, temp_dir):
+        manager = StateManager(str(temp_dir / "promo.state.json"), backend=request.param)
+        manager.initialize_campaign("test-campaign")
+        for i in range(20):
+            manager.add_post("twitter", str(i), f"url{i}", {"text": f"Post {i}"})
+        return manager
+    
+    def count_writes(self, manager, monkeypatch):
+        writes = []
+        original = manager.backend.update_posts
+        
+        def update_posts(state, records):
+            writes.append(len(records))
+            original(state, records)
+        
+        monkeypatch.setattr(manager.backend, "update_posts", update_posts)
+        return writes
+    
+    def test_bulk_update_is_one_write(self, manager, monkeypatch):
+        """All metric changes are persisted in a single backend write."""
+        writes = self.count_writes(manager, monkeypatch)
+        
+        updated = manager.update_metrics_bulk(
+            [(str(i), {"likes": i}) for i in range(20)] + [("missing", {"likes": 1})]
+        )
+        
+        assert updated == 20
+        assert writes == [20]
+        
+        reloaded = StateManager(str(manager.state_file))
+        reloaded.load_state()
+        assert reloaded.get_post("19").metrics == {"likes": 19}
+    
+    def test_flush_threshold(self, manager, monkeypatch):
+        """Large batches flush once the dirty set reaches the threshold."""
+        writes = self.count_writes(manager, monkeypatch)
+        manager.flush_threshold = 8
+        
+        manager.update_metrics_bulk((str(i), {"likes": 1}) for i in range(20))
+        
+        assert writes == [8, 8, 4]
+    
+    def test_batch_updates_defers_writes(self, manager, monkeypatch):
+        """Single-post updates inside a batch are coalesced per post."""
+        writes = self.count_writes(manager, monkeypatch)
+        
+        with manager.batch_updates():
+            manager.update_post_metrics("1", {"likes": 1})
+            manager.update_post_metrics("1", {"likes": 2})
+            manager.update_post_metrics("2", {"likes": 3})
+            assert writes == []
+        
+        assert writes == [2]
+        assert manager.get_post("1").metrics == {"likes": 2}
+    
+    def test_flush_interval_counts_from_oldest_change(self, manager, monkeypatch):
+        """An update after a long idle period is still coalesced."""
+        writes = self.count_writes(manager, monkeypatch)
+        clock = [1000.0]
+        monkeypatch.setattr("aetherpost.core.state.manager.time.monotonic", lambda: clock[0])
+        
+        with manager.batch_updates():
+            manager.update_post_metrics("1", {"likes": 1})
+            clock[0] += 4
+            manager.update_post_metrics("2", {"likes": 2})
+            assert writes == []
+            
+            clock[0] += 1
+            manager.update_post_metrics("3", {"likes": 3})
+            assert writes == [3]
+            
+            clock[0] += 60
+            manager.update_post_metrics("4", {"likes": 4})
+            assert writes == [3]
+        
+        assert writes == [3, 1]
@@ -0,0 +1,182 @@
+"""Test streaming and resumable media uploads."""
+
+import asyncio
+import os
+import pytest
+from aiohttp import ClientSession, ClientTimeout, web
+from aiohttp.test_utils import TestServer
+
+from aetherpost.platforms.core.base_platform import MediaFile
+from aetherpost.platforms.core.error_handling.exceptions import MediaUploadError
+from aetherpost.platforms.core.upload import (
+    STREAM_CHUNK_SIZE, ResumableUpload, UploadStateStore, stream_file, upload_all
+)
+from aetherpost.platforms.implementations.bluesky_platform import BlueskyPlatform
+
+
+def make_media(temp_dir, size):
+    path = temp_dir / "video.mp4"
+    path.write_bytes(os.urandom(size))
+    return str(path)
+
+
+def make_resumable_server(fail_at_offset=None):
+    """Server implementing the resumable protocol, failing once at ``fail_at_offset``."""
+    received = bytearray()
+    state = {"sessions": 0, "failed": False}
+    
+    async def start(request):
+        state["sessions"] += 1
+        return web.Response(headers={"Location": str(request.url.with_path("/upload"))})
+    
+    async def upload(request):
+        content_range = request.headers["Content-Range"]
+        body = await request.read()
+        
+        if content_range.startswith("bytes */"):
+            # Status query for an interrupted upload
+            total = int(content_range.split("/")[1])
+        else:
+            span, total = content_range[len("bytes "):].split("/")
+            start, end = map(int, span.split("-"))
+            total = int(total)
+            assert start == len(received) and end - start + 1 == len(body)
+            if start == fail_at_offset and not state["failed"]:
+                state["failed"] = True
+                return web.Response(status=503)
+            received.extend(body)
+        
+        if len(received) == total:
+            return web.json_response({"id": "video-1"})
+        return web.Response(status=308, headers={"Range": f"bytes=0-{len(received) - 1}"} if received else {})
+    
+    app = web.Application()
+    app.router.add_post("/start", start)
+    app.router.add_put("/upload", upload)
+    return TestServer(app), received, state
+
+
+class TestStreamFile:
+    """Test chunked reads and progress reporting."""
+    
+    @pytest.mark.asyncio
+    async def test_streams_range_in_chunks(self, temp_dir):
+        path = make_media(temp_dir, 1000)
+        progress = []
+        
+        chunks = [chunk async for chunk in stream_file(path, start=100, length=500, chunk_size=128, progress=progress.append)]
+        
+        assert b"".join(chunks) == open(path, "rb").read()[100:600]
+        assert max(len(chunk) for chunk in chunks) == 128
+        assert [p.bytes_sent for p in progress] == [228, 356, 484, 600]
+        assert progress[-1].total_bytes == 1000
+
+
+class TestResumableUpload:
+    """Test chunked upload and resume from the persisted offset."""
+    
+    @pytest.mark.asyncio
+    async def test_resumes_after_interruption(self, temp_dir):
+        path = make_media(temp_dir, 3 * STREAM_CHUNK_SIZE + 1000)
+        server, received, state = make_resumable_server(fail_at_offset=2 * STREAM_CHUNK_SIZE)
+        await server.start_server()
+        store = UploadStateStore(str(temp_dir / "uploads.json"))
+        key = UploadStateStore.key_for("youtube", path)
+        progress = []
+        
+        async with ClientSession() as session:
+            async def start_session(total_bytes):
+                async with session.post(server.make_url("/start")) as response:
+                    return response.headers["Location"]
+            
+            uploader = ResumableUpload(store, chunk_size=STREAM_CHUNK_SIZE, progress=progress.append)
+            assert await uploader.upload(session, key, path, start_session) is None
+            
+            # The confirmed offset survives a restart
+            assert UploadStateStore(store.state_file).get(key)["offset"] == 2 * STREAM_CHUNK_SIZE
+            
+            uploader = ResumableUpload(UploadStateStore(store.state_file), chunk_size=STREAM_CHUNK_SIZE)
+            result = await uploader.upload(session, key, path, start_session)
+        
+        await server.close()
+        
+        assert result == {"id": "video-1"}
+        assert bytes(received) == open(path, "rb").read()
+        assert state["sessions"] == 1
+        assert UploadStateStore(store.state_file).get(key) is None
+        assert progress[0].bytes_sent == 0
+
+
+class TestUploadAll:
+    """Test concurrent, all-or-nothing media upload."""
+    
+    @pytest.mark.asyncio
+    async def test_uploads_concurrently_in_order(self):
+        in_flight = {"now": 0, "max": 0}
+        
+        async def upload(item):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01 * (5 - item))
+            in_flight["now"] -= 1
+            return f"blob-{item}"
+        
+        results = await upload_all(range(5), upload, max_concurrency=3)
+        
+        assert results == [f"blob-{i}" for i in range(5)]
+        assert in_flight["max"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_uploads(self):
+        finished = []
+        
+        async def upload(item):
+            if item == "bad":
+                return None
+            await asyncio.sleep(1)
+            finished.append(item)
+            return item
+        
+        with pytest.raises(MediaUploadError):
+            await upload_all(["a", "bad", "b"], upload)
+        
+        await asyncio.sleep(0)
+        assert finished == []
+    
+    @pytest.mark.asyncio
+    async def test_bluesky_images_upload_together(self, temp_dir, monkeypatch):
+        platform = BlueskyPlatform({"identifier": "user.bsky.social", "password": "secret"})
+        started = []
+        
+        async def upload_blob(file_path):
+            started.append(file_path)
+            await asyncio.sleep(0.05)
+            return {"ref": file_path}
+        
+        monkeypatch.setattr(platform, "_upload_blob", upload_blob)
+        media = [MediaFile(file_path=f"image{i}.png", media_type="image/png", file_size=1) for i in range(5)]
+        
+        images = await asyncio.wait_for(platform._upload_media(media), timeout=0.15)
+        
+        assert [image["image"]["ref"] for image in images] == [f"image{i}.png" for i in range(4)]
+    
+    @pytest.mark.asyncio
+    async def test_blob_stream_outlasts_session_timeout(self, temp_dir):
+        async def upload_blob(request):
+            body = await request.read()
+            # Slower than the session's total timeout
+            await asyncio.sleep(0.3)
+            return web.json_response({"blob": {"size": len(body)}})
+        
+        app = web.Application()
+        app.router.add_post("/xrpc/com.atproto.repo.uploadBlob", upload_blob)
+        path = make_media(temp_dir, 3 * STREAM_CHUNK_SIZE)
+        
+        async with TestServer(app) as server:
+            platform = BlueskyPlatform({"identifier": "user.bsky.social", "password": "secret"})
+            platform.base_url = str(server.make_url("")).rstrip("/")
+            platform._session = ClientSession(timeout=ClientTimeout(total=0.1))
+            try:
+                assert await platform._send_blob(path) == {"size": 3 * STREAM_CHUNK_SIZE}
+            finally:
+                await platform._session.close()
@@ -0,0 +1,128 @@
+"""Test the ffmpeg video pipeline and its stage cache."""
+
+import asyncio
+import shutil
+import pytest
+from PIL import Image
+
+from aetherpost.core.exceptions import ContentError
+from aetherpost.core.media import audio_generator
+from aetherpost.core.media.ffmpeg_pipeline import FFmpegPipeline
+from aetherpost.core.media.video_generator import VideoGenerator
+
+
+@pytest.fixture
+def generator(temp_dir, monkeypatch):
+    monkeypatch.setattr(audio_generator, 'find_tts_engine', lambda: None)
+    return VideoGenerator({'cache_dir': str(temp_dir / "video"), 'music_dir': str(temp_dir / "music")})
+
+
+@pytest.fixture
+def commands(generator, monkeypatch):
+    """Record ffmpeg invocations instead of running them; outputs are placeholder files."""
+    calls = []
+    
+    async def fake_run(*args, threads=False):
+        calls.append(args)
+        with open(args[-1], 'w') as f:
+            f.write(' '.join(args))
+    
+    monkeypatch.setattr(generator.pipeline, 'run', fake_run)
+    return calls
+
+
+class TestFFmpegPipeline:
+    """Test content-addressed stage caching."""
+    
+    @pytest.mark.asyncio
+    async def test_stage_reused_for_same_inputs(self, temp_dir):
+        pipeline = FFmpegPipeline(str(temp_dir))
+        builds = []
+        
+        async def build(path):
+            builds.append(path)
+            with open(path, 'w') as f:
+                f.write("out")
+        
+        first = await pipeline.stage('tts', {'text': "hello"}, 'wav', build)
+        second = await pipeline.stage('tts', {'text': "hello"}, 'wav', build)
+        other = await pipeline.stage('tts', {'text': "bye"}, 'wav', build)
+        
+        assert first == second != other
+        assert len(builds) == 2
+        assert pipeline.stats == {'hits': 1, 'runs': 2}
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_stages_run_once(self, temp_dir):
+        pipeline = FFmpegPipeline(str(temp_dir))
+        builds = []
+        
+        async def build(path):
+            builds.append(path)
+            await asyncio.sleep(0.01)
+            with open(path, 'w') as f:
+                f.write("out")
+        
+        paths = await asyncio.gather(*(pipeline.stage('frames', {'text': "x"}, 'png', build) for _ in range(3)))
+        
+        assert len(set(paths)) == 1
+        assert len(builds) == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_stage_leaves_no_output(self, temp_dir):
+        pipeline = FFmpegPipeline(str(temp_dir), ffmpeg='ffmpeg-that-does-not-exist')
+        
+        async def build(path):
+            await pipeline.run('-i', 'in.wav', path)
+        
+        with pytest.raises(ContentError, match="not installed"):
+            await pipeline.stage('mix', {'a': 1}, 'wav', build)
+        assert not list((temp_dir / "mix").iterdir())
+
+
+class TestVideoGenerator:
+    """Test video assembly from cached stages."""
+    
+    @pytest.mark.asyncio
+    async def test_only_downstream_stages_rerun(self, generator, commands):
+        await generator.create_text_video({'text': "新機能リリース", 'duration': 10})
+        assert generator.pipeline.stats == {'hits': 0, 'runs': 5}
+        
+        # Same video again: every stage is a cache hit
+        await generator.create_text_video({'text': "新機能リリース", 'duration': 10})
+        assert generator.pipeline.stats == {'hits': 5, 'runs': 5}
+        
+        # A new length re-renders music, the mix and the encode, not speech or the frame
+        await generator.create_text_video({'text': "新機能リリース", 'duration': 12})
+        assert generator.pipeline.stats == {'hits': 7, 'runs': 8}
+    
+    @pytest.mark.asyncio
+    async def test_shorts_are_vertical(self, generator, commands, temp_dir):
+        await generator.create_shorts_video({'text': "Tip"})
+        
+        frames = list((temp_dir / "video" / "frames").glob("*.png"))
+        assert len(frames) == 1
+        with Image.open(frames[0]) as image:
+            assert image.size == (1080, 1920)
+    
+    @pytest.mark.asyncio
+    async def test_slideshow_encodes_slides_and_joins_them(self, generator, commands):
+        slides = [{'text': f"Slide {i}", 'duration': 2} for i in range(3)]
+        
+        await generator.create_slideshow_video(slides)
+        
+        encodes = [args for args in commands if 'libx264' in args]
+        concat = [args for args in commands if 'concat' in args]
+        assert len(encodes) == 3
+        assert len(concat) == 1
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg is not installed")
+class TestFFmpegEndToEnd:
+    """Render a real video when ffmpeg is available."""
+    
+    @pytest.mark.asyncio
+    async def test_renders_playable_video(self, generator):
+        path = await generator.create_text_video({'text': "Hello", 'duration': 2})
+        
+        assert await generator.pipeline.probe_duration(path) == pytest.approx(2, abs=0.2)